@@ -0,0 +1,304 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Load test the ZenML server with different numbers of worker processes.
+
+For each number of workers, a ZenML server is started on a fresh database and
+concurrent clients send requests to one API endpoint for a fixed duration.
+The throughput and latency percentiles are printed for each run, e.g.:
+
+    python scripts/benchmark_server.py --workers 1 --workers 4 --concurrency 64
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from secrets import token_hex
+from typing import Dict, List, Tuple
+
+import click
+import requests
+
+from zenml.constants import API, HEALTH, LOGIN, STACKS, VERSION_1
+
+
+def _get_free_port() -> int:
+    """Get a free TCP port on localhost.
+
+    Returns:
+        The port.
+    """
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return int(s.getsockname()[1])
+
+
+def _prepare_database(env: Dict[str, str]) -> None:
+    """Create the database schema and default entities once.
+
+    Args:
+        env: The environment of the server.
+    """
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from zenml.client import Client; Client().zen_store",
+        ],
+        env=env,
+        check=True,
+    )
+
+
+def _start_server(
+    workers: int, thread_pool_size: int, store_url: str
+) -> Tuple["subprocess.Popen[bytes]", str]:
+    """Start a ZenML server and wait until it is healthy.
+
+    Args:
+        workers: The number of worker processes.
+        thread_pool_size: The number of threads per worker process.
+        store_url: The URL of the database.
+
+    Returns:
+        The server process and its URL.
+
+    Raises:
+        RuntimeError: If the server didn't become healthy.
+    """
+    port = _get_free_port()
+    env = {
+        **os.environ,
+        "ZENML_CONFIG_PATH": tempfile.mkdtemp(prefix="zenml-benchmark-"),
+        "ZENML_STORE_URL": store_url,
+        "ZENML_ANALYTICS_OPT_IN": "false",
+        "ZENML_SERVER_JWT_SECRET_KEY": token_hex(32),
+        "ZENML_SERVER_THREAD_POOL_SIZE": str(thread_pool_size),
+    }
+    _prepare_database(env)
+    env["DISABLE_DATABASE_MIGRATION"] = "true"
+
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "zenml.zen_server.zen_server_api:app",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+    )
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 120
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(url + HEALTH, timeout=1).ok:
+                # Give the remaining workers time to finish their startup
+                time.sleep(2 * workers)
+                return process, url
+        except requests.ConnectionError:
+            pass
+        time.sleep(0.5)
+
+    process.terminate()
+    raise RuntimeError("The ZenML server didn't start in time.")
+
+
+def _login(url: str) -> str:
+    """Log in as the default user.
+
+    Args:
+        url: The URL of the server.
+
+    Returns:
+        The API token.
+    """
+    response = requests.post(
+        url + API + VERSION_1 + LOGIN,
+        data={"username": "default", "password": ""},
+        timeout=10,
+    )
+    response.raise_for_status()
+    return str(response.json()["access_token"])
+
+
+def _run_load(
+    url: str, token: str, concurrency: int, duration: float
+) -> Tuple[List[float], int]:
+    """Send requests from concurrent clients for a fixed duration.
+
+    Args:
+        url: The URL of the endpoint.
+        token: The API token.
+        concurrency: The number of concurrent clients.
+        duration: The duration of the load test in seconds.
+
+    Returns:
+        The latencies of all successful requests and the number of failed
+        requests.
+    """
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def _client() -> None:
+        nonlocal errors
+        session = requests.Session()
+        session.headers["Authorization"] = f"Bearer {token}"
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                ok = session.get(url, timeout=60).ok
+            except requests.RequestException:
+                ok = False
+            latency = time.perf_counter() - start
+            with lock:
+                if ok:
+                    latencies.append(latency)
+                else:
+                    errors += 1
+
+    threads = [threading.Thread(target=_client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    """Compute a percentile of a list of values.
+
+    Args:
+        values: The values.
+        percentile: The percentile between 0 and 100.
+
+    Returns:
+        The percentile or 0 if there are no values.
+    """
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, int(len(values) * percentile / 100))
+    return values[index]
+
+
+@click.command()
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    multiple=True,
+    default=[1, 2, 4],
+    help="Number of server worker processes. Can be passed multiple times.",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=int,
+    default=32,
+    help="Number of concurrent clients.",
+)
+@click.option(
+    "--duration",
+    "-d",
+    type=float,
+    default=20,
+    help="Duration of each load test in seconds.",
+)
+@click.option(
+    "--thread-pool-size",
+    type=int,
+    default=40,
+    help="Number of threads per server worker process.",
+)
+@click.option(
+    "--path",
+    type=str,
+    default=API + VERSION_1 + STACKS + "?hydrate=true",
+    help="API path that is requested.",
+)
+@click.option(
+    "--store-url",
+    type=str,
+    default=None,
+    help="URL of the database to use. Defaults to a new SQLite database "
+    "for each run.",
+)
+def benchmark(
+    workers: Tuple[int, ...],
+    concurrency: int,
+    duration: float,
+    thread_pool_size: int,
+    path: str,
+    store_url: str,
+) -> None:
+    """Load test the ZenML server with different numbers of workers.
+
+    Args:
+        workers: The numbers of server worker processes to test.
+        concurrency: The number of concurrent clients.
+        duration: The duration of each load test in seconds.
+        thread_pool_size: The number of threads per server worker process.
+        path: The API path that is requested.
+        store_url: The URL of the database to use.
+    """
+    click.echo(
+        f"{'workers':>8} {'requests':>9} {'errors':>7} {'req/s':>8} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    )
+    for worker_count in workers:
+        run_store_url = store_url or (
+            "sqlite:///"
+            + os.path.join(
+                tempfile.mkdtemp(prefix="zenml-benchmark-"), "zenml.db"
+            )
+        )
+        process, url = _start_server(
+            workers=worker_count,
+            thread_pool_size=thread_pool_size,
+            store_url=run_store_url,
+        )
+        try:
+            token = _login(url)
+            latencies, errors = _run_load(
+                url + path,
+                token=token,
+                concurrency=concurrency,
+                duration=duration,
+            )
+        finally:
+            process.terminate()
+            process.wait()
+
+        click.echo(
+            f"{worker_count:>8} {len(latencies):>9} {errors:>7} "
+            f"{len(latencies) / duration:>8.1f} "
+            f"{_percentile(latencies, 50) * 1000:>8.1f} "
+            f"{_percentile(latencies, 95) * 1000:>8.1f} "
+            f"{_percentile(latencies, 99) * 1000:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -13,9 +13,11 @@
 #  permissions and limitations under the License.
 """Initialization for ZenML."""
 
-# Define ROOT_DIR
+import importlib
 import os
+from typing import TYPE_CHECKING, Any
 
+# Define ROOT_DIR
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # Set the version
@@ -32,30 +34,80 @@ from pkgutil import extend_path
 
 __path__ = extend_path(__path__, __name__)
 
-# Need to import zenml.models before zenml.config to avoid circular imports
-from zenml.models import *  # noqa: F401
-
-# Define public Python API
-from zenml.api import show
-from zenml.artifacts.utils import (
-    log_artifact_metadata,
-    save_artifact,
-    load_artifact,
-)
-from zenml.model.utils import (
-    log_model_metadata,
-    link_artifact_to_model,
-    log_model_version_metadata,
-)
-from zenml.artifacts.artifact_config import ArtifactConfig
-from zenml.artifacts.external_artifact import ExternalArtifact
-from zenml.model.model import Model
-from zenml.model.model_version import ModelVersion # TODO: deprecate me
-from zenml.new.pipelines.pipeline_context import get_pipeline_context
-from zenml.new.pipelines.pipeline_decorator import pipeline
-from zenml.new.steps.step_decorator import step
-from zenml.new.steps.step_context import get_step_context
-from zenml.steps.utils import log_step_metadata
+# Define public Python API. The objects are imported lazily on first access
+# to keep `import zenml` (and with it the CLI startup) fast.
+_PUBLIC_API = {
+    "ArtifactConfig": "zenml.artifacts.artifact_config",
+    "ExternalArtifact": "zenml.artifacts.external_artifact",
+    "get_pipeline_context": "zenml.new.pipelines.pipeline_context",
+    "get_step_context": "zenml.new.steps.step_context",
+    "link_artifact_to_model": "zenml.model.utils",
+    "load_artifact": "zenml.artifacts.utils",
+    "log_artifact_metadata": "zenml.artifacts.utils",
+    "log_model_metadata": "zenml.model.utils",
+    "log_model_version_metadata": "zenml.model.utils",
+    "log_step_metadata": "zenml.steps.utils",
+    "Model": "zenml.model.model",
+    "ModelVersion": "zenml.model.model_version",  # TODO: deprecate me
+    "pipeline": "zenml.new.pipelines.pipeline_decorator",
+    "save_artifact": "zenml.artifacts.utils",
+    "show": "zenml.api",
+    "step": "zenml.new.steps.step_decorator",
+}
+
+if TYPE_CHECKING:
+    from zenml.api import show
+    from zenml.artifacts.artifact_config import ArtifactConfig
+    from zenml.artifacts.external_artifact import ExternalArtifact
+    from zenml.artifacts.utils import (
+        load_artifact,
+        log_artifact_metadata,
+        save_artifact,
+    )
+    from zenml.model.model import Model
+    from zenml.model.model_version import ModelVersion
+    from zenml.model.utils import (
+        link_artifact_to_model,
+        log_model_metadata,
+        log_model_version_metadata,
+    )
+    from zenml.models import *  # noqa: F401
+    from zenml.new.pipelines.pipeline_context import get_pipeline_context
+    from zenml.new.pipelines.pipeline_decorator import pipeline
+    from zenml.new.steps.step_context import get_step_context
+    from zenml.new.steps.step_decorator import step
+    from zenml.steps.utils import log_step_metadata
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import the public ZenML API.
+
+    Args:
+        name: The name of the attribute.
+
+    Returns:
+        The attribute value.
+
+    Raises:
+        AttributeError: If the attribute doesn't exist.
+    """
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if name in _PUBLIC_API:
+        module = importlib.import_module(_PUBLIC_API[name])
+    else:
+        # All models used to be exported from the top-level package
+        module = importlib.import_module("zenml.models")
+        if not hasattr(module, name):
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            )
+
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "ArtifactConfig",
@@ -68,7 +120,7 @@ __all__ = [
     "log_model_version_metadata",
     "log_step_metadata",
     "Model",
-    "ModelVersion", # TODO: deprecate me
+    "ModelVersion",  # TODO: deprecate me
     "link_artifact_to_model",
     "pipeline",
     "save_artifact",
@@ -14,6 +14,7 @@
 """The base interface to extend the ZenML artifact store."""
 
 import inspect
+import os
 import textwrap
 from abc import abstractmethod
 from pathlib import Path
@@ -45,6 +46,9 @@ logger = get_logger(__name__)
 
 PathType = Union[bytes, str]
 
+# Non-abstract artifact store methods that are exposed through the filesystem
+_OPTIONAL_FILESYSTEM_METHODS = {"du"}
+
 
 class _sanitize_paths:
     """Sanitizes path inputs before calling the original function.
@@ -400,6 +404,40 @@ class BaseArtifactStore(StackComponent):
         )
         return None
 
+    def du(self, path: PathType) -> Optional[int]:
+        """Get the total size of a file or directory in bytes.
+
+        Artifact stores should override this method if their backend can
+        compute the size of a directory with a single recursive listing.
+
+        Args:
+            path: The path to the file or directory.
+
+        Returns:
+            The total size in bytes or `None` if the artifact store does not
+            implement the `size` method.
+        """
+        if not self.exists(path):
+            return 0
+
+        if not self.isdir(path):
+            return self.size(path)
+
+        total_size = 0
+        for directory, _, files in self.walk(path):
+            for file in files:
+                file_size = self.size(
+                    os.path.join(
+                        fileio.convert_to_str(directory),
+                        fileio.convert_to_str(file),
+                    )
+                )
+                if file_size is None:
+                    return None
+                total_size += file_size
+
+        return total_size
+
     @abstractmethod
     def walk(
         self,
@@ -439,7 +477,10 @@ class BaseArtifactStore(StackComponent):
             "SUPPORTED_SCHEMES": self.config.SUPPORTED_SCHEMES,
         }
         for abc_method in inspect.getmembers(BaseArtifactStore):
-            if getattr(abc_method[1], "__isabstractmethod__", False):
+            if (
+                getattr(abc_method[1], "__isabstractmethod__", False)
+                or abc_method[0] in _OPTIONAL_FILESYSTEM_METHODS
+            ):
                 sanitized_method = _sanitize_paths(
                     getattr(self, abc_method[0]), self.path
                 )
@@ -0,0 +1,241 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Process-local cache of in-memory artifact values."""
+
+import copy
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Set, Tuple
+from uuid import UUID
+
+from zenml.constants import IN_MEMORY_ARTIFACT_CACHE_SIZE
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Types whose size is fully reported by `sys.getsizeof`
+_SCALAR_TYPES = (str, bytes, bytearray, int, float, complex, bool, type(None))
+
+
+def estimate_size(value: Any) -> Optional[int]:
+    """Estimates the in-memory size of an artifact value.
+
+    Array-like objects (e.g. numpy arrays) report their buffer size via
+    `nbytes` and dataframe-like objects (e.g. pandas) via `memory_usage`.
+    Scalars, strings and bytes are measured with `sys.getsizeof`, and the
+    elements of lists, tuples, sets and dictionaries are included recursively.
+    The size of any other object can't be estimated, because it might
+    reference an arbitrary amount of memory.
+
+    Args:
+        value: The value for which to estimate the size.
+
+    Returns:
+        The estimated size of the value in bytes or None if the size can't be
+        estimated.
+    """
+    size = 0
+    seen: Set[int] = set()
+    pending = [value]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+
+        if isinstance(obj, _SCALAR_TYPES):
+            size += sys.getsizeof(obj)
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            size += sys.getsizeof(obj)
+            pending.extend(obj)
+        elif isinstance(obj, dict):
+            size += sys.getsizeof(obj)
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        else:
+            object_size = _estimate_buffer_size(obj)
+            if object_size is None:
+                return None
+            size += object_size
+
+    return size
+
+
+def _estimate_buffer_size(value: Any) -> Optional[int]:
+    """Estimates the size of an array-like or dataframe-like object.
+
+    Args:
+        value: The value for which to estimate the size.
+
+    Returns:
+        The estimated size of the value in bytes or None if the value is
+        neither array-like nor dataframe-like.
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        # Arrays of Python objects only report the size of their pointers
+        if getattr(getattr(value, "dtype", None), "hasobject", False):
+            return None
+        return nbytes
+
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+        except Exception:
+            pass
+
+    return None
+
+
+class InMemoryArtifactCache:
+    """LRU cache of artifact values keyed by artifact version ID.
+
+    Steps that run in the same process as the step that produced one of their
+    inputs can use this cache to skip loading that input from the artifact
+    store. The artifacts are still persisted as usual, the cache only avoids
+    the deserialization when reading them back.
+
+    Values are copied when they are read from the cache, so that steps which
+    modify their inputs in place don't affect other steps that consume the
+    same artifact.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initializes the cache.
+
+        Args:
+            max_size: Maximum total estimated size of the cached values in
+                bytes. A value of 0 disables the cache.
+        """
+        self.max_size = max_size
+        self._size = 0
+        self._entries: "OrderedDict[UUID, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """The total estimated size of the cached values in bytes.
+
+        Returns:
+            The total estimated size of the cached values.
+        """
+        return self._size
+
+    def __contains__(self, artifact_version_id: UUID) -> bool:
+        """Checks whether a value is cached for an artifact version.
+
+        Args:
+            artifact_version_id: The ID of the artifact version.
+
+        Returns:
+            Whether a value is cached for the artifact version.
+        """
+        return artifact_version_id in self._entries
+
+    def __len__(self) -> int:
+        """Returns the number of cached values.
+
+        Returns:
+            The number of cached values.
+        """
+        return len(self._entries)
+
+    def put(self, artifact_version_id: UUID, value: Any) -> bool:
+        """Stores the value of an artifact version in the cache.
+
+        Values larger than the maximum cache size or whose size can't be
+        estimated are not cached. Storing a value evicts the least recently used values until the cache fits
+        within its maximum size again.
+
+        Args:
+            artifact_version_id: The ID of the artifact version.
+            value: The artifact value.
+
+        Returns:
+            Whether the value was cached.
+        """
+        if self.max_size <= 0:
+            return False
+
+        size = estimate_size(value)
+        if size is None:
+            logger.debug(
+                "Not caching value of artifact version %s in memory: unable "
+                "to estimate the size of values of type %s.",
+                artifact_version_id,
+                type(value),
+            )
+            return False
+
+        if size > self.max_size:
+            logger.debug(
+                "Not caching value of artifact version %s in memory: "
+                "estimated size of %d bytes exceeds the cache size.",
+                artifact_version_id,
+                size,
+            )
+            return False
+
+        with self._lock:
+            self._remove(artifact_version_id)
+            self._entries[artifact_version_id] = (value, size)
+            self._size += size
+            while self._size > self.max_size:
+                oldest_id = next(iter(self._entries))
+                self._remove(oldest_id)
+
+        return True
+
+    def get(self, artifact_version_id: UUID) -> Any:
+        """Gets a copy of the cached value of an artifact version.
+
+        Args:
+            artifact_version_id: The ID of the artifact version.
+
+        Returns:
+            A copy of the cached value.
+
+        Raises:
+            KeyError: If no value is cached for the artifact version.
+        """
+        with self._lock:
+            value, _ = self._entries[artifact_version_id]
+            self._entries.move_to_end(artifact_version_id)
+
+        return copy.deepcopy(value)
+
+    def clear(self) -> None:
+        """Removes all values from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, artifact_version_id: UUID) -> None:
+        """Removes a value from the cache if it exists.
+
+        Args:
+            artifact_version_id: The ID of the artifact version.
+        """
+        entry = self._entries.pop(artifact_version_id, None)
+        if entry:
+            self._size -= entry[1]
+
+
+in_memory_artifact_cache = InMemoryArtifactCache(
+    max_size=IN_MEMORY_ARTIFACT_CACHE_SIZE
+)
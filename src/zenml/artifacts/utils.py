@@ -15,12 +15,29 @@
 
 import base64
 import contextlib
+import io
 import os
+import queue
 import tempfile
+import threading
 import time
 import zipfile
-from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union, cast
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 from uuid import UUID, uuid4
 
 from zenml.client import Client
@@ -67,6 +84,24 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Size of the chunks in which artifact files are read when archiving them
+ARTIFACT_ARCHIVE_CHUNK_SIZE = 1024 * 1024
+# Maximum number of artifact files that are read concurrently when archiving
+# them
+MAX_ARTIFACT_ARCHIVE_WORKERS = 8
+# Maximum number of chunks that are read ahead per artifact file
+MAX_BUFFERED_ARTIFACT_ARCHIVE_CHUNKS = 4
+# Maximum number of instantiated artifact stores that are cached
+MAX_CACHED_ARTIFACT_STORES = 32
+# Maximum number of characters of text visualization previews
+VISUALIZATION_PREVIEW_MAX_LENGTH = 100_000
+# Maximum width and height in pixels of image visualization previews
+VISUALIZATION_PREVIEW_IMAGE_SIZE = 512
+
+# Instantiated artifact stores by component ID and update time
+_artifact_store_cache: "OrderedDict[Tuple[UUID, datetime], BaseArtifactStore]" = OrderedDict()
+_artifact_store_cache_lock = threading.Lock()
+
 # ----------
 # Public API
 # ----------
@@ -266,11 +301,25 @@ def save_artifact(
                 f"`{name}`. Given version already exists."
             )
     if artifact_metadata:
-        client.create_run_metadata(
-            metadata=artifact_metadata,
-            resource_id=response.id,
-            resource_type=MetadataResourceTypes.ARTIFACT_VERSION,
-        )
+        step_context = None
+        if not manual_save:
+            with contextlib.suppress(RuntimeError):
+                step_context = get_step_context()
+
+        if step_context:
+            # Step outputs are only saved once the step function returned, so
+            # their metadata is stored together with the step run metadata.
+            step_context._run_metadata_buffer.add(
+                metadata=artifact_metadata,
+                resource_id=response.id,
+                resource_type=MetadataResourceTypes.ARTIFACT_VERSION,
+            )
+        else:
+            client.create_run_metadata(
+                metadata=artifact_metadata,
+                resource_id=response.id,
+                resource_type=MetadataResourceTypes.ARTIFACT_VERSION,
+            )
 
     if manual_save:
         try:
@@ -398,6 +447,7 @@ def load_artifact_visualization(
     index: int = 0,
     zen_store: Optional["BaseZenStore"] = None,
     encode_image: bool = False,
+    preview: bool = False,
 ) -> LoadedVisualization:
     """Load a visualization of the given artifact.
 
@@ -407,6 +457,9 @@ def load_artifact_visualization(
         zen_store: The ZenStore to use for finding the artifact store. If not
             provided, the client's ZenStore will be used.
         encode_image: Whether to base64 encode image visualizations.
+        preview: Whether to only load a preview of the visualization. Text
+            visualizations are truncated and images are downsampled to a
+            thumbnail if `Pillow` is installed.
 
     Returns:
         The loaded visualization.
@@ -437,12 +490,27 @@ def load_artifact_visualization(
     artifact_store = _load_artifact_store(
         artifact_store_id=artifact.artifact_store_id, zen_store=zen_store
     )
-    mode = "rb" if visualization.type == VisualizationType.IMAGE else "r"
-    value = _load_file_from_artifact_store(
-        uri=visualization.uri,
-        artifact_store=artifact_store,
-        mode=mode,
-    )
+    if visualization.type == VisualizationType.IMAGE:
+        value = _load_file_from_artifact_store(
+            uri=visualization.uri, artifact_store=artifact_store, mode="rb"
+        )
+        if preview:
+            value = _create_image_thumbnail(value)
+    elif preview:
+        # Only read the beginning of the file instead of the whole file
+        value = _load_file_from_artifact_store(
+            uri=visualization.uri,
+            artifact_store=artifact_store,
+            mode="r",
+            max_length=VISUALIZATION_PREVIEW_MAX_LENGTH + 1,
+        )
+        value = _truncate_text_visualization(
+            value, visualization_type=visualization.type
+        )
+    else:
+        value = _load_file_from_artifact_store(
+            uri=visualization.uri, artifact_store=artifact_store, mode="r"
+        )
 
     # Encode image visualizations if requested
     if visualization.type == VisualizationType.IMAGE and encode_image:
@@ -525,35 +593,135 @@ def download_artifact_files_from_response(
         )
 
     artifact_store = Client().active_stack.artifact_store
-    if filepaths := artifact_store.listdir(artifact.uri):
-        # save a zipfile to 'path' containing all the files
-        # in 'filepaths' with compression
-        try:
-            with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zipf:
-                for file in filepaths:
-                    # Ensure 'file' is a string for path operations
-                    # and ZIP entry naming
-                    file_str = (
-                        file.decode() if isinstance(file, bytes) else file
-                    )
-                    file_path = str(Path(artifact.uri) / file_str)
-                    with artifact_store.open(
-                        name=file_path, mode="rb"
-                    ) as store_file:
-                        # Use a loop to read and write chunks of the file
-                        # instead of reading the entire file into memory
-                        CHUNK_SIZE = 8192
-                        while True:
-                            if file_content := store_file.read(CHUNK_SIZE):
-                                zipf.writestr(file_str, file_content)
-                            else:
-                                break
-        except Exception as e:
-            logger.error(
-                f"Failed to save artifact '{artifact.id}' to zip file "
-                f" '{path}': {e}"
+    try:
+        with open(path, "wb") as f:
+            write_artifact_files_to_zip(
+                artifact_store=artifact_store, uri=artifact.uri, fileobj=f
+            )
+    except Exception as e:
+        logger.error(
+            f"Failed to save artifact '{artifact.id}' to zip file "
+            f" '{path}': {e}"
+        )
+        raise
+
+
+def stream_artifact_files_as_zip(
+    artifact: "ArtifactVersionResponse",
+    zen_store: Optional["BaseZenStore"] = None,
+) -> Iterator[bytes]:
+    """Stream the files of an artifact as a zip archive.
+
+    The archive is written in a background thread and yielded in chunks as
+    soon as they are written, so it is never fully stored in memory or on
+    disk.
+
+    Args:
+        artifact: The artifact whose files to stream.
+        zen_store: The ZenStore to use for finding the artifact store. If not
+            provided, the client's ZenStore will be used.
+
+    Returns:
+        An iterator over the chunks of the zip archive.
+
+    Raises:
+        DoesNotExistException: If the artifact store of the artifact was
+            deleted.
+    """
+    if not artifact.artifact_store_id:
+        raise DoesNotExistException(
+            f"Files of artifact '{artifact.id}' cannot be downloaded because "
+            "the underlying artifact store was deleted."
+        )
+    artifact_store = _load_artifact_store(
+        artifact_store_id=artifact.artifact_store_id, zen_store=zen_store
+    )
+    return _stream_zip(artifact_store=artifact_store, uri=artifact.uri)
+
+
+def list_artifact_files(
+    artifact_store: "BaseArtifactStore", uri: str
+) -> List[str]:
+    """Recursively list the files of an artifact.
+
+    Args:
+        artifact_store: The artifact store in which the artifact is stored.
+        uri: The URI of the artifact directory.
+
+    Returns:
+        The paths of all files in the artifact directory and its
+        subdirectories, relative to the artifact directory.
+    """
+    files: List[str] = []
+
+    def _list(directory: str, prefix: str) -> None:
+        for entry in sorted(
+            fileio.convert_to_str(e) for e in artifact_store.listdir(directory)
+        ):
+            path = os.path.join(directory, entry)
+            if artifact_store.isdir(path):
+                _list(path, prefix=f"{prefix}{entry}/")
+            else:
+                files.append(f"{prefix}{entry}")
+
+    if artifact_store.isdir(uri):
+        _list(uri, prefix="")
+    return files
+
+
+def write_artifact_files_to_zip(
+    artifact_store: "BaseArtifactStore",
+    uri: str,
+    fileobj: IO[bytes],
+    max_workers: int = MAX_ARTIFACT_ARCHIVE_WORKERS,
+) -> None:
+    """Write the files of an artifact to a zip archive.
+
+    The files are read from the artifact store concurrently, while each of
+    them is written to the archive as a single entry in the order of their
+    paths. Only a few chunks of each file are read ahead, so files of any size
+    can be archived without loading them into memory.
+
+    Args:
+        artifact_store: The artifact store in which the artifact is stored.
+        uri: The URI of the artifact directory.
+        fileobj: The file object to which to write the archive. It does not
+            need to be seekable.
+        max_workers: The maximum number of files to read concurrently.
+
+    Raises:
+        Exception: If a file could not be read from the artifact store.
+    """
+    files = list_artifact_files(artifact_store=artifact_store, uri=uri)
+    cancelled = threading.Event()
+    file_chunks: List["queue.Queue[Union[bytes, Exception, None]]"] = [
+        queue.Queue(maxsize=MAX_BUFFERED_ARTIFACT_ARCHIVE_CHUNKS)
+        for _ in files
+    ]
+
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        for file, chunks in zip(files, file_chunks):
+            executor.submit(
+                _read_file_chunks,
+                artifact_store=artifact_store,
+                path=os.path.join(uri, file),
+                chunks=chunks,
+                cancelled=cancelled,
             )
-            raise
+
+        with zipfile.ZipFile(fileobj, "w", zipfile.ZIP_DEFLATED) as zipf:
+            for file, chunks in zip(files, file_chunks):
+                # The file size is unknown upfront, so large files require
+                # the ZIP64 format
+                with zipf.open(file, "w", force_zip64=True) as entry:
+                    while (chunk := chunks.get()) is not None:
+                        if isinstance(chunk, Exception):
+                            raise chunk
+                        entry.write(chunk)
+    finally:
+        cancelled.set()
+        executor.shutdown(wait=True)
 
 
 def get_producer_step_of_artifact(
@@ -663,6 +831,9 @@ def _load_artifact_store(
 ) -> "BaseArtifactStore":
     """Load an artifact store (potentially inside the server).
 
+    Instantiated artifact stores are cached until their stack component is
+    updated.
+
     Args:
         artifact_store_id: The id of the artifact store to load.
         zen_store: The ZenStore to use for finding the artifact store. If not
@@ -694,6 +865,12 @@ def _load_artifact_store(
             f"Stack component '{artifact_store_id}' is not an artifact store."
         )
 
+    cache_key = (artifact_store_model.id, artifact_store_model.updated)
+    with _artifact_store_cache_lock:
+        if cached_artifact_store := _artifact_store_cache.get(cache_key):
+            _artifact_store_cache.move_to_end(cache_key)
+            return cached_artifact_store
+
     try:
         artifact_store = cast(
             "BaseArtifactStore",
@@ -707,9 +884,243 @@ def _load_artifact_store(
             f"dependencies are not installed. For more information, see {link}."
         )
 
+    with _artifact_store_cache_lock:
+        # Remove the outdated instances of the artifact store
+        for key in [
+            key
+            for key in _artifact_store_cache
+            if key[0] == artifact_store_model.id
+        ]:
+            del _artifact_store_cache[key]
+        _artifact_store_cache[cache_key] = artifact_store
+        while len(_artifact_store_cache) > MAX_CACHED_ARTIFACT_STORES:
+            _artifact_store_cache.popitem(last=False)
+
     return artifact_store
 
 
+def _truncate_text_visualization(
+    value: str, visualization_type: VisualizationType
+) -> str:
+    """Truncate a text visualization to the maximum preview length.
+
+    Args:
+        value: The text of the visualization.
+        visualization_type: The type of the visualization.
+
+    Returns:
+        The truncated text. CSV visualizations are truncated after the last
+        complete row.
+    """
+    if len(value) <= VISUALIZATION_PREVIEW_MAX_LENGTH:
+        return value
+
+    value = value[:VISUALIZATION_PREVIEW_MAX_LENGTH]
+    if visualization_type == VisualizationType.CSV and "\n" in value:
+        value = value[: value.rindex("\n") + 1]
+    return value
+
+
+def _create_image_thumbnail(value: bytes) -> bytes:
+    """Downsample an image to the maximum preview size.
+
+    Args:
+        value: The image data.
+
+    Returns:
+        The image data of the thumbnail, or the original image data if the
+        image is already small enough, can't be read or `Pillow` isn't
+        installed.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return value
+
+    try:
+        with Image.open(io.BytesIO(value)) as image:
+            if (
+                max(image.size) <= VISUALIZATION_PREVIEW_IMAGE_SIZE
+                or image.format is None
+            ):
+                return value
+
+            image_format = image.format
+            image.thumbnail(
+                (
+                    VISUALIZATION_PREVIEW_IMAGE_SIZE,
+                    VISUALIZATION_PREVIEW_IMAGE_SIZE,
+                )
+            )
+            thumbnail = io.BytesIO()
+            image.save(thumbnail, format=image_format)
+            return thumbnail.getvalue()
+    except Exception as e:
+        logger.debug("Unable to create image thumbnail: %s", e)
+        return value
+
+
+def _put_unless_cancelled(
+    items: "queue.Queue[Any]", item: Any, cancelled: threading.Event
+) -> bool:
+    """Put an item into a bounded queue unless the operation was cancelled.
+
+    Args:
+        items: The queue.
+        item: The item to put into the queue.
+        cancelled: Event that is set when the operation was cancelled.
+
+    Returns:
+        Whether the item was put into the queue.
+    """
+    while not cancelled.is_set():
+        try:
+            items.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _read_file_chunks(
+    artifact_store: "BaseArtifactStore",
+    path: str,
+    chunks: "queue.Queue[Union[bytes, Exception, None]]",
+    cancelled: threading.Event,
+) -> None:
+    """Read a file from an artifact store in chunks.
+
+    Args:
+        artifact_store: The artifact store from which to read the file.
+        path: The path of the file.
+        chunks: Queue to which the chunks of the file are added. The end of
+            the file is marked with `None`, errors are added to the queue
+            instead of being raised.
+        cancelled: Event that is set when reading should stop.
+    """
+    if cancelled.is_set():
+        return
+
+    try:
+        with artifact_store.open(path, "rb") as f:
+            while chunk := f.read(ARTIFACT_ARCHIVE_CHUNK_SIZE):
+                if not _put_unless_cancelled(chunks, chunk, cancelled):
+                    return
+    except Exception as e:
+        _put_unless_cancelled(chunks, e, cancelled)
+        return
+
+    _put_unless_cancelled(chunks, None, cancelled)
+
+
+class _ChunkStream:
+    """Write-only file object whose data is consumed as chunks by another thread."""
+
+    def __init__(self) -> None:
+        """Initializes the stream."""
+        self._chunks: "queue.Queue[Union[bytes, Exception, None]]" = (
+            queue.Queue(maxsize=MAX_BUFFERED_ARTIFACT_ARCHIVE_CHUNKS)
+        )
+        self._buffer = bytearray()
+        self._cancelled = threading.Event()
+
+    def write(self, data: bytes) -> int:
+        """Writes data to the stream.
+
+        Args:
+            data: The data to write.
+
+        Returns:
+            The number of bytes written.
+
+        Raises:
+            OSError: If the consumer stopped reading from the stream.
+        """
+        if self._cancelled.is_set():
+            raise OSError("The consumer stopped reading from the stream.")
+
+        self._buffer += data
+        if len(self._buffer) >= ARTIFACT_ARCHIVE_CHUNK_SIZE:
+            _put_unless_cancelled(
+                self._chunks, bytes(self._buffer), self._cancelled
+            )
+            self._buffer.clear()
+        return len(data)
+
+    def flush(self) -> None:
+        """Flushes the stream.
+
+        Data is only passed to the consumer in full chunks or when the stream
+        is finished, so this does nothing.
+        """
+
+    def finish(self, error: Optional[Exception] = None) -> None:
+        """Passes the remaining data to the consumer and ends the stream.
+
+        Args:
+            error: An error to raise to the consumer after the remaining data.
+        """
+        if self._buffer:
+            _put_unless_cancelled(
+                self._chunks, bytes(self._buffer), self._cancelled
+            )
+            self._buffer.clear()
+        _put_unless_cancelled(self._chunks, error, self._cancelled)
+
+    def cancel(self) -> None:
+        """Signals the producer that the consumer stopped reading."""
+        self._cancelled.set()
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterates over the chunks written to the stream.
+
+        Yields:
+            The chunks written to the stream.
+
+        Raises:
+            Exception: If the producer failed to write the stream.
+        """
+        while (chunk := self._chunks.get()) is not None:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+
+def _stream_zip(
+    artifact_store: "BaseArtifactStore", uri: str
+) -> Iterator[bytes]:
+    """Stream the files of an artifact directory as a zip archive.
+
+    Args:
+        artifact_store: The artifact store in which the artifact is stored.
+        uri: The URI of the artifact directory.
+
+    Yields:
+        The chunks of the zip archive.
+    """
+    stream = _ChunkStream()
+
+    def _write() -> None:
+        try:
+            write_artifact_files_to_zip(
+                artifact_store=artifact_store,
+                uri=uri,
+                fileobj=cast(IO[bytes], stream),
+            )
+        except Exception as e:
+            stream.finish(error=e)
+        else:
+            stream.finish()
+
+    thread = threading.Thread(target=_write, daemon=True)
+    thread.start()
+    try:
+        yield from stream
+    finally:
+        stream.cancel()
+        thread.join()
+
+
 def _get_new_artifact_version(artifact_name: str) -> int:
     """Get the next auto-incremented version for an artifact name.
 
@@ -738,6 +1149,7 @@ def _load_file_from_artifact_store(
     uri: str,
     artifact_store: "BaseArtifactStore",
     mode: str = "rb",
+    max_length: Optional[int] = None,
 ) -> Any:
     """Load the given uri from the given artifact store.
 
@@ -745,6 +1157,8 @@ def _load_file_from_artifact_store(
         uri: The uri of the file to load.
         artifact_store: The artifact store from which to load the file.
         mode: The mode in which to open the file.
+        max_length: The maximum number of bytes or characters to read. If not
+            given, the whole file is read.
 
     Returns:
         The loaded file.
@@ -756,7 +1170,9 @@ def _load_file_from_artifact_store(
     """
     try:
         with artifact_store.open(uri, mode) as text_file:
-            return text_file.read()
+            if max_length is None:
+                return text_file.read()
+            return text_file.read(max_length)
     except FileNotFoundError:
         raise DoesNotExistException(
             f"File '{uri}' does not exist in artifact store "
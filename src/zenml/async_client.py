@@ -0,0 +1,326 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Asyncio facade for concurrent ZenML client operations."""
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+from uuid import UUID
+
+from zenml.constants import REST_CONNECTION_POOL_SIZE
+from zenml.enums import MetadataResourceTypes, ModelStages
+
+if TYPE_CHECKING:
+    from zenml.client import Client
+    from zenml.metadata.metadata_types import MetadataType
+    from zenml.models import (
+        ArtifactVersionResponse,
+        ModelVersionArtifactRequest,
+        ModelVersionArtifactResponse,
+        ModelVersionResponse,
+        Page,
+        PipelineRunResponse,
+        RunMetadataResponse,
+        StepRunResponse,
+    )
+
+T = TypeVar("T")
+
+
+class AsyncClient:
+    """Asyncio facade for the ZenML client.
+
+    The methods of the client block until the server or database responded,
+    so independent calls are executed one after the other. This facade runs
+    the client methods in a bounded pool of worker threads instead, so that
+    many independent calls can be awaited concurrently, e.g. with
+    `asyncio.gather`:
+
+    ```python
+    async with AsyncClient() as client:
+        step_runs = await asyncio.gather(
+            *(client.get_run_step(step_run_id) for step_run_id in ids)
+        )
+    ```
+
+    The number of concurrent calls is limited by the
+    `ZENML_REST_CONNECTION_POOL_SIZE` environment variable, which is also the
+    number of connections the client keeps open to the ZenML server.
+    """
+
+    def __init__(
+        self,
+        client: Optional["Client"] = None,
+        max_workers: int = REST_CONNECTION_POOL_SIZE,
+    ) -> None:
+        """Initializes the async client.
+
+        Args:
+            client: The client to use. Defaults to the global client.
+            max_workers: The maximum number of concurrent client calls.
+        """
+        if client is None:
+            from zenml.client import Client
+
+            client = Client()
+
+        self.client = client
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(max_workers, 1),
+            thread_name_prefix="zenml-async-client",
+        )
+
+    async def __aenter__(self) -> "AsyncClient":
+        """Enters the async client context.
+
+        Returns:
+            The async client.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exits the async client context and shuts down the worker threads.
+
+        Args:
+            exc_type: The type of the raised exception, if any.
+            exc_value: The raised exception, if any.
+            traceback: The traceback of the raised exception, if any.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """Shuts down the worker threads once all pending calls finished."""
+        self._executor.shutdown(wait=False)
+
+    async def run(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """Runs a blocking function in a worker thread.
+
+        The function runs in a copy of the current context, so that context
+        variables like the source of the calls are preserved.
+
+        Args:
+            func: The function to run.
+            *args: Positional arguments to pass to the function.
+            **kwargs: Keyword arguments to pass to the function.
+
+        Returns:
+            The return value of the function.
+        """
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(context.run, func, *args, **kwargs),
+        )
+
+    async def get_pipeline_run(
+        self,
+        name_id_or_prefix: Union[str, UUID],
+        allow_name_prefix_match: bool = True,
+        hydrate: bool = True,
+    ) -> "PipelineRunResponse":
+        """Gets a pipeline run, see `Client.get_pipeline_run`.
+
+        Args:
+            name_id_or_prefix: Name, ID, or prefix of the pipeline run.
+            allow_name_prefix_match: If True, allow matching by name prefix.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            The pipeline run.
+        """
+        return await self.run(
+            self.client.get_pipeline_run,
+            name_id_or_prefix=name_id_or_prefix,
+            allow_name_prefix_match=allow_name_prefix_match,
+            hydrate=hydrate,
+        )
+
+    async def get_run_step(
+        self, step_run_id: UUID, hydrate: bool = True
+    ) -> "StepRunResponse":
+        """Gets a step run, see `Client.get_run_step`.
+
+        Args:
+            step_run_id: The ID of the step run to get.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            The step run.
+        """
+        return await self.run(
+            self.client.get_run_step, step_run_id=step_run_id, hydrate=hydrate
+        )
+
+    async def list_run_steps(self, **kwargs: Any) -> "Page[StepRunResponse]":
+        """Lists step runs, see `Client.list_run_steps`.
+
+        Args:
+            **kwargs: The filter arguments of `Client.list_run_steps`.
+
+        Returns:
+            A page of step runs.
+        """
+        return await self.run(self.client.list_run_steps, **kwargs)
+
+    async def get_cached_step_run(
+        self, cache_key: str
+    ) -> Optional["StepRunResponse"]:
+        """Gets the step run that a step with a cache key can be cached from.
+
+        Args:
+            cache_key: The cache key of the step.
+
+        Returns:
+            The existing step run if the step can be cached, otherwise None.
+        """
+        from zenml.orchestrators.cache_utils import get_cached_step_run
+
+        return await self.run(get_cached_step_run, cache_key=cache_key)
+
+    async def get_artifact_version(
+        self,
+        name_id_or_prefix: Union[str, UUID],
+        version: Optional[str] = None,
+        hydrate: bool = True,
+    ) -> "ArtifactVersionResponse":
+        """Gets an artifact version, see `Client.get_artifact_version`.
+
+        Args:
+            name_id_or_prefix: Either the ID of the artifact version or the
+                name of the artifact.
+            version: The version of the artifact to get. Only used if
+                `name_id_or_prefix` is the name of the artifact.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            The artifact version.
+        """
+        return await self.run(
+            self.client.get_artifact_version,
+            name_id_or_prefix=name_id_or_prefix,
+            version=version,
+            hydrate=hydrate,
+        )
+
+    async def list_artifact_versions(
+        self, **kwargs: Any
+    ) -> "Page[ArtifactVersionResponse]":
+        """Lists artifact versions, see `Client.list_artifact_versions`.
+
+        Args:
+            **kwargs: The filter arguments of `Client.list_artifact_versions`.
+
+        Returns:
+            A page of artifact versions.
+        """
+        return await self.run(self.client.list_artifact_versions, **kwargs)
+
+    async def get_model_version(
+        self,
+        model_name_or_id: Union[str, UUID],
+        model_version_name_or_number_or_id: Optional[
+            Union[str, int, ModelStages, UUID]
+        ] = None,
+        hydrate: bool = True,
+    ) -> "ModelVersionResponse":
+        """Gets a model version, see `Client.get_model_version`.
+
+        Args:
+            model_name_or_id: name or id of the model containing the model
+                version.
+            model_version_name_or_number_or_id: name, id, stage or number of
+                the model version to be retrieved. If skipped - latest version
+                is retrieved.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            The model version.
+        """
+        return await self.run(
+            self.client.get_model_version,
+            model_name_or_id=model_name_or_id,
+            model_version_name_or_number_or_id=model_version_name_or_number_or_id,
+            hydrate=hydrate,
+        )
+
+    async def create_model_version_artifact_link(
+        self, model_version_artifact_link: "ModelVersionArtifactRequest"
+    ) -> "ModelVersionArtifactResponse":
+        """Links an artifact version to a model version.
+
+        Args:
+            model_version_artifact_link: The link to create.
+
+        Returns:
+            The created link.
+        """
+        return await self.run(
+            self.client.zen_store.create_model_version_artifact_link,
+            model_version_artifact_link,
+        )
+
+    async def create_run_metadata(
+        self,
+        metadata: Dict[str, "MetadataType"],
+        resource_id: UUID,
+        resource_type: MetadataResourceTypes,
+        stack_component_id: Optional[UUID] = None,
+    ) -> List["RunMetadataResponse"]:
+        """Creates run metadata, see `Client.create_run_metadata`.
+
+        Args:
+            metadata: The metadata to create as a dictionary of key-value
+                pairs.
+            resource_id: The ID of the resource for which the metadata was
+                produced.
+            resource_type: The type of the resource for which the metadata
+                was produced.
+            stack_component_id: The ID of the stack component that produced
+                the metadata.
+
+        Returns:
+            The created metadata.
+        """
+        return await self.run(
+            self.client.create_run_metadata,
+            metadata=metadata,
+            resource_id=resource_id,
+            resource_type=resource_type,
+            stack_component_id=stack_component_id,
+        )
@@ -1447,28 +1447,6 @@ zenml hub logs
 ```
 """
 
-from zenml.cli.version import *  # noqa
-from zenml.cli.annotator import *  # noqa
-from zenml.cli.artifact import *  # noqa
-from zenml.cli.authorized_device import *  # noqa
-from zenml.cli.base import *  # noqa
-from zenml.cli.code_repository import *  # noqa
-from zenml.cli.config import *  # noqa
-from zenml.cli.downgrade import *  # noqa
-from zenml.cli.feature import *  # noqa
-from zenml.cli.hub import *  # noqa
-from zenml.cli.integration import *  # noqa
-from zenml.cli.model import *  # noqa
-from zenml.cli.model_registry import *  # noqa
-from zenml.cli.pipeline import *  # noqa
-from zenml.cli.secret import *  # noqa
-from zenml.cli.served_model import *  # noqa
-from zenml.cli.server import *  # noqa
-from zenml.cli.service_accounts import *  # noqa
-from zenml.cli.service_connectors import *  # noqa
-from zenml.cli.stack import *  # noqa
-from zenml.cli.stack_components import *  # noqa
-from zenml.cli.stack_recipes import *  # noqa
-from zenml.cli.user_management import *  # noqa
-from zenml.cli.workspace import *  # noqa
-from zenml.cli.tag import *  # noqa
+# The CLI command modules are imported lazily when the commands are invoked,
+# see `zenml.cli.cli.LAZY_COMMANDS`.
+from zenml.cli.cli import cli  # noqa
@@ -13,8 +13,19 @@
 #  permissions and limitations under the License.
 """Core CLI functionality."""
 
+import importlib
 import os
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import click
 import rich
@@ -23,10 +34,11 @@ from click import Command, Context, formatting
 from zenml import __version__
 from zenml.analytics import source_context
 from zenml.cli.formatter import ZenFormatter
-from zenml.client import Client
-from zenml.enums import CliCategories, SourceContextTypes
+from zenml.enums import CliCategories, SourceContextTypes, StackComponentType
 from zenml.logger import set_root_verbosity
-from zenml.utils import source_utils
+
+if TYPE_CHECKING:
+    from click.shell_completion import CompletionItem
 
 
 class TagGroup(click.Group):
@@ -63,11 +75,285 @@ class ZenContext(click.Context):
     formatter_class = ZenFormatter
 
 
+class LazyCommand(NamedTuple):
+    """Static description of a top-level CLI command that is loaded lazily.
+
+    Attributes:
+        modules: The modules that need to be imported to register the command
+            and all its subcommands.
+        help: The short help text of the command.
+        tag: The category of the command.
+        hidden: Whether the command is hidden in the help output.
+    """
+
+    modules: Tuple[str, ...]
+    help: str
+    tag: CliCategories = CliCategories.OTHER_COMMANDS
+    hidden: bool = False
+
+
+def _lazy_commands() -> Dict[str, LazyCommand]:
+    """Builds the registry of lazily loaded top-level CLI commands.
+
+    Returns:
+        The lazily loaded commands, indexed by command name.
+    """
+    management = CliCategories.MANAGEMENT_TOOLS
+    security = CliCategories.IDENTITY_AND_SECURITY
+
+    def _module(*names: str) -> Tuple[str, ...]:
+        return tuple(f"zenml.cli.{name}" for name in names)
+
+    commands = {
+        "analytics": LazyCommand(
+            _module("config"), "Analytics for opt-in and opt-out.", management
+        ),
+        "artifact": LazyCommand(
+            _module("artifact"),
+            "Commands for interacting with artifacts.",
+            management,
+        ),
+        "authorized-device": LazyCommand(
+            _module("authorized_device"),
+            "Interact with authorized devices.",
+            management,
+        ),
+        "backup-database": LazyCommand(
+            _module("base"), "Create a database backup.", hidden=True
+        ),
+        "clean": LazyCommand(
+            _module("base"),
+            "Delete all ZenML metadata, artifacts and stacks.",
+            hidden=True,
+        ),
+        "code-repository": LazyCommand(
+            _module("code_repository"),
+            "Interact with code repositories.",
+            management,
+        ),
+        "connect": LazyCommand(
+            _module("server"), "Connect to a remote ZenML server."
+        ),
+        "deploy": LazyCommand(_module("server"), "Deploy ZenML in the cloud."),
+        "destroy": LazyCommand(
+            _module("server"),
+            "Tear down and clean up the cloud ZenML deployment.",
+        ),
+        "disconnect": LazyCommand(
+            _module("server"), "Disconnect from a ZenML server."
+        ),
+        "down": LazyCommand(
+            _module("server"), "Shut down the local ZenML dashboard."
+        ),
+        "downgrade": LazyCommand(
+            _module("downgrade"), "Downgrade zenml version in global config."
+        ),
+        "go": LazyCommand(
+            _module("base"), "Quickly explore ZenML with this walk-through."
+        ),
+        "hub": LazyCommand(
+            _module("hub"), "Interact with the ZenML Hub.", CliCategories.HUB
+        ),
+        "info": LazyCommand(
+            _module("base"),
+            "Show information about the current user setup.",
+            hidden=True,
+        ),
+        "init": LazyCommand(_module("base"), "Initialize a ZenML repository."),
+        "integration": LazyCommand(
+            _module("integration"),
+            "Interact with external integrations.",
+            CliCategories.INTEGRATIONS,
+        ),
+        "logging": LazyCommand(
+            _module("config"),
+            "Configuration of logging for ZenML pipelines.",
+            management,
+        ),
+        "logs": LazyCommand(
+            _module("server"),
+            "Show the logs for the local or cloud ZenML server.",
+        ),
+        "migrate-database": LazyCommand(
+            _module("base"), "Migrate the ZenML database.", hidden=True
+        ),
+        "model": LazyCommand(
+            _module("model"),
+            "Interact with models and model versions in the Model Control "
+            "Plane.",
+            CliCategories.MODEL_CONTROL_PLANE,
+        ),
+        "pipeline": LazyCommand(
+            _module("pipeline"),
+            "Interact with pipelines, runs and schedules.",
+            management,
+        ),
+        "restore-database": LazyCommand(
+            _module("base"), "Restore the database from a backup.", hidden=True
+        ),
+        "secret": LazyCommand(
+            _module("secret"),
+            "Create, list, update, or delete secrets.",
+            security,
+        ),
+        "service-account": LazyCommand(
+            _module("service_accounts"),
+            "Commands for service account management.",
+            security,
+        ),
+        "service-connector": LazyCommand(
+            _module("service_connectors"),
+            "Configure and manage service connectors.",
+            security,
+        ),
+        "show": LazyCommand(_module("server"), "Show the ZenML dashboard."),
+        "stack": LazyCommand(
+            _module("stack", "stack_recipes"),
+            "Stacks to define various environments.",
+            management,
+        ),
+        "status": LazyCommand(
+            _module("server"),
+            "Show information about the current configuration.",
+        ),
+        "tag": LazyCommand(_module("tag"), "Interact with tags.", management),
+        "up": LazyCommand(
+            _module("server"), "Start the ZenML dashboard locally."
+        ),
+        "user": LazyCommand(
+            _module("user_management"),
+            "Commands for user management.",
+            security,
+        ),
+        "version": LazyCommand(_module("version"), "Version of ZenML."),
+        "workspace": LazyCommand(
+            _module("workspace"),
+            "Commands for workspace management.",
+            management,
+        ),
+    }
+
+    for component_type in StackComponentType:
+        display_name = component_type.plural.replace("_", " ")
+        commands[component_type.value.replace("_", "-")] = LazyCommand(
+            _module("stack_components"),
+            f"Commands to interact with {display_name}.",
+            CliCategories.STACK_COMPONENTS,
+        )
+
+    return commands
+
+
+LAZY_COMMANDS = _lazy_commands()
+
+
+class LazyCommandDict(Dict[str, click.Command]):
+    """Dictionary of CLI commands that imports lazy commands on access."""
+
+    def __missing__(self, key: str) -> click.Command:
+        """Imports the modules that register a lazily loaded command.
+
+        Args:
+            key: The command name.
+
+        Returns:
+            The command.
+
+        Raises:
+            KeyError: If no command with the given name exists.
+        """
+        lazy_command = LAZY_COMMANDS.get(key)
+        if lazy_command:
+            for module in lazy_command.modules:
+                importlib.import_module(module)
+            if key in self:
+                return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+
 class ZenMLCLI(click.Group):
-    """Custom click Group to create a custom format command help output."""
+    """Custom click Group to create a custom format command help output.
+
+    Most commands are only imported when they're invoked: the
+    `LAZY_COMMANDS` registry describes them statically, so listing them or
+    rendering the help output doesn't require importing them.
+    """
 
     context_class = ZenContext
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the ZenML CLI group.
+
+        Args:
+            *args: Positional arguments for the click group.
+            **kwargs: Keyword arguments for the click group.
+        """
+        super().__init__(*args, **kwargs)
+        self.commands = LazyCommandDict(self.commands)
+
+    def list_commands(self, ctx: Context) -> List[str]:
+        """Lists the names of all commands, including lazy ones.
+
+        Args:
+            ctx: The click context.
+
+        Returns:
+            The sorted command names.
+        """
+        return sorted(set(self.commands) | set(LAZY_COMMANDS))
+
+    def get_command(
+        self, ctx: Context, cmd_name: str
+    ) -> Optional[click.Command]:
+        """Gets a command by name, importing it if necessary.
+
+        Args:
+            ctx: The click context.
+            cmd_name: The name of the command.
+
+        Returns:
+            The command or None if no command with this name exists.
+        """
+        try:
+            return self.commands[cmd_name]
+        except KeyError:
+            return None
+
+    def shell_complete(
+        self, ctx: Context, incomplete: str
+    ) -> List["CompletionItem"]:
+        """Completes command names without importing lazy commands.
+
+        Args:
+            ctx: The click context.
+            incomplete: The incomplete value to complete.
+
+        Returns:
+            The completion items.
+        """
+        from click.shell_completion import CompletionItem
+
+        results: List[CompletionItem] = []
+        for name in self.list_commands(ctx):
+            if not name.startswith(incomplete):
+                continue
+            lazy_command = LAZY_COMMANDS.get(name)
+            if lazy_command and name not in self.commands:
+                if not lazy_command.hidden:
+                    results.append(
+                        CompletionItem(name, help=lazy_command.help)
+                    )
+                continue
+            command = self.commands[name]
+            if not command.hidden:
+                results.append(
+                    CompletionItem(name, help=command.get_short_help_str())
+                )
+
+        # Complete the options of the group itself
+        results.extend(Command.shell_complete(self, ctx, incomplete))
+        return results
+
     def get_help(self, ctx: Context) -> str:
         """Formats the help into a string and returns it.
 
@@ -103,6 +389,18 @@ class ZenMLCLI(click.Group):
             Tuple[CliCategories, str, Union[Command, TagGroup]]
         ] = []
         for subcommand in self.list_commands(ctx):
+            lazy_command = LAZY_COMMANDS.get(subcommand)
+            if lazy_command and subcommand not in self.commands:
+                # Use the static description instead of importing the command
+                if not lazy_command.hidden:
+                    placeholder = click.Command(
+                        subcommand, short_help=lazy_command.help
+                    )
+                    commands.append(
+                        (lazy_command.tag, subcommand, placeholder)
+                    )
+                continue
+
             cmd = self.get_command(ctx, subcommand)
             # What is this, the tool lied about a command.  Ignore it
             if cmd is None or cmd.hidden:
@@ -148,6 +446,9 @@ class ZenMLCLI(click.Group):
 @click.version_option(__version__, "--version", "-v")
 def cli() -> None:
     """CLI base command for ZenML."""
+    from zenml.client import Client
+    from zenml.utils import source_utils
+
     set_root_verbosity()
     source_context.set(SourceContextTypes.CLI)
     repo_root = Client.find_repository()
@@ -14,7 +14,6 @@
 """Client implementation."""
 
 import functools
-import json
 import os
 from abc import ABCMeta
 from datetime import datetime
@@ -155,6 +154,7 @@ from zenml.models import (
     StackResponse,
     StackUpdate,
     StepRunFilter,
+    StepRunOutputs,
     StepRunResponse,
     TagFilter,
     TagRequest,
@@ -177,11 +177,11 @@ from zenml.models import (
 )
 from zenml.utils import io_utils, source_utils
 from zenml.utils.filesync_model import FileSyncModel
-from zenml.utils.pagination_utils import depaginate
+from zenml.utils.pagination_utils import iterate_items
 from zenml.utils.uuid_utils import is_valid_uuid
 
 if TYPE_CHECKING:
-    from zenml.metadata.metadata_types import MetadataType, MetadataTypeEnum
+    from zenml.metadata.metadata_types import MetadataType
     from zenml.service_connectors.service_connector import ServiceConnector
     from zenml.stack import Stack
     from zenml.zen_stores.base_zen_store import BaseZenStore
@@ -751,6 +751,7 @@ class Client(metaclass=ClientMetaClass):
         active: Optional[bool] = None,
         email_opted_in: Optional[bool] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[UserResponse]:
         """List all users.
 
@@ -770,6 +771,8 @@ class Client(metaclass=ClientMetaClass):
             email_opted_in: Use the user opt in status for filtering
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             The User
@@ -779,6 +782,7 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                fields=fields,
                 logical_operator=logical_operator,
                 id=id,
                 external_user_id=external_user_id,
@@ -911,6 +915,7 @@ class Client(metaclass=ClientMetaClass):
         updated: Optional[Union[datetime, str]] = None,
         name: Optional[str] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[WorkspaceResponse]:
         """List all workspaces.
 
@@ -925,6 +930,8 @@ class Client(metaclass=ClientMetaClass):
             name: Use the workspace name for filtering
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             Page of workspaces
@@ -934,6 +941,7 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                fields=fields,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -1125,6 +1133,7 @@ class Client(metaclass=ClientMetaClass):
         user_id: Optional[Union[str, UUID]] = None,
         component_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[StackResponse]:
         """Lists all stacks.
 
@@ -1143,6 +1152,8 @@ class Client(metaclass=ClientMetaClass):
             name: The name of the stack to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A page of stacks.
@@ -1150,6 +1161,7 @@ class Client(metaclass=ClientMetaClass):
         stack_filter_model = StackFilter(
             page=page,
             size=size,
+            fields=fields,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id,
@@ -1559,6 +1571,7 @@ class Client(metaclass=ClientMetaClass):
         connector_id: Optional[Union[str, UUID]] = None,
         stack_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[ComponentResponse]:
         """Lists all registered stack components.
 
@@ -1579,6 +1592,8 @@ class Client(metaclass=ClientMetaClass):
             name: The name of the component to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A page of stack components.
@@ -1586,6 +1601,7 @@ class Client(metaclass=ClientMetaClass):
         component_filter_model = ComponentFilter(
             page=page,
             size=size,
+            fields=fields,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id or self.active_workspace.id,
@@ -1888,6 +1904,7 @@ class Client(metaclass=ClientMetaClass):
         integration: Optional[str] = None,
         user_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[FlavorResponse]:
         """Fetches all the flavor models.
 
@@ -1905,6 +1922,8 @@ class Client(metaclass=ClientMetaClass):
             integration: The integration of the flavor to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A list of all the flavor models.
@@ -1912,6 +1931,7 @@ class Client(metaclass=ClientMetaClass):
         flavor_filter_model = FlavorFilter(
             page=page,
             size=size,
+            fields=fields,
             sort_by=sort_by,
             logical_operator=logical_operator,
             user_id=user_id,
@@ -2012,6 +2032,7 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[PipelineResponse]:
         """List all pipelines.
 
@@ -2031,6 +2052,8 @@ class Client(metaclass=ClientMetaClass):
             user_id: The id of the user to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A page with Pipeline fitting the filter description
@@ -2039,6 +2062,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            fields=fields,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -2176,6 +2200,7 @@ class Client(metaclass=ClientMetaClass):
         python_version: Optional[str] = None,
         checksum: Optional[str] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[PipelineBuildResponse]:
         """List all builds.
 
@@ -2198,6 +2223,8 @@ class Client(metaclass=ClientMetaClass):
             checksum: The build checksum to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A page with builds fitting the filter description
@@ -2206,6 +2233,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            fields=fields,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -2312,6 +2340,7 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[EventSourceResponse]:
         """Lists all event_sources.
 
@@ -2330,6 +2359,8 @@ class Client(metaclass=ClientMetaClass):
             event_source_type: The subtype of the event_source to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A page of event_sources.
@@ -2337,6 +2368,7 @@ class Client(metaclass=ClientMetaClass):
         event_source_filter_model = EventSourceFilter(
             page=page,
             size=size,
+            fields=fields,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id,
@@ -2516,6 +2548,7 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[TriggerResponse]:
         """Lists all triggers.
 
@@ -2533,6 +2566,8 @@ class Client(metaclass=ClientMetaClass):
             event_source_id: The event source associated with the Trigger
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A page of triggers.
@@ -2540,6 +2575,7 @@ class Client(metaclass=ClientMetaClass):
         trigger_filter_model = TriggerFilter(
             page=page,
             size=size,
+            fields=fields,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id,
@@ -2707,6 +2743,7 @@ class Client(metaclass=ClientMetaClass):
         stack_id: Optional[Union[str, UUID]] = None,
         build_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[PipelineDeploymentResponse]:
         """List all deployments.
 
@@ -2725,6 +2762,8 @@ class Client(metaclass=ClientMetaClass):
             build_id: The id of the build to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A page with deployments fitting the filter description
@@ -2733,6 +2772,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            fields=fields,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -2806,6 +2846,7 @@ class Client(metaclass=ClientMetaClass):
         interval_second: Optional[int] = None,
         catchup: Optional[Union[str, bool]] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[ScheduleResponse]:
         """List schedules.
 
@@ -2830,6 +2871,8 @@ class Client(metaclass=ClientMetaClass):
             catchup: Use to filter by catchup.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A list of schedules.
@@ -2838,6 +2881,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            fields=fields,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -2930,6 +2974,7 @@ class Client(metaclass=ClientMetaClass):
         num_steps: Optional[Union[int, str]] = None,
         unlisted: Optional[bool] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[PipelineRunResponse]:
         """List all pipeline runs.
 
@@ -2959,6 +3004,8 @@ class Client(metaclass=ClientMetaClass):
             unlisted: If the runs should be unlisted or not.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A page with Pipeline Runs fitting the filter description
@@ -2967,6 +3014,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            fields=fields,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3067,6 +3115,7 @@ class Client(metaclass=ClientMetaClass):
         user_id: Optional[Union[str, UUID]] = None,
         num_outputs: Optional[Union[int, str]] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[StepRunResponse]:
         """List all pipelines.
 
@@ -3092,6 +3141,8 @@ class Client(metaclass=ClientMetaClass):
             num_outputs: The number of outputs for the step run
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A page with Pipeline fitting the filter description
@@ -3100,6 +3151,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            fields=fields,
             logical_operator=logical_operator,
             id=id,
             entrypoint_name=entrypoint_name,
@@ -3123,6 +3175,29 @@ class Client(metaclass=ClientMetaClass):
             hydrate=hydrate,
         )
 
+    def get_run_step_outputs(
+        self,
+        run_id: UUID,
+        step_names: List[str],
+        output_names: List[str],
+    ) -> Dict[str, StepRunOutputs]:
+        """Get the IDs and some of the outputs of steps of a pipeline run.
+
+        Args:
+            run_id: The ID of the pipeline run.
+            step_names: The names of the steps to fetch.
+            output_names: The names of the outputs to fetch for these steps.
+
+        Returns:
+            The IDs and outputs of the steps, indexed by step name. Steps or
+            outputs which don't exist are not included.
+        """
+        return self.zen_store.get_run_step_outputs(
+            run_id=run_id,
+            step_names=step_names,
+            output_names=output_names,
+        )
+
     # ------------------------------- Artifacts -------------------------------
 
     def get_artifact(
@@ -3159,6 +3234,7 @@ class Client(metaclass=ClientMetaClass):
         name: Optional[str] = None,
         has_custom_name: Optional[bool] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
         tag: Optional[str] = None,
     ) -> Page[ArtifactResponse]:
         """Get a list of artifacts.
@@ -3175,6 +3251,8 @@ class Client(metaclass=ClientMetaClass):
             has_custom_name: Filter artifacts with/without custom names.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
             tag: Filter artifacts by tag.
 
         Returns:
@@ -3184,6 +3262,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            fields=fields,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3253,7 +3332,7 @@ class Client(metaclass=ClientMetaClass):
             delete_from_artifact_store: Delete data from artifact metadata
         """
         if delete_from_artifact_store:
-            unused_artifact_versions = depaginate(
+            unused_artifact_versions = iterate_items(
                 partial(self.list_artifact_versions, only_unused=True)
             )
             for unused_artifact_version in unused_artifact_versions:
@@ -3324,6 +3403,7 @@ class Client(metaclass=ClientMetaClass):
         only_unused: Optional[bool] = False,
         has_custom_name: Optional[bool] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
         tag: Optional[str] = None,
     ) -> Page[ArtifactVersionResponse]:
         """Get a list of artifact versions.
@@ -3352,6 +3432,8 @@ class Client(metaclass=ClientMetaClass):
             has_custom_name: Filter artifacts with/without custom names.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
             tag: A tag to filter by.
 
         Returns:
@@ -3361,6 +3443,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            fields=fields,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3462,9 +3545,9 @@ class Client(metaclass=ClientMetaClass):
         Raises:
             ValueError: If the artifact version is still used in any runs.
         """
-        if artifact_version not in depaginate(
-            partial(self.list_artifact_versions, only_unused=True)
-        ):
+        if not self.list_artifact_versions(
+            id=artifact_version.id, only_unused=True, size=1
+        ).total:
             raise ValueError(
                 "The metadata of artifact versions that are used in runs "
                 "cannot be deleted. Please delete all runs that use this "
@@ -3543,30 +3626,9 @@ class Client(metaclass=ClientMetaClass):
         Returns:
             The created metadata, as string to model dictionary.
         """
-        from zenml.metadata.metadata_types import get_metadata_type
-
-        values: Dict[str, "MetadataType"] = {}
-        types: Dict[str, "MetadataTypeEnum"] = {}
-        for key, value in metadata.items():
-            # Skip metadata that is too large to be stored in the database.
-            if len(json.dumps(value)) > TEXT_FIELD_MAX_LENGTH:
-                logger.warning(
-                    f"Metadata value for key '{key}' is too large to be "
-                    "stored in the database. Skipping."
-                )
-                continue
-            # Skip metadata that is not of a supported type.
-            try:
-                metadata_type = get_metadata_type(value)
-            except ValueError as e:
-                logger.warning(
-                    f"Metadata value for key '{key}' is not of a supported "
-                    f"type. Skipping. Full error: {e}"
-                )
-                continue
-            values[key] = value
-            types[key] = metadata_type
+        from zenml.metadata.run_metadata_buffer import validate_run_metadata
 
+        values, types = validate_run_metadata(metadata)
         run_metadata = RunMetadataRequest(
             workspace=self.active_workspace.id,
             user=self.active_user.id,
@@ -3596,6 +3658,7 @@ class Client(metaclass=ClientMetaClass):
         value: Optional["MetadataType"] = None,
         type: Optional[str] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[RunMetadataResponse]:
         """List run metadata.
 
@@ -3618,6 +3681,8 @@ class Client(metaclass=ClientMetaClass):
             type: The type of the metadata.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             The run metadata.
@@ -3626,6 +3691,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            fields=fields,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3828,6 +3894,7 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[SecretResponse]:
         """Fetches all the secret models.
 
@@ -3848,6 +3915,8 @@ class Client(metaclass=ClientMetaClass):
             user_id: The  id of the user to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A list of all the secret models without the secret values.
@@ -3859,6 +3928,7 @@ class Client(metaclass=ClientMetaClass):
         secret_filter_model = SecretFilter(
             page=page,
             size=size,
+            fields=fields,
             sort_by=sort_by,
             logical_operator=logical_operator,
             user_id=user_id,
@@ -4177,6 +4247,7 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[CodeRepositoryResponse]:
         """List all code repositories.
 
@@ -4193,6 +4264,8 @@ class Client(metaclass=ClientMetaClass):
             user_id: The id of the user to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A page of code repositories matching the filter description.
@@ -4201,6 +4274,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            fields=fields,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -4571,6 +4645,7 @@ class Client(metaclass=ClientMetaClass):
         labels: Optional[Dict[str, Optional[str]]] = None,
         secret_id: Optional[Union[str, UUID]] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[ServiceConnectorResponse]:
         """Lists all registered service connectors.
 
@@ -4596,6 +4671,8 @@ class Client(metaclass=ClientMetaClass):
                 service connector.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A page of service connectors.
@@ -4603,6 +4680,7 @@ class Client(metaclass=ClientMetaClass):
         connector_filter_model = ServiceConnectorFilter(
             page=page,
             size=size,
+            fields=fields,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id or self.active_workspace.id,
@@ -5258,6 +5336,7 @@ class Client(metaclass=ClientMetaClass):
         updated: Optional[Union[datetime, str]] = None,
         name: Optional[str] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
         tag: Optional[str] = None,
     ) -> Page[ModelResponse]:
         """Get models by filter from Model Control Plane.
@@ -5272,6 +5351,8 @@ class Client(metaclass=ClientMetaClass):
             name: The name of the model to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
             tag: The tag of the model to filter by.
 
         Returns:
@@ -5282,6 +5363,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            fields=fields,
             logical_operator=logical_operator,
             created=created,
             updated=updated,
@@ -5456,6 +5538,7 @@ class Client(metaclass=ClientMetaClass):
         number: Optional[int] = None,
         stage: Optional[Union[str, ModelStages]] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
         tag: Optional[str] = None,
     ) -> Page[ModelVersionResponse]:
         """Get model versions by filter from Model Control Plane.
@@ -5474,6 +5557,8 @@ class Client(metaclass=ClientMetaClass):
             stage: stage of the model version.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
             tag: The tag to filter by.
 
         Returns:
@@ -5482,6 +5567,7 @@ class Client(metaclass=ClientMetaClass):
         model_version_filter_model = ModelVersionFilter(
             page=page,
             size=size,
+            fields=fields,
             sort_by=sort_by,
             logical_operator=logical_operator,
             created=created,
@@ -5568,6 +5654,7 @@ class Client(metaclass=ClientMetaClass):
         only_deployment_artifacts: Optional[bool] = None,
         has_custom_name: Optional[bool] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[ModelVersionArtifactResponse]:
         """Get model version to artifact links by filter in Model Control Plane.
 
@@ -5590,6 +5677,8 @@ class Client(metaclass=ClientMetaClass):
             has_custom_name: Filter artifacts with/without custom names.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A page of all model version to artifact links.
@@ -5600,6 +5689,7 @@ class Client(metaclass=ClientMetaClass):
                 logical_operator=logical_operator,
                 page=page,
                 size=size,
+                fields=fields,
                 created=created,
                 updated=updated,
                 workspace_id=workspace_id,
@@ -5682,6 +5772,7 @@ class Client(metaclass=ClientMetaClass):
         pipeline_run_id: Optional[Union[UUID, str]] = None,
         pipeline_run_name: Optional[str] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[ModelVersionPipelineRunResponse]:
         """Get all model version to pipeline run links by filter.
 
@@ -5700,6 +5791,8 @@ class Client(metaclass=ClientMetaClass):
             pipeline_run_name: Use the pipeline run name for filtering
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A page of all model version to pipeline run links.
@@ -5710,6 +5803,7 @@ class Client(metaclass=ClientMetaClass):
                 logical_operator=logical_operator,
                 page=page,
                 size=size,
+                fields=fields,
                 created=created,
                 updated=updated,
                 workspace_id=workspace_id,
@@ -5740,6 +5834,7 @@ class Client(metaclass=ClientMetaClass):
         failed_auth_attempts: Union[int, str, None] = None,
         last_login: Optional[Union[datetime, str, None]] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[OAuthDeviceResponse]:
         """List all authorized devices.
 
@@ -5759,6 +5854,8 @@ class Client(metaclass=ClientMetaClass):
             last_login: Use the last login date for filtering.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A page of authorized devices matching the filter.
@@ -5767,6 +5864,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            fields=fields,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -5893,6 +5991,7 @@ class Client(metaclass=ClientMetaClass):
         logical_operator: LogicalOperators = LogicalOperators.AND,
         trigger_id: Optional[UUID] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[TriggerExecutionResponse]:
         """List all trigger executions matching the given filter criteria.
 
@@ -5904,6 +6003,8 @@ class Client(metaclass=ClientMetaClass):
             trigger_id: ID of the trigger to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A list of all trigger executions matching the filter criteria.
@@ -5913,6 +6014,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            fields=fields,
             logical_operator=logical_operator,
         )
         filter_model.set_scope_workspace(self.active_workspace.id)
@@ -6205,6 +6307,7 @@ class Client(metaclass=ClientMetaClass):
         description: Optional[str] = None,
         active: Optional[bool] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[ServiceAccountResponse]:
         """List all service accounts.
 
@@ -6221,6 +6324,8 @@ class Client(metaclass=ClientMetaClass):
             active: Use the service account active status for filtering
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             The list of service accounts matching the filter description.
@@ -6230,6 +6335,7 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                fields=fields,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -6365,6 +6471,7 @@ class Client(metaclass=ClientMetaClass):
         last_login: Optional[Union[datetime, str]] = None,
         last_rotated: Optional[Union[datetime, str]] = None,
         hydrate: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> Page[APIKeyResponse]:
         """List all API keys.
 
@@ -6385,6 +6492,8 @@ class Client(metaclass=ClientMetaClass):
             last_rotated: The last time the API key was rotated.
             hydrate: Flag deciding whether to hydrate the output model(s)
                 by including metadata fields in the response.
+            fields: Only include these fields in the returned models. If not
+                set, all fields are included.
 
         Returns:
             A page of API keys matching the filter description.
@@ -6397,6 +6506,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            fields=fields,
             logical_operator=logical_operator,
             id=id,
             created=created,
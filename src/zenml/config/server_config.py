@@ -26,8 +26,16 @@ from zenml.constants import (
     DEFAULT_ZENML_JWT_TOKEN_LEEWAY,
     DEFAULT_ZENML_SERVER_DEVICE_AUTH_POLLING,
     DEFAULT_ZENML_SERVER_DEVICE_AUTH_TIMEOUT,
+    DEFAULT_ZENML_SERVER_EVENT_HUB_MAX_PENDING_ACTIONS,
+    DEFAULT_ZENML_SERVER_EVENT_HUB_MAX_WORKERS,
+    DEFAULT_ZENML_SERVER_EVENT_HUB_TRIGGER_INDEX_TTL,
     DEFAULT_ZENML_SERVER_MAX_DEVICE_AUTH_ATTEMPTS,
     DEFAULT_ZENML_SERVER_PIPELINE_RUN_AUTH_WINDOW,
+    DEFAULT_ZENML_SERVER_RBAC_PERMISSION_CACHE_TTL,
+    DEFAULT_ZENML_SERVER_SLOW_QUERY_THRESHOLD,
+    DEFAULT_ZENML_SERVER_THREAD_POOL_SIZE,
+    DEFAULT_ZENML_SERVER_VISUALIZATION_CACHE_SIZE,
+    DEFAULT_ZENML_SERVER_WORKERS,
     ENV_ZENML_SERVER_PREFIX,
 )
 from zenml.enums import AuthScheme
@@ -114,11 +122,51 @@ class ServerConfiguration(BaseModel):
             the RBAC interface defined by
             `zenml.zen_server.rbac_interface.RBACInterface`. If not specified,
             RBAC will not be enabled for this server.
+        rbac_permission_cache_ttl: The time in seconds for which the
+            permission decisions of the RBAC implementation are cached per
+            user. Changes to the permissions of a user that are not made
+            through this server take effect after this time. Set to 0 to
+            disable the cache.
         workload_manager_implementation_source: Source pointing to a class
             implementing the workload management interface.
         pipeline_run_auth_window: The default time window in minutes for which
             a pipeline run action is allowed to authenticate with the ZenML
             server.
+        event_hub_trigger_index_ttl: The time in seconds for which the event
+            hub keeps the active triggers of an event source in memory. The
+            index is also invalidated whenever a trigger is changed through
+            this server.
+        event_hub_max_workers: The number of worker threads used by the event
+            hub to execute trigger actions outside of the request path.
+        event_hub_max_pending_actions: The maximum number of trigger actions
+            that can be queued or running at the same time. If this limit is
+            reached, actions are executed in the thread that published the
+            event instead.
+        metrics_enabled: Whether to collect request and database metrics and
+            expose them in the Prometheus text format on the `/metrics`
+            endpoint.
+        metrics_server_timing: Whether to add a `Server-Timing` header with
+            the request duration and the number and duration of the database
+            queries to all responses. Requires `metrics_enabled`.
+        metrics_multiprocess_dir: The directory in which the worker processes
+            of the server share their metrics, so that the `/metrics` endpoint
+            of every worker returns the metrics of all workers. Generated
+            automatically if the server is started with multiple workers by
+            ZenML. A configured directory is emptied when ZenML starts the
+            server. If the server is started in another way, e.g. with
+            `uvicorn` directly, the directory must be emptied before every
+            start, otherwise the metrics of previous runs are included.
+        slow_query_threshold: The duration in seconds after which database
+            queries are logged as slow if metrics are enabled. Set to 0 to
+            disable logging slow queries.
+        visualization_cache_size: The maximum total size in bytes of the
+            artifact visualizations that are cached in memory by the server.
+            Set to 0 to disable caching visualizations.
+        workers: The number of worker processes that handle requests when the
+            server is started by ZenML. All workers must use the same JWT
+            secret key, which is generated automatically if not specified.
+        thread_pool_size: The number of threads per worker process that
+            handle requests to synchronous endpoints.
     """
 
     deployment_type: ServerDeploymentType = ServerDeploymentType.OTHER
@@ -152,10 +200,29 @@ class ServerConfiguration(BaseModel):
     external_server_id: Optional[UUID] = None
 
     rbac_implementation_source: Optional[str] = None
+    rbac_permission_cache_ttl: int = (
+        DEFAULT_ZENML_SERVER_RBAC_PERMISSION_CACHE_TTL
+    )
     workload_manager_implementation_source: Optional[str] = None
     pipeline_run_auth_window: int = (
         DEFAULT_ZENML_SERVER_PIPELINE_RUN_AUTH_WINDOW
     )
+    event_hub_trigger_index_ttl: int = (
+        DEFAULT_ZENML_SERVER_EVENT_HUB_TRIGGER_INDEX_TTL
+    )
+    event_hub_max_workers: int = DEFAULT_ZENML_SERVER_EVENT_HUB_MAX_WORKERS
+    event_hub_max_pending_actions: int = (
+        DEFAULT_ZENML_SERVER_EVENT_HUB_MAX_PENDING_ACTIONS
+    )
+    metrics_enabled: bool = False
+    metrics_server_timing: bool = False
+    metrics_multiprocess_dir: Optional[str] = None
+    slow_query_threshold: float = DEFAULT_ZENML_SERVER_SLOW_QUERY_THRESHOLD
+    visualization_cache_size: int = (
+        DEFAULT_ZENML_SERVER_VISUALIZATION_CACHE_SIZE
+    )
+    workers: int = DEFAULT_ZENML_SERVER_WORKERS
+    thread_pool_size: int = DEFAULT_ZENML_SERVER_THREAD_POOL_SIZE
 
     _deployment_id: Optional[UUID] = None
 
@@ -95,11 +95,20 @@ ENV_ZENML_DISABLE_STEP_LOGS_STORAGE = "ZENML_DISABLE_STEP_LOGS_STORAGE"
 ENV_ZENML_PIPELINE_API_TOKEN_EXPIRES_MINUTES = (
     "ZENML_PIPELINE_API_TOKEN_EXPIRES_MINUTES"
 )
+ENV_ZENML_IN_MEMORY_ARTIFACT_CACHE_SIZE = "ZENML_IN_MEMORY_ARTIFACT_CACHE_SIZE"
+ENV_ZENML_PANDAS_STATISTICS_SAMPLE_SIZE = "ZENML_PANDAS_STATISTICS_SAMPLE_SIZE"
+ENV_ZENML_CACHE_LOCAL_REQUIREMENTS = "ZENML_CACHE_LOCAL_REQUIREMENTS"
+ENV_ZENML_REST_RESPONSE_CACHE_SIZE = "ZENML_REST_RESPONSE_CACHE_SIZE"
+ENV_ZENML_REST_CONNECTION_POOL_SIZE = "ZENML_REST_CONNECTION_POOL_SIZE"
 
 # ZenML Server environment variables
 ENV_ZENML_SERVER_PREFIX = "ZENML_SERVER_"
 ENV_ZENML_SERVER_DEPLOYMENT_TYPE = f"{ENV_ZENML_SERVER_PREFIX}DEPLOYMENT_TYPE"
 ENV_ZENML_SERVER_AUTH_SCHEME = f"{ENV_ZENML_SERVER_PREFIX}AUTH_SCHEME"
+ENV_ZENML_SERVER_JWT_SECRET_KEY = f"{ENV_ZENML_SERVER_PREFIX}JWT_SECRET_KEY"
+ENV_ZENML_SERVER_METRICS_MULTIPROCESS_DIR = (
+    f"{ENV_ZENML_SERVER_PREFIX}METRICS_MULTIPROCESS_DIR"
+)
 
 # Logging variables
 IS_DEBUG_ENV: bool = handle_bool_env_var(ENV_ZENML_DEBUG, default=False)
@@ -160,6 +169,35 @@ ENFORCE_TYPE_ANNOTATIONS = handle_bool_env_var(
     ENV_ZENML_ENFORCE_TYPE_ANNOTATIONS, default=False
 )
 
+# Maximum size (in bytes) of the artifact values that are kept in memory to
+# pass them to steps running in the same process. 0 disables the cache.
+IN_MEMORY_ARTIFACT_CACHE_SIZE = handle_int_env_var(
+    ENV_ZENML_IN_MEMORY_ARTIFACT_CACHE_SIZE, default=512 * 1024 * 1024
+)
+
+# Maximum number of rows of pandas dataframes and series used to compute
+# metadata and visualizations. Larger objects are sampled, 0 disables sampling.
+PANDAS_STATISTICS_SAMPLE_SIZE = handle_int_env_var(
+    ENV_ZENML_PANDAS_STATISTICS_SAMPLE_SIZE, default=1_000_000
+)
+
+# Whether the exported packages of the local Python environment are cached on
+# disk and reused as long as the environment doesn't change.
+CACHE_LOCAL_REQUIREMENTS = handle_bool_env_var(
+    ENV_ZENML_CACHE_LOCAL_REQUIREMENTS, default=False
+)
+
+# Maximum number of responses that the REST store keeps to revalidate them
+# with the server using their ETag. 0 disables the cache.
+REST_RESPONSE_CACHE_SIZE = handle_int_env_var(
+    ENV_ZENML_REST_RESPONSE_CACHE_SIZE, default=128
+)
+# Maximum number of connections that the REST store keeps open to the server,
+# which is also the maximum number of concurrent requests of the async client
+REST_CONNECTION_POOL_SIZE = handle_int_env_var(
+    ENV_ZENML_REST_CONNECTION_POOL_SIZE, default=16
+)
+
 # Services
 DEFAULT_SERVICE_START_STOP_TIMEOUT = 60
 DEFAULT_LOCAL_SERVICE_IP_ADDRESS = "127.0.0.1"
@@ -178,6 +216,14 @@ DEFAULT_ZENML_SERVER_DEVICE_AUTH_POLLING = 5  # seconds
 DEFAULT_HTTP_TIMEOUT = 30
 ZENML_API_KEY_PREFIX = "ZENKEY_"
 DEFAULT_ZENML_SERVER_PIPELINE_RUN_AUTH_WINDOW = 60 * 48  # 48 hours
+DEFAULT_ZENML_SERVER_EVENT_HUB_TRIGGER_INDEX_TTL = 60  # seconds
+DEFAULT_ZENML_SERVER_EVENT_HUB_MAX_WORKERS = 4
+DEFAULT_ZENML_SERVER_EVENT_HUB_MAX_PENDING_ACTIONS = 100
+DEFAULT_ZENML_SERVER_RBAC_PERMISSION_CACHE_TTL = 10  # seconds
+DEFAULT_ZENML_SERVER_SLOW_QUERY_THRESHOLD = 1.0  # seconds
+DEFAULT_ZENML_SERVER_VISUALIZATION_CACHE_SIZE = 64 * 1024 * 1024  # bytes
+DEFAULT_ZENML_SERVER_WORKERS = 1
+DEFAULT_ZENML_SERVER_THREAD_POOL_SIZE = 40
 
 # API Endpoint paths:
 ACTIVATE = "/activate"
@@ -189,12 +235,14 @@ API_TOKEN = "/api_token"
 ARTIFACTS = "/artifacts"
 ARTIFACT_VERSIONS = "/artifact_versions"
 ARTIFACT_VISUALIZATIONS = "/artifact_visualizations"
+BATCH = "/batch"
 CODE_REFERENCES = "/code_references"
 CODE_REPOSITORIES = "/code_repositories"
 COMPONENT_TYPES = "/component-types"
 CURRENT_USER = "/current-user"
 DEACTIVATE = "/deactivate"
 DEVICES = "/devices"
+DOWNLOAD = "/download"
 DEVICE_AUTHORIZATION = "/device_authorization"
 DEVICE_VERIFY = "/verify"
 EMAIL_ANALYTICS = "/email-opt-in"
@@ -208,6 +256,7 @@ INFO = "/info"
 LOGIN = "/login"
 LOGOUT = "/logout"
 LOGS = "/logs"
+METRICS = "/metrics"
 MODEL_VERSION_ARTIFACTS = "/model_version_artifacts"
 MODEL_VERSION_PIPELINE_RUNS = "/model_version_pipeline_runs"
 MODEL_VERSIONS = "/model_versions"
@@ -236,6 +285,7 @@ STACK_COMPONENTS = "/components"
 STATISTICS = "/statistics"
 STATUS = "/status"
 STEP_CONFIGURATION = "/step-configuration"
+STEP_OUTPUTS = "/step-outputs"
 STEPS = "/steps"
 TAGS = "/tags"
 TRIGGERS = "/triggers"
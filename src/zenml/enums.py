@@ -245,6 +245,7 @@ class GenericFilterOps(StrEnum):
     GT = "gt"
     LTE = "lte"
     LT = "lt"
+    ONEOF = "oneof"
 
 
 class SorterOps(StrEnum):
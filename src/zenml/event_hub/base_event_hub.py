@@ -13,7 +13,11 @@
 #  permissions and limitations under the License.
 """Base class for event hub implementations."""
 
+import os
+import threading
 from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
@@ -30,6 +34,7 @@ from zenml.models import (
 )
 from zenml.zen_server.auth import AuthContext
 from zenml.zen_server.jwt import JWTToken
+from zenml.zen_server.utils import server_config
 
 if TYPE_CHECKING:
     from zenml.zen_stores.sql_zen_store import SqlZenStore
@@ -55,6 +60,15 @@ class BaseEventHub(ABC):
 
     action_handlers: Dict[Tuple[str, str], ActionHandlerCallback] = {}
 
+    def __init__(self) -> None:
+        """Initialize the event hub."""
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending_actions: Optional[threading.BoundedSemaphore] = None
+        self._executor_pid: Optional[int] = None
+        self._executor_lock = threading.Lock()
+        self._action_stats: Counter[str] = Counter()
+        self._action_stats_lock = threading.Lock()
+
     @property
     def zen_store(self) -> "SqlZenStore":
         """Returns the active zen store.
@@ -102,6 +116,29 @@ class BaseEventHub(ABC):
         """
         self.action_handlers.pop((action_flavor, action_subtype), None)
 
+    @property
+    def action_stats(self) -> Dict[str, int]:
+        """Statistics about the trigger actions executed by the event hub.
+
+        Returns:
+            The number of actions that were `dispatched` to the worker pool,
+            executed `inline` because the worker pool was saturated,
+            `completed` or `failed`, and the number of actions that are
+            currently `pending`.
+        """
+        with self._action_stats_lock:
+            stats = {
+                key: self._action_stats[key]
+                for key in ("dispatched", "inline", "completed", "failed")
+            }
+        stats["pending"] = (
+            stats["dispatched"]
+            + stats["inline"]
+            - stats["completed"]
+            - stats["failed"]
+        )
+        return stats
+
     def trigger_action(
         self,
         event: BaseEvent,
@@ -111,45 +148,151 @@ class BaseEventHub(ABC):
     ) -> None:
         """Trigger an action.
 
+        The action is executed by a bounded pool of worker threads, outside
+        of the request path that published the event. If the maximum number of
+        pending actions is reached, the action is executed in the calling
+        thread instead, which slows down publishers until the backlog clears.
+
         Args:
             event: The event.
             event_source: The event source that produced the event.
             trigger: The trigger that was activated.
             action_callback: The action to trigger.
         """
-        request = TriggerExecutionRequest(
-            trigger=trigger.id, event_metadata=event.dict()
-        )
+        executor, pending_actions = self._get_executor()
+
+        if not pending_actions.acquire(blocking=False):
+            logger.warning(
+                f"The event hub has reached the maximum number of pending "
+                f"actions. Executing the action for trigger {trigger.id} "
+                f"inline."
+            )
+            self._record_action_stat("inline")
+            self._execute_action(
+                event=event,
+                trigger=trigger,
+                action_callback=action_callback,
+            )
+            return
+
+        def _run() -> None:
+            try:
+                self._execute_action(
+                    event=event,
+                    trigger=trigger,
+                    action_callback=action_callback,
+                )
+            finally:
+                pending_actions.release()
+
+        self._record_action_stat("dispatched")
+        try:
+            executor.submit(_run)
+        except RuntimeError:
+            # The executor was shut down
+            pending_actions.release()
+            self._record_action_stat("failed")
+            logger.exception(
+                f"Failed to dispatch the action for trigger {trigger.id}."
+            )
 
-        action_config = trigger.get_metadata().action
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker pool that executes trigger actions.
 
-        trigger_execution = self.zen_store.create_trigger_execution(request)
+        Args:
+            wait: Whether to wait for all pending actions to finish.
+        """
+        with self._executor_lock:
+            executor = self._executor
+            self._executor = None
+            self._pending_actions = None
 
-        # Generate an API token that can be used by external workloads
-        # implementing the action to authenticate with the server. This token
-        # is associated with the service account configured for the trigger
-        # and has a validity defined by the trigger's authentication window.
-        token = JWTToken(
-            user_id=trigger.service_account.id,
-        )
-        expires: Optional[datetime] = None
-        if trigger.auth_window:
-            expires = datetime.utcnow() + timedelta(
-                minutes=trigger.auth_window
-            )
-        encoded_token = token.encode(expires=expires)
-        auth_context = AuthContext(
-            user=trigger.service_account,
-            access_token=token,
-            encoded_access_token=encoded_token,
-        )
+        if executor:
+            executor.shutdown(wait=wait)
+
+    def _get_executor(
+        self,
+    ) -> Tuple[ThreadPoolExecutor, threading.BoundedSemaphore]:
+        """Get the worker pool used to execute trigger actions.
+
+        The worker threads of a pool don't exist in server worker processes
+        that are forked from the process that created the pool, so a new pool
+        is created in each process.
+
+        Returns:
+            The worker pool and the semaphore that limits the number of
+            pending actions.
+        """
+        with self._executor_lock:
+            if (
+                self._executor is None
+                or self._pending_actions is None
+                or self._executor_pid != os.getpid()
+            ):
+                self._executor_pid = os.getpid()
+                config = server_config()
+                self._executor = ThreadPoolExecutor(
+                    max_workers=config.event_hub_max_workers,
+                    thread_name_prefix="zenml-event-hub",
+                )
+                self._pending_actions = threading.BoundedSemaphore(
+                    config.event_hub_max_pending_actions
+                )
+            return self._executor, self._pending_actions
+
+    def _record_action_stat(self, key: str) -> None:
+        """Increment an action statistic.
+
+        Args:
+            key: The statistic to increment.
+        """
+        with self._action_stats_lock:
+            self._action_stats[key] += 1
+
+    def _execute_action(
+        self,
+        event: BaseEvent,
+        trigger: TriggerResponse,
+        action_callback: ActionHandlerCallback,
+    ) -> None:
+        """Execute an action for a trigger.
 
+        Args:
+            event: The event.
+            trigger: The trigger that was activated.
+            action_callback: The action to trigger.
+        """
         try:
-            # TODO: We need to make this async, as this might take quite some
-            # time per trigger. We can either use threads starting here, or
-            # use fastapi background tasks that get passed here instead of
-            # running the event hub as a background tasks in the webhook
-            # endpoints
+            request = TriggerExecutionRequest(
+                trigger=trigger.id, event_metadata=event.dict()
+            )
+
+            action_config = trigger.get_metadata().action
+
+            trigger_execution = self.zen_store.create_trigger_execution(
+                request
+            )
+
+            # Generate an API token that can be used by external workloads
+            # implementing the action to authenticate with the server. This
+            # token is associated with the service account configured for the
+            # trigger and has a validity defined by the trigger's
+            # authentication window.
+            token = JWTToken(
+                user_id=trigger.service_account.id,
+            )
+            expires: Optional[datetime] = None
+            if trigger.auth_window:
+                expires = datetime.utcnow() + timedelta(
+                    minutes=trigger.auth_window
+                )
+            encoded_token = token.encode(expires=expires)
+            auth_context = AuthContext(
+                user=trigger.service_account,
+                access_token=token,
+                encoded_access_token=encoded_token,
+            )
+
             action_callback(
                 action_config,
                 trigger_execution,
@@ -157,9 +300,12 @@ class BaseEventHub(ABC):
             )
         except Exception:
             # Don't let action errors stop the event hub from working
+            self._record_action_stat("failed")
             logger.exception(
                 f"An error occurred while executing trigger {trigger}."
             )
+        else:
+            self._record_action_stat("completed")
 
     @abstractmethod
     def activate_trigger(self, trigger: TriggerResponse) -> None:
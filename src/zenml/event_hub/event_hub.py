@@ -13,8 +13,10 @@
 #  permissions and limitations under the License.
 """Base class for all the Event Hub."""
 
-from functools import partial
-from typing import TYPE_CHECKING, List
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Tuple
+from uuid import UUID
 
 from zenml import EventSourceResponse
 from zenml.enums import PluginType
@@ -24,6 +26,7 @@ from zenml.event_sources.base_event import (
 )
 from zenml.event_sources.base_event_source import (
     BaseEventSourceFlavor,
+    EventFilterConfig,
 )
 from zenml.logger import get_logger
 from zenml.models import (
@@ -31,13 +34,15 @@ from zenml.models import (
     TriggerResponse,
 )
 from zenml.utils.pagination_utils import depaginate
-from zenml.zen_server.utils import plugin_flavor_registry
+from zenml.zen_server.utils import plugin_flavor_registry, server_config
 
 logger = get_logger(__name__)
 
 if TYPE_CHECKING:
     pass
 
+IndexedTrigger = Tuple[TriggerResponse, EventFilterConfig]
+
 
 class InternalEventHub(BaseEventHub):
     """Internal in-server event hub implementation.
@@ -45,8 +50,23 @@ class InternalEventHub(BaseEventHub):
     The internal in-server event hub uses the database as a source of truth for
     configured triggers and triggers actions by calling the action handlers
     directly.
+
+    The active triggers of each event source are kept in an in-memory index
+    together with their parsed event filters. The index is invalidated when
+    triggers are activated or deactivated through this event hub and expires
+    after a configurable time to pick up changes made by other server
+    replicas.
     """
 
+    def __init__(self) -> None:
+        """Initialize the event hub."""
+        super().__init__()
+        self._trigger_index: Dict[
+            UUID, Tuple[float, List[IndexedTrigger]]
+        ] = {}
+        self._trigger_index_generation = 0
+        self._trigger_index_lock = threading.Lock()
+
     def activate_trigger(self, trigger: TriggerResponse) -> None:
         """Add a trigger to the event hub.
 
@@ -55,9 +75,10 @@ class InternalEventHub(BaseEventHub):
         Args:
             trigger: the trigger to activate.
         """
-        # We don't need to do anything here to change the event hub
-        # configuration. The in-server event hub already uses the database
-        # as the source of truth regarding configured active triggers.
+        # The in-server event hub uses the database as the source of truth
+        # regarding configured active triggers, we only need to make sure
+        # that the index is reloaded from the database.
+        self.invalidate_trigger_index()
 
     def deactivate_trigger(self, trigger: TriggerResponse) -> None:
         """Remove a trigger from the event hub.
@@ -68,9 +89,16 @@ class InternalEventHub(BaseEventHub):
         Args:
             trigger: the trigger to deactivate.
         """
-        # We don't need to do anything here to change the event hub
-        # configuration. The in-server event hub already uses the database
-        # as the source of truth regarding configured active triggers.
+        # The in-server event hub uses the database as the source of truth
+        # regarding configured active triggers, we only need to make sure
+        # that the index is reloaded from the database.
+        self.invalidate_trigger_index()
+
+    def invalidate_trigger_index(self) -> None:
+        """Remove all event sources from the trigger index."""
+        with self._trigger_index_lock:
+            self._trigger_index.clear()
+            self._trigger_index_generation += 1
 
     def publish_event(
         self,
@@ -124,52 +152,113 @@ class InternalEventHub(BaseEventHub):
         Returns:
             The list of matching triggers.
         """
+        trigger_list: List[TriggerResponse] = [
+            trigger
+            for trigger, event_filter in self._get_indexed_triggers(
+                event_source
+            )
+            if event_filter.event_matches_filter(event=event)
+        ]
+
+        logger.debug(
+            f"For event {event} and event source {event_source}, "
+            f"the following triggers matched: {trigger_list}"
+        )
+
+        return trigger_list
+
+    def _get_indexed_triggers(
+        self, event_source: EventSourceResponse
+    ) -> List[IndexedTrigger]:
+        """Get the active triggers of an event source from the index.
+
+        Args:
+            event_source: The event source.
+
+        Returns:
+            The active triggers of the event source and their event filters.
+        """
+        now = time.monotonic()
+        with self._trigger_index_lock:
+            entry = self._trigger_index.get(event_source.id)
+            if entry and now - entry[0] < (
+                server_config().event_hub_trigger_index_ttl
+            ):
+                return entry[1]
+            generation = self._trigger_index_generation
+
+        indexed_triggers = self._load_triggers(event_source)
+
+        with self._trigger_index_lock:
+            # Don't store triggers that were loaded before the index was
+            # invalidated, they might already be outdated.
+            if generation == self._trigger_index_generation:
+                self._trigger_index[event_source.id] = (now, indexed_triggers)
+
+        return indexed_triggers
+
+    def _load_triggers(
+        self, event_source: EventSourceResponse
+    ) -> List[IndexedTrigger]:
+        """Load the active triggers of an event source from the database.
+
+        Args:
+            event_source: The event source.
+
+        Returns:
+            The active triggers of the event source and their event filters.
+        """
+        # For now, the matching of trigger filters vs event is implemented
+        # in each filter class. This is not ideal and should be refactored
+        # to a more generic solution that doesn't require the plugin
+        # implementation to be imported here.
+        try:
+            plugin_flavor = plugin_flavor_registry().get_flavor_class(
+                name=event_source.flavor,
+                _type=PluginType.EVENT_SOURCE,
+                subtype=event_source.plugin_subtype,
+            )
+        except KeyError:
+            logger.exception(
+                f"Could not find plugin flavor for event source "
+                f"{event_source.id} and flavor {event_source.flavor}. "
+                f"Skipping all its triggers."
+            )
+            return []
+
+        assert issubclass(plugin_flavor, BaseEventSourceFlavor)
+
+        # Get the filter class from the plugin flavor class
+        event_filter_config_class = plugin_flavor.EVENT_FILTER_CONFIG_CLASS
+
         # get all event sources configured for this flavor
         triggers: List[TriggerResponse] = depaginate(
-            partial(
-                self.zen_store.list_triggers,
+            lambda page, size: self.zen_store.list_triggers(
                 trigger_filter_model=TriggerFilter(
-                    event_source_id=event_source.id, is_active=True
+                    event_source_id=event_source.id,
+                    is_active=True,
+                    page=page,
+                    size=size,
                 ),
                 hydrate=True,
             )
         )
 
-        trigger_list: List[TriggerResponse] = []
-
+        indexed_triggers: List[IndexedTrigger] = []
         for trigger in triggers:
-            # For now, the matching of trigger filters vs event is implemented
-            # in each filter class. This is not ideal and should be refactored
-            # to a more generic solution that doesn't require the plugin
-            # implementation to be imported here.
             try:
-                plugin_flavor = plugin_flavor_registry().get_flavor_class(
-                    name=event_source.flavor,
-                    _type=PluginType.EVENT_SOURCE,
-                    subtype=event_source.plugin_subtype,
+                event_filter = event_filter_config_class(
+                    **trigger.event_filter
                 )
-            except KeyError:
+            except ValueError:
                 logger.exception(
-                    f"Could not find plugin flavor for event source "
-                    f"{event_source.id} and flavor {event_source.flavor}. "
-                    f"Skipping trigger {trigger.id}."
+                    f"Invalid event filter for trigger {trigger.id}. "
+                    f"Skipping trigger."
                 )
                 continue
+            indexed_triggers.append((trigger, event_filter))
 
-            assert issubclass(plugin_flavor, BaseEventSourceFlavor)
-
-            # Get the filter class from the plugin flavor class
-            event_filter_config_class = plugin_flavor.EVENT_FILTER_CONFIG_CLASS
-            event_filter = event_filter_config_class(**trigger.event_filter)
-            if event_filter.event_matches_filter(event=event):
-                trigger_list.append(trigger)
-
-        logger.debug(
-            f"For event {event} and event source {event_source}, "
-            f"the following triggers matched: {trigger_list}"
-        )
-
-        return trigger_list
+        return indexed_triggers
 
 
 event_hub = InternalEventHub()
@@ -331,6 +331,19 @@ class AzureArtifactStore(BaseArtifactStore, AuthenticationMixin):
         """
         return self.filesystem.size(path=path)  # type: ignore[no-any-return]
 
+    def du(self, path: PathType) -> int:
+        """Get the total size of a file or directory in bytes.
+
+        The size is computed from a single recursive listing of the path.
+
+        Args:
+            path: The path to the file or directory.
+
+        Returns:
+            The total size in bytes.
+        """
+        return self.filesystem.du(path=path, total=True)  # type: ignore[no-any-return]
+
     def walk(
         self,
         top: PathType,
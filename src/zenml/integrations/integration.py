@@ -13,15 +13,31 @@
 #  permissions and limitations under the License.
 """Base and meta classes for ZenML integrations."""
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, cast
-
-import pkg_resources
-from pkg_resources import Requirement
+import sys
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    cast,
+)
+
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion
 
 from zenml.integrations.registry import integration_registry
 from zenml.logger import get_logger
 from zenml.stack.flavor import Flavor
-from zenml.utils.integration_utils import parse_requirement
+
+if sys.version_info < (3, 10):
+    from importlib_metadata import PackageNotFoundError, distribution
+else:
+    from importlib.metadata import PackageNotFoundError, distribution
 
 if TYPE_CHECKING:
     from zenml.plugins.base_plugin_flavor import BasePluginFlavor
@@ -64,67 +80,33 @@ class Integration(metaclass=IntegrationMeta):
     def check_installation(cls) -> bool:
         """Method to check whether the required packages are installed.
 
+        The result is cached in the integration installation manifest, which
+        is invalidated whenever packages are installed or removed from the
+        Python environment.
+
         Returns:
             True if all required packages are installed, False otherwise.
         """
-        for r in cls.get_requirements():
-            try:
-                # First check if the base package is installed
-                dist = pkg_resources.get_distribution(r)
-
-                # Next, check if the dependencies (including extras) are
-                # installed
-                deps: List[Requirement] = []
-
-                _, extras = parse_requirement(r)
-                if extras:
-                    extra_list = extras[1:-1].split(",")
-                    for extra in extra_list:
-                        try:
-                            requirements = dist.requires(extras=[extra])  # type: ignore[arg-type]
-                        except pkg_resources.UnknownExtra as e:
-                            logger.debug("Unknown extra: " + str(e))
-                            return False
-                        deps.extend(requirements)
-                else:
-                    deps = dist.requires()
-
-                for ri in deps:
-                    try:
-                        pkg_resources.get_distribution(ri)
-                    except pkg_resources.DistributionNotFound as e:
-                        logger.debug(
-                            f"Unable to find required dependency "
-                            f"'{e.req}' for requirement '{r}' "
-                            f"necessary for integration '{cls.NAME}'."
-                        )
-                        return False
-                    except pkg_resources.VersionConflict as e:
-                        logger.debug(
-                            f"Package version '{e.dist}' does not match "
-                            f"version '{e.req}' required by '{r}' "
-                            f"necessary for integration '{cls.NAME}'."
-                        )
-                        return False
-
-            except pkg_resources.DistributionNotFound as e:
-                logger.debug(
-                    f"Unable to find required package '{e.req}' for "
-                    f"integration {cls.NAME}."
-                )
-                return False
-            except pkg_resources.VersionConflict as e:
-                logger.debug(
-                    f"Package version '{e.dist}' does not match version "
-                    f"'{e.req}' necessary for integration {cls.NAME}."
-                )
-                return False
+        requirements = cls.get_requirements()
+        installed = integration_registry.get_cached_installation_status(
+            cls.NAME, requirements
+        )
+        if installed is not None:
+            return installed
 
-        logger.debug(
-            f"Integration {cls.NAME} is installed correctly with "
-            f"requirements {cls.get_requirements()}."
+        installed = all(
+            _check_requirement(r, integration_name=cls.NAME)
+            for r in requirements
         )
-        return True
+        integration_registry.cache_installation_status(
+            cls.NAME, requirements, installed
+        )
+        if installed:
+            logger.debug(
+                f"Integration {cls.NAME} is installed correctly with "
+                f"requirements {requirements}."
+            )
+        return installed
 
     @classmethod
     def get_requirements(cls, target_os: Optional[str] = None) -> List[str]:
@@ -159,3 +141,106 @@ class Integration(metaclass=IntegrationMeta):
             A list of new plugin flavors.
         """
         return []
+
+
+def _check_requirement(
+    requirement: str,
+    integration_name: str,
+    required_by: Optional[str] = None,
+    checked: Optional[Set[str]] = None,
+) -> bool:
+    """Checks whether a requirement and its dependencies are installed.
+
+    Args:
+        requirement: The requirement string.
+        integration_name: The name of the integration that needs the
+            requirement.
+        required_by: The requirement that depends on this requirement, if
+            any.
+        checked: Requirements that were already checked. Used to avoid
+            checking shared dependencies multiple times.
+
+    Returns:
+        True if the requirement and all its (transitive) dependencies are
+        installed in compatible versions, False otherwise.
+    """
+    checked = set() if checked is None else checked
+    context = f" required by '{required_by}'" if required_by else ""
+
+    try:
+        req = Requirement(requirement)
+    except InvalidRequirement as e:
+        logger.debug(
+            f"Invalid requirement '{requirement}'{context} for integration "
+            f"{integration_name}: {e}"
+        )
+        return False
+
+    if req.marker and not req.marker.evaluate():
+        # The requirement doesn't apply to the current environment
+        return True
+
+    try:
+        dist = distribution(req.name)
+    except PackageNotFoundError:
+        logger.debug(
+            f"Unable to find required package '{req}'{context} for "
+            f"integration {integration_name}."
+        )
+        return False
+
+    try:
+        version_matches = req.specifier.contains(
+            dist.version, prereleases=True
+        )
+    except InvalidVersion:
+        # We can't verify non-standard versions, assume they match
+        version_matches = True
+    if not version_matches:
+        logger.debug(
+            f"Package version '{req.name}=={dist.version}' does not match "
+            f"version '{req}'{context} necessary for integration "
+            f"{integration_name}."
+        )
+        return False
+
+    available_extras = {
+        canonicalize_name(extra)
+        for extra in dist.metadata.get_all("Provides-Extra") or []
+    }
+    extras = {canonicalize_name(extra) for extra in req.extras}
+    unknown_extras = extras - available_extras
+    if unknown_extras:
+        logger.debug(
+            f"Unknown extras {unknown_extras} for requirement '{req}'"
+            f"{context} necessary for integration {integration_name}."
+        )
+        return False
+
+    for dependency in dist.requires or []:
+        try:
+            dependency_req = Requirement(dependency)
+        except InvalidRequirement:
+            continue
+
+        if dependency_req.marker and not any(
+            dependency_req.marker.evaluate({"extra": extra})
+            for extra in extras | {""}
+        ):
+            continue
+
+        dependency_req.marker = None
+        dependency_key = str(dependency_req)
+        if dependency_key in checked:
+            continue
+        checked.add(dependency_key)
+
+        if not _check_requirement(
+            dependency_key,
+            integration_name=integration_name,
+            required_by=str(req),
+            checked=checked,
+        ):
+            return False
+
+    return True
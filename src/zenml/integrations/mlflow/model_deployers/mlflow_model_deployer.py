@@ -15,7 +15,6 @@
 
 import os
 import shutil
-from pathlib import Path
 from typing import ClassVar, Dict, List, Optional, Type, cast
 from uuid import UUID
 
@@ -31,8 +30,11 @@ from zenml.integrations.mlflow.services.mlflow_deployment import (
 )
 from zenml.logger import get_logger
 from zenml.model_deployers import BaseModelDeployer, BaseModelDeployerFlavor
-from zenml.services import ServiceRegistry
-from zenml.services.local.local_service import SERVICE_DAEMON_CONFIG_FILE_NAME
+from zenml.services.local.local_service_index import (
+    LocalServiceIndex,
+    is_service_running,
+    update_service_statuses,
+)
 from zenml.services.service import BaseService, ServiceConfig
 from zenml.utils.io_utils import create_dir_recursive_if_not_exists
 
@@ -306,38 +308,30 @@ class MLFlowModelDeployer(BaseModelDeployer):
             registry_model_version=registry_model_version,
         )
 
-        # find all services that match the input criteria
-        for root, _, files in os.walk(self.local_path):
-            if service_uuid and Path(root).name != str(service_uuid):
-                continue
-            for file in files:
-                if file == SERVICE_DAEMON_CONFIG_FILE_NAME:
-                    service_config_path = os.path.join(root, file)
-                    logger.debug(
-                        "Loading service daemon configuration from %s",
-                        service_config_path,
-                    )
-                    existing_service_config = None
-                    with open(service_config_path, "r") as f:
-                        existing_service_config = f.read()
-                    existing_service = (
-                        ServiceRegistry().load_service_from_json(
-                            existing_service_config
-                        )
-                    )
-                    if not isinstance(
-                        existing_service, MLFlowDeploymentService
-                    ):
-                        raise TypeError(
-                            f"Expected service type MLFlowDeploymentService but got "
-                            f"{type(existing_service)} instead"
-                        )
-                    existing_service.update_status()
-                    if self._matches_search_criteria(existing_service, config):
-                        if not running or existing_service.is_running:
-                            services.append(
-                                cast(BaseService, existing_service)
-                            )
+        # find all services that match the input criteria, using the service
+        # index to avoid loading the configuration of unrelated services
+        existing_services = LocalServiceIndex(self.local_path).load_services(
+            service_uuid=service_uuid,
+            pipeline_name=pipeline_name,
+            pipeline_step_name=pipeline_step_name,
+            model_name=model_name,
+            run_name=run_name,
+        )
+        for existing_service in existing_services:
+            if not isinstance(existing_service, MLFlowDeploymentService):
+                raise TypeError(
+                    f"Expected service type MLFlowDeploymentService but got "
+                    f"{type(existing_service)} instead"
+                )
+            if self._matches_search_criteria(existing_service, config):
+                services.append(cast(BaseService, existing_service))
+
+        # only check the status of the services that match the criteria
+        update_service_statuses(services)
+        if running:
+            services = [
+                service for service in services if is_service_running(service)
+            ]
 
         return services
 
@@ -13,7 +13,12 @@
 #  permissions and limitations under the License.
 """Implementation of a registry to track ZenML integrations."""
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Type
 
 from zenml.exceptions import IntegrationError
 from zenml.logger import get_logger
@@ -23,6 +28,33 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+INTEGRATIONS_MANIFEST_FILE_NAME = "integrations_manifest.json"
+
+
+def get_environment_fingerprint() -> str:
+    """Computes a fingerprint of the installed Python packages.
+
+    The fingerprint is based on the modification times of the
+    `site-packages` directories, which change whenever a distribution is
+    installed, upgraded or removed. This is a lot cheaper than reading the
+    metadata of all installed distributions.
+
+    Returns:
+        The fingerprint of the Python environment.
+    """
+    from zenml import __version__
+
+    entries = [sys.executable, sys.version, __version__]
+    for path in sys.path:
+        if "site-packages" not in path and "dist-packages" not in path:
+            continue
+        try:
+            entries.append(f"{path}:{os.stat(path).st_mtime_ns}")
+        except OSError:
+            continue
+
+    return hashlib.sha256("\n".join(entries).encode()).hexdigest()
+
 
 class IntegrationRegistry(object):
     """Registry to keep track of ZenML Integrations."""
@@ -30,6 +62,11 @@ class IntegrationRegistry(object):
     def __init__(self) -> None:
         """Initializing the integration registry."""
         self._integrations: Dict[str, Type["Integration"]] = {}
+        self._activated_integrations: Set[str] = set()
+        self._installation_status: Optional[Dict[str, Any]] = None
+        self._flavor_fingerprints: Dict[str, Dict[str, str]] = {}
+        self._environment_fingerprint: Optional[str] = None
+        self._manifest_modified = False
 
     @property
     def integrations(self) -> Dict[str, Type["Integration"]]:
@@ -69,15 +106,169 @@ class IntegrationRegistry(object):
         self._integrations[key] = type_
 
     def activate_integrations(self) -> None:
-        """Method to activate the integrations with are registered in the registry."""
+        """Method to activate the integrations with are registered in the registry.
+
+        Integrations that were already activated in this process are skipped.
+        """
         for name, integration in self._integrations.items():
+            if name in self._activated_integrations:
+                continue
             if integration.check_installation():
                 logger.debug(f"Activating integration `{name}`...")
                 integration.activate()
+                self._activated_integrations.add(name)
                 logger.debug(f"Integration `{name}` is activated.")
             else:
                 logger.debug(f"Integration `{name}` could not be activated.")
 
+        self.save_installation_manifest()
+
+    @staticmethod
+    def _get_manifest_path() -> str:
+        """Get the path of the integration installation manifest.
+
+        Returns:
+            The path of the integration installation manifest.
+        """
+        from zenml.utils.io_utils import get_global_config_directory
+
+        return os.path.join(
+            get_global_config_directory(), INTEGRATIONS_MANIFEST_FILE_NAME
+        )
+
+    def _get_installation_status(self) -> Dict[str, Any]:
+        """Get the cached installation status of the integrations.
+
+        The installation status is loaded from the installation manifest
+        if it was computed for the current Python environment.
+
+        Returns:
+            The installation status of the integrations, indexed by
+            integration name.
+        """
+        if self._installation_status is not None:
+            return self._installation_status
+
+        self._environment_fingerprint = get_environment_fingerprint()
+        installation_status: Dict[str, Any] = {}
+        flavor_fingerprints: Dict[str, Dict[str, str]] = {}
+        try:
+            with open(self._get_manifest_path(), "r") as f:
+                manifest = json.load(f)
+            environment = manifest.get(sys.prefix, {})
+            if environment.get("fingerprint") == self._environment_fingerprint:
+                installation_status = dict(environment["integrations"])
+                flavor_fingerprints = dict(environment.get("flavors", {}))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Unable to load integrations manifest: {e}")
+
+        self._installation_status = installation_status
+        self._flavor_fingerprints = flavor_fingerprints
+        return installation_status
+
+    def get_cached_installation_status(
+        self, integration_name: str, requirements: List[str]
+    ) -> Optional[bool]:
+        """Get the cached installation status of an integration.
+
+        Args:
+            integration_name: Name of the integration.
+            requirements: The current requirements of the integration.
+
+        Returns:
+            Whether the integration is installed, or `None` if the installation
+            status is not cached for the given requirements.
+        """
+        status = self._get_installation_status().get(integration_name)
+        if status and status.get("requirements") == requirements:
+            return bool(status.get("installed"))
+        return None
+
+    def cache_installation_status(
+        self, integration_name: str, requirements: List[str], installed: bool
+    ) -> None:
+        """Cache the installation status of an integration.
+
+        Args:
+            integration_name: Name of the integration.
+            requirements: The requirements of the integration.
+            installed: Whether the integration is installed.
+        """
+        self._get_installation_status()[integration_name] = {
+            "requirements": list(requirements),
+            "installed": installed,
+        }
+        self._manifest_modified = True
+
+    def get_cached_flavor_fingerprints(
+        self, integration_name: str
+    ) -> Optional[Dict[str, str]]:
+        """Get the cached fingerprints of the flavors of an integration.
+
+        Args:
+            integration_name: Name of the integration.
+
+        Returns:
+            The fingerprints of the flavors of the integration, indexed by
+            `<TYPE>:<NAME>` of the flavors, or `None` if they are not cached
+            for the current Python environment.
+        """
+        self._get_installation_status()
+        return self._flavor_fingerprints.get(integration_name)
+
+    def cache_flavor_fingerprints(
+        self, integration_name: str, fingerprints: Dict[str, str]
+    ) -> None:
+        """Cache the fingerprints of the flavors of an integration.
+
+        Args:
+            integration_name: Name of the integration.
+            fingerprints: The fingerprints of the flavors of the integration,
+                indexed by `<TYPE>:<NAME>` of the flavors.
+        """
+        self._get_installation_status()
+        self._flavor_fingerprints[integration_name] = dict(fingerprints)
+        self._manifest_modified = True
+
+    def save_installation_manifest(self) -> None:
+        """Persist the cached installation status of the integrations."""
+        if not self._manifest_modified:
+            return
+
+        manifest_path = self._get_manifest_path()
+        try:
+            try:
+                with open(manifest_path, "r") as f:
+                    manifest = json.load(f)
+                if not isinstance(manifest, dict):
+                    manifest = {}
+            except (OSError, ValueError):
+                manifest = {}
+
+            manifest[sys.prefix] = {
+                "fingerprint": self._environment_fingerprint,
+                "integrations": self._installation_status,
+                "flavors": self._flavor_fingerprints,
+            }
+
+            # Write to a temporary file first to not leave a corrupted
+            # manifest behind if multiple processes write concurrently
+            directory = os.path.dirname(manifest_path)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(manifest, f)
+                os.replace(tmp_path, manifest_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        except OSError as e:
+            logger.debug(f"Unable to save integrations manifest: {e}")
+            return
+
+        self._manifest_modified = False
+
     @property
     def list_integration_names(self) -> List[str]:
         """Get a list of all possible integrations.
@@ -137,12 +328,17 @@ class IntegrationRegistry(object):
             KeyError: If the integration is not found.
         """
         if integration_name in self.list_integration_names:
-            return self._integrations[integration_name].check_installation()
+            installed = self._integrations[
+                integration_name
+            ].check_installation()
+            self.save_installation_manifest()
+            return installed
         elif not integration_name:
             all_installed = [
                 self._integrations[item].check_installation()
                 for item in self.list_integration_names
             ]
+            self.save_installation_manifest()
             return all(all_installed)
         else:
             raise KeyError(
@@ -157,11 +353,13 @@ class IntegrationRegistry(object):
         Returns:
             List of installed integrations.
         """
-        return [
+        installed_integrations = [
             name
             for name, integration in integration_registry.integrations.items()
             if integration.check_installation()
         ]
+        self.save_installation_manifest()
+        return installed_integrations
 
 
 integration_registry = IntegrationRegistry()
@@ -248,6 +248,11 @@ def size(path: "PathType") -> Optional[int]:
     """
     file_system = _get_filesystem(path)
 
+    # Prefer the `du` method which computes the size of directories without
+    # listing every subdirectory separately.
+    if file_system.du != BaseFilesystem.du:
+        return file_system.du(path)
+
     # If the file system does not implement the `size` method, return `None`.
     if file_system.size == BaseFilesystem.size:
         logger.warning(
@@ -213,6 +213,25 @@ class BaseFilesystem(ABC):
         """
         return -1
 
+    @staticmethod
+    def du(path: PathType) -> int:
+        """Get the total size of a file or directory in bytes.
+
+        For directories, this includes the size of all files in the directory
+        and its subdirectories. Filesystems should implement this using as few
+        requests as possible, e.g. with a single recursive listing.
+
+        To be implemented by subclasses but not abstract for backwards
+        compatibility.
+
+        Args:
+            path: The path to the file or directory.
+
+        Returns:
+            The total size in bytes.
+        """
+        return -1
+
     @staticmethod
     @abstractmethod
     def walk(
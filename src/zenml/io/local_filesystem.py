@@ -219,6 +219,29 @@ class LocalFilesystem(BaseFilesystem):
         """
         return os.path.getsize(path)
 
+    @staticmethod
+    def du(path: PathType) -> int:
+        """Get the total size of a file or directory in bytes.
+
+        Args:
+            path: The path to the file or directory.
+
+        Returns:
+            The total size in bytes or 0 if the path does not exist.
+        """
+        path = os.fsdecode(path)
+        if not os.path.exists(path):
+            return 0
+
+        if not os.path.isdir(path):
+            return os.path.getsize(path)
+
+        return sum(
+            os.path.getsize(os.path.join(directory, file))
+            for directory, _, files in os.walk(path)
+            for file in files
+        )
+
     @staticmethod
     def walk(
         top: PathType,
@@ -18,6 +18,9 @@ are most often used to handle the input or output of ZenML steps, and can be
 extended by building on the `BaseMaterializer` class.
 """
 
+import importlib
+from typing import Any
+
 from zenml.materializers.built_in_materializer import (
     BuiltInContainerMaterializer,
     BuiltInMaterializer,
@@ -29,11 +32,45 @@ from zenml.materializers.cloudpickle_materializer import (
 from zenml.materializers.structured_string_materializer import (
     StructuredStringMaterializer,
 )
-from zenml.materializers.numpy_materializer import NumpyMaterializer
-from zenml.materializers.pandas_materializer import PandasMaterializer
+from zenml.materializers.materializer_registry import materializer_registry
 from zenml.materializers.pydantic_materializer import PydanticMaterializer
 from zenml.materializers.service_materializer import ServiceMaterializer
 
+# The materializers for third-party types are only imported when they're
+# first needed to avoid importing e.g. `pandas` when loading ZenML.
+_LAZY_MATERIALIZERS = {
+    "NumpyMaterializer": "zenml.materializers.numpy_materializer",
+    "PandasMaterializer": "zenml.materializers.pandas_materializer",
+}
+materializer_registry.register_lazy_materializer_type(
+    "numpy.ndarray", _LAZY_MATERIALIZERS["NumpyMaterializer"]
+)
+materializer_registry.register_lazy_materializer_type(
+    "pandas.core.frame.DataFrame", _LAZY_MATERIALIZERS["PandasMaterializer"]
+)
+materializer_registry.register_lazy_materializer_type(
+    "pandas.core.series.Series", _LAZY_MATERIALIZERS["PandasMaterializer"]
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import the materializers for third-party types.
+
+    Args:
+        name: The name of the attribute.
+
+    Returns:
+        The materializer class.
+
+    Raises:
+        AttributeError: If the attribute doesn't exist.
+    """
+    if name in _LAZY_MATERIALIZERS:
+        module = importlib.import_module(_LAZY_MATERIALIZERS[name])
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "BuiltInContainerMaterializer",
     "BuiltInMaterializer",
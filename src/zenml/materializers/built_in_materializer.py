@@ -202,6 +202,9 @@ def find_type_by_str(type_str: str) -> Type[Any]:
     Returns:
         The type whose string representation is `type_str`.
     """
+    if type_str.startswith("<class '") and type_str.endswith("'>"):
+        materializer_registry.load_lazy_materializer_type(type_str[8:-2])
+
     registered_types = materializer_registry.materializer_types.keys()
     type_str_mapping = {str(type_): type_ for type_ in registered_types}
     if type_str in type_str_mapping:
@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Implementation of a default materializer registry."""
 
+import importlib
 from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
 from zenml.logger import get_logger
@@ -30,6 +31,66 @@ class MaterializerRegistry:
         """Initialize the materializer registry."""
         self.default_materializer: Optional[Type["BaseMaterializer"]] = None
         self.materializer_types: Dict[Type[Any], Type["BaseMaterializer"]] = {}
+        self.lazy_materializer_types: Dict[str, str] = {}
+
+    @staticmethod
+    def _get_type_name(type_: Type[Any]) -> str:
+        """Get the fully qualified name of a type.
+
+        Args:
+            type_: The type.
+
+        Returns:
+            The fully qualified name of the type.
+        """
+        return f"{type_.__module__}.{type_.__qualname__}"
+
+    def register_lazy_materializer_type(
+        self, type_name: str, materializer_module: str
+    ) -> None:
+        """Registers a materializer for a type without importing either.
+
+        The materializer module is only imported the first time a materializer
+        is requested for a type with the given name (or a subclass of it).
+        Importing the module registers the materializer as usual.
+
+        Args:
+            type_name: The fully qualified name of the type, e.g.
+                `pandas.core.frame.DataFrame`.
+            materializer_module: The module in which the materializer for the
+                type is defined.
+        """
+        self.lazy_materializer_types[type_name] = materializer_module
+
+    def _load_lazy_materializers(self, key: Type[Any]) -> None:
+        """Imports the lazily registered materializers for a type.
+
+        Args:
+            key: Indicates the type of object.
+        """
+        if not self.lazy_materializer_types:
+            return
+
+        for class_ in getattr(key, "__mro__", ()):
+            materializer_module = self.lazy_materializer_types.pop(
+                self._get_type_name(class_), None
+            )
+            if materializer_module:
+                logger.debug(
+                    f"Importing module {materializer_module} to load the "
+                    f"materializer for {class_}."
+                )
+                importlib.import_module(materializer_module)
+
+    def load_lazy_materializer_type(self, type_name: str) -> None:
+        """Imports the lazily registered materializer for a type name.
+
+        Args:
+            type_name: The fully qualified name of the type.
+        """
+        materializer_module = self.lazy_materializer_types.pop(type_name, None)
+        if materializer_module:
+            importlib.import_module(materializer_module)
 
     def register_materializer_type(
         self, key: Type[Any], type_: Type["BaseMaterializer"]
@@ -40,6 +101,10 @@ class MaterializerRegistry:
             key: Indicates the type of object.
             type_: A BaseMaterializer subclass.
         """
+        # Lazily registered materializers take precedence, just like they
+        # would if they had been imported eagerly.
+        self._load_lazy_materializers(key)
+
         if key not in self.materializer_types:
             self.materializer_types[key] = type_
             logger.debug(f"Registered materializer {type_} for {key}")
@@ -71,6 +136,8 @@ class MaterializerRegistry:
         Returns:
             `BaseMaterializer` subclass that was registered for this key.
         """
+        self._load_lazy_materializers(key)
+
         for class_ in key.__mro__:
             materializer = self.materializer_types.get(class_, None)
             if materializer:
@@ -112,6 +179,7 @@ class MaterializerRegistry:
             True if a materializer is registered for the given type, False
             otherwise.
         """
+        self._load_lazy_materializers(key)
         return any(issubclass(key, type_) for type_ in self.materializer_types)
 
 
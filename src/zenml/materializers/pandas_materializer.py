@@ -14,11 +14,14 @@
 """Materializer for Pandas."""
 
 import os
-from typing import Any, ClassVar, Dict, Tuple, Type, Union
+import warnings
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type, Union
 
+import numpy as np
 import pandas as pd
 
 from zenml.client import Client
+from zenml.constants import PANDAS_STATISTICS_SAMPLE_SIZE
 from zenml.enums import ArtifactType, VisualizationType
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
@@ -31,6 +34,184 @@ COMPRESSION_TYPE = "gzip"
 
 CSV_FILENAME = "df.csv"
 
+METADATA_STATISTICS = ["mean", "std", "min", "max"]
+DESCRIBE_QUANTILES = [0.25, 0.5, 0.75]
+
+# Approximate number of bytes of float values aggregated at once when
+# computing statistics, so that each chunk stays in the CPU cache.
+STATISTICS_CHUNK_BYTES = 1 << 20
+STATISTICS_MIN_CHUNK_ROWS = 1024
+# Number of rows kept by the quantile sketch. Quantiles of objects with more
+# rows than this are approximate.
+QUANTILE_SKETCH_SIZE = 10_000
+
+
+class _QuantileSketch:
+    """Streaming quantile sketch based on a uniform sample of rows.
+
+    Every row gets a random key and the sketch keeps the rows with the
+    `size` smallest keys, which is a uniform sample of all rows seen so far.
+    """
+
+    def __init__(self, size: int, num_columns: int) -> None:
+        """Initializes the sketch.
+
+        Args:
+            size: Maximum number of rows to keep.
+            num_columns: Number of columns of the aggregated values.
+        """
+        self.size = size
+        self.num_rows = 0
+        self._random = np.random.default_rng(seed=0)
+        self._keys = np.empty(0)
+        self._values = np.empty((0, num_columns))
+
+    @property
+    def is_exact(self) -> bool:
+        """Whether the sketch contains all rows it has seen.
+
+        Returns:
+            True if the quantiles of the sketch are exact.
+        """
+        return self.num_rows <= self.size
+
+    def update(self, values: "np.ndarray[Any, Any]") -> None:
+        """Adds a chunk of rows to the sketch.
+
+        Args:
+            values: 2D array of float values.
+        """
+        self.num_rows += len(values)
+        keys = self._random.random(len(values))
+        if len(self._keys) >= self.size:
+            # Only rows with a smaller key than the current largest key can
+            # end up in the sample
+            selected = keys < self._keys.max()
+            keys, values = keys[selected], values[selected]
+
+        keys = np.concatenate([self._keys, keys])
+        values = np.concatenate([self._values, values])
+        if len(keys) > self.size:
+            kept = np.argpartition(keys, self.size - 1)[: self.size]
+            keys, values = keys[kept], values[kept]
+
+        self._keys, self._values = keys, values
+
+    def quantiles(self, q: List[float]) -> "np.ndarray[Any, Any]":
+        """Computes the quantiles of all columns.
+
+        Args:
+            q: The quantiles to compute.
+
+        Returns:
+            2D array with one row per quantile and one column per column of
+            the aggregated values.
+        """
+        if not len(self._values):
+            return np.full((len(q), self._values.shape[1]), np.nan)
+
+        with warnings.catch_warnings():
+            # Columns without any values have NaN quantiles
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            quantiles: "np.ndarray[Any, Any]" = np.nanquantile(
+                self._values, q, axis=0
+            )
+
+        return quantiles.reshape(len(q), self._values.shape[1])
+
+
+def _aggregate_statistics(
+    frame: pd.DataFrame, with_quantiles: bool
+) -> Tuple[pd.DataFrame, bool]:
+    """Computes descriptive statistics of numeric columns in a single pass.
+
+    The rows are aggregated in chunks that fit in the CPU cache. The count,
+    sum of the values and the sum of squared deviations of each chunk are
+    merged with the running totals, so the values are read from memory once.
+
+    Args:
+        frame: Dataframe with only numeric or boolean columns.
+        with_quantiles: Whether to compute the quantiles of `describe()`.
+
+    Returns:
+        A dataframe with the same rows as `describe()` and one column per
+        column of the input, and whether the quantiles are approximate.
+    """
+    num_columns = len(frame.columns)
+    count = np.zeros(num_columns)
+    mean = np.zeros(num_columns)
+    squared_deviations = np.zeros(num_columns)
+    minimum = np.full(num_columns, np.nan)
+    maximum = np.full(num_columns, np.nan)
+    sketch = (
+        _QuantileSketch(QUANTILE_SKETCH_SIZE, num_columns)
+        if with_quantiles
+        else None
+    )
+
+    chunk_rows = max(
+        STATISTICS_MIN_CHUNK_ROWS,
+        STATISTICS_CHUNK_BYTES // (8 * max(num_columns, 1)),
+    )
+    with np.errstate(invalid="ignore", divide="ignore"):
+        num_rows = len(frame) if num_columns else 0
+        for start in range(0, num_rows, chunk_rows):
+            values = frame.iloc[start : start + chunk_rows].to_numpy(
+                dtype="float64", na_value=np.nan
+            )
+            is_nan = np.isnan(values)
+            chunk_count = (~is_nan).sum(axis=0)
+            chunk_mean = np.where(is_nan, 0.0, values).sum(axis=0) / np.where(
+                chunk_count > 0, chunk_count, 1
+            )
+            chunk_squared_deviations = np.where(
+                is_nan, 0.0, values - chunk_mean
+            )
+            chunk_squared_deviations = (chunk_squared_deviations**2).sum(
+                axis=0
+            )
+
+            # Merge the chunk with the running totals (Chan et al.)
+            total_count = count + chunk_count
+            delta = chunk_mean - mean
+            weight = np.where(
+                total_count > 0, chunk_count / np.maximum(total_count, 1), 0.0
+            )
+            mean = mean + delta * weight
+            squared_deviations = (
+                squared_deviations
+                + chunk_squared_deviations
+                + delta**2 * count * weight
+            )
+            count = total_count
+            minimum = np.fmin(minimum, np.fmin.reduce(values, axis=0))
+            maximum = np.fmax(maximum, np.fmax.reduce(values, axis=0))
+            if sketch is not None:
+                sketch.update(values)
+
+        statistics = {
+            "count": count,
+            "mean": np.where(count > 0, mean, np.nan),
+            "std": np.where(
+                count > 1, np.sqrt(squared_deviations / (count - 1)), np.nan
+            ),
+            "min": minimum,
+        }
+
+    approximate = False
+    if sketch is not None:
+        for quantile, values in zip(
+            DESCRIBE_QUANTILES, sketch.quantiles(DESCRIBE_QUANTILES)
+        ):
+            statistics[f"{quantile:.0%}"] = values
+        approximate = not sketch.is_exact
+    statistics["max"] = maximum
+
+    description = pd.DataFrame.from_dict(
+        statistics, orient="index", columns=frame.columns
+    )
+    return description, approximate
+
 
 class PandasMaterializer(BaseMaterializer):
     """Materializer to read data to and from pandas."""
@@ -48,6 +229,9 @@ class PandasMaterializer(BaseMaterializer):
             uri: The URI where the artifact data is stored.
         """
         super().__init__(uri)
+        self._statistics: Optional[
+            Tuple[Union[pd.DataFrame, pd.Series], bool, pd.DataFrame, bool]
+        ] = None
         try:
             import pyarrow  # type: ignore # noqa
 
@@ -149,7 +333,7 @@ class PandasMaterializer(BaseMaterializer):
         describe_uri = os.path.join(self.uri, "describe.csv")
         describe_uri = describe_uri.replace("\\", "/")
         with artifact_store.open(describe_uri, mode="wb") as f:
-            df.describe().to_csv(f)
+            self._describe(df).to_csv(f)
         return {describe_uri: VisualizationType.CSV}
 
     def extract_metadata(
@@ -164,27 +348,150 @@ class PandasMaterializer(BaseMaterializer):
             The extracted metadata as a dictionary.
         """
         pandas_metadata: Dict[str, "MetadataType"] = {"shape": df.shape}
+        statistics = self._get_statistics(df, with_quantiles=False)[0]
 
         if isinstance(df, pd.Series):
             pandas_metadata["dtype"] = DType(df.dtype.type)
-            pandas_metadata["mean"] = float(df.mean().item())
-            pandas_metadata["std"] = float(df.std().item())
-            pandas_metadata["min"] = float(df.min().item())
-            pandas_metadata["max"] = float(df.max().item())
+            if len(statistics.columns):
+                for stat_name in METADATA_STATISTICS:
+                    pandas_metadata[stat_name] = float(
+                        statistics.loc[stat_name].iloc[0]
+                    )
 
         else:
             pandas_metadata["dtype"] = {
                 str(key): DType(value.type) for key, value in df.dtypes.items()
             }
-            for stat_name, stat in {
-                "mean": df.mean,
-                "std": df.std,
-                "min": df.min,
-                "max": df.max,
-            }.items():
+            for stat_name in METADATA_STATISTICS:
                 pandas_metadata[stat_name] = {
                     str(key): float(value)
-                    for key, value in stat(numeric_only=True).to_dict().items()
+                    for key, value in statistics.loc[stat_name].items()
                 }
 
+        if self._is_sampled(df):
+            pandas_metadata["statistics_sample_size"] = (
+                PANDAS_STATISTICS_SAMPLE_SIZE
+            )
+
         return pandas_metadata
+
+    @staticmethod
+    def _is_sampled(df: Union[pd.DataFrame, pd.Series]) -> bool:
+        """Checks whether the statistics of an object are computed on a sample.
+
+        Args:
+            df: The pandas dataframe or series.
+
+        Returns:
+            True if the object has more than `PANDAS_STATISTICS_SAMPLE_SIZE`
+            rows and sampling is enabled.
+        """
+        return 0 < PANDAS_STATISTICS_SAMPLE_SIZE < len(df)
+
+    def _sample(
+        self, df: Union[pd.DataFrame, pd.Series]
+    ) -> Union[pd.DataFrame, pd.Series]:
+        """Samples the rows used to compute statistics of large objects.
+
+        Args:
+            df: The pandas dataframe or series to sample.
+
+        Returns:
+            A deterministic random sample of at most
+            `PANDAS_STATISTICS_SAMPLE_SIZE` rows, or the input if it is
+            smaller than that or sampling is disabled.
+        """
+        if self._is_sampled(df):
+            logger.debug(
+                "Computing approximate statistics for %s with %d rows from a "
+                "sample of %d rows.",
+                type(df).__name__,
+                len(df),
+                PANDAS_STATISTICS_SAMPLE_SIZE,
+            )
+            return df.sample(n=PANDAS_STATISTICS_SAMPLE_SIZE, random_state=0)
+
+        return df
+
+    def _get_statistics(
+        self, df: Union[pd.DataFrame, pd.Series], with_quantiles: bool
+    ) -> Tuple[pd.DataFrame, bool]:
+        """Gets the descriptive statistics of all numeric columns.
+
+        The statistics are computed once per object and shared between the
+        visualizations and the metadata. Quantiles are only computed if they
+        are requested.
+
+        Args:
+            df: The pandas dataframe or series.
+            with_quantiles: Whether the quantiles are required.
+
+        Returns:
+            A dataframe with the rows of `describe()` and one column per
+            numeric or boolean column of the (sampled) input, and whether the
+            quantiles are approximate.
+        """
+        if (
+            self._statistics is None
+            or self._statistics[0] is not df
+            or (with_quantiles and not self._statistics[1])
+        ):
+            sample = self._sample(df)
+            frame = (
+                sample.to_frame() if isinstance(sample, pd.Series) else sample
+            )
+            numeric_columns = [
+                column
+                for column, dtype in frame.dtypes.items()
+                if pd.api.types.is_numeric_dtype(dtype)
+            ]
+            description, approximate = _aggregate_statistics(
+                frame[numeric_columns], with_quantiles=with_quantiles
+            )
+            self._statistics = (df, with_quantiles, description, approximate)
+
+        return self._statistics[2], self._statistics[3]
+
+    def _describe(
+        self, df: Union[pd.DataFrame, pd.Series]
+    ) -> Union[pd.DataFrame, pd.Series]:
+        """Computes the output of `describe()` for a dataframe or series.
+
+        Numeric columns are described from the shared statistics. Objects
+        without numeric columns or with datetime columns are described by
+        pandas.
+
+        Args:
+            df: The pandas dataframe or series to describe.
+
+        Returns:
+            The description of the (sampled) dataframe or series. Approximate
+            quantiles are marked in the row labels.
+        """
+        frame = df.to_frame() if isinstance(df, pd.Series) else df
+        described_columns = [
+            column
+            for column, dtype in frame.dtypes.items()
+            if pd.api.types.is_numeric_dtype(dtype)
+            and not pd.api.types.is_bool_dtype(dtype)
+        ]
+        if not described_columns or any(
+            pd.api.types.is_datetime64_any_dtype(dtype)
+            for dtype in frame.dtypes
+        ):
+            return self._sample(df).describe()
+
+        statistics, approximate = self._get_statistics(df, with_quantiles=True)
+        description = statistics[described_columns]
+        if approximate:
+            description = description.rename(
+                index={
+                    f"{quantile:.0%}": f"{quantile:.0%} (approx.)"
+                    for quantile in DESCRIBE_QUANTILES
+                }
+            )
+
+        if isinstance(df, pd.Series):
+            return description.iloc[:, 0].rename(df.name)
+
+        return description
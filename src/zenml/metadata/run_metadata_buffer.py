@@ -0,0 +1,161 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Buffer to create run metadata for many resources with a single request."""
+
+import json
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from zenml.constants import TEXT_FIELD_MAX_LENGTH
+from zenml.enums import MetadataResourceTypes
+from zenml.logger import get_logger
+from zenml.metadata.metadata_types import (
+    MetadataType,
+    MetadataTypeEnum,
+    get_metadata_type,
+)
+
+if TYPE_CHECKING:
+    from zenml.models import RunMetadataResponse
+
+logger = get_logger(__name__)
+
+
+def validate_run_metadata(
+    metadata: Dict[str, MetadataType],
+) -> Tuple[Dict[str, MetadataType], Dict[str, MetadataTypeEnum]]:
+    """Filters out metadata values that can't be stored.
+
+    Values that are too large to be stored in the database or that are not
+    of a supported type are skipped with a warning.
+
+    Args:
+        metadata: The metadata as a dictionary of key-value pairs.
+
+    Returns:
+        The metadata values that can be stored and their types.
+    """
+    values: Dict[str, MetadataType] = {}
+    types: Dict[str, MetadataTypeEnum] = {}
+    for key, value in metadata.items():
+        # Skip metadata that is too large to be stored in the database.
+        if len(json.dumps(value)) > TEXT_FIELD_MAX_LENGTH:
+            logger.warning(
+                f"Metadata value for key '{key}' is too large to be "
+                "stored in the database. Skipping."
+            )
+            continue
+        # Skip metadata that is not of a supported type.
+        try:
+            metadata_type = get_metadata_type(value)
+        except ValueError as e:
+            logger.warning(
+                f"Metadata value for key '{key}' is not of a supported "
+                f"type. Skipping. Full error: {e}"
+            )
+            continue
+        values[key] = value
+        types[key] = metadata_type
+
+    return values, types
+
+
+class RunMetadataBuffer:
+    """Collects run metadata to create it with a single request.
+
+    Metadata added to the buffer is only stored once the buffer is flushed.
+    Metadata logged for the same resource and stack component is merged, with
+    later values overriding earlier values of the same key.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the buffer."""
+        self._entries: Dict[
+            Tuple[UUID, MetadataResourceTypes, Optional[UUID]],
+            Dict[str, MetadataType],
+        ] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of buffered metadata values.
+
+        Returns:
+            The number of buffered metadata values.
+        """
+        return sum(len(metadata) for metadata in self._entries.values())
+
+    def add(
+        self,
+        metadata: Dict[str, MetadataType],
+        resource_id: UUID,
+        resource_type: MetadataResourceTypes,
+        stack_component_id: Optional[UUID] = None,
+    ) -> None:
+        """Adds metadata to the buffer.
+
+        Args:
+            metadata: The metadata as a dictionary of key-value pairs.
+            resource_id: The ID of the resource for which the metadata was
+                produced.
+            resource_type: The type of the resource for which the metadata
+                was produced.
+            stack_component_id: The ID of the stack component that produced
+                the metadata.
+        """
+        key = (resource_id, resource_type, stack_component_id)
+        with self._lock:
+            self._entries.setdefault(key, {}).update(metadata)
+
+    def flush(self) -> List["RunMetadataResponse"]:
+        """Creates all buffered metadata and empties the buffer.
+
+        Returns:
+            The created metadata.
+        """
+        from zenml.client import Client
+        from zenml.models import RunMetadataRequest
+
+        with self._lock:
+            entries = self._entries
+            self._entries = {}
+
+        if not entries:
+            return []
+
+        client = Client()
+        requests = []
+        for (
+            resource_id,
+            resource_type,
+            stack_component_id,
+        ), metadata in entries.items():
+            values, types = validate_run_metadata(metadata)
+            if not values:
+                continue
+            requests.append(
+                RunMetadataRequest(
+                    workspace=client.active_workspace.id,
+                    user=client.active_user.id,
+                    resource_id=resource_id,
+                    resource_type=resource_type,
+                    stack_component_id=stack_component_id,
+                    values=values,
+                    types=types,
+                )
+            )
+
+        if not requests:
+            return []
+        return client.zen_store.create_run_metadata_batch(requests)
@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """Utility functions for linking step outputs to model versions."""
 
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 from uuid import UUID
 
 from zenml.artifacts.artifact_config import ArtifactConfig
@@ -53,6 +53,7 @@ def link_step_artifacts_to_model(
         model = None
         logger.debug("No model context found, unable to auto-link artifacts.")
 
+    artifact_configs: Dict[UUID, ArtifactConfig] = {}
     for artifact_name, artifact_version_id in artifact_version_ids.items():
         artifact_config = step_context._get_output(
             artifact_name
@@ -67,11 +68,11 @@ def link_step_artifacts_to_model(
             )
 
         if artifact_config:
-            link_artifact_config_to_model(
-                artifact_config=artifact_config,
-                artifact_version_id=artifact_version_id,
-                model=model,
-            )
+            artifact_configs[artifact_version_id] = artifact_config
+
+    link_artifact_configs_to_model(
+        artifact_configs=artifact_configs, model=model
+    )
 
 
 def link_artifact_config_to_model(
@@ -86,30 +87,55 @@ def link_artifact_config_to_model(
         artifact_version_id: The ID of the artifact to link.
         model: The model version from the step or pipeline context.
     """
-    client = Client()
+    link_artifact_configs_to_model(
+        artifact_configs={artifact_version_id: artifact_config}, model=model
+    )
 
-    # If the artifact config specifies a model itself then always use that
-    if artifact_config.model_name is not None:
-        from zenml.model.model import Model
 
-        model = Model(
-            name=artifact_config.model_name,
-            version=artifact_config.model_version,
-        )
+def link_artifact_configs_to_model(
+    artifact_configs: Dict[UUID, ArtifactConfig],
+    model: Optional["Model"] = None,
+) -> None:
+    """Link multiple artifact configs to their model versions.
 
-    if model:
-        model._get_or_create_model_version()
-        model_version_response = model._get_model_version()
-        request = ModelVersionArtifactRequest(
-            user=client.active_user.id,
-            workspace=client.active_workspace.id,
-            artifact_version=artifact_version_id,
-            model=model_version_response.model.id,
-            model_version=model_version_response.id,
-            is_model_artifact=artifact_config.is_model_artifact,
-            is_deployment_artifact=artifact_config.is_deployment_artifact,
-        )
-        client.zen_store.create_model_version_artifact_link(request)
+    All links are created with a single call to the ZenML store.
+
+    Args:
+        artifact_configs: The artifact configs to link, keyed by the ID of
+            the artifact version to link.
+        model: The model version from the step or pipeline context.
+    """
+    if not artifact_configs:
+        return
+
+    client = Client()
+    requests: List[ModelVersionArtifactRequest] = []
+    for artifact_version_id, artifact_config in artifact_configs.items():
+        artifact_model = model
+        # If the artifact config specifies a model itself then always use that
+        if artifact_config.model_name is not None:
+            artifact_model = Model(
+                name=artifact_config.model_name,
+                version=artifact_config.model_version,
+            )
+
+        if artifact_model:
+            artifact_model._get_or_create_model_version()
+            model_version_response = artifact_model._get_model_version()
+            requests.append(
+                ModelVersionArtifactRequest(
+                    user=client.active_user.id,
+                    workspace=client.active_workspace.id,
+                    artifact_version=artifact_version_id,
+                    model=model_version_response.model.id,
+                    model_version=model_version_response.id,
+                    is_model_artifact=artifact_config.is_model_artifact,
+                    is_deployment_artifact=artifact_config.is_deployment_artifact,
+                )
+            )
+
+    if requests:
+        client.zen_store.create_model_version_artifact_links(requests)
 
 
 def log_model_version_metadata(
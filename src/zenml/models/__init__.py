@@ -24,7 +24,7 @@ from zenml.models.v2.base.base import (
     BaseResponseBody,
     BaseResponseMetadata,
     BaseResponseResources,
-    BaseDatedResponseBody
+    BaseDatedResponseBody,
 )
 from zenml.models.v2.base.scoped import (
     UserScopedRequest,
@@ -37,7 +37,7 @@ from zenml.models.v2.base.scoped import (
     WorkspaceScopedResponse,
     WorkspaceScopedResponseBody,
     WorkspaceScopedResponseMetadata,
-    WorkspaceScopedTaggableFilter
+    WorkspaceScopedTaggableFilter,
 )
 from zenml.models.v2.base.filter import (
     BaseFilter,
@@ -159,12 +159,14 @@ from zenml.models.v2.core.model_version import (
     ModelVersionUpdate,
 )
 from zenml.models.v2.core.model_version_artifact import (
+    ModelVersionArtifactBatchRequest,
     ModelVersionArtifactFilter,
     ModelVersionArtifactRequest,
     ModelVersionArtifactResponse,
     ModelVersionArtifactResponseBody,
 )
 from zenml.models.v2.core.model_version_pipeline_run import (
+    ModelVersionPipelineRunBatchRequest,
     ModelVersionPipelineRunFilter,
     ModelVersionPipelineRunRequest,
     ModelVersionPipelineRunResponse,
@@ -210,6 +212,7 @@ from zenml.models.v2.core.pipeline_run import (
 from zenml.models.v2.base.base_plugin_flavor import BasePluginFlavorResponse
 from zenml.models.v2.core.run_metadata import (
     RunMetadataRequest,
+    RunMetadataBatchRequest,
     RunMetadataFilter,
     RunMetadataResponse,
     RunMetadataResponseBody,
@@ -258,10 +261,13 @@ from zenml.models.v2.core.stack import (
 from zenml.models.v2.core.step_run import (
     StepRunRequest,
     StepRunUpdate,
+    StepRunBatchRequest,
+    StepRunBatchUpdate,
     StepRunFilter,
     StepRunResponse,
     StepRunResponseBody,
     StepRunResponseMetadata,
+    StepRunOutputs,
 )
 from zenml.models.v2.core.tag import (
     TagFilter,
@@ -309,7 +315,7 @@ from zenml.models.v2.core.trigger import (
     TriggerResponse,
     TriggerResponseBody,
     TriggerResponseMetadata,
-    TriggerResponseResources
+    TriggerResponseResources,
 )
 from zenml.models.v2.core.trigger_execution import (
     TriggerExecutionRequest,
@@ -317,7 +323,7 @@ from zenml.models.v2.core.trigger_execution import (
     TriggerExecutionResponse,
     TriggerExecutionResponseBody,
     TriggerExecutionResponseMetadata,
-    TriggerExecutionResponseResources
+    TriggerExecutionResponseResources,
 )
 from zenml.models.v2.core.event_source import (
     EventSourceRequest,
@@ -326,7 +332,7 @@ from zenml.models.v2.core.event_source import (
     EventSourceResponse,
     EventSourceResponseBody,
     EventSourceResponseMetadata,
-    EventSourceResponseResources
+    EventSourceResponseResources,
 )
 from zenml.models.v2.misc.user_auth import UserAuthModel
 from zenml.models.v2.misc.build_item import BuildItem
@@ -516,6 +522,9 @@ StepRunResponseBody.update_forward_refs(
     UserResponse=UserResponse,
     ArtifactVersionResponse=ArtifactVersionResponse,
 )
+StepRunOutputs.update_forward_refs(
+    ArtifactVersionResponse=ArtifactVersionResponse,
+)
 StepRunResponseMetadata.update_forward_refs(
     WorkspaceResponse=WorkspaceResponse,
     LogsResponse=LogsResponse,
@@ -640,10 +649,12 @@ __all__ = [
     "ModelVersionResponseBody",
     "ModelVersionResponseMetadata",
     "ModelVersionUpdate",
+    "ModelVersionArtifactBatchRequest",
     "ModelVersionArtifactFilter",
     "ModelVersionArtifactRequest",
     "ModelVersionArtifactResponse",
     "ModelVersionArtifactResponseBody",
+    "ModelVersionPipelineRunBatchRequest",
     "ModelVersionPipelineRunFilter",
     "ModelVersionPipelineRunRequest",
     "ModelVersionPipelineRunResponse",
@@ -685,6 +696,7 @@ __all__ = [
     "PipelineRunResponseBody",
     "PipelineRunResponseMetadata",
     "RunMetadataRequest",
+    "RunMetadataBatchRequest",
     "RunMetadataFilter",
     "RunMetadataResponse",
     "RunMetadataResponseBody",
@@ -721,10 +733,13 @@ __all__ = [
     "StackResponseMetadata",
     "StepRunRequest",
     "StepRunUpdate",
+    "StepRunBatchRequest",
+    "StepRunBatchUpdate",
     "StepRunFilter",
     "StepRunResponse",
     "StepRunResponseBody",
     "StepRunResponseMetadata",
+    "StepRunOutputs",
     "TagFilter",
     "TagResourceResponse",
     "TagResourceResponseBody",
@@ -14,10 +14,19 @@
 """Base model definitions."""
 
 from datetime import datetime
-from typing import Any, Dict, Generic, Optional, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+)
 from uuid import UUID
 
-from pydantic import Extra, Field, SecretStr
+from pydantic import Extra, Field, PrivateAttr, SecretStr, ValidationError
 from pydantic.generics import GenericModel
 
 from zenml.analytics.models import AnalyticsTrackedModelMixin
@@ -70,9 +79,50 @@ class BaseRequest(BaseZenModel):
 # -------------------- Response Model --------------------
 
 
+def _missing_projection_field_error(name: str) -> HydrationError:
+    """Creates the error for a field that was not included in a projection.
+
+    Loading the field for each response of a projected page would send one
+    request per response, so the field has to be requested explicitly.
+
+    Args:
+        name: The name of the field.
+
+    Returns:
+        The error.
+    """
+    return HydrationError(
+        f"The field `{name}` was not included in the projection of this "
+        "response. Add it to the `fields` of the list call, or hydrate the "
+        "response, e.g. with `get_metadata()`, to load all its fields."
+    )
+
+
 class BaseResponseBody(BaseZenModel):
     """Base body model."""
 
+    _is_projection: bool = PrivateAttr(default=False)
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            """Fails for fields that were not included in a projection.
+
+            Args:
+                name: The name of the attribute.
+
+            Raises:
+                HydrationError: If the attribute is a field that was not
+                    included in a projection.
+                AttributeError: If the attribute is not a field.
+            """
+            if name in self.__fields__ and self._is_projection:
+                raise _missing_projection_field_error(name)
+
+            raise AttributeError(
+                f"`{type(self).__name__}` object has no attribute `{name}`."
+            )
+
 
 class BaseResponseMetadata(BaseZenModel):
     """Base metadata model.
@@ -96,6 +146,7 @@ class BaseResponseResources(BaseZenModel):
 AnyBody = TypeVar("AnyBody", bound=BaseResponseBody)
 AnyMetadata = TypeVar("AnyMetadata", bound=BaseResponseMetadata)
 AnyResources = TypeVar("AnyResources", bound=BaseResponseResources)
+AnyResponseType = TypeVar("AnyResponseType", bound="BaseResponse")  # type: ignore[type-arg]
 
 
 class BaseResponse(
@@ -118,6 +169,108 @@ class BaseResponse(
         ResponseUpdateStrategy.ALLOW
     )
     _warn_on_response_updates: bool = True
+    _is_projection: bool = PrivateAttr(default=False)
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            """Fails for fields that were not included in a projection.
+
+            Args:
+                name: The name of the attribute.
+
+            Raises:
+                HydrationError: If the attribute is a field that was not
+                    included in a projection.
+                AttributeError: If the attribute is not a field.
+            """
+            if name in self.__fields__ and self._is_projection:
+                raise _missing_projection_field_error(name)
+
+            raise AttributeError(
+                f"`{type(self).__name__}` object has no attribute `{name}`."
+            )
+
+    @classmethod
+    def construct_projection(
+        cls: Type[AnyResponseType], values: Dict[str, Any]
+    ) -> AnyResponseType:
+        """Create a response that only includes a subset of its fields.
+
+        The values are validated individually, but the response is created
+        without checking whether all required fields are included.
+
+        Args:
+            values: The values of the fields to include, indexed by field
+                name. These can be fields of the response itself or of its
+                body.
+
+        Returns:
+            The response that only includes the given fields.
+
+        Raises:
+            ValueError: If a value does not belong to any field of the
+                response or its body.
+            ValidationError: If a value is not valid for its field.
+        """
+        body_type = cls.__fields__["body"].type_
+        response_values: Dict[str, Any] = {}
+        body_values: Dict[str, Any] = {}
+
+        for name, value in values.items():
+            if name in cls.get_projection_fields(include_body=False):
+                model, target = cls, response_values
+            elif name in body_type.__fields__:
+                model, target = body_type, body_values
+            else:
+                raise ValueError(
+                    f"`{name}` is not a field of `{cls.__name__}` or its body."
+                )
+
+            target[name], errors = model.__fields__[name].validate(
+                value, target, loc=name, cls=model
+            )
+            if errors:
+                raise ValidationError([errors], model)
+
+        body = body_type.construct(**body_values)
+        # `construct` sets all other fields to their default values, which
+        # would hide their actual values until the response is hydrated
+        for name in set(body.__dict__) - set(body_values):
+            del body.__dict__[name]
+
+        response = cls.construct(body=body, **response_values)
+        response._is_projection = True
+        body._is_projection = True
+        return response
+
+    @classmethod
+    def get_projection_fields(cls, include_body: bool = True) -> List[str]:
+        """Get the names of the fields that can be included in a projection.
+
+        Args:
+            include_body: Whether to include the fields of the body.
+
+        Returns:
+            The names of the fields.
+        """
+        fields = [
+            name
+            for name in cls.__fields__
+            if name not in ("body", "metadata", "resources")
+        ]
+        if include_body:
+            fields.extend(cls.__fields__["body"].type_.__fields__)
+        return fields
+
+    @property
+    def is_projection(self) -> bool:
+        """Whether the response only includes a subset of its fields.
+
+        Returns:
+            Whether the response was created with `construct_projection`.
+        """
+        return self._is_projection
 
     def _validate_hydrated_version(
         self,
@@ -139,6 +292,11 @@ class BaseResponse(
                 "The hydrated model does not have a metadata field."
             )
 
+        # Fill in the fields that were not included in a projection
+        for field in self.get_projection_fields(include_body=False):
+            if field not in self.__fields_set__:
+                setattr(self, field, getattr(hydrated_model, field))
+
         # Check if the name has changed
         if "name" in self.__fields__:
             original_name = getattr(self, "name")
@@ -179,8 +337,13 @@ class BaseResponse(
 
         # Check all the fields in the body
         for field in self.get_body().__fields__:
-            original_value = getattr(self.get_body(), field)
             hydrated_value = getattr(hydrated_model.get_body(), field)
+            if field not in self.get_body().__fields_set__:
+                # The field was not included in a projection of the response
+                setattr(self.get_body(), field, hydrated_value)
+                continue
+
+            original_value = getattr(self.get_body(), field)
 
             if original_value != hydrated_value:
                 if (
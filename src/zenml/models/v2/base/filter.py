@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Base filter model definitions."""
 
+import json
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import (
@@ -179,6 +180,10 @@ class StrFilter(Filter):
 class UUIDFilter(StrFilter):
     """Filter for all uuid fields which are mostly treated like strings."""
 
+    ALLOWED_OPS: ClassVar[List[str]] = StrFilter.ALLOWED_OPS + [
+        GenericFilterOps.ONEOF,
+    ]
+
     def generate_query_conditions_from_column(self, column: Any) -> Any:
         """Generate query conditions for a UUID column.
 
@@ -195,6 +200,9 @@ class UUIDFilter(StrFilter):
         if self.operation == GenericFilterOps.EQUALS:
             return column == self.value
 
+        if self.operation == GenericFilterOps.ONEOF:
+            return column.in_(self.value)
+
         # For all other operations, cast and handle the column as string
         return super().generate_query_conditions_from_column(
             column=cast_if(column, sqlalchemy.String)
@@ -259,13 +267,14 @@ class BaseFilter(BaseModel):
         "page",
         "size",
         "logical_operator",
+        "fields",
     ]
 
     # List of fields that are not even mentioned as options in the CLI.
-    CLI_EXCLUDE_FIELDS: ClassVar[List[str]] = []
+    CLI_EXCLUDE_FIELDS: ClassVar[List[str]] = ["fields"]
 
     # List of fields that are wrapped with `fastapi.Query(default)` in API.
-    API_MULTI_INPUT_PARAMS: ClassVar[List[str]] = []
+    API_MULTI_INPUT_PARAMS: ClassVar[List[str]] = ["fields"]
 
     sort_by: str = Field(
         default="created", description="Which column to sort by."
@@ -284,6 +293,11 @@ class BaseFilter(BaseModel):
         le=PAGE_SIZE_MAXIMUM,
         description="Page size",
     )
+    fields: Optional[List[str]] = Field(
+        default=None,
+        description="Only include these fields of the resources in the "
+        "response. If not set, all fields are included.",
+    )
 
     id: Optional[Union[UUID, str]] = Field(
         default=None, description="Id for this resource"
@@ -715,6 +729,26 @@ class BaseFilter(BaseModel):
         Raises:
             ValueError: If the value is not a valid UUID.
         """
+        # For membership checks, the value is a JSON list of UUIDs.
+        if operator == GenericFilterOps.ONEOF:
+            try:
+                values = json.loads(value) if isinstance(value, str) else value
+                if not isinstance(values, (list, set, tuple)):
+                    raise ValueError(f"{values} is not a list.")
+                value = [str(UUID(str(v))) for v in values]
+            except ValueError as e:
+                raise ValueError(
+                    "Invalid value passed as UUID query parameter. The "
+                    f"`{GenericFilterOps.ONEOF}` operation requires a JSON "
+                    "list of UUIDs."
+                ) from e
+
+            return UUIDFilter(
+                operation=GenericFilterOps(operator),
+                column=column,
+                value=value,
+            )
+
         # For equality checks, ensure that the value is a valid UUID.
         if operator == GenericFilterOps.EQUALS and not isinstance(value, UUID):
             try:
@@ -16,7 +16,7 @@
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from uuid import UUID
 
-from pydantic import Field, validator
+from pydantic import BaseModel, Field, validator
 from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList
 
 from zenml.enums import GenericFilterOps
@@ -61,6 +61,14 @@ class ModelVersionArtifactRequest(WorkspaceScopedRequest):
         return is_deployment_artifact
 
 
+class ModelVersionArtifactBatchRequest(BaseModel):
+    """Request model for creating multiple model version artifact links."""
+
+    links: List[ModelVersionArtifactRequest] = Field(
+        title="The links between model versions and artifacts to create.",
+    )
+
+
 # ------------------ Update Model ------------------
 
 # There is no update model for links between model version and artifacts.
@@ -16,7 +16,7 @@
 from typing import Any, List, Optional, Union
 from uuid import UUID
 
-from pydantic import Field
+from pydantic import BaseModel, Field
 from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList
 
 from zenml.enums import GenericFilterOps
@@ -44,6 +44,14 @@ class ModelVersionPipelineRunRequest(WorkspaceScopedRequest):
     pipeline_run: UUID
 
 
+class ModelVersionPipelineRunBatchRequest(BaseModel):
+    """Request model for creating multiple model version pipeline run links."""
+
+    links: List[ModelVersionPipelineRunRequest] = Field(
+        title="The links between model versions and pipeline runs to create.",
+    )
+
+
 # ------------------ Update Model ------------------
 
 # There is no update model for links between model version and pipeline runs.
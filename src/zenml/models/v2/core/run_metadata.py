@@ -13,10 +13,10 @@
 #  permissions and limitations under the License.
 """Models representing run metadata."""
 
-from typing import TYPE_CHECKING, Dict, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 from uuid import UUID
 
-from pydantic import Field
+from pydantic import BaseModel, Field
 
 from zenml.constants import STR_FIELD_MAX_LENGTH, TEXT_FIELD_MAX_LENGTH
 from zenml.enums import MetadataResourceTypes
@@ -61,6 +61,14 @@ class RunMetadataRequest(WorkspaceScopedRequest):
         smart_union = True
 
 
+class RunMetadataBatchRequest(BaseModel):
+    """Request model for creating run metadata for many resources at once."""
+
+    run_metadata: List[RunMetadataRequest] = Field(
+        title="The run metadata to be created.",
+    )
+
+
 # ------------------ Update Model ------------------
 
 # There is no update model for run metadata.
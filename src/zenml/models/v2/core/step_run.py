@@ -137,6 +137,25 @@ class StepRunUpdate(BaseModel):
     )
 
 
+# ------------------ Batch Models ------------------
+
+
+class StepRunBatchRequest(BaseModel):
+    """Request model for creating multiple step runs at once."""
+
+    step_runs: List[StepRunRequest] = Field(
+        title="The step runs to create.",
+    )
+
+
+class StepRunBatchUpdate(BaseModel):
+    """Update model for updating multiple step runs at once."""
+
+    updates: Dict[str, StepRunUpdate] = Field(
+        title="The updates to apply, keyed by step run ID.",
+    )
+
+
 # ------------------ Response Model ------------------
 class StepRunResponseBody(WorkspaceScopedResponseBody):
     """Response body for step runs."""
@@ -436,6 +455,19 @@ class StepRunResponse(
         return self.get_metadata().run_metadata
 
 
+# ------------------ Outputs Model ------------------
+
+
+class StepRunOutputs(BaseModel):
+    """ID and (a subset of the) output artifact versions of a step run."""
+
+    id: UUID = Field(title="The ID of the step run.")
+    outputs: Dict[str, "ArtifactVersionResponse"] = Field(
+        title="The output artifact versions of the step run.",
+        default={},
+    )
+
+
 # ------------------ Filter Model ------------------
 
 
@@ -44,6 +44,7 @@ from zenml.utils import (
 )
 from zenml.utils.pipeline_docker_image_builder import (
     PipelineDockerImageBuilder,
+    requirements_cache,
 )
 
 if TYPE_CHECKING:
@@ -100,6 +101,7 @@ def _create_deployment(
     )
 
 
+@requirements_cache()
 def reuse_or_create_pipeline_build(
     deployment: "PipelineDeploymentBase",
     allow_build_reuse: bool,
@@ -220,6 +222,7 @@ def find_existing_build(
     return matches[0]
 
 
+@requirements_cache()
 def create_pipeline_build(
     deployment: "PipelineDeploymentBase",
     pipeline_id: Optional[UUID] = None,
@@ -356,6 +359,7 @@ def create_pipeline_build(
     return client.zen_store.create_build(build_request)
 
 
+@requirements_cache()
 def compute_build_checksum(
     items: List["BuildConfiguration"],
     stack: "Stack",
@@ -452,6 +456,7 @@ def verify_local_repository_context(
     return code_repository
 
 
+@requirements_cache()
 def verify_custom_build(
     build: "PipelineBuildResponse",
     deployment: "PipelineDeploymentBase",
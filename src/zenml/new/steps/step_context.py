@@ -26,6 +26,7 @@ from typing import (
 
 from zenml.exceptions import EntityExistsError, StepContextError
 from zenml.logger import get_logger
+from zenml.metadata.run_metadata_buffer import RunMetadataBuffer
 from zenml.utils.singleton import SingletonMetaClass
 
 if TYPE_CHECKING:
@@ -145,6 +146,10 @@ class StepContext(metaclass=SingletonMetaClass):
             for key in output_materializers.keys()
         }
 
+        # Run metadata logged for the step run and its outputs is only stored
+        # once the step finished, so that it can be created in one request.
+        self._run_metadata_buffer = RunMetadataBuffer()
+
     @property
     def pipeline(self) -> "PipelineResponse":
         """Returns the current pipeline.
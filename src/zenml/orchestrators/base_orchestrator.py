@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Any, Dict, Optional, Type, cast
 
 from pydantic import root_validator
 
+from zenml.artifacts.in_memory_cache import in_memory_artifact_cache
 from zenml.enums import StackComponentType
 from zenml.logger import get_logger
 from zenml.orchestrators.step_launcher import StepLauncher
@@ -27,6 +28,7 @@ from zenml.stack import Flavor, Stack, StackComponent, StackComponentConfig
 if TYPE_CHECKING:
     from zenml.config.step_configurations import Step
     from zenml.models import PipelineDeploymentResponse
+    from zenml.orchestrators.step_run_buffer import StepRunBuffer
 
 logger = get_logger(__name__)
 
@@ -180,17 +182,39 @@ class BaseOrchestrator(StackComponent, ABC):
 
         return result
 
-    def run_step(self, step: "Step") -> None:
+    @property
+    def runs_steps_in_process(self) -> bool:
+        """Whether the orchestrator runs all steps in its own process.
+
+        Steps that run in the same process can receive the values of their
+        input artifacts in memory instead of loading them from the artifact
+        store.
+
+        Returns:
+            Whether the orchestrator runs all steps in its own process.
+        """
+        return False
+
+    def run_step(
+        self,
+        step: "Step",
+        step_run_buffer: Optional["StepRunBuffer"] = None,
+    ) -> None:
         """Runs the given step.
 
         Args:
             step: The step to run.
+            step_run_buffer: Optional buffer to collect the step runs of
+                cached steps. Orchestrators that run all steps in their own
+                process can pass the same buffer for all steps of a pipeline
+                run and flush it once all steps finished.
         """
         assert self._active_deployment
         launcher = StepLauncher(
             deployment=self._active_deployment,
             step=step,
             orchestrator_run_id=self.get_orchestrator_run_id(),
+            step_run_buffer=step_run_buffer,
         )
         launcher.launch()
 
@@ -226,6 +250,8 @@ class BaseOrchestrator(StackComponent, ABC):
     def _cleanup_run(self) -> None:
         """Cleans up the active run."""
         self._active_deployment = None
+        # Don't keep the artifact values of the run alive after it finished
+        in_memory_artifact_cache.clear()
 
 
 class BaseOrchestratorFlavor(Flavor):
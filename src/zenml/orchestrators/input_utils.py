@@ -13,14 +13,12 @@
 #  permissions and limitations under the License.
 """Utilities for inputs."""
 
-import functools
 from typing import TYPE_CHECKING, Dict, List, Tuple
 from uuid import UUID
 
 from zenml.client import Client
 from zenml.config.step_configurations import Step
 from zenml.exceptions import InputResolutionError
-from zenml.utils import pagination_utils
 
 if TYPE_CHECKING:
     from zenml.models import ArtifactVersionResponse
@@ -48,15 +46,15 @@ def resolve_step_inputs(
     """
     from zenml.models import ArtifactVersionResponse, RunMetadataResponse
 
-    list_run_steps = functools.partial(
-        Client().list_run_steps, pipeline_run_id=run_id
+    step_names = {input_.step_name for input_ in step.spec.inputs.values()}
+    step_names.update(step.spec.upstream_steps)
+    output_names = {input_.output_name for input_ in step.spec.inputs.values()}
+    current_run_steps = Client().get_run_step_outputs(
+        run_id=run_id,
+        step_names=sorted(step_names),
+        output_names=sorted(output_names),
     )
 
-    current_run_steps = {
-        run_step.name: run_step
-        for run_step in pagination_utils.depaginate(list_run_steps)
-    }
-
     input_artifacts: Dict[str, "ArtifactVersionResponse"] = {}
     for name, input_ in step.spec.inputs.items():
         try:
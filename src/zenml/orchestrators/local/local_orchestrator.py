@@ -23,6 +23,7 @@ from zenml.orchestrators.base_orchestrator import (
     BaseOrchestratorConfig,
     BaseOrchestratorFlavor,
 )
+from zenml.orchestrators.step_run_buffer import StepRunBuffer
 from zenml.stack import Stack
 from zenml.utils import string_utils
 
@@ -64,6 +65,7 @@ class LocalOrchestrator(BaseOrchestrator):
 
         self._orchestrator_run_id = str(uuid4())
         start_time = time.time()
+        step_run_buffer = StepRunBuffer()
 
         # Run each step
         for step_name, step in deployment.step_configurations.items():
@@ -77,8 +79,12 @@ class LocalOrchestrator(BaseOrchestrator):
 
             self.run_step(
                 step=step,
+                step_run_buffer=step_run_buffer,
             )
 
+        # Create the step runs of the remaining cached steps
+        step_run_buffer.flush()
+
         run_duration = time.time() - start_time
         logger.info(
             "Pipeline run has finished in `%s`.",
@@ -86,6 +92,15 @@ class LocalOrchestrator(BaseOrchestrator):
         )
         self._orchestrator_run_id = None
 
+    @property
+    def runs_steps_in_process(self) -> bool:
+        """Whether the orchestrator runs all steps in its own process.
+
+        Returns:
+            Whether the orchestrator runs all steps in its own process.
+        """
+        return True
+
     def get_orchestrator_run_id(self) -> str:
         """Returns the active orchestrator run id.
 
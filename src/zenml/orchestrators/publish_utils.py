@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Dict, List
 
 from zenml.client import Client
 from zenml.enums import ExecutionStatus, MetadataResourceTypes
+from zenml.metadata.run_metadata_buffer import RunMetadataBuffer
 from zenml.models import (
     PipelineRunResponse,
     PipelineRunUpdate,
@@ -125,14 +126,15 @@ def publish_pipeline_run_metadata(
         pipeline_run_metadata: A dictionary mapping stack component IDs to the
             metadata they created.
     """
-    client = Client()
+    run_metadata_buffer = RunMetadataBuffer()
     for stack_component_id, metadata in pipeline_run_metadata.items():
-        client.create_run_metadata(
+        run_metadata_buffer.add(
             metadata=metadata,
             resource_id=pipeline_run_id,
             resource_type=MetadataResourceTypes.PIPELINE_RUN,
             stack_component_id=stack_component_id,
         )
+    run_metadata_buffer.flush()
 
 
 def publish_step_run_metadata(
@@ -146,11 +148,12 @@ def publish_step_run_metadata(
         step_run_metadata: A dictionary mapping stack component IDs to the
             metadata they created.
     """
-    client = Client()
+    run_metadata_buffer = RunMetadataBuffer()
     for stack_component_id, metadata in step_run_metadata.items():
-        client.create_run_metadata(
+        run_metadata_buffer.add(
             metadata=metadata,
             resource_id=step_run_id,
             resource_type=MetadataResourceTypes.STEP_RUN,
             stack_component_id=stack_component_id,
         )
+    run_metadata_buffer.flush()
@@ -17,6 +17,7 @@ import time
 from contextlib import nullcontext
 from datetime import datetime
 from typing import TYPE_CHECKING, Dict, Optional, Tuple
+from uuid import UUID
 
 from zenml.client import Client
 from zenml.config.step_configurations import Step
@@ -31,7 +32,7 @@ from zenml.enums import ExecutionStatus
 from zenml.environment import get_run_environment_dict
 from zenml.logger import get_logger
 from zenml.logging import step_logging
-from zenml.model.utils import link_artifact_config_to_model
+from zenml.model.utils import link_artifact_configs_to_model
 from zenml.models import (
     ArtifactVersionResponse,
     LogsRequest,
@@ -48,6 +49,7 @@ from zenml.orchestrators import (
     publish_utils,
 )
 from zenml.orchestrators import utils as orchestrator_utils
+from zenml.orchestrators.step_run_buffer import StepRunBuffer
 from zenml.orchestrators.step_runner import StepRunner
 from zenml.stack import Stack
 from zenml.utils import string_utils
@@ -114,6 +116,7 @@ class StepLauncher:
         deployment: PipelineDeploymentResponse,
         step: Step,
         orchestrator_run_id: str,
+        step_run_buffer: Optional[StepRunBuffer] = None,
     ):
         """Initializes the launcher.
 
@@ -121,6 +124,8 @@ class StepLauncher:
             deployment: The pipeline deployment.
             step: The step to launch.
             orchestrator_run_id: The orchestrator pipeline run id.
+            step_run_buffer: Optional buffer in which the step run is stored
+                instead of being created right away if the step is cached.
 
         Raises:
             RuntimeError: If the deployment has no associated stack.
@@ -128,6 +133,7 @@ class StepLauncher:
         self._deployment = deployment
         self._step = step
         self._orchestrator_run_id = orchestrator_run_id
+        self._step_run_buffer = step_run_buffer
 
         if not deployment.stack:
             raise RuntimeError(
@@ -208,6 +214,8 @@ class StepLauncher:
                     workspace=client.active_workspace.id,
                     logs=logs_model,
                 )
+                if self._depends_on_buffered_step_run():
+                    self._flush_step_run_buffer()
                 try:
                     execution_needed, step_run = self._prepare(
                         step_run=step_run
@@ -220,9 +228,16 @@ class StepLauncher:
                     step_run.end_time = datetime.utcnow()
                     raise
                 finally:
-                    step_run_response = Client().zen_store.create_run_step(
-                        step_run
-                    )
+                    if (
+                        self._step_run_buffer is not None
+                        and step_run.status == ExecutionStatus.CACHED
+                    ):
+                        self._step_run_buffer.add(step_run)
+                    else:
+                        self._flush_step_run_buffer()
+                        step_run_response = Client().zen_store.create_run_step(
+                            step_run
+                        )
 
                 logger.info(f"Step `{self._step_name}` has started.")
                 if execution_needed:
@@ -243,9 +258,34 @@ class StepLauncher:
 
         except:  # noqa: E722
             logger.error(f"Pipeline run `{pipeline_run.name}` failed.")
-            publish_utils.publish_failed_pipeline_run(pipeline_run.id)
+            try:
+                self._flush_step_run_buffer()
+            finally:
+                publish_utils.publish_failed_pipeline_run(pipeline_run.id)
             raise
 
+    def _depends_on_buffered_step_run(self) -> bool:
+        """Checks whether the step depends on a buffered step run.
+
+        Returns:
+            Whether the step run of an upstream step is still buffered.
+        """
+        if self._step_run_buffer is None:
+            return False
+
+        upstream_steps = {
+            input_.step_name for input_ in self._step.spec.inputs.values()
+        }
+        upstream_steps.update(self._step.spec.upstream_steps)
+        return any(
+            step_name in self._step_run_buffer for step_name in upstream_steps
+        )
+
+    def _flush_step_run_buffer(self) -> None:
+        """Creates the buffered step runs of previous cached steps."""
+        if self._step_run_buffer is not None:
+            self._step_run_buffer.flush()
+
     def _get_step_docstring_and_source_code(self) -> Tuple[Optional[str], str]:
         """Gets the docstring and source code of the step.
 
@@ -388,6 +428,7 @@ class StepLauncher:
         output_annotations = parse_return_type_annotations(
             step_instance.entrypoint
         )
+        artifact_configs: Dict[UUID, ArtifactConfig] = {}
         for output_name_, output_id in step_run.outputs.items():
             if output_name_ in output_annotations:
                 annotation = output_annotations.get(output_name_, None)
@@ -396,11 +437,11 @@ class StepLauncher:
                 else:
                     artifact_config_ = ArtifactConfig(name=output_name_)
 
-                link_artifact_config_to_model(
-                    artifact_config=artifact_config_,
-                    model=model_from_context,
-                    artifact_version_id=output_id,
-                )
+                artifact_configs[output_id] = artifact_config_
+
+        link_artifact_configs_to_model(
+            artifact_configs=artifact_configs, model=model_from_context
+        )
 
     def _run_step(
         self,
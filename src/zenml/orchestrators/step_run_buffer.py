@@ -0,0 +1,79 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Buffer to create the step runs of a pipeline run with a single request."""
+
+import threading
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    from zenml.models import StepRunRequest, StepRunResponse
+
+
+class StepRunBuffer:
+    """Collects step runs to create them with a single request.
+
+    Step runs added to the buffer are only stored once the buffer is
+    flushed. Orchestrators that run all steps of a pipeline in their own
+    process use this buffer for cached steps, which don't need to exist in
+    the database until a later step depends on them.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the buffer."""
+        self._step_runs: Dict[str, "StepRunRequest"] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of buffered step runs.
+
+        Returns:
+            The number of buffered step runs.
+        """
+        return len(self._step_runs)
+
+    def __contains__(self, step_name: object) -> bool:
+        """Checks whether a step run with the given name is buffered.
+
+        Args:
+            step_name: The name of the step.
+
+        Returns:
+            Whether a step run with the given name is buffered.
+        """
+        return step_name in self._step_runs
+
+    def add(self, step_run: "StepRunRequest") -> None:
+        """Adds a step run to the buffer.
+
+        Args:
+            step_run: The step run to create.
+        """
+        with self._lock:
+            self._step_runs[step_run.name] = step_run
+
+    def flush(self) -> List["StepRunResponse"]:
+        """Creates all buffered step runs and empties the buffer.
+
+        Returns:
+            The created step runs.
+        """
+        from zenml.client import Client
+
+        with self._lock:
+            step_runs = list(self._step_runs.values())
+            self._step_runs = {}
+
+        if not step_runs:
+            return []
+        return Client().zen_store.create_run_steps(step_runs)
@@ -31,6 +31,7 @@ from uuid import UUID
 
 from pydantic.typing import get_origin, is_union
 
+from zenml.artifacts.in_memory_cache import in_memory_artifact_cache
 from zenml.artifacts.unmaterialized_artifact import UnmaterializedArtifact
 from zenml.artifacts.utils import save_artifact
 from zenml.client import Client
@@ -89,6 +90,12 @@ class StepRunner:
         """
         self._step = step
         self._stack = stack
+        # Artifact values are only passed in memory if the following steps
+        # run in the same process
+        self._use_in_memory_artifact_cache = (
+            stack.orchestrator.runs_steps_in_process
+            and not step.config.step_operator
+        )
 
     @property
     def configuration(self) -> StepConfiguration:
@@ -168,7 +175,7 @@ class StepRunner:
 
                 # Initialize the step context singleton
                 StepContext._clear()
-                StepContext(
+                step_context = StepContext(
                     pipeline_run=pipeline_run,
                     step_run=step_run,
                     output_materializers=output_materializers,
@@ -212,58 +219,74 @@ class StepRunner:
                         )
                     raise
                 finally:
-                    step_run_metadata = self._stack.get_step_run_metadata(
-                        info=step_run_info,
-                    )
-                    publish_step_run_metadata(
-                        step_run_id=step_run_info.step_run_id,
-                        step_run_metadata=step_run_metadata,
-                    )
-                    self._stack.cleanup_step_run(
-                        info=step_run_info, step_failed=step_failed
-                    )
-                    if not step_failed:
-                        success_hook_source = (
-                            self.configuration.success_hook_source
-                        )
-                        if success_hook_source:
-                            logger.info("Detected success hook. Running...")
-                            self.load_and_run_hook(
-                                success_hook_source,
-                                step_exception=None,
-                            )
-
-                        # Store and publish the output artifacts of the step function.
-                        output_data = self._validate_outputs(
-                            return_values, output_annotations
-                        )
-                        artifact_metadata_enabled = is_setting_enabled(
-                            is_enabled_on_step=step_run_info.config.enable_artifact_metadata,
-                            is_enabled_on_pipeline=step_run_info.pipeline.enable_artifact_metadata,
+                    try:
+                        step_run_metadata = self._stack.get_step_run_metadata(
+                            info=step_run_info,
                         )
-                        artifact_visualization_enabled = is_setting_enabled(
-                            is_enabled_on_step=step_run_info.config.enable_artifact_visualization,
-                            is_enabled_on_pipeline=step_run_info.pipeline.enable_artifact_visualization,
+                        publish_step_run_metadata(
+                            step_run_id=step_run_info.step_run_id,
+                            step_run_metadata=step_run_metadata,
                         )
-                        output_artifact_ids = self._store_output_artifacts(
-                            output_data=output_data,
-                            output_artifact_uris=output_artifact_uris,
-                            output_materializers=output_materializers,
-                            output_annotations=output_annotations,
-                            artifact_metadata_enabled=artifact_metadata_enabled,
-                            artifact_visualization_enabled=artifact_visualization_enabled,
+                        self._stack.cleanup_step_run(
+                            info=step_run_info, step_failed=step_failed
                         )
-                        link_step_artifacts_to_model(
-                            artifact_version_ids=output_artifact_ids
-                        )
-                        self._link_pipeline_run_to_model_from_artifacts(
-                            pipeline_run=pipeline_run,
-                            artifact_names=list(output_artifact_ids.keys()),
-                            external_artifacts=list(
-                                step_run.config.external_input_artifacts.values()
-                            ),
-                        )
-                    StepContext._clear()  # Remove the step context singleton
+                        if not step_failed:
+                            success_hook_source = (
+                                self.configuration.success_hook_source
+                            )
+                            if success_hook_source:
+                                logger.info(
+                                    "Detected success hook. Running..."
+                                )
+                                self.load_and_run_hook(
+                                    success_hook_source,
+                                    step_exception=None,
+                                )
+
+                            # Store and publish the output artifacts of the step function.
+                            output_data = self._validate_outputs(
+                                return_values, output_annotations
+                            )
+                            artifact_metadata_enabled = is_setting_enabled(
+                                is_enabled_on_step=step_run_info.config.enable_artifact_metadata,
+                                is_enabled_on_pipeline=step_run_info.pipeline.enable_artifact_metadata,
+                            )
+                            artifact_visualization_enabled = is_setting_enabled(
+                                is_enabled_on_step=step_run_info.config.enable_artifact_visualization,
+                                is_enabled_on_pipeline=step_run_info.pipeline.enable_artifact_visualization,
+                            )
+                            output_artifact_ids = self._store_output_artifacts(
+                                output_data=output_data,
+                                output_artifact_uris=output_artifact_uris,
+                                output_materializers=output_materializers,
+                                output_annotations=output_annotations,
+                                artifact_metadata_enabled=artifact_metadata_enabled,
+                                artifact_visualization_enabled=artifact_visualization_enabled,
+                            )
+                            link_step_artifacts_to_model(
+                                artifact_version_ids=output_artifact_ids
+                            )
+                            self._link_pipeline_run_to_model_from_artifacts(
+                                pipeline_run=pipeline_run,
+                                artifact_names=list(
+                                    output_artifact_ids.keys()
+                                ),
+                                external_artifacts=list(
+                                    step_run.config.external_input_artifacts.values()
+                                ),
+                            )
+                    finally:
+                        try:
+                            # Store all run metadata logged during the step
+                            step_context._run_metadata_buffer.flush()
+                        except Exception as e:
+                            # Don't hide the exception of the step, if any
+                            logger.error(
+                                "Failed to store the run metadata of step "
+                                f"`{step_run_info.config.name}`: {e}"
+                            )
+                        finally:
+                            StepContext._clear()  # Remove the step context singleton
 
             # Update the status and output artifacts of the step run.
             publish_successful_step_run(
@@ -441,6 +464,29 @@ class StepRunner:
             # we use the datatype of the stored artifact
             data_type = source_utils.load(artifact.data_type)
 
+        if (
+            self._use_in_memory_artifact_cache
+            and artifact.id in in_memory_artifact_cache
+        ):
+            # The artifact was produced in this process, so we can skip
+            # loading it from the artifact store if the cached value has the
+            # requested type.
+            try:
+                value = in_memory_artifact_cache.get(artifact.id)
+            except Exception as e:
+                logger.debug(
+                    "Failed to get artifact version %s from the in-memory "
+                    "cache: %s",
+                    artifact.id,
+                    e,
+                )
+            else:
+                try:
+                    if isinstance(value, data_type):
+                        return value
+                except TypeError:
+                    pass
+
         materializer_class: Type[BaseMaterializer] = (
             source_utils.load_and_validate_class(
                 artifact.materializer, expected_class=BaseMaterializer
@@ -631,6 +677,8 @@ class StepRunner:
                 manual_save=False,
             )
             output_artifacts[output_name] = artifact.id
+            if self._use_in_memory_artifact_cache:
+                in_memory_artifact_cache.put(artifact.id, return_value)
 
         return output_artifacts
 
@@ -700,16 +748,18 @@ class StepRunner:
         models = self._get_model_versions_from_config()
 
         client = Client()
-        for model in models:
-            client.zen_store.create_model_version_pipeline_run_link(
+        client.zen_store.create_model_version_pipeline_run_links(
+            [
                 ModelVersionPipelineRunRequest(
-                    user=Client().active_user.id,
-                    workspace=Client().active_workspace.id,
+                    user=client.active_user.id,
+                    workspace=client.active_workspace.id,
                     pipeline_run=pipeline_run.id,
                     model=model[0],
                     model_version=model[1],
                 )
-            )
+                for model in models
+            ]
+        )
 
     def _link_pipeline_run_to_model_from_artifacts(
         self,
@@ -739,8 +789,8 @@ class StepRunner:
                     )
                 )
 
-        for model in models:
-            client.zen_store.create_model_version_pipeline_run_link(
+        client.zen_store.create_model_version_pipeline_run_links(
+            [
                 ModelVersionPipelineRunRequest(
                     user=client.active_user.id,
                     workspace=client.active_workspace.id,
@@ -748,7 +798,9 @@ class StepRunner:
                     model=model[0],
                     model_version=model[1],
                 )
-            )
+                for model in models
+            ]
+        )
 
     def load_and_run_hook(
         self,
@@ -0,0 +1,277 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""On-disk index of the local daemon services stored in a directory."""
+
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from zenml.logger import get_logger
+from zenml.services.local.local_service import SERVICE_DAEMON_CONFIG_FILE_NAME
+from zenml.services.service import BaseService
+from zenml.services.service_registry import ServiceRegistry
+from zenml.services.service_status import ServiceState
+
+logger = get_logger(__name__)
+
+SERVICE_INDEX_FILE_NAME = "service_index.json"
+MAX_STATUS_UPDATE_WORKERS = 8
+
+
+class LocalServiceIndex:
+    """Index of the local daemon services stored in a root directory.
+
+    Local daemon services store their configuration in a
+    `service.json` file in their runtime directory, which is either the root
+    directory itself or one of its subdirectories. The index keeps the UUID
+    and configuration of all these services in a single file in the root
+    directory, so that services can be searched without parsing every
+    service configuration file.
+
+    The index is validated against the modification time of the service
+    configuration files whenever it is used, which means that services
+    created, updated or deleted by other processes are picked up as well.
+    """
+
+    def __init__(self, root_path: str) -> None:
+        """Initializes the index.
+
+        Args:
+            root_path: The root directory in which the services are stored.
+        """
+        self.root_path = root_path
+        self.index_path = os.path.join(root_path, SERVICE_INDEX_FILE_NAME)
+
+    def find_config_files(
+        self,
+        service_uuid: Optional[UUID] = None,
+        **config_filters: Any,
+    ) -> List[str]:
+        """Finds the configuration files of services matching some criteria.
+
+        Args:
+            service_uuid: Only find the service with this UUID.
+            **config_filters: Service configuration attribute values to
+                filter by. Attributes with an empty value are ignored.
+
+        Returns:
+            The paths of the matching service configuration files.
+        """
+        config_filters = {
+            key: value for key, value in config_filters.items() if value
+        }
+
+        config_files = []
+        for directory, entry in self._refresh().items():
+            if service_uuid and entry["uuid"] != str(service_uuid):
+                continue
+
+            config = entry["config"]
+            if any(
+                config.get(key) != value
+                for key, value in config_filters.items()
+            ):
+                continue
+
+            config_files.append(
+                os.path.join(
+                    self.root_path, directory, SERVICE_DAEMON_CONFIG_FILE_NAME
+                )
+            )
+
+        return config_files
+
+    def load_services(
+        self,
+        service_uuid: Optional[UUID] = None,
+        **config_filters: Any,
+    ) -> List[BaseService]:
+        """Loads the services matching some criteria.
+
+        The services are loaded with their last known status, their status
+        is not updated.
+
+        Args:
+            service_uuid: Only load the service with this UUID.
+            **config_filters: Service configuration attribute values to
+                filter by. Attributes with an empty value are ignored.
+
+        Returns:
+            The matching services.
+        """
+        services = []
+        for config_file in self.find_config_files(
+            service_uuid=service_uuid, **config_filters
+        ):
+            logger.debug(
+                "Loading service daemon configuration from %s", config_file
+            )
+            try:
+                with open(config_file, "r") as f:
+                    service_config = f.read()
+            except FileNotFoundError:
+                # The service was deleted in the meantime
+                continue
+
+            services.append(
+                ServiceRegistry().load_service_from_json(service_config)
+            )
+
+        return services
+
+    def _get_service_directories(self) -> List[str]:
+        """Gets the directories that can contain a service configuration.
+
+        Returns:
+            The root directory and its subdirectories, relative to the root
+            directory.
+        """
+        directories = [os.curdir]
+        try:
+            with os.scandir(self.root_path) as entries:
+                directories.extend(
+                    entry.name for entry in entries if entry.is_dir()
+                )
+        except FileNotFoundError:
+            return []
+
+        return directories
+
+    def _refresh(self) -> Dict[str, Dict[str, Any]]:
+        """Updates the index with the current service configuration files.
+
+        Returns:
+            The index entries, keyed by the service directory relative to the
+            root directory.
+        """
+        index = self._read()
+        updated_index: Dict[str, Dict[str, Any]] = {}
+        changed = False
+
+        for directory in self._get_service_directories():
+            config_file = os.path.join(
+                self.root_path, directory, SERVICE_DAEMON_CONFIG_FILE_NAME
+            )
+            try:
+                mtime = os.stat(config_file).st_mtime_ns
+            except FileNotFoundError:
+                continue
+
+            entry = index.get(directory)
+            if entry is None or entry.get("mtime") != mtime:
+                try:
+                    with open(config_file, "r") as f:
+                        service_dict = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.warning(
+                        "Skipping invalid service configuration file %s: %s",
+                        config_file,
+                        e,
+                    )
+                    continue
+
+                entry = {
+                    "mtime": mtime,
+                    "uuid": service_dict.get("uuid"),
+                    "config": service_dict.get("config", {}),
+                }
+                changed = True
+
+            updated_index[directory] = entry
+
+        if changed or updated_index.keys() != index.keys():
+            self._write(updated_index)
+
+        return updated_index
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """Reads the index file.
+
+        Returns:
+            The index entries or an empty dictionary if the index file does
+            not exist or is invalid.
+        """
+        try:
+            with open(self.index_path, "r") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        return index if isinstance(index, dict) else {}
+
+    def _write(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """Writes the index file.
+
+        The index is written to a temporary file first, so that concurrent
+        readers never see a partially written index.
+
+        Args:
+            index: The index entries.
+        """
+        try:
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.root_path, prefix=SERVICE_INDEX_FILE_NAME
+            )
+        except OSError as e:
+            logger.debug("Failed to write service index: %s", e)
+            return
+
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(index, f)
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            logger.debug("Failed to write service index: %s", e)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+
+def update_service_statuses(services: Sequence[BaseService]) -> None:
+    """Updates the status of multiple services concurrently.
+
+    Args:
+        services: The services to update.
+    """
+    if len(services) <= 1:
+        for service in services:
+            service.update_status()
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(services), MAX_STATUS_UPDATE_WORKERS)
+    ) as executor:
+        for _ in executor.map(lambda s: s.update_status(), services):
+            pass
+
+
+def is_service_running(service: BaseService) -> bool:
+    """Checks if a service was running when its status was last updated.
+
+    Unlike `BaseService.is_running`, this does not poll the external service,
+    so it can be used to filter services after `update_service_statuses`.
+
+    Args:
+        service: The service to check.
+
+    Returns:
+        True if the service and its endpoint, if any, were active, otherwise
+        False.
+    """
+    return service.status.state == ServiceState.ACTIVE and (
+        not service.endpoint
+        or service.endpoint.status.state == ServiceState.ACTIVE
+    )
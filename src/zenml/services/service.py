@@ -44,6 +44,13 @@ logger = get_logger(__name__)
 
 T = TypeVar("T", bound=Callable[..., Any])
 
+# Intervals (in seconds) between status checks while waiting for a service
+# to reach its administrative state. The interval starts small so that
+# services which become ready quickly are detected without delay and is
+# doubled after every check up to the maximum.
+SERVICE_STATUS_POLL_MIN_INTERVAL = 0.1
+SERVICE_STATUS_POLL_MAX_INTERVAL = 1.0
+
 
 def update_service_status(
     pre_status: Optional[ServiceState] = None,
@@ -341,18 +348,21 @@ class BaseService(BaseTypedModel, metaclass=BaseServiceMeta):
             True if the service operational state matches the administrative
             state, False otherwise.
         """
-        time_remaining = timeout
+        deadline = time.monotonic() + timeout
+        interval = SERVICE_STATUS_POLL_MIN_INTERVAL
         while True:
-            if self.admin_state == ServiceState.ACTIVE and self.is_running:
-                return True
-            if self.admin_state == ServiceState.INACTIVE and self.is_stopped:
+            # check the status only once per iteration and evaluate the
+            # admin state against the updated status information
+            self.update_status()
+            if self._is_admin_state_reached():
                 return True
-            if self.is_failed:
+            if self.status.state == ServiceState.ERROR:
                 return False
+            time_remaining = deadline - time.monotonic()
             if time_remaining <= 0:
                 break
-            time.sleep(1)
-            time_remaining -= 1
+            time.sleep(min(interval, time_remaining))
+            interval = min(interval * 2, SERVICE_STATUS_POLL_MAX_INTERVAL)
 
         if timeout > 0:
             logger.error(
@@ -363,6 +373,25 @@ class BaseService(BaseTypedModel, metaclass=BaseServiceMeta):
 
         return False
 
+    def _is_admin_state_reached(self) -> bool:
+        """Check if the last known status matches the administrative state.
+
+        Unlike `is_running` and `is_stopped`, this does not poll the external
+        service.
+
+        Returns:
+            True if the service operational state matches the administrative
+            state, False otherwise.
+        """
+        if self.admin_state == ServiceState.ACTIVE:
+            return self.status.state == ServiceState.ACTIVE and (
+                not self.endpoint
+                or self.endpoint.status.state == ServiceState.ACTIVE
+            )
+        if self.admin_state == ServiceState.INACTIVE:
+            return self.status.state == ServiceState.INACTIVE
+        return False
+
     @property
     def is_running(self) -> bool:
         """Check if the service is currently running.
@@ -14,7 +14,7 @@
 """Implementation of the ZenML flavor registry."""
 
 from collections import defaultdict
-from typing import DefaultDict, Dict, List, Type
+from typing import DefaultDict, Dict, Iterable, List, Optional, Type
 
 from zenml.analytics.utils import analytics_disabler
 from zenml.enums import StackComponentType
@@ -22,6 +22,7 @@ from zenml.integrations.registry import integration_registry
 from zenml.logger import get_logger
 from zenml.models import (
     FlavorFilter,
+    FlavorRequest,
     FlavorResponse,
     FlavorUpdate,
 )
@@ -100,6 +101,104 @@ class FlavorRegistry:
 
         return integrated_flavors
 
+    def get_builtin_flavor_models(self) -> List[FlavorRequest]:
+        """Creates the request models of the default built-in flavors.
+
+        Returns:
+            The request models of the built-in flavors.
+        """
+        return [
+            flavor().to_model(integration="built-in", is_custom=False)
+            for flavor in self.builtin_flavors
+        ]
+
+    @staticmethod
+    def load_integration_flavor_models(
+        integration_names: Optional[Iterable[str]] = None,
+    ) -> Dict[str, List[FlavorRequest]]:
+        """Creates the request models of the flavors implemented by integrations.
+
+        Integrations that fail to load their flavors are skipped.
+
+        Args:
+            integration_names: Names of the integrations for which to load
+                the flavors. If not given, the flavors of all integrations
+                are loaded.
+
+        Returns:
+            The request models of the integration flavors, indexed by
+            integration name.
+        """
+        if integration_names is None:
+            integration_names = integration_registry.integrations
+
+        flavor_models: Dict[str, List[FlavorRequest]] = {}
+        for name in integration_names:
+            integration = integration_registry.integrations[name]
+            try:
+                flavor_models[name] = [
+                    flavor().to_model(integration=name, is_custom=False)
+                    for flavor in integration.flavors()
+                ]
+            except Exception as e:
+                logger.warning(
+                    f"Integration {name} failed to register flavors. "
+                    f"Error: {e}"
+                )
+        return flavor_models
+
+    @staticmethod
+    def get_integration_flavor_models() -> List[FlavorRequest]:
+        """Creates the request models of the flavors implemented by integrations.
+
+        Integrations that fail to load their flavors are skipped.
+
+        Returns:
+            The request models of the integration flavors.
+        """
+        integration_flavor_models = (
+            FlavorRegistry.load_integration_flavor_models()
+        )
+        return [
+            flavor_model
+            for flavor_models in integration_flavor_models.values()
+            for flavor_model in flavor_models
+        ]
+
+    def get_flavor_models(self) -> List[FlavorRequest]:
+        """Creates the request models of all built-in and integration flavors.
+
+        Returns:
+            The request models of all flavors.
+        """
+        return (
+            self.get_builtin_flavor_models()
+            + self.get_integration_flavor_models()
+        )
+
+    @staticmethod
+    def _register_flavor(
+        store: BaseZenStore, flavor_request_model: FlavorRequest
+    ) -> None:
+        """Creates or updates a flavor in the store.
+
+        Args:
+            store: The instance of the zen_store to use
+            flavor_request_model: The flavor to register.
+        """
+        existing_flavor = store.list_flavors(
+            FlavorFilter(
+                name=flavor_request_model.name,
+                type=flavor_request_model.type,
+            )
+        )
+
+        if len(existing_flavor) == 0:
+            store.create_flavor(flavor_request_model)
+        else:
+            flavor_update_model = FlavorUpdate.parse_obj(flavor_request_model)
+            store.update_flavor(existing_flavor[0].id, flavor_update_model)
+
     def register_builtin_flavors(self, store: BaseZenStore) -> None:
         """Registers the default built-in flavors.
 
@@ -107,27 +206,8 @@ class FlavorRegistry:
             store: The instance of the zen_store to use
         """
         with analytics_disabler():
-            for flavor in self.builtin_flavors:
-                flavor_request_model = flavor().to_model(
-                    integration="built-in",
-                    is_custom=False,
-                )
-                existing_flavor = store.list_flavors(
-                    FlavorFilter(
-                        name=flavor_request_model.name,
-                        type=flavor_request_model.type,
-                    )
-                )
-
-                if len(existing_flavor) == 0:
-                    store.create_flavor(flavor_request_model)
-                else:
-                    flavor_update_model = FlavorUpdate.parse_obj(
-                        flavor_request_model
-                    )
-                    store.update_flavor(
-                        existing_flavor[0].id, flavor_update_model
-                    )
+            for flavor_request_model in self.get_builtin_flavor_models():
+                self._register_flavor(store, flavor_request_model)
 
     @staticmethod
     def register_integration_flavors(store: BaseZenStore) -> None:
@@ -137,31 +217,6 @@ class FlavorRegistry:
             store: The instance of the zen_store to use
         """
         with analytics_disabler():
-            for name, integration in integration_registry.integrations.items():
-                try:
-                    integrated_flavors = integration.flavors()
-                    for flavor in integrated_flavors:
-                        flavor_request_model = flavor().to_model(
-                            integration=name,
-                            is_custom=False,
-                        )
-                        existing_flavor = store.list_flavors(
-                            FlavorFilter(
-                                name=flavor_request_model.name,
-                                type=flavor_request_model.type,
-                            )
-                        )
-                        if len(existing_flavor) == 0:
-                            store.create_flavor(flavor_request_model)
-                        else:
-                            flavor_update_model = FlavorUpdate.parse_obj(
-                                flavor_request_model
-                            )
-                            store.update_flavor(
-                                existing_flavor[0].id, flavor_update_model
-                            )
-                except Exception as e:
-                    logger.warning(
-                        f"Integration {name} failed to register flavors. "
-                        f"Error: {e}"
-                    )
+            flavor_models = FlavorRegistry.get_integration_flavor_models()
+            for flavor_request_model in flavor_models:
+                FlavorRegistry._register_flavor(store, flavor_request_model)
@@ -450,7 +450,12 @@ def log_step_metadata(
 
     client = Client()
     if step_context:
-        step_run_id = step_context.step_run.id
+        step_context._run_metadata_buffer.add(
+            metadata=metadata,
+            resource_id=step_context.step_run.id,
+            resource_type=MetadataResourceTypes.STEP_RUN,
+        )
+        return
     elif run_id:
         step_run_id = UUID(int=int(run_id))
     else:
@@ -13,28 +13,101 @@
 #  permissions and limitations under the License.
 """Pagination utilities."""
 
-from typing import Callable, List, TypeVar
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, TypeVar
 
+from zenml.constants import PAGE_SIZE_MAXIMUM
 from zenml.models import BaseIdentifiedResponse, Page
 
 AnyResponse = TypeVar("AnyResponse", bound=BaseIdentifiedResponse)  # type: ignore[type-arg]
 
 
+def iterate_pages(
+    list_method: Callable[..., Page[AnyResponse]],
+    page_size: int = PAGE_SIZE_MAXIMUM,
+    prefetch: bool = True,
+) -> Iterator[Page[AnyResponse]]:
+    """Iterate over all pages of a client or store method that returns pages.
+
+    Pages are fetched lazily. If prefetching is enabled, the next page is
+    fetched in a background thread while the caller processes the current
+    page.
+
+    Args:
+        list_method: The list method to wrap around. It is called with the
+            `page` and `size` keyword arguments.
+        page_size: The number of items to fetch per page.
+        prefetch: Whether to fetch the next page while the current page is
+            being processed.
+
+    Yields:
+        The pages.
+    """
+    page = list_method(page=1, size=page_size)
+
+    if not prefetch:
+        yield page
+        while page.index < page.total_pages:
+            page = list_method(page=page.index + 1, size=page_size)
+            yield page
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        while True:
+            next_page: Optional[Future[Page[AnyResponse]]] = None
+            if page.index < page.total_pages:
+                next_page = executor.submit(
+                    list_method, page=page.index + 1, size=page_size
+                )
+
+            yield page
+
+            if next_page is None:
+                return
+            page = next_page.result()
+    finally:
+        executor.shutdown(wait=False)
+
+
+def iterate_items(
+    list_method: Callable[..., Page[AnyResponse]],
+    page_size: int = PAGE_SIZE_MAXIMUM,
+    prefetch: bool = True,
+) -> Iterator[AnyResponse]:
+    """Iterate over the items of all pages of a list method.
+
+    In contrast to `depaginate`, only the items of the current (and the
+    prefetched) page are kept in memory.
+
+    Args:
+        list_method: The list method to wrap around. It is called with the
+            `page` and `size` keyword arguments.
+        page_size: The number of items to fetch per page.
+        prefetch: Whether to fetch the next page while the items of the
+            current page are being processed.
+
+    Yields:
+        The items of all pages.
+    """
+    for page in iterate_pages(
+        list_method, page_size=page_size, prefetch=prefetch
+    ):
+        yield from page.items
+
+
 def depaginate(
     list_method: Callable[..., Page[AnyResponse]],
+    page_size: int = PAGE_SIZE_MAXIMUM,
 ) -> List[AnyResponse]:
     """Depaginate the results from a client or store method that returns pages.
 
     Args:
-        list_method: The list method to wrap around.
+        list_method: The list method to wrap around. It is called with the
+            `page` and `size` keyword arguments.
+        page_size: The number of items to fetch per page.
 
     Returns:
         A list of the corresponding Response Models.
     """
-    page = list_method()
-    items = list(page.items)
-    while page.index < page.total_pages:
-        page = list_method(page=page.index + 1)
-        items += list(page.items)
-
-    return items
+    return list(iterate_items(list_method, page_size=page_size))
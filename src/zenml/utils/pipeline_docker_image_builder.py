@@ -13,6 +13,8 @@
 #  permissions and limitations under the License.
 """Implementation of Docker image builds to run ZenML pipelines."""
 
+import contextlib
+import hashlib
 import itertools
 import os
 import subprocess
@@ -20,24 +22,35 @@ import sys
 from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
+    Any,
+    Callable,
     DefaultDict,
     Dict,
+    Iterator,
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
+    TypeVar,
+    Union,
+    cast,
 )
 
 import zenml
 from zenml.config import DockerSettings
 from zenml.config.docker_settings import PythonEnvironmentExportMethod
 from zenml.constants import (
+    CACHE_LOCAL_REQUIREMENTS,
     ENV_ZENML_CONFIG_PATH,
     ENV_ZENML_ENABLE_REPO_INIT_WARNINGS,
     ENV_ZENML_REQUIRES_CODE_DOWNLOAD,
 )
 from zenml.enums import OperatingSystemType
-from zenml.integrations.registry import integration_registry
+from zenml.integrations.registry import (
+    get_environment_fingerprint,
+    integration_registry,
+)
 from zenml.logger import get_logger
 from zenml.utils import docker_utils, io_utils, source_utils
 
@@ -49,6 +62,8 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 DOCKER_IMAGE_WORKDIR = "/app"
 DOCKER_IMAGE_ZENML_CONFIG_DIR = ".zenconfig"
 DOCKER_IMAGE_ZENML_CONFIG_PATH = (
@@ -60,6 +75,161 @@ DEFAULT_DOCKER_PARENT_IMAGE = (
     f"py{sys.version_info.major}.{sys.version_info.minor}"
 )
 
+LOCAL_REQUIREMENTS_CACHE_DIRECTORY_NAME = "local_requirements_cache"
+
+_requirements_cache: Optional[Dict[Tuple[Any, ...], Any]] = None
+
+
+@contextlib.contextmanager
+def requirements_cache() -> Iterator[None]:
+    """Memoizes the gathered requirements while the context is active.
+
+    Multiple Docker builds of a pipeline usually gather the same requirements,
+    both to compute their checksums and to build the images. While this
+    context is active, the local Python environment is exported only once per
+    command and the requirements of files, integrations, stacks and hub
+    plugins are only resolved once. Nested contexts share the cache of the
+    outermost context.
+
+    This can also be used as a function decorator.
+
+    Yields:
+        None.
+    """
+    global _requirements_cache
+
+    if _requirements_cache is not None:
+        yield
+        return
+
+    _requirements_cache = {}
+    try:
+        yield
+    finally:
+        _requirements_cache = None
+
+
+def _memoize(key: Tuple[Any, ...], func: Callable[[], T]) -> T:
+    """Calls a function or returns its result from the requirements cache.
+
+    Args:
+        key: The cache key of the function result.
+        func: The function to call.
+
+    Returns:
+        The (cached) function result.
+    """
+    if _requirements_cache is None:
+        return func()
+
+    if key not in _requirements_cache:
+        _requirements_cache[key] = func()
+
+    return cast(T, _requirements_cache[key])
+
+
+def get_python_environment_fingerprint(command: str) -> str:
+    """Computes a fingerprint of the local Python environment.
+
+    The fingerprint extends the fingerprint of the installed Python packages
+    with the export command and the Poetry project files in the current
+    working directory.
+
+    Args:
+        command: The command used to export the local Python environment.
+
+    Returns:
+        The fingerprint.
+    """
+    cwd = os.getcwd()
+    entries = [get_environment_fingerprint(), command, cwd]
+    for file_name in ("pyproject.toml", "poetry.lock"):
+        path = os.path.join(cwd, file_name)
+        try:
+            entries.append(f"{path}:{os.stat(path).st_mtime_ns}")
+        except OSError:
+            continue
+
+    return hashlib.sha256("\n".join(entries).encode()).hexdigest()
+
+
+def _run_export_command(command: str) -> str:
+    """Runs a command that exports the local Python environment.
+
+    Args:
+        command: The command to run.
+
+    Raises:
+        RuntimeError: If the command failed.
+
+    Returns:
+        The output of the command.
+    """
+    try:
+        return subprocess.check_output(
+            command,
+            shell=True,  # nosec
+        ).decode()
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError("Unable to export local python packages.") from e
+
+
+def _export_local_python_environment(
+    export_method: Union[PythonEnvironmentExportMethod, List[str]],
+) -> str:
+    """Exports the packages installed in the local Python environment.
+
+    If enabled using the `ZENML_CACHE_LOCAL_REQUIREMENTS` environment
+    variable, the packages exported by the builtin export methods are cached
+    on disk and reused until the local Python environment changes.
+
+    Args:
+        export_method: The builtin export method or a custom command.
+
+    Returns:
+        The exported packages.
+    """
+    if isinstance(export_method, PythonEnvironmentExportMethod):
+        command = export_method.command
+    else:
+        command = " ".join(export_method)
+
+    if not (
+        CACHE_LOCAL_REQUIREMENTS
+        and isinstance(export_method, PythonEnvironmentExportMethod)
+    ):
+        return _memoize(
+            ("local_environment", command, os.getcwd()),
+            lambda: _run_export_command(command),
+        )
+
+    fingerprint = get_python_environment_fingerprint(command)
+    cache_path = os.path.join(
+        io_utils.get_global_config_directory(),
+        LOCAL_REQUIREMENTS_CACHE_DIRECTORY_NAME,
+        f"{fingerprint}.txt",
+    )
+
+    def _export() -> str:
+        try:
+            return io_utils.read_file_contents_as_string(cache_path)
+        except FileNotFoundError:
+            pass
+
+        local_requirements = _run_export_command(command)
+        try:
+            io_utils.create_dir_recursive_if_not_exists(
+                os.path.dirname(cache_path)
+            )
+            io_utils.write_file_contents_as_string(
+                cache_path, local_requirements
+            )
+        except OSError as e:
+            logger.debug("Failed to cache local requirements: %s", e)
+        return local_requirements
+
+    return _memoize(("local_environment", fingerprint), _export)
+
 
 class PipelineDockerImageBuilder:
     """Builds Docker images to run a ZenML pipeline."""
@@ -394,28 +564,9 @@ class PipelineDockerImageBuilder:
 
         # Generate requirements file for the local environment if configured
         if docker_settings.replicate_local_python_environment:
-            if isinstance(
-                docker_settings.replicate_local_python_environment,
-                PythonEnvironmentExportMethod,
-            ):
-                command = (
-                    docker_settings.replicate_local_python_environment.command
-                )
-            else:
-                command = " ".join(
-                    docker_settings.replicate_local_python_environment
-                )
-
-            try:
-                local_requirements = subprocess.check_output(
-                    command,
-                    shell=True,  # nosec
-                ).decode()
-            except subprocess.CalledProcessError as e:
-                raise RuntimeError(
-                    "Unable to export local python packages."
-                ) from e
-
+            local_requirements = _export_local_python_environment(
+                docker_settings.replicate_local_python_environment
+            )
             requirements_files.append(
                 (".zenml_local_requirements", local_requirements, [])
             )
@@ -428,7 +579,10 @@ class PipelineDockerImageBuilder:
         if isinstance(docker_settings.requirements, str):
             path = os.path.abspath(docker_settings.requirements)
             try:
-                user_requirements = io_utils.read_file_contents_as_string(path)
+                user_requirements = _memoize(
+                    ("requirements_file", path),
+                    lambda: io_utils.read_file_contents_as_string(path),
+                )
             except FileNotFoundError as e:
                 raise FileNotFoundError(
                     f"Requirements file {path} does not exist."
@@ -456,16 +610,22 @@ class PipelineDockerImageBuilder:
         # Generate requirements file for all required integrations
         integration_requirements = set(
             itertools.chain.from_iterable(
-                integration_registry.select_integration_requirements(
-                    integration_name=integration,
-                    target_os=OperatingSystemType.LINUX,
+                _memoize(
+                    ("integration", integration),
+                    lambda: integration_registry.select_integration_requirements(
+                        integration_name=integration,
+                        target_os=OperatingSystemType.LINUX,
+                    ),
                 )
                 for integration in docker_settings.required_integrations
             )
         )
 
         if docker_settings.install_stack_requirements:
-            integration_requirements.update(stack.requirements())
+            stack_requirements: Set[str] = _memoize(
+                ("stack", stack.id), stack.requirements
+            )
+            integration_requirements.update(stack_requirements)
             if code_repository:
                 integration_requirements.update(code_repository.requirements)
 
@@ -492,8 +652,11 @@ class PipelineDockerImageBuilder:
             (
                 hub_internal_requirements,
                 hub_pypi_requirements,
-            ) = PipelineDockerImageBuilder._get_hub_requirements(
-                docker_settings.required_hub_plugins
+            ) = _memoize(
+                ("hub_plugins", tuple(docker_settings.required_hub_plugins)),
+                lambda: PipelineDockerImageBuilder._get_hub_requirements(
+                    docker_settings.required_hub_plugins
+                ),
             )
 
             # Plugin packages themselves
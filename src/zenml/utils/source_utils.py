@@ -14,19 +14,25 @@
 """Utilities for loading/resolving objects."""
 
 import contextlib
+import functools
 import importlib
 import inspect
 import os
 import site
 import sys
+import threading
+from collections import OrderedDict
 from distutils.sysconfig import get_python_lib
 from pathlib import Path, PurePath
 from types import ModuleType
 from typing import (
     Any,
     Callable,
+    Dict,
     Iterator,
+    List,
     Optional,
+    Tuple,
     Type,
     Union,
     cast,
@@ -49,6 +55,12 @@ NoneTypeSource = Source(
 
 _CUSTOM_SOURCE_ROOT: Optional[str] = None
 
+# Maximum number of entries of the caches for loaded sources, source types and
+# package lookups
+SOURCE_CACHE_SIZE = 1024
+_LOADED_MODULE_CACHE: "OrderedDict[str, ModuleType]" = OrderedDict()
+_LOADED_MODULE_CACHE_LOCK = threading.Lock()
+
 
 def load(source: Union[Source, str]) -> Any:
     """Load a source or import path.
@@ -67,6 +79,29 @@ def load(source: Union[Source, str]) -> Any:
         # so we need to manually handle it here
         return NoneType
 
+    cache_key = source.json()
+    module = _get_cached_module(cache_key=cache_key, module_name=source.module)
+    if module is None:
+        module = _load_source_module(source)
+        _cache_module(cache_key=cache_key, module=module)
+
+    if source.attribute:
+        obj = getattr(module, source.attribute)
+    else:
+        obj = module
+
+    return obj
+
+
+def _load_source_module(source: Source) -> ModuleType:
+    """Load the module of a source.
+
+    Args:
+        source: The source for which to load the module.
+
+    Returns:
+        The loaded module.
+    """
     import_root = None
     if source.type == SourceType.CODE_REPOSITORY:
         source = CodeRepositorySource.parse_obj(source)
@@ -93,14 +128,58 @@ def load(source: Union[Source, str]) -> Any:
         # root in python path just to be sure
         import_root = get_source_root()
 
-    module = _load_module(module_name=source.module, import_root=import_root)
+    return _load_module(module_name=source.module, import_root=import_root)
 
-    if source.attribute:
-        obj = getattr(module, source.attribute)
-    else:
-        obj = module
 
-    return obj
+def _get_cached_module(
+    cache_key: str, module_name: str
+) -> Optional[ModuleType]:
+    """Get the cached module of a previously loaded source.
+
+    Cached modules are only returned if they are still the module imported
+    under that name, so that reloaded modules are never returned.
+
+    Args:
+        cache_key: The cache key of the source.
+        module_name: The name of the source module.
+
+    Returns:
+        The cached module or None if the source module is not cached.
+    """
+    with _LOADED_MODULE_CACHE_LOCK:
+        module = _LOADED_MODULE_CACHE.get(cache_key)
+        if module is None:
+            return None
+
+        if sys.modules.get(module_name) is not module:
+            del _LOADED_MODULE_CACHE[cache_key]
+            return None
+
+        _LOADED_MODULE_CACHE.move_to_end(cache_key)
+        return module
+
+
+def _cache_module(cache_key: str, module: ModuleType) -> None:
+    """Cache the module of a loaded source.
+
+    Args:
+        cache_key: The cache key of the source.
+        module: The loaded module.
+    """
+    with _LOADED_MODULE_CACHE_LOCK:
+        _LOADED_MODULE_CACHE[cache_key] = module
+        _LOADED_MODULE_CACHE.move_to_end(cache_key)
+        while len(_LOADED_MODULE_CACHE) > SOURCE_CACHE_SIZE:
+            _LOADED_MODULE_CACHE.popitem(last=False)
+
+
+def clear_caches() -> None:
+    """Clears the caches of loaded sources and package lookups."""
+    with _LOADED_MODULE_CACHE_LOCK:
+        _LOADED_MODULE_CACHE.clear()
+    _get_non_user_source_type.cache_clear()
+    _get_packages_distributions.cache_clear()
+    _get_installed_package_version.cache_clear()
 
 
 def resolve(
@@ -252,6 +331,7 @@ def set_custom_source_root(source_root: Optional[str]) -> None:
     logger.debug("Setting custom source root: %s", source_root)
     global _CUSTOM_SOURCE_ROOT
     _CUSTOM_SOURCE_ROOT = source_root
+    clear_caches()
 
 
 def is_internal_module(module_name: str) -> bool:
@@ -336,23 +416,46 @@ def get_source_type(module: ModuleType) -> SourceType:
 
         return SourceType.BUILTIN
 
-    if is_internal_module(module_name=module.__name__):
+    source_type = _get_non_user_source_type(
+        module_name=module.__name__, file_path=file_path
+    )
+    if source_type:
+        return source_type
+
+    # Make sure to check for distribution packages before this to catch the
+    # case when a virtual environment is inside our source root
+    if is_user_file(file_path=file_path):
+        return SourceType.USER
+
+    return SourceType.UNKNOWN
+
+
+@functools.lru_cache(maxsize=SOURCE_CACHE_SIZE)
+def _get_non_user_source_type(
+    module_name: str, file_path: str
+) -> Optional[SourceType]:
+    """Get the type of a source if it doesn't depend on the source root.
+
+    Args:
+        module_name: The name of the source module.
+        file_path: The path of the file from which the module was loaded.
+
+    Returns:
+        The source type or None if the source is not an internal, builtin or
+        distribution package source.
+    """
+    if is_internal_module(module_name=module_name):
         return SourceType.INTERNAL
 
     if is_distribution_package_file(
-        file_path=file_path, module_name=module.__name__
+        file_path=file_path, module_name=module_name
     ):
         return SourceType.DISTRIBUTION_PACKAGE
 
     if is_standard_lib_file(file_path=file_path):
         return SourceType.BUILTIN
 
-    # Make sure to check for distribution packages before this to catch the
-    # case when a virtual environment is inside our source root
-    if is_user_file(file_path=file_path):
-        return SourceType.USER
-
-    return SourceType.UNKNOWN
+    return None
 
 
 @contextlib.contextmanager
@@ -508,13 +611,10 @@ def _get_package_for_module(module_name: str) -> Optional[str]:
     Returns:
         The package name or None if no package was found.
     """
-    if sys.version_info < (3, 10):
-        from importlib_metadata import packages_distributions
-    else:
-        from importlib.metadata import packages_distributions
-
     top_level_module = module_name.split(".", maxsplit=1)[0]
-    package_names = packages_distributions().get(top_level_module, [])
+    package_names = _get_packages_distributions(
+        python_path=tuple(sys.path)
+    ).get(top_level_module, [])
 
     if len(package_names) == 1:
         return package_names[0]
@@ -523,12 +623,56 @@ def _get_package_for_module(module_name: str) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=1)
+def _get_packages_distributions(
+    python_path: Tuple[str, ...],
+) -> Dict[str, List[str]]:
+    """Get the mapping of top-level modules to distribution packages.
+
+    Building this mapping requires reading the metadata of all installed
+    distributions, which is why it is cached for the current python path.
+
+    Args:
+        python_path: The python path for which to get the mapping. Only used
+            as cache key.
+
+    Returns:
+        Dictionary mapping top-level module names to the names of the
+        distribution packages that provide them.
+    """
+    if sys.version_info < (3, 10):
+        from importlib_metadata import packages_distributions
+    else:
+        from importlib.metadata import packages_distributions
+
+    return dict(packages_distributions())
+
+
 def _get_package_version(package_name: str) -> Optional[str]:
     """Gets the version of a package.
 
     Args:
         package_name: The name of the package for which to get the version.
 
+    Returns:
+        The package version or None if fetching the version failed.
+    """
+    return _get_installed_package_version(
+        package_name=package_name, python_path=tuple(sys.path)
+    )
+
+
+@functools.lru_cache(maxsize=SOURCE_CACHE_SIZE)
+def _get_installed_package_version(
+    package_name: str, python_path: Tuple[str, ...]
+) -> Optional[str]:
+    """Gets the installed version of a package for a python path.
+
+    Args:
+        package_name: The name of the package for which to get the version.
+        python_path: The python path for which to get the version. Only used
+            as cache key.
+
     Returns:
         The package version or None if fetching the version failed.
     """
@@ -190,6 +190,8 @@ class DockerZenServer(ContainerService):
         """
         import uvicorn
 
+        from zenml.zen_server.utils import prepare_server_workers
+
         gc = GlobalConfiguration()
         if gc.store_configuration.type == StoreType.REST:
             raise ValueError(
@@ -208,6 +210,7 @@ class DockerZenServer(ContainerService):
                 host="0.0.0.0",  # nosec
                 port=self.endpoint.config.port or 8000,
                 log_level="info",
+                workers=prepare_server_workers(),
             )
         except KeyboardInterrupt:
             logger.info("ZenML Server stopped. Resuming normal execution.")
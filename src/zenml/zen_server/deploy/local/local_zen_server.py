@@ -213,6 +213,8 @@ class LocalZenServer(LocalDaemonService):
         """
         import uvicorn
 
+        from zenml.zen_server.utils import prepare_server_workers
+
         gc = GlobalConfiguration()
         if gc.store_configuration.type == StoreType.REST:
             raise ValueError(
@@ -231,6 +233,7 @@ class LocalZenServer(LocalDaemonService):
                 host=self.endpoint.config.ip_address,
                 port=self.endpoint.config.port or 8000,
                 log_level="info",
+                workers=prepare_server_workers(),
             )
         except KeyboardInterrupt:
             logger.info("ZenML Server stopped. Resuming normal execution.")
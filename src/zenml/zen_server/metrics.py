@@ -0,0 +1,629 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Request and database metrics of the ZenML server."""
+
+import glob
+import json
+import os
+import tempfile
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import psutil
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.middleware.base import (
+    BaseHTTPMiddleware,
+    RequestResponseEndpoint,
+)
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bounds in seconds of the request latency histogram buckets
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# Route label for requests that didn't match any API route
+UNMATCHED_ROUTE = "unmatched"
+# Maximum length of slow queries that are logged
+MAX_LOGGED_QUERY_LENGTH = 1000
+# Minimum time in seconds between two snapshots of the metrics of a worker
+METRICS_SNAPSHOT_INTERVAL = 1.0
+
+RouteKey = Tuple[str, str]
+
+
+class RequestStats:
+    """Database statistics of a single request.
+
+    Attributes:
+        query_count: The number of database queries executed.
+        query_duration: The total time in seconds spent executing queries.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the statistics."""
+        self.query_count = 0
+        self.query_duration = 0.0
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "request_stats", default=None
+)
+
+
+class ServerMetrics:
+    """Collects request and database metrics of the server.
+
+    All metrics are labeled with the HTTP method and the route template of
+    the request, e.g. `/api/v1/runs/{run_id}`, so that the number of label
+    combinations is bounded by the number of API routes.
+
+    If the server runs in multiple worker processes, each worker periodically
+    writes a snapshot of its metrics to a shared directory. The metrics of
+    all workers are then aggregated when rendering them, so that it doesn't
+    matter which worker handles the request for the metrics. The metrics of
+    the other workers can be up to `METRICS_SNAPSHOT_INTERVAL` seconds old.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        multiprocess_dir: Optional[str] = None,
+    ) -> None:
+        """Initializes the metrics.
+
+        Args:
+            buckets: Upper bounds in seconds of the latency histogram buckets.
+            multiprocess_dir: The directory in which the worker processes of
+                the server share their metrics. If not given, only the
+                metrics of this process are rendered.
+        """
+        self.buckets = sorted(buckets)
+        self.multiprocess_dir = multiprocess_dir
+        self._last_snapshot_time = 0.0
+        self.requests_in_progress = 0
+        self._requests: Dict[Tuple[str, str, int], int] = {}
+        self._latency_buckets: Dict[RouteKey, List[int]] = {}
+        self._latency_sum: Dict[RouteKey, float] = {}
+        self._response_size: Dict[RouteKey, List[int]] = {}
+        self._db_queries: Dict[RouteKey, int] = {}
+        self._db_duration: Dict[RouteKey, float] = {}
+        self._lock = threading.Lock()
+
+    def request_started(self) -> None:
+        """Records that a request started."""
+        with self._lock:
+            self.requests_in_progress += 1
+
+    def request_finished(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        duration: float,
+        response_size: Optional[int] = None,
+        stats: Optional[RequestStats] = None,
+    ) -> None:
+        """Records a finished request.
+
+        Args:
+            method: The HTTP method of the request.
+            route: The route template of the request.
+            status_code: The status code of the response.
+            duration: The time in seconds it took to handle the request.
+            response_size: The size of the response body in bytes, if known.
+            stats: The database statistics of the request.
+        """
+        key = (method, route)
+        with self._lock:
+            self.requests_in_progress -= 1
+            self._requests[(method, route, status_code)] = (
+                self._requests.get((method, route, status_code), 0) + 1
+            )
+
+            buckets = self._latency_buckets.setdefault(
+                key, [0] * len(self.buckets)
+            )
+            for i, upper_bound in enumerate(self.buckets):
+                if duration <= upper_bound:
+                    buckets[i] += 1
+            self._latency_sum[key] = self._latency_sum.get(key, 0.0) + duration
+
+            if response_size is not None:
+                size = self._response_size.setdefault(key, [0, 0])
+                size[0] += response_size
+                size[1] += 1
+
+            if stats is not None:
+                self._db_queries[key] = (
+                    self._db_queries.get(key, 0) + stats.query_count
+                )
+                self._db_duration[key] = (
+                    self._db_duration.get(key, 0.0) + stats.query_duration
+                )
+
+        if (
+            self.multiprocess_dir
+            and time.monotonic() - self._last_snapshot_time
+            > METRICS_SNAPSHOT_INTERVAL
+        ):
+            self.write_snapshot()
+
+    def render(self) -> str:
+        """Renders the metrics in the Prometheus text exposition format.
+
+        Returns:
+            The rendered metrics, including the metrics of all other worker
+            processes of the server if a multiprocess directory is configured.
+        """
+        if not self.multiprocess_dir:
+            return self._render()
+
+        self.write_snapshot()
+        aggregated_metrics = ServerMetrics(buckets=self.buckets)
+        for snapshot_file in sorted(
+            glob.glob(os.path.join(self.multiprocess_dir, "*.json"))
+        ):
+            try:
+                with open(snapshot_file, "r") as f:
+                    snapshot = json.load(f)
+                aggregated_metrics._merge_snapshot(snapshot)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.debug(
+                    "Skipping invalid metrics snapshot %s: %s",
+                    snapshot_file,
+                    e,
+                )
+        return aggregated_metrics._render()
+
+    def write_snapshot(self) -> None:
+        """Writes a snapshot of the metrics of this process.
+
+        The snapshot is written to a temporary file first, so that concurrent
+        readers never see a partially written snapshot.
+        """
+        if not self.multiprocess_dir:
+            return
+
+        with self._lock:
+            self._last_snapshot_time = time.monotonic()
+            snapshot = {
+                "pid": os.getpid(),
+                "buckets": self.buckets,
+                "requests_in_progress": self.requests_in_progress,
+                "requests": [
+                    [*key, count] for key, count in self._requests.items()
+                ],
+                "latency_buckets": [
+                    [*key, buckets]
+                    for key, buckets in self._latency_buckets.items()
+                ],
+                "latency_sum": [
+                    [*key, value] for key, value in self._latency_sum.items()
+                ],
+                "response_size": [
+                    [*key, size] for key, size in self._response_size.items()
+                ],
+                "db_queries": [
+                    [*key, count] for key, count in self._db_queries.items()
+                ],
+                "db_duration": [
+                    [*key, value] for key, value in self._db_duration.items()
+                ],
+            }
+
+        try:
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.multiprocess_dir, suffix=".tmp"
+            )
+        except OSError as e:
+            logger.debug("Failed to write metrics snapshot: %s", e)
+            return
+
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(snapshot, f)
+            os.replace(
+                temp_path,
+                os.path.join(self.multiprocess_dir, f"{os.getpid()}.json"),
+            )
+        except OSError as e:
+            logger.debug("Failed to write metrics snapshot: %s", e)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def remove_snapshot(self) -> None:
+        """Removes the snapshot of this process.
+
+        Called when the worker process shuts down, so that its metrics are no
+        longer aggregated by other workers or later runs of the server.
+        """
+        if not self.multiprocess_dir:
+            return
+
+        try:
+            os.remove(
+                os.path.join(self.multiprocess_dir, f"{os.getpid()}.json")
+            )
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug("Failed to remove metrics snapshot: %s", e)
+
+    def _merge_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """Adds the metrics of a worker process snapshot to these metrics.
+
+        Counters of worker processes that exited without removing their
+        snapshot are kept. Their in-progress requests are ignored.
+
+        Args:
+            snapshot: The snapshot of the worker process.
+
+        Raises:
+            ValueError: If the snapshot uses different histogram buckets.
+        """
+        if snapshot["buckets"] != self.buckets:
+            raise ValueError("Histogram buckets don't match.")
+
+        with self._lock:
+            if psutil.pid_exists(snapshot["pid"]):
+                self.requests_in_progress += snapshot["requests_in_progress"]
+            for method, route, status_code, count in snapshot["requests"]:
+                key = (method, route, status_code)
+                self._requests[key] = self._requests.get(key, 0) + count
+            for method, route, buckets in snapshot["latency_buckets"]:
+                merged_buckets = self._latency_buckets.setdefault(
+                    (method, route), [0] * len(self.buckets)
+                )
+                for i, count in enumerate(buckets):
+                    merged_buckets[i] += count
+            for name in ("latency_sum", "db_queries", "db_duration"):
+                values: Dict[RouteKey, Any] = getattr(self, f"_{name}")
+                for method, route, value in snapshot[name]:
+                    values[(method, route)] = (
+                        values.get((method, route), 0) + value
+                    )
+            for method, route, (size_sum, size_count) in snapshot[
+                "response_size"
+            ]:
+                size = self._response_size.setdefault((method, route), [0, 0])
+                size[0] += size_sum
+                size[1] += size_count
+
+    def _render(self) -> str:
+        """Renders the metrics of this process.
+
+        Returns:
+            The rendered metrics.
+        """
+        lines: List[str] = []
+
+        def _add_metric(
+            name: str,
+            type_: str,
+            help_: str,
+            samples: List[Tuple[str, Dict[str, Any], Any]],
+        ) -> None:
+            lines.append(f"# HELP {name} {help_}")
+            lines.append(f"# TYPE {name} {type_}")
+            for suffix, labels, value in samples:
+                label_str = ",".join(
+                    f'{k}="{_escape_label_value(str(v))}"'
+                    for k, v in labels.items()
+                )
+                if label_str:
+                    label_str = f"{{{label_str}}}"
+                lines.append(f"{name}{suffix}{label_str} {value}")
+
+        with self._lock:
+            _add_metric(
+                "zenml_http_requests_in_progress",
+                "gauge",
+                "Number of requests that are currently being handled.",
+                [("", {}, self.requests_in_progress)],
+            )
+            _add_metric(
+                "zenml_http_requests_total",
+                "counter",
+                "Number of handled requests.",
+                [
+                    ("", {"method": m, "route": r, "status": s}, count)
+                    for (m, r, s), count in sorted(self._requests.items())
+                ],
+            )
+
+            latency_samples: List[Tuple[str, Dict[str, Any], Any]] = []
+            for (method, route), buckets in sorted(
+                self._latency_buckets.items()
+            ):
+                labels: Dict[str, Any] = {"method": method, "route": route}
+                for upper_bound, count in zip(self.buckets, buckets):
+                    latency_samples.append(
+                        ("_bucket", {**labels, "le": upper_bound}, count)
+                    )
+                total = self._requests_for_route(method, route)
+                latency_samples.append(
+                    ("_bucket", {**labels, "le": "+Inf"}, total)
+                )
+                latency_samples.append(
+                    ("_sum", labels, self._latency_sum[(method, route)])
+                )
+                latency_samples.append(("_count", labels, total))
+            _add_metric(
+                "zenml_http_request_duration_seconds",
+                "histogram",
+                "Time spent handling requests.",
+                latency_samples,
+            )
+
+            size_samples: List[Tuple[str, Dict[str, Any], Any]] = []
+            for (method, route), (size_sum, size_count) in sorted(
+                self._response_size.items()
+            ):
+                labels = {"method": method, "route": route}
+                size_samples.append(("_sum", labels, size_sum))
+                size_samples.append(("_count", labels, size_count))
+            _add_metric(
+                "zenml_http_response_size_bytes",
+                "summary",
+                "Size of the response bodies.",
+                size_samples,
+            )
+
+            _add_metric(
+                "zenml_db_queries_total",
+                "counter",
+                "Number of database queries executed while handling requests.",
+                [
+                    ("", {"method": m, "route": r}, count)
+                    for (m, r), count in sorted(self._db_queries.items())
+                ],
+            )
+            _add_metric(
+                "zenml_db_query_duration_seconds_total",
+                "counter",
+                "Time spent executing database queries while handling "
+                "requests.",
+                [
+                    ("", {"method": m, "route": r}, duration)
+                    for (m, r), duration in sorted(self._db_duration.items())
+                ],
+            )
+
+        return "\n".join(lines) + "\n"
+
+    def _requests_for_route(self, method: str, route: str) -> int:
+        """Counts the requests of a route for all status codes.
+
+        Args:
+            method: The HTTP method.
+            route: The route template.
+
+        Returns:
+            The number of requests.
+        """
+        return sum(
+            count
+            for (m, r, _), count in self._requests.items()
+            if m == method and r == route
+        )
+
+
+def clear_snapshots(multiprocess_dir: str) -> None:
+    """Removes the metrics snapshots of previous server runs.
+
+    Args:
+        multiprocess_dir: The directory in which the worker processes of the
+            server share their metrics.
+    """
+    for pattern in ("*.json", "*.tmp"):
+        for snapshot_file in glob.glob(
+            os.path.join(multiprocess_dir, pattern)
+        ):
+            try:
+                os.remove(snapshot_file)
+            except OSError as e:
+                logger.debug(
+                    "Failed to remove metrics snapshot %s: %s",
+                    snapshot_file,
+                    e,
+                )
+
+
+def _escape_label_value(value: str) -> str:
+    """Escapes a Prometheus label value.
+
+    Args:
+        value: The label value.
+
+    Returns:
+        The escaped label value.
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def get_route_template(request: Request) -> str:
+    """Gets the route template that handled a request.
+
+    Args:
+        request: The request.
+
+    Returns:
+        The path template of the matching route or a placeholder if the
+        request didn't match a route.
+    """
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+def format_server_timing(duration: float, stats: RequestStats) -> str:
+    """Formats the `Server-Timing` header of a response.
+
+    Args:
+        duration: The time in seconds it took to handle the request.
+        stats: The database statistics of the request.
+
+    Returns:
+        The header value.
+    """
+    return (
+        f"app;dur={duration * 1000:.1f}, "
+        f"db;dur={stats.query_duration * 1000:.1f};"
+        f'desc="{stats.query_count} queries"'
+    )
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """Middleware that records the metrics of all requests."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        metrics: ServerMetrics,
+        server_timing: bool = False,
+    ) -> None:
+        """Initializes the middleware.
+
+        Args:
+            app: The application to wrap.
+            metrics: The metrics in which to record the requests.
+            server_timing: Whether to add a `Server-Timing` header with the
+                request and database timings to all responses.
+        """
+        super().__init__(app)
+        self.metrics = metrics
+        self.server_timing = server_timing
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        """Records the metrics of a request.
+
+        Args:
+            request: The incoming request object.
+            call_next: A function that will receive the request as a parameter
+                and pass it to the corresponding path operation.
+
+        Returns:
+            The response to the request.
+        """
+        stats = RequestStats()
+        _request_stats.set(stats)
+        self.metrics.request_started()
+        start_time = time.perf_counter()
+        status_code = 500
+        response_size: Optional[int] = None
+
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            if content_length := response.headers.get("content-length"):
+                response_size = int(content_length)
+        finally:
+            duration = time.perf_counter() - start_time
+            self.metrics.request_finished(
+                method=request.method,
+                route=get_route_template(request),
+                status_code=status_code,
+                duration=duration,
+                response_size=response_size,
+                stats=stats,
+            )
+
+        if self.server_timing:
+            response.headers["Server-Timing"] = format_server_timing(
+                duration, stats
+            )
+        return response
+
+
+def instrument_engine(engine: Engine, slow_query_threshold: float) -> None:
+    """Counts and times the queries executed by a SQLAlchemy engine.
+
+    The queries are attributed to the request that is handled in the current
+    context. Queries that take longer than the threshold are logged.
+
+    Args:
+        engine: The engine to instrument.
+        slow_query_threshold: The duration in seconds after which a query is
+            logged as slow. Set to 0 to disable logging slow queries.
+    """
+
+    def _before_cursor_execute(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        conn.info.setdefault("query_start_time", []).append(
+            time.perf_counter()
+        )
+
+    def _after_cursor_execute(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        start_times = conn.info.get("query_start_time")
+        if not start_times:
+            return
+        duration = time.perf_counter() - start_times.pop()
+
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.query_count += 1
+            stats.query_duration += duration
+
+        if slow_query_threshold > 0 and duration > slow_query_threshold:
+            logger.warning(
+                "Slow database query took %.3fs: %s",
+                duration,
+                statement[:MAX_LOGGED_QUERY_LENGTH],
+            )
+
+    def _handle_error(exception_context: Any) -> None:
+        # `after_cursor_execute` isn't called for failed queries
+        connection = exception_context.connection
+        if connection is None or exception_context.execution_context is None:
+            return
+        start_times = connection.info.get("query_start_time")
+        if start_times:
+            start_times.pop()
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,211 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""RBAC implementation that caches the decisions of another implementation."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from zenml.zen_server.rbac.models import Action, Resource
+from zenml.zen_server.rbac.rbac_interface import RBACInterface
+
+if TYPE_CHECKING:
+    from zenml.models import UserResponse
+
+# Maximum number of cached permission decisions
+MAX_CACHED_PERMISSION_DECISIONS = 10000
+
+# Cache keys and entries: (decision, expiration time)
+PermissionKey = Tuple[UUID, Action, Resource]
+PermissionEntry = Tuple[bool, float]
+AllowedResourceIdsEntry = Tuple[Tuple[bool, List[str]], float]
+
+
+class CachingRBAC(RBACInterface):
+    """RBAC implementation that caches the decisions of another implementation.
+
+    Permission decisions are cached per user, action and resource for a short
+    time. When checking the permissions for multiple resources, all resources
+    without a cached decision are checked with a single call to the wrapped
+    implementation.
+
+    Changes to the permissions of a user that are made by other services or
+    other server worker processes only take effect once the cached decisions
+    expired. Changes made through this implementation invalidate the cached
+    decisions of the affected user in the same process immediately.
+    """
+
+    def __init__(
+        self,
+        rbac: RBACInterface,
+        ttl: float,
+        max_entries: int = MAX_CACHED_PERMISSION_DECISIONS,
+    ) -> None:
+        """Initializes the RBAC implementation.
+
+        Args:
+            rbac: The RBAC implementation that makes the permission decisions.
+            ttl: The time in seconds for which decisions are cached.
+            max_entries: The maximum number of cached decisions.
+        """
+        self._rbac = rbac
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._permissions: "OrderedDict[PermissionKey, PermissionEntry]" = (
+            OrderedDict()
+        )
+        self._allowed_resource_ids: "OrderedDict[PermissionKey, AllowedResourceIdsEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check_permissions(
+        self, user: "UserResponse", resources: Set[Resource], action: Action
+    ) -> Dict[Resource, bool]:
+        """Checks if a user has permissions to perform an action on resources.
+
+        Args:
+            user: User which wants to access a resource.
+            resources: The resources the user wants to access.
+            action: The action that the user wants to perform on the resources.
+
+        Returns:
+            A dictionary mapping resources to a boolean which indicates whether
+            the user has permissions to perform the action on that resource.
+        """
+        now = time.monotonic()
+        permissions: Dict[Resource, bool] = {}
+        missing_resources: Set[Resource] = set()
+
+        with self._lock:
+            for resource in resources:
+                entry = self._permissions.get((user.id, action, resource))
+                if entry and entry[1] > now:
+                    permissions[resource] = entry[0]
+                else:
+                    missing_resources.add(resource)
+
+        if missing_resources:
+            new_permissions = self._rbac.check_permissions(
+                user=user, resources=missing_resources, action=action
+            )
+            expiration = now + self._ttl
+            with self._lock:
+                for resource, has_permission in new_permissions.items():
+                    self._store(
+                        self._permissions,
+                        key=(user.id, action, resource),
+                        value=(has_permission, expiration),
+                    )
+            permissions.update(new_permissions)
+
+        return permissions
+
+    def list_allowed_resource_ids(
+        self, user: "UserResponse", resource: Resource, action: Action
+    ) -> Tuple[bool, List[str]]:
+        """Lists all resource IDs of a resource type that a user can access.
+
+        Args:
+            user: User which wants to access a resource.
+            resource: The resource the user wants to access.
+            action: The action that the user wants to perform on the resource.
+
+        Returns:
+            A tuple (full_resource_access, resource_ids).
+            `full_resource_access` will be `True` if the user can perform the
+            given action on any instance of the given resource type, `False`
+            otherwise. If `full_resource_access` is `False`, `resource_ids`
+            will contain the list of instance IDs that the user can perform
+            the action on.
+        """
+        now = time.monotonic()
+        key = (user.id, action, resource)
+
+        with self._lock:
+            entry = self._allowed_resource_ids.get(key)
+            if entry and entry[1] > now:
+                full_resource_access, resource_ids = entry[0]
+                return full_resource_access, list(resource_ids)
+
+        full_resource_access, resource_ids = (
+            self._rbac.list_allowed_resource_ids(
+                user=user, resource=resource, action=action
+            )
+        )
+        with self._lock:
+            self._store(
+                self._allowed_resource_ids,
+                key=key,
+                value=(
+                    (full_resource_access, list(resource_ids)),
+                    now + self._ttl,
+                ),
+            )
+        return full_resource_access, resource_ids
+
+    def update_resource_membership(
+        self, user: "UserResponse", resource: Resource, actions: List[Action]
+    ) -> None:
+        """Update the resource membership of a user.
+
+        Args:
+            user: User for which the resource membership should be updated.
+            resource: The resource.
+            actions: The actions that the user should be able to perform on the
+                resource.
+        """
+        self._rbac.update_resource_membership(
+            user=user, resource=resource, actions=actions
+        )
+        self.invalidate(user_id=user.id)
+
+    def invalidate(self, user_id: Optional[UUID] = None) -> None:
+        """Removes cached decisions.
+
+        Args:
+            user_id: Only remove the cached decisions of this user. If not
+                given, all cached decisions are removed.
+        """
+        with self._lock:
+            if user_id is None:
+                self._permissions.clear()
+                self._allowed_resource_ids.clear()
+                return
+
+            caches: List["OrderedDict[PermissionKey, Any]"] = [
+                self._permissions,
+                self._allowed_resource_ids,
+            ]
+            for cache in caches:
+                for key in [key for key in cache if key[0] == user_id]:
+                    del cache[key]
+
+    def _store(
+        self,
+        cache: "OrderedDict[PermissionKey, Any]",
+        key: PermissionKey,
+        value: Any,
+    ) -> None:
+        """Stores a decision in a cache and evicts the oldest decisions.
+
+        Args:
+            cache: The cache in which to store the decision.
+            key: The key of the decision.
+            value: The decision and its expiration time.
+        """
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self._max_entries:
+            cache.popitem(last=False)
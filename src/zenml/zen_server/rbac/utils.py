@@ -58,6 +58,11 @@ def dehydrate_page(page: Page[AnyResponse]) -> Page[AnyResponse]:
     if not server_config().rbac_enabled:
         return page
 
+    if any(item.is_projection for item in page.items):
+        # Projected responses don't include any sub-models which would need
+        # to be dehydrated
+        return page
+
     auth_context = get_auth_context()
     assert auth_context
 
@@ -102,16 +107,21 @@ def dehydrate_response_model(
             user=auth_context.user, resources=resources, action=Action.READ
         )
 
+    # The values of the model are already validated, so instead of parsing
+    # the model again we only replace the values that changed in a copy
     dehydrated_values = {}
     for key, value in model.__dict__.items():
         if key in model.__private_attributes__:
-            dehydrated_values[key] = value
-        else:
-            dehydrated_values[key] = _dehydrate_value(
-                value, permissions=permissions
-            )
+            continue
+
+        dehydrated_value = _dehydrate_value(value, permissions=permissions)
+        if dehydrated_value is not value:
+            dehydrated_values[key] = dehydrated_value
 
-    return type(model).parse_obj(dehydrated_values)
+    if not dehydrated_values:
+        return model
+
+    return model.copy(update=dehydrated_values)
 
 
 def _dehydrate_value(
@@ -127,7 +137,8 @@ def _dehydrate_value(
             permissions will be checked with the RBAC component.
 
     Returns:
-        The recursively dehydrated value.
+        The recursively dehydrated value. Values which don't need to be
+        dehydrated are returned as is.
     """
     if isinstance(value, BaseIdentifiedResponse):
         permission_model = get_surrogate_permission_model_for_model(
@@ -147,15 +158,21 @@ def _dehydrate_value(
     elif isinstance(value, BaseModel):
         return dehydrate_response_model(value, permissions=permissions)
     elif isinstance(value, Dict):
-        return {
+        dehydrated_dict = {
             k: _dehydrate_value(v, permissions=permissions)
             for k, v in value.items()
         }
+        if all(dehydrated_dict[k] is v for k, v in value.items()):
+            return value
+        return dehydrated_dict
     elif isinstance(value, (List, Set, tuple)):
-        type_ = type(value)
-        return type_(
+        dehydrated_items = [
             _dehydrate_value(v, permissions=permissions) for v in value
-        )
+        ]
+        if all(d is v for d, v in zip(dehydrated_items, value)):
+            return value
+        type_ = type(value)
+        return type_(dehydrated_items)
     else:
         return value
 
@@ -16,9 +16,19 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Security
+from fastapi.responses import StreamingResponse
 
-from zenml.artifacts.utils import load_artifact_visualization
-from zenml.constants import API, ARTIFACT_VERSIONS, VERSION_1, VISUALIZE
+from zenml.artifacts.utils import (
+    load_artifact_visualization,
+    stream_artifact_files_as_zip,
+)
+from zenml.constants import (
+    API,
+    ARTIFACT_VERSIONS,
+    DOWNLOAD,
+    VERSION_1,
+    VISUALIZE,
+)
 from zenml.models import (
     ArtifactVersionFilter,
     ArtifactVersionRequest,
@@ -44,6 +54,7 @@ from zenml.zen_server.rbac.utils import (
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
+    visualization_cache,
     zen_store,
 )
 
@@ -225,13 +236,19 @@ def prune_artifact_versions(
 def get_artifact_visualization(
     artifact_version_id: UUID,
     index: int = 0,
+    preview: bool = False,
     _: AuthContext = Security(authorize),
 ) -> LoadedVisualization:
     """Get the visualization of an artifact.
 
+    Loaded visualizations are cached by the server, so that repeatedly viewing
+    the same visualization doesn't read it from the artifact store each time.
+
     Args:
         artifact_version_id: ID of the artifact version for which to get the visualization.
         index: Index of the visualization to get (if there are multiple).
+        preview: Whether to only get a preview of the visualization. Large
+            text visualizations are truncated and images are downsampled.
 
     Returns:
         The visualization of the artifact version.
@@ -240,6 +257,55 @@ def get_artifact_visualization(
     artifact = verify_permissions_and_get_entity(
         id=artifact_version_id, get_method=store.get_artifact_version
     )
-    return load_artifact_visualization(
-        artifact=artifact, index=index, zen_store=store, encode_image=True
+
+    cache = visualization_cache()
+    cache_key = (artifact_version_id, index, preview)
+    if cache and (visualization := cache.get(cache_key)):
+        return visualization
+
+    visualization = load_artifact_visualization(
+        artifact=artifact,
+        index=index,
+        zen_store=store,
+        encode_image=True,
+        preview=preview,
+    )
+    if cache:
+        cache.put(cache_key, visualization)
+    return visualization
+
+
+@artifact_version_router.get(
+    "/{artifact_version_id}" + DOWNLOAD,
+    response_class=StreamingResponse,
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def download_artifact_version_files(
+    artifact_version_id: UUID,
+    _: AuthContext = Security(authorize),
+) -> StreamingResponse:
+    """Download the files of an artifact version as a zip archive.
+
+    The archive is streamed while it is being created from the files in the
+    artifact store.
+
+    Args:
+        artifact_version_id: ID of the artifact version for which to download
+            the files.
+
+    Returns:
+        The zip archive containing the files of the artifact version.
+    """
+    store = zen_store()
+    artifact = verify_permissions_and_get_entity(
+        id=artifact_version_id, get_method=store.get_artifact_version
+    )
+    return StreamingResponse(
+        stream_artifact_files_as_zip(artifact=artifact, zen_store=store),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": "attachment; "
+            f'filename="{artifact_version_id}.zip"'
+        },
     )
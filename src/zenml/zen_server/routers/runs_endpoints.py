@@ -13,10 +13,10 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for pipeline runs."""
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Query, Security
 
 from zenml.constants import (
     API,
@@ -24,6 +24,7 @@ from zenml.constants import (
     PIPELINE_CONFIGURATION,
     RUNS,
     STATUS,
+    STEP_OUTPUTS,
     STEPS,
     VERSION_1,
 )
@@ -35,6 +36,7 @@ from zenml.models import (
     PipelineRunResponse,
     PipelineRunUpdate,
     StepRunFilter,
+    StepRunOutputs,
     StepRunResponse,
 )
 from zenml.zen_server.auth import AuthContext, authorize
@@ -221,6 +223,36 @@ def get_run_steps(
     return zen_store().list_run_steps(step_run_filter_model)
 
 
+@router.get(
+    "/{run_id}" + STEP_OUTPUTS,
+    response_model=Dict[str, StepRunOutputs],
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def get_run_step_outputs(
+    run_id: UUID,
+    step_names: List[str] = Query([]),
+    output_names: List[str] = Query([]),
+    _: AuthContext = Security(authorize),
+) -> Dict[str, StepRunOutputs]:
+    """Get the IDs and some of the outputs of steps of a pipeline run.
+
+    Args:
+        run_id: ID of the pipeline run.
+        step_names: The names of the steps to fetch.
+        output_names: The names of the outputs to fetch for these steps.
+
+    Returns:
+        The IDs and outputs of the steps, indexed by step name.
+    """
+    verify_permissions_and_get_entity(
+        id=run_id, get_method=zen_store().get_run, hydrate=False
+    )
+    return zen_store().get_run_step_outputs(
+        run_id=run_id, step_names=step_names, output_names=output_names
+    )
+
+
 @router.get(
     "/{run_id}" + PIPELINE_CONFIGURATION,
     response_model=Dict[str, Any],
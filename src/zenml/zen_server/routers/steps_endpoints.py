@@ -13,7 +13,8 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for steps (and artifacts) of pipeline runs."""
 
-from typing import Any, Dict
+import json
+from typing import Any, Collection, Dict, List, Set
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Security
@@ -24,15 +25,20 @@ from zenml.artifacts.utils import (
 )
 from zenml.constants import (
     API,
+    BATCH,
     LOGS,
+    PAGE_SIZE_MAXIMUM,
     STATUS,
     STEP_CONFIGURATION,
     STEPS,
     VERSION_1,
 )
-from zenml.enums import ExecutionStatus
+from zenml.enums import ExecutionStatus, GenericFilterOps
 from zenml.models import (
     Page,
+    PipelineRunFilter,
+    StepRunBatchRequest,
+    StepRunBatchUpdate,
     StepRunFilter,
     StepRunRequest,
     StepRunResponse,
@@ -42,6 +48,7 @@ from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.rbac.models import Action, ResourceType
 from zenml.zen_server.rbac.utils import (
+    batch_verify_permissions_for_models,
     dehydrate_page,
     dehydrate_response_model,
     get_allowed_resource_ids,
@@ -123,6 +130,77 @@ def create_run_step(
     return zen_store().create_run_step(step_run=step)
 
 
+@router.post(
+    BATCH,
+    response_model=List[StepRunResponse],
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def create_run_steps(
+    batch: StepRunBatchRequest,
+    _: AuthContext = Security(authorize),
+) -> List[StepRunResponse]:
+    """Create multiple run steps in a single transaction.
+
+    Args:
+        batch: The run steps to create.
+
+    Returns:
+        The created run steps.
+    """
+    _verify_permissions_to_update_runs(
+        {step.pipeline_run_id for step in batch.step_runs}
+    )
+
+    return zen_store().create_run_steps(step_runs=batch.step_runs)
+
+
+@router.put(
+    BATCH,
+    response_model=List[StepRunResponse],
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def update_steps(
+    batch: StepRunBatchUpdate,
+    _: AuthContext = Security(authorize),
+) -> List[StepRunResponse]:
+    """Updates multiple steps in a single transaction.
+
+    Args:
+        batch: The updates to apply, keyed by step ID.
+
+    Returns:
+        The updated step models.
+    """
+    step_run_updates = {
+        UUID(step_id): step_model
+        for step_id, step_model in batch.updates.items()
+    }
+
+    step_ids = list(step_run_updates)
+    pipeline_run_ids: Set[UUID] = set()
+    for start in range(0, len(step_ids), PAGE_SIZE_MAXIMUM):
+        chunk = step_ids[start : start + PAGE_SIZE_MAXIMUM]
+        steps = zen_store().list_run_steps(
+            StepRunFilter(id=_one_of(chunk), size=len(chunk))
+        )
+        if steps.total < len(chunk):
+            missing_ids = set(chunk) - {step.id for step in steps.items}
+            raise KeyError(
+                "Unable to update steps: No steps with IDs "
+                f"{', '.join(map(str, missing_ids))} found."
+            )
+        pipeline_run_ids.update(step.pipeline_run_id for step in steps.items)
+
+    _verify_permissions_to_update_runs(pipeline_run_ids)
+
+    updated_steps = zen_store().update_run_steps(
+        step_run_updates=step_run_updates
+    )
+    return [dehydrate_response_model(step) for step in updated_steps]
+
+
 @router.get(
     "/{step_id}",
     response_model=StepRunResponse,
@@ -268,3 +346,45 @@ def get_step_logs(
             logs.uri, artifact_store=artifact_store, mode="r"
         )
     )
+
+
+def _one_of(ids: Collection[UUID]) -> str:
+    """Builds the value of a filter that matches any of the given IDs.
+
+    Args:
+        ids: The IDs to match.
+
+    Returns:
+        The filter value.
+    """
+    return f"{GenericFilterOps.ONEOF}:{json.dumps([str(id_) for id_ in ids])}"
+
+
+def _verify_permissions_to_update_runs(
+    pipeline_run_ids: Collection[UUID],
+) -> None:
+    """Verifies that the user is allowed to update the given pipeline runs.
+
+    The pipeline runs are fetched in a single query per page.
+
+    Args:
+        pipeline_run_ids: The IDs of the pipeline runs.
+
+    Raises:
+        KeyError: If any of the pipeline runs doesn't exist.
+    """
+    run_ids = list(pipeline_run_ids)
+    for start in range(0, len(run_ids), PAGE_SIZE_MAXIMUM):
+        chunk = run_ids[start : start + PAGE_SIZE_MAXIMUM]
+        pipeline_runs = zen_store().list_runs(
+            PipelineRunFilter(id=_one_of(chunk), size=len(chunk))
+        )
+        if pipeline_runs.total < len(chunk):
+            missing_ids = set(chunk) - {run.id for run in pipeline_runs.items}
+            raise KeyError(
+                "No pipeline runs with IDs "
+                f"{', '.join(map(str, missing_ids))} found."
+            )
+        batch_verify_permissions_for_models(
+            pipeline_runs.items, action=Action.UPDATE
+        )
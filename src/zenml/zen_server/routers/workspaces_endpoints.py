@@ -21,8 +21,11 @@ from fastapi import APIRouter, Depends, Security
 from zenml.constants import (
     API,
     ARTIFACTS,
+    BATCH,
     CODE_REPOSITORIES,
     GET_OR_CREATE,
+    MODEL_VERSION_ARTIFACTS,
+    MODEL_VERSION_PIPELINE_RUNS,
     MODEL_VERSIONS,
     MODELS,
     PIPELINE_BUILDS,
@@ -51,8 +54,10 @@ from zenml.models import (
     ComponentResponse,
     ModelRequest,
     ModelResponse,
+    ModelVersionArtifactBatchRequest,
     ModelVersionArtifactRequest,
     ModelVersionArtifactResponse,
+    ModelVersionPipelineRunBatchRequest,
     ModelVersionPipelineRunRequest,
     ModelVersionPipelineRunResponse,
     ModelVersionRequest,
@@ -70,6 +75,7 @@ from zenml.models import (
     PipelineRunFilter,
     PipelineRunRequest,
     PipelineRunResponse,
+    RunMetadataBatchRequest,
     RunMetadataRequest,
     RunMetadataResponse,
     ScheduleRequest,
@@ -860,6 +866,64 @@ def create_run_metadata(
 
     Returns:
         The created run metadata.
+    """
+    _verify_run_metadata_permissions(
+        workspace_name_or_id=workspace_name_or_id,
+        run_metadata=run_metadata,
+        auth_context=auth_context,
+    )
+    verify_permission(
+        resource_type=ResourceType.RUN_METADATA, action=Action.CREATE
+    )
+
+    return zen_store().create_run_metadata(run_metadata)
+
+
+@router.post(
+    WORKSPACES + "/{workspace_name_or_id}" + RUN_METADATA + BATCH,
+    response_model=List[RunMetadataResponse],
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def create_run_metadata_batch(
+    workspace_name_or_id: Union[str, UUID],
+    batch: RunMetadataBatchRequest,
+    auth_context: AuthContext = Security(authorize),
+) -> List[RunMetadataResponse]:
+    """Creates run metadata for multiple resources in one transaction.
+
+    Args:
+        workspace_name_or_id: Name or ID of the workspace.
+        batch: The run metadata to create.
+        auth_context: Authentication context.
+
+    Returns:
+        The created run metadata.
+    """
+    for run_metadata in batch.run_metadata:
+        _verify_run_metadata_permissions(
+            workspace_name_or_id=workspace_name_or_id,
+            run_metadata=run_metadata,
+            auth_context=auth_context,
+        )
+    verify_permission(
+        resource_type=ResourceType.RUN_METADATA, action=Action.CREATE
+    )
+
+    return zen_store().create_run_metadata_batch(batch.run_metadata)
+
+
+def _verify_run_metadata_permissions(
+    workspace_name_or_id: Union[str, UUID],
+    run_metadata: RunMetadataRequest,
+    auth_context: AuthContext,
+) -> None:
+    """Verifies that run metadata can be created for its resource.
+
+    Args:
+        workspace_name_or_id: Name or ID of the workspace.
+        run_metadata: The run metadata to create.
+        auth_context: Authentication context.
 
     Raises:
         IllegalOperationError: If the workspace or user specified in the run
@@ -900,12 +964,6 @@ def create_run_metadata(
             f"Unknown resource type: {run_metadata.resource_type}"
         )
 
-    verify_permission(
-        resource_type=ResourceType.RUN_METADATA, action=Action.CREATE
-    )
-
-    return zen_store().create_run_metadata(run_metadata)
-
 
 @router.post(
     WORKSPACES + "/{workspace_name_or_id}" + SECRETS,
@@ -1369,6 +1427,53 @@ def create_model_version_artifact_link(
     return mv
 
 
+@router.post(
+    WORKSPACES + "/{workspace_name_or_id}" + MODEL_VERSION_ARTIFACTS + BATCH,
+    response_model=List[ModelVersionArtifactResponse],
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def create_model_version_artifact_links(
+    workspace_name_or_id: Union[str, UUID],
+    batch: ModelVersionArtifactBatchRequest,
+    auth_context: AuthContext = Security(authorize),
+) -> List[ModelVersionArtifactResponse]:
+    """Create multiple model version to artifact links in one transaction.
+
+    Args:
+        workspace_name_or_id: Name or ID of the workspace.
+        batch: The model version to artifact links to create.
+        auth_context: Authentication context.
+
+    Returns:
+        The created or existing model version to artifact links.
+
+    Raises:
+        IllegalOperationError: If the workspace or user specified in one of
+            the links does not match the current workspace or authenticated
+            user.
+    """
+    workspace = zen_store().get_workspace(workspace_name_or_id)
+    for link in batch.links:
+        if link.workspace != workspace.id:
+            raise IllegalOperationError(
+                "Creating model version to artifact links outside of the "
+                f"workspace scope of this endpoint `{workspace_name_or_id}` "
+                "is not supported."
+            )
+        if link.user != auth_context.user.id:
+            raise IllegalOperationError(
+                "Creating model to artifact links for a user other than "
+                "yourself is not supported."
+            )
+
+    for model_version_id in {link.model_version for link in batch.links}:
+        model_version = zen_store().get_model_version(model_version_id)
+        verify_permission_for_model(model_version, action=Action.UPDATE)
+
+    return zen_store().create_model_version_artifact_links(batch.links)
+
+
 @router.post(
     WORKSPACES
     + "/{workspace_name_or_id}"
@@ -1431,3 +1536,53 @@ def create_model_version_pipeline_run_link(
         model_version_pipeline_run_link
     )
     return mv
+
+
+@router.post(
+    WORKSPACES
+    + "/{workspace_name_or_id}"
+    + MODEL_VERSION_PIPELINE_RUNS
+    + BATCH,
+    response_model=List[ModelVersionPipelineRunResponse],
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def create_model_version_pipeline_run_links(
+    workspace_name_or_id: Union[str, UUID],
+    batch: ModelVersionPipelineRunBatchRequest,
+    auth_context: AuthContext = Security(authorize),
+) -> List[ModelVersionPipelineRunResponse]:
+    """Create multiple model version to pipeline run links in one transaction.
+
+    Args:
+        workspace_name_or_id: Name or ID of the workspace.
+        batch: The model version to pipeline run links to create.
+        auth_context: Authentication context.
+
+    Returns:
+        The created or existing model version to pipeline run links.
+
+    Raises:
+        IllegalOperationError: If the workspace or user specified in one of
+            the links does not match the current workspace or authenticated
+            user.
+    """
+    workspace = zen_store().get_workspace(workspace_name_or_id)
+    for link in batch.links:
+        if link.workspace != workspace.id:
+            raise IllegalOperationError(
+                "Creating model version to pipeline run links outside of the "
+                f"workspace scope of this endpoint `{workspace_name_or_id}` "
+                "is not supported."
+            )
+        if link.user != auth_context.user.id:
+            raise IllegalOperationError(
+                "Creating model to pipeline run links for a user other than "
+                "yourself is not supported."
+            )
+
+    for model_version_id in {link.model_version for link in batch.links}:
+        model_version = zen_store().get_model_version(model_version_id)
+        verify_permission_for_model(model_version, action=Action.UPDATE)
+
+    return zen_store().create_model_version_pipeline_run_links(batch.links)
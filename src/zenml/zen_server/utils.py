@@ -13,10 +13,22 @@
 #  permissions and limitations under the License.
 """Util functions for the ZenML Server."""
 
+import atexit
 import inspect
 import os
+import shutil
+import tempfile
 from functools import wraps
-from typing import Any, Callable, Optional, Tuple, Type, TypeVar, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 from urllib.parse import urlparse
 
 from pydantic import BaseModel, ValidationError
@@ -24,11 +36,15 @@ from pydantic import BaseModel, ValidationError
 from zenml.config.global_config import GlobalConfiguration
 from zenml.config.server_config import ServerConfiguration
 from zenml.constants import (
+    ENV_ZENML_DISABLE_DATABASE_MIGRATION,
     ENV_ZENML_SERVER,
+    ENV_ZENML_SERVER_JWT_SECRET_KEY,
+    ENV_ZENML_SERVER_METRICS_MULTIPROCESS_DIR,
 )
 from zenml.enums import ServerProviderType
 from zenml.exceptions import OAuthError
 from zenml.logger import get_logger
+from zenml.models import Page
 from zenml.plugins.plugin_flavor_registry import PluginFlavorRegistry
 from zenml.zen_server.deploy.deployment import ServerDeployment
 from zenml.zen_server.deploy.local.local_zen_server import (
@@ -41,12 +57,18 @@ from zenml.zen_server.pipeline_deployment.workload_manager_interface import (
 from zenml.zen_server.rbac.rbac_interface import RBACInterface
 from zenml.zen_stores.sql_zen_store import SqlZenStore
 
+if TYPE_CHECKING:
+    from zenml.zen_server.metrics import ServerMetrics
+    from zenml.zen_server.visualization_cache import VisualizationCache
+
 logger = get_logger(__name__)
 
 _zen_store: Optional["SqlZenStore"] = None
 _rbac: Optional[RBACInterface] = None
 _workload_manager: Optional[WorkloadManagerInterface] = None
 _plugin_flavor_registry: Optional[PluginFlavorRegistry] = None
+_server_metrics: Optional["ServerMetrics"] = None
+_visualization_cache: Optional["VisualizationCache"] = None
 
 
 def zen_store() -> "SqlZenStore":
@@ -117,7 +139,17 @@ def initialize_rbac() -> None:
         implementation_class = source_utils.load_and_validate_class(
             rbac_source, expected_class=RBACInterface
         )
-        _rbac = implementation_class()
+        rbac_implementation: RBACInterface = implementation_class()
+
+        if server_config().rbac_permission_cache_ttl > 0:
+            from zenml.zen_server.rbac.caching_rbac import CachingRBAC
+
+            rbac_implementation = CachingRBAC(
+                rbac=rbac_implementation,
+                ttl=server_config().rbac_permission_cache_ttl,
+            )
+
+        _rbac = rbac_implementation
 
 
 def initialize_workload_manager() -> None:
@@ -167,6 +199,14 @@ def initialize_zen_store() -> None:
             "when trying to start the ZenML Server."
         )
 
+    if server_config().metrics_enabled:
+        from zenml.zen_server.metrics import instrument_engine
+
+        instrument_engine(
+            zen_store_.engine,
+            slow_query_threshold=server_config().slow_query_threshold,
+        )
+
     global _zen_store
     _zen_store = zen_store_
 
@@ -186,6 +226,76 @@ def server_config() -> ServerConfiguration:
     return _server_config
 
 
+def server_metrics() -> "ServerMetrics":
+    """Returns the request and database metrics of the ZenML server.
+
+    Returns:
+        The metrics of the ZenML server.
+    """
+    global _server_metrics
+    if _server_metrics is None:
+        from zenml.zen_server.metrics import ServerMetrics
+
+        _server_metrics = ServerMetrics(
+            multiprocess_dir=server_config().metrics_multiprocess_dir
+        )
+    return _server_metrics
+
+
+def visualization_cache() -> Optional["VisualizationCache"]:
+    """Returns the cache of the artifact visualizations served by the server.
+
+    Returns:
+        The visualization cache or `None` if caching visualizations is
+        disabled.
+    """
+    global _visualization_cache
+    max_size = server_config().visualization_cache_size
+    if _visualization_cache is None and max_size > 0:
+        from zenml.zen_server.visualization_cache import VisualizationCache
+
+        _visualization_cache = VisualizationCache(max_size=max_size)
+    return _visualization_cache
+
+
+def prepare_server_workers() -> int:
+    """Prepares the environment of the worker processes of the ZenML server.
+
+    The worker processes read their configuration from the environment.
+    Multiple workers need to sign JWT tokens with the same secret key and
+    share their metrics through a common directory. If these are not
+    configured, they are generated by this process and passed on to the
+    workers through the environment. The database is migrated once by this
+    process, because workers that start at the same time would otherwise all
+    try to migrate it concurrently.
+
+    Returns:
+        The number of worker processes to start.
+    """
+    config = server_config()
+    if config.workers > 1:
+        # Initializing the store migrates the database, unless migrations
+        # are disabled
+        GlobalConfiguration().zen_store
+        os.environ[ENV_ZENML_DISABLE_DATABASE_MIGRATION] = "true"
+
+        os.environ.setdefault(
+            ENV_ZENML_SERVER_JWT_SECRET_KEY, config.jwt_secret_key
+        )
+        if config.metrics_enabled:
+            from zenml.zen_server.metrics import clear_snapshots
+
+            if config.metrics_multiprocess_dir:
+                clear_snapshots(config.metrics_multiprocess_dir)
+            else:
+                metrics_dir = tempfile.mkdtemp(prefix="zenml-server-metrics-")
+                atexit.register(shutil.rmtree, metrics_dir, ignore_errors=True)
+                os.environ[ENV_ZENML_SERVER_METRICS_MULTIPROCESS_DIR] = (
+                    metrics_dir
+                )
+    return config.workers
+
+
 def get_active_deployment(local: bool = False) -> Optional["ServerDeployment"]:
     """Get the active local or remote server deployment.
 
@@ -286,6 +396,7 @@ def handle_exceptions(func: F) -> F:
         # These imports can't happen at module level as this module is also
         # used by the CLI when installed without the `server` extra
         from fastapi import HTTPException
+        from fastapi.encoders import jsonable_encoder
         from fastapi.responses import JSONResponse
 
         from zenml.zen_server.auth import AuthContext, set_auth_context
@@ -301,7 +412,7 @@ def handle_exceptions(func: F) -> F:
                     break
 
         try:
-            return func(*args, **kwargs)
+            result = func(*args, **kwargs)
         except OAuthError as error:
             # The OAuthError is special because it needs to have a JSON response
             return JSONResponse(
@@ -315,6 +426,18 @@ def handle_exceptions(func: F) -> F:
             http_exception = http_exception_from_error(error)
             raise http_exception
 
+        if isinstance(result, Page) and any(
+            item.is_projection for item in result.items
+        ):
+            # Projected responses only include some of their required fields,
+            # so they can't be validated against the response model of the
+            # endpoint and are returned as they are instead.
+            return JSONResponse(
+                content=jsonable_encoder(result, exclude_unset=True)
+            )
+
+        return result
+
     return cast(F, decorated)
 
 
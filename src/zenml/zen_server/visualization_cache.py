@@ -0,0 +1,84 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Cache of the artifact visualizations served by the ZenML server."""
+
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+from uuid import UUID
+
+from zenml.models import LoadedVisualization
+
+# Cache keys: (artifact version ID, visualization index, preview)
+VisualizationKey = Tuple[UUID, int, bool]
+
+
+class VisualizationCache:
+    """Size-bounded LRU cache of loaded artifact visualizations.
+
+    Artifact versions and their visualizations are immutable, so cached
+    visualizations never need to be invalidated. The cache is bounded by the
+    total size of the cached visualization values, visualizations that are
+    larger than the cache itself are never cached.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initializes the cache.
+
+        Args:
+            max_size: The maximum total size in bytes of the cached
+                visualizations.
+        """
+        self.max_size = max_size
+        self.size = 0
+        self._entries: "OrderedDict[VisualizationKey, Tuple[LoadedVisualization, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: VisualizationKey) -> Optional[LoadedVisualization]:
+        """Gets a cached visualization.
+
+        Args:
+            key: The key of the visualization.
+
+        Returns:
+            The cached visualization or `None` if it is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(
+        self, key: VisualizationKey, visualization: LoadedVisualization
+    ) -> None:
+        """Caches a visualization and evicts the least recently used ones.
+
+        Args:
+            key: The key of the visualization.
+            visualization: The visualization to cache.
+        """
+        size = len(visualization.value)
+        if size > self.max_size:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.size -= self._entries.pop(key)[1]
+            self._entries[key] = (visualization, size)
+            self.size += size
+            while self.size > self.max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
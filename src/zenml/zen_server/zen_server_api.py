@@ -13,10 +13,12 @@
 #  permissions and limitations under the License.
 """Zen Server API."""
 
+import hashlib
 import os
 from asyncio.log import logger
 from typing import Any, List
 
+from anyio import to_thread
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import ORJSONResponse
@@ -24,13 +26,15 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from genericpath import isfile
 from starlette.middleware.cors import CORSMiddleware
-from starlette.responses import FileResponse
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import FileResponse, PlainTextResponse, Response
 
 import zenml
 from zenml.analytics import source_context
-from zenml.constants import API, HEALTH
+from zenml.constants import API, HEALTH, METRICS
 from zenml.enums import AuthScheme, SourceContextTypes
 from zenml.zen_server.exceptions import error_detail
+from zenml.zen_server.metrics import MetricsMiddleware
 from zenml.zen_server.routers import (
     artifact_endpoint,
     artifact_version_endpoints,
@@ -67,9 +71,12 @@ from zenml.zen_server.utils import (
     initialize_workload_manager,
     initialize_zen_store,
     server_config,
+    server_metrics,
 )
 
 DASHBOARD_DIRECTORY = "dashboard"
+# Minimum size in bytes of responses that are compressed
+GZIP_MINIMUM_SIZE = 1000
 
 
 def relative_path(rel: str) -> str:
@@ -151,6 +158,61 @@ async def infer_source_context(request: Request, call_next: Any) -> Any:
     return await call_next(request)
 
 
+@app.middleware("http")
+async def set_etag(request: Request, call_next: Any) -> Any:
+    """A middleware to support conditional requests for JSON responses.
+
+    It adds an ETag computed from the body to successful JSON responses of
+    GET requests. If the request contains the same ETag in its
+    `If-None-Match` header, the client already has an up-to-date response
+    and an empty `304 Not Modified` response is returned instead.
+
+    Args:
+        request: the incoming request object.
+        call_next: a function that will receive the request as a parameter and
+            pass it to the corresponding path operation.
+
+    Returns:
+        the response to the request.
+    """
+    response = await call_next(request)
+
+    if (
+        request.method != "GET"
+        or response.status_code != 200
+        or not response.headers.get("content-type", "").startswith(
+            "application/json"
+        )
+    ):
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = f'W/"{hashlib.md5(body).hexdigest()}"'  # nosec
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    headers = dict(response.headers)
+    headers["ETag"] = etag
+    return Response(
+        content=body, status_code=response.status_code, headers=headers
+    )
+
+
+# Added after the ETag middleware so that it compresses the final responses
+# including their ETag. Only the metrics middleware, which needs to time the
+# complete request, is added after it.
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
+
+if server_config().metrics_enabled:
+    app.add_middleware(
+        MetricsMiddleware,
+        metrics=server_metrics(),
+        server_timing=server_config().metrics_server_timing,
+    )
+
+
 @app.on_event("startup")
 def initialize() -> None:
     """Initialize the ZenML server."""
@@ -162,6 +224,21 @@ def initialize() -> None:
     initialize_plugins()
 
 
+@app.on_event("startup")
+async def configure_thread_pool() -> None:
+    """Configure the thread pool that runs the synchronous endpoints."""
+    to_thread.current_default_thread_limiter().total_tokens = (
+        server_config().thread_pool_size
+    )
+
+
+@app.on_event("shutdown")
+def remove_metrics_snapshot() -> None:
+    """Remove the metrics snapshot of this worker process."""
+    if server_config().metrics_enabled:
+        server_metrics().remove_snapshot()
+
+
 app.mount(
     "/static",
     StaticFiles(
@@ -183,6 +260,21 @@ def health() -> str:
     return "OK"
 
 
+if server_config().metrics_enabled:
+
+    @app.get(METRICS, include_in_schema=False)
+    def metrics() -> PlainTextResponse:
+        """Get the request and database metrics of the server.
+
+        Returns:
+            The metrics in the Prometheus text exposition format.
+        """
+        return PlainTextResponse(
+            server_metrics().render(),
+            media_type="text/plain; version=0.0.4",
+        )
+
+
 templates = Jinja2Templates(directory=relative_path(DASHBOARD_DIRECTORY))
 
 
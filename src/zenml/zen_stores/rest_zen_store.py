@@ -13,26 +13,32 @@
 #  permissions and limitations under the License.
 """REST Zen Store implementation."""
 
+import copy
 import os
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import (
     Any,
+    Callable,
     ClassVar,
     Dict,
+    Hashable,
     List,
     Optional,
     Tuple,
     Type,
     TypeVar,
     Union,
+    cast,
 )
 from urllib.parse import urlparse
 from uuid import UUID
 
 import requests
 import urllib3
-from pydantic import BaseModel, root_validator, validator
+from pydantic import BaseModel, PrivateAttr, root_validator, validator
 from requests.adapters import HTTPAdapter, Retry
 
 import zenml
@@ -47,6 +53,7 @@ from zenml.constants import (
     ARTIFACT_VERSIONS,
     ARTIFACT_VISUALIZATIONS,
     ARTIFACTS,
+    BATCH,
     CODE_REFERENCES,
     CODE_REPOSITORIES,
     CURRENT_USER,
@@ -67,6 +74,8 @@ from zenml.constants import (
     PIPELINE_BUILDS,
     PIPELINE_DEPLOYMENTS,
     PIPELINES,
+    REST_CONNECTION_POOL_SIZE,
+    REST_RESPONSE_CACHE_SIZE,
     RUN_METADATA,
     RUNS,
     SCHEDULES,
@@ -82,6 +91,7 @@ from zenml.constants import (
     SERVICE_CONNECTORS,
     STACK_COMPONENTS,
     STACKS,
+    STEP_OUTPUTS,
     STEPS,
     TAGS,
     TRIGGER_EXECUTIONS,
@@ -139,10 +149,12 @@ from zenml.models import (
     ModelRequest,
     ModelResponse,
     ModelUpdate,
+    ModelVersionArtifactBatchRequest,
     ModelVersionArtifactFilter,
     ModelVersionArtifactRequest,
     ModelVersionArtifactResponse,
     ModelVersionFilter,
+    ModelVersionPipelineRunBatchRequest,
     ModelVersionPipelineRunFilter,
     ModelVersionPipelineRunRequest,
     ModelVersionPipelineRunResponse,
@@ -167,6 +179,7 @@ from zenml.models import (
     PipelineRunResponse,
     PipelineRunUpdate,
     PipelineUpdate,
+    RunMetadataBatchRequest,
     RunMetadataFilter,
     RunMetadataRequest,
     RunMetadataResponse,
@@ -193,7 +206,10 @@ from zenml.models import (
     StackRequest,
     StackResponse,
     StackUpdate,
+    StepRunBatchRequest,
+    StepRunBatchUpdate,
     StepRunFilter,
+    StepRunOutputs,
     StepRunRequest,
     StepRunResponse,
     StepRunUpdate,
@@ -238,6 +254,7 @@ AnyWorkspaceScopedRequest = TypeVar(
     "AnyWorkspaceScopedRequest",
     bound=WorkspaceScopedRequest,
 )
+T = TypeVar("T")
 
 
 class RestZenStoreConfiguration(StoreConfiguration):
@@ -389,13 +406,20 @@ class RestZenStoreConfiguration(StoreConfiguration):
 
 
 class RestZenStore(BaseZenStore):
-    """Store implementation for accessing data from a REST API."""
+    """Store implementation for accessing data from a REST API.
+
+    The store can be used from multiple threads at the same time. Requests
+    share a pool of up to `ZENML_REST_CONNECTION_POOL_SIZE` connections to the
+    server.
+    """
 
     config: RestZenStoreConfiguration
     TYPE: ClassVar[StoreType] = StoreType.REST
     CONFIG_TYPE: ClassVar[Type[StoreConfiguration]] = RestZenStoreConfiguration
     _api_token: Optional[str] = None
     _session: Optional[requests.Session] = None
+    _response_cache: "OrderedDict[Hashable, Tuple[str, Any]]" = OrderedDict()
+    _lock: threading.RLock = PrivateAttr(default_factory=threading.RLock)
 
     # ====================================
     # ZenML Store interface implementation
@@ -1596,6 +1620,37 @@ class RestZenStore(BaseZenStore):
                 result.append(RunMetadataResponse.parse_obj(metadata))
         return result
 
+    def create_run_metadata_batch(
+        self, run_metadata: List[RunMetadataRequest]
+    ) -> List[RunMetadataResponse]:
+        """Creates run metadata for multiple resources in one transaction.
+
+        One request is sent per workspace.
+
+        Args:
+            run_metadata: The run metadata to create.
+
+        Returns:
+            The created run metadata.
+        """
+        requests_by_workspace: Dict[UUID, List[RunMetadataRequest]] = {}
+        for request in run_metadata:
+            requests_by_workspace.setdefault(request.workspace, []).append(
+                request
+            )
+
+        result: List[RunMetadataResponse] = []
+        for workspace_id, workspace_requests in requests_by_workspace.items():
+            route = f"{WORKSPACES}/{str(workspace_id)}{RUN_METADATA}{BATCH}"
+            response_body = self.post(
+                route,
+                body=RunMetadataBatchRequest(run_metadata=workspace_requests),
+            )
+            if isinstance(response_body, list):
+                for metadata in response_body:
+                    result.append(RunMetadataResponse.parse_obj(metadata))
+        return result
+
     def get_run_metadata(
         self, run_metadata_id: UUID, hydrate: bool = True
     ) -> RunMetadataResponse:
@@ -2543,6 +2598,32 @@ class RestZenStore(BaseZenStore):
             route=STEPS,
         )
 
+    def create_run_steps(
+        self, step_runs: List[StepRunRequest]
+    ) -> List[StepRunResponse]:
+        """Creates multiple step runs in a single transaction.
+
+        Args:
+            step_runs: The step runs to create.
+
+        Returns:
+            The created step runs, in the same order as the requests.
+
+        Raises:
+            ValueError: if the server response is not a list.
+        """
+        if not step_runs:
+            return []
+
+        body = self.post(
+            STEPS + BATCH, body=StepRunBatchRequest(step_runs=step_runs)
+        )
+        if not isinstance(body, list):
+            raise ValueError(
+                f"Bad API Response. Expected list, got {type(body)}"
+            )
+        return [StepRunResponse.parse_obj(step_run) for step_run in body]
+
     def get_run_step(
         self, step_run_id: UUID, hydrate: bool = True
     ) -> StepRunResponse:
@@ -2586,6 +2667,39 @@ class RestZenStore(BaseZenStore):
             params={"hydrate": hydrate},
         )
 
+    def get_run_step_outputs(
+        self,
+        run_id: UUID,
+        step_names: List[str],
+        output_names: List[str],
+    ) -> Dict[str, StepRunOutputs]:
+        """Get the IDs and some of the outputs of steps of a pipeline run.
+
+        Args:
+            run_id: The ID of the pipeline run.
+            step_names: The names of the steps to fetch.
+            output_names: The names of the outputs to fetch for these steps.
+
+        Returns:
+            The IDs and outputs of the steps, indexed by step name. Steps or
+            outputs which don't exist are not included.
+
+        Raises:
+            ValueError: if the server response is not a dictionary.
+        """
+        body = self.get(
+            f"{RUNS}/{str(run_id)}{STEP_OUTPUTS}",
+            params={"step_names": step_names, "output_names": output_names},
+        )
+        if not isinstance(body, dict):
+            raise ValueError(
+                f"Bad API Response. Expected dict, got {type(body)}"
+            )
+        return {
+            name: StepRunOutputs.parse_obj(step_outputs)
+            for name, step_outputs in body.items()
+        }
+
     def update_run_step(
         self,
         step_run_id: UUID,
@@ -2607,6 +2721,39 @@ class RestZenStore(BaseZenStore):
             route=STEPS,
         )
 
+    def update_run_steps(
+        self, step_run_updates: Dict[UUID, StepRunUpdate]
+    ) -> List[StepRunResponse]:
+        """Updates multiple step runs in a single transaction.
+
+        Args:
+            step_run_updates: The updates to apply, keyed by the ID of the
+                step run to update.
+
+        Returns:
+            The updated step runs, in the same order as the updates.
+
+        Raises:
+            ValueError: if the server response is not a list.
+        """
+        if not step_run_updates:
+            return []
+
+        body = self.put(
+            STEPS + BATCH,
+            body=StepRunBatchUpdate(
+                updates={
+                    str(step_run_id): update
+                    for step_run_id, update in step_run_updates.items()
+                }
+            ),
+        )
+        if not isinstance(body, list):
+            raise ValueError(
+                f"Bad API Response. Expected list, got {type(body)}"
+            )
+        return [StepRunResponse.parse_obj(step_run) for step_run in body]
+
     # -------------------- Triggers  --------------------
 
     def create_trigger(self, trigger: TriggerRequest) -> TriggerResponse:
@@ -3173,6 +3320,52 @@ class RestZenStore(BaseZenStore):
             route=f"{MODEL_VERSIONS}/{model_version_artifact_link.model_version}{ARTIFACTS}",
         )
 
+    def create_model_version_artifact_links(
+        self, model_version_artifact_links: List[ModelVersionArtifactRequest]
+    ) -> List[ModelVersionArtifactResponse]:
+        """Creates multiple model version to artifact links in one transaction.
+
+        One request is sent per workspace.
+
+        Args:
+            model_version_artifact_links: the Model Version to Artifact Links
+                to be created.
+
+        Returns:
+            The created or existing links, in the same order as the requests.
+
+        Raises:
+            ValueError: if the server response is not a list.
+        """
+        links_by_workspace: Dict[
+            UUID, List[Tuple[int, ModelVersionArtifactRequest]]
+        ] = {}
+        for index, link in enumerate(model_version_artifact_links):
+            links_by_workspace.setdefault(link.workspace, []).append(
+                (index, link)
+            )
+
+        result: List[Optional[ModelVersionArtifactResponse]] = [None] * len(
+            model_version_artifact_links
+        )
+        for workspace_id, workspace_links in links_by_workspace.items():
+            route = f"{WORKSPACES}/{str(workspace_id)}{MODEL_VERSION_ARTIFACTS}{BATCH}"
+            body = self.post(
+                route,
+                body=ModelVersionArtifactBatchRequest(
+                    links=[link for _, link in workspace_links]
+                ),
+            )
+            if not isinstance(body, list):
+                raise ValueError(
+                    f"Bad API Response. Expected list, got {type(body)}"
+                )
+            for (index, _), link_body in zip(workspace_links, body):
+                result[index] = ModelVersionArtifactResponse.parse_obj(
+                    link_body
+                )
+        return [link for link in result if link is not None]
+
     def list_model_version_artifact_links(
         self,
         model_version_artifact_link_filter_model: ModelVersionArtifactFilter,
@@ -3253,6 +3446,53 @@ class RestZenStore(BaseZenStore):
             route=f"{MODEL_VERSIONS}/{model_version_pipeline_run_link.model_version}{RUNS}",
         )
 
+    def create_model_version_pipeline_run_links(
+        self,
+        model_version_pipeline_run_links: List[ModelVersionPipelineRunRequest],
+    ) -> List[ModelVersionPipelineRunResponse]:
+        """Creates multiple model version to pipeline run links in one transaction.
+
+        One request is sent per workspace.
+
+        Args:
+            model_version_pipeline_run_links: the Model Version to Pipeline
+                Run Links to be created.
+
+        Returns:
+            The created or existing links, in the same order as the requests.
+
+        Raises:
+            ValueError: if the server response is not a list.
+        """
+        links_by_workspace: Dict[
+            UUID, List[Tuple[int, ModelVersionPipelineRunRequest]]
+        ] = {}
+        for index, link in enumerate(model_version_pipeline_run_links):
+            links_by_workspace.setdefault(link.workspace, []).append(
+                (index, link)
+            )
+
+        result: List[Optional[ModelVersionPipelineRunResponse]] = [None] * len(
+            model_version_pipeline_run_links
+        )
+        for workspace_id, workspace_links in links_by_workspace.items():
+            route = f"{WORKSPACES}/{str(workspace_id)}{MODEL_VERSION_PIPELINE_RUNS}{BATCH}"
+            body = self.post(
+                route,
+                body=ModelVersionPipelineRunBatchRequest(
+                    links=[link for _, link in workspace_links]
+                ),
+            )
+            if not isinstance(body, list):
+                raise ValueError(
+                    f"Bad API Response. Expected list, got {type(body)}"
+                )
+            for (index, _), link_body in zip(workspace_links, body):
+                result[index] = ModelVersionPipelineRunResponse.parse_obj(
+                    link_body
+                )
+        return [link for link in result if link is not None]
+
     def list_model_version_pipeline_run_links(
         self,
         model_version_pipeline_run_link_filter_model: ModelVersionPipelineRunFilter,
@@ -3502,6 +3742,19 @@ class RestZenStore(BaseZenStore):
     def _get_auth_token(self) -> str:
         """Get the authentication token for the REST store.
 
+        Returns:
+            The authentication token.
+
+        Raises:
+            ValueError: if the response from the server isn't in the right
+                format.
+        """
+        with self._lock:
+            return self._get_or_fetch_auth_token()
+
+    def _get_or_fetch_auth_token(self) -> str:
+        """Get the cached authentication token or fetch a new one.
+
         Returns:
             The authentication token.
 
@@ -3568,35 +3821,45 @@ class RestZenStore(BaseZenStore):
         Returns:
             A requests session with the authentication token.
         """
-        if self._session is None:
-            if self.config.verify_ssl is False:
-                urllib3.disable_warnings(
-                    urllib3.exceptions.InsecureRequestWarning
-                )
+        with self._lock:
+            if self._session is None:
+                if self.config.verify_ssl is False:
+                    urllib3.disable_warnings(
+                        urllib3.exceptions.InsecureRequestWarning
+                    )
 
-            self._session = requests.Session()
-            retries = Retry(backoff_factor=0.1, connect=5)
-            self._session.mount("https://", HTTPAdapter(max_retries=retries))
-            self._session.mount("http://", HTTPAdapter(max_retries=retries))
-            self._session.verify = self.config.verify_ssl
-            token = self._get_auth_token()
-            self._session.headers.update({"Authorization": "Bearer " + token})
-            logger.debug("Authenticated to ZenML server.")
-        return self._session
+                session = requests.Session()
+                retries = Retry(backoff_factor=0.1, connect=5)
+                for prefix in ("https://", "http://"):
+                    session.mount(
+                        prefix,
+                        HTTPAdapter(
+                            max_retries=retries,
+                            pool_maxsize=REST_CONNECTION_POOL_SIZE,
+                        ),
+                    )
+                session.verify = self.config.verify_ssl
+                token = self._get_auth_token()
+                session.headers.update({"Authorization": "Bearer " + token})
+                self._session = session
+                logger.debug("Authenticated to ZenML server.")
+            return self._session
 
     def clear_session(self) -> None:
         """Clear the authentication session and any cached API tokens."""
-        self._session = None
-        self._api_token = None
-        # Clear the configured API token only if it's possible to fetch a new
-        # one from the server using other credentials (username/password or
-        # service account API key).
-        if (
-            self.config.username is not None
-            and self.config.password is not None
-            or self.config.api_key is not None
-        ):
-            self.config.api_token = None
+        with self._lock:
+            self._session = None
+            self._api_token = None
+            self._response_cache.clear()
+            # Clear the configured API token only if it's possible to fetch a
+            # new one from the server using other credentials
+            # (username/password or service account API key).
+            if (
+                self.config.username is not None
+                and self.config.password is not None
+                or self.config.api_key is not None
+            ):
+                self.config.api_token = None
 
     @staticmethod
     def _handle_response(response: requests.Response) -> Json:
@@ -3615,7 +3878,10 @@ class RestZenStore(BaseZenStore):
             exc: the exception converted from an error response, if one
                 is returned from the server.
         """
-        if 200 <= response.status_code < 300:
+        if response.status_code == 304:
+            # Not modified responses to conditional requests have no body
+            return None
+        elif 200 <= response.status_code < 300:
             try:
                 payload: Json = response.json()
                 return payload
@@ -3639,6 +3905,92 @@ class RestZenStore(BaseZenStore):
                 f"{response.status_code} with body:\n{response.text}"
             )
 
+    @staticmethod
+    def _is_authorization_error(response: requests.Response) -> bool:
+        """Checks if a response signals an authorization error.
+
+        Args:
+            response: The response to check.
+
+        Returns:
+            Whether the response signals an authorization error.
+        """
+        # Only error responses are parsed, successful responses are decoded
+        # once when they are handled
+        if response.status_code < 400:
+            return False
+
+        return isinstance(
+            exception_from_response(response), AuthorizationException
+        )
+
+    def _send_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send a request to the REST API.
+
+        If the request fails due to an expired authentication token, the token
+        is refreshed and the request is sent again.
+
+        Args:
+            method: The HTTP method to use.
+            url: The URL to request.
+            params: The query parameters to pass to the endpoint.
+            kwargs: Additional keyword arguments to pass to the request.
+
+        Returns:
+            The response.
+        """
+        params = {k: str(v) for k, v in params.items()} if params else {}
+        # The source is sent with every request instead of being stored in
+        # the shared session, because requests can be sent concurrently from
+        # different contexts.
+        headers = {
+            source_context.name: source_context.get().value,
+            **kwargs.pop("headers", {}),
+        }
+
+        session = self.session
+        response = session.request(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            verify=self.config.verify_ssl,
+            timeout=self.config.http_timeout,
+            **kwargs,
+        )
+        if not self._is_authorization_error(response):
+            return response
+
+        # The authentication token could have expired; refresh it and try
+        # again. This will clear any cached token and trigger a new
+        # authentication flow. If another thread already refreshed the
+        # session in the meantime, the new session is used instead.
+        with self._lock:
+            if self._session is session:
+                self.clear_session()
+                logger.info("Authentication token expired; refreshing...")
+
+        response = self.session.request(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            verify=self.config.verify_ssl,
+            timeout=self.config.http_timeout,
+            **kwargs,
+        )
+        if self._is_authorization_error(response):
+            logger.info(
+                "Your authentication token has expired. Please re-authenticate."
+            )
+        return response
+
     def _request(
         self,
         method: str,
@@ -3656,51 +4008,71 @@ class RestZenStore(BaseZenStore):
 
         Returns:
             The parsed response.
+        """
+        return self._handle_response(
+            self._send_request(method, url, params=params, **kwargs)
+        )
 
-        Raises:
-            AuthorizationException: if the request fails due to an expired
-                authentication token.
+    def _get_with_response_cache(
+        self,
+        path: str,
+        parse: Callable[[Json], T],
+        cache_key: Hashable,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> T:
+        """Make a GET request that is revalidated using a cached response.
+
+        The parsed response is cached together with its ETag. When requesting
+        the same path again, the server only sends a new response if the
+        entity changed in the meantime, otherwise a copy of the cached
+        response is returned without parsing it again. Callers receive their
+        own copy, because responses are modified when they are hydrated
+        lazily.
+
+        Args:
+            path: The path to the endpoint.
+            parse: Function to parse the response body.
+            cache_key: Key that identifies how the response body is parsed.
+            params: The query parameters to pass to the endpoint.
+
+        Returns:
+            The parsed response.
         """
-        params = {k: str(v) for k, v in params.items()} if params else {}
+        if REST_RESPONSE_CACHE_SIZE <= 0:
+            return parse(self.get(path, params=params))
 
-        self.session.headers.update(
-            {source_context.name: source_context.get().value}
+        key = (
+            path,
+            tuple(sorted((k, str(v)) for k, v in (params or {}).items())),
+            cache_key,
+        )
+        with self._lock:
+            cached_response = self._response_cache.get(key)
+        headers = (
+            {"If-None-Match": cached_response[0]} if cached_response else {}
         )
 
-        try:
-            return self._handle_response(
-                self.session.request(
-                    method,
-                    url,
-                    params=params,
-                    verify=self.config.verify_ssl,
-                    timeout=self.config.http_timeout,
-                    **kwargs,
-                )
-            )
-        except AuthorizationException:
-            # The authentication token could have expired; refresh it and try
-            # again. This will clear any cached token and trigger a new
-            # authentication flow.
-            self.clear_session()
-            logger.info("Authentication token expired; refreshing...")
+        logger.debug(f"Sending GET request to {path}...")
+        response = self._send_request(
+            "GET",
+            self.url + API + VERSION_1 + path,
+            params=params,
+            headers=headers,
+        )
+        if cached_response and response.status_code == 304:
+            return cast(T, copy.deepcopy(cached_response[1]))
+
+        result = parse(self._handle_response(response))
+        with self._lock:
+            if etag := response.headers.get("ETag"):
+                self._response_cache[key] = (etag, copy.deepcopy(result))
+                self._response_cache.move_to_end(key)
+                while len(self._response_cache) > REST_RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+            else:
+                self._response_cache.pop(key, None)
 
-        try:
-            return self._handle_response(
-                self.session.request(
-                    method,
-                    url,
-                    params=params,
-                    verify=self.config.verify_ssl,
-                    timeout=self.config.http_timeout,
-                    **kwargs,
-                )
-            )
-        except AuthorizationException:
-            logger.info(
-                "Your authentication token has expired. Please re-authenticate."
-            )
-            raise
+        return result
 
     def get(
         self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any
@@ -3939,8 +4311,12 @@ class RestZenStore(BaseZenStore):
         Returns:
             The retrieved resource.
         """
-        body = self.get(f"{route}/{str(resource_id)}", params=params)
-        return response_model.parse_obj(body)
+        return self._get_with_response_cache(
+            f"{route}/{str(resource_id)}",
+            parse=response_model.parse_obj,
+            cache_key=response_model,
+            params=params,
+        )
 
     def _list_paginated_resources(
         self,
@@ -3966,19 +4342,60 @@ class RestZenStore(BaseZenStore):
         # leave out filter params that are not supplied
         params = params or {}
         params.update(filter_model.dict(exclude_none=True))
-        body = self.get(f"{route}", params=params)
-        if not isinstance(body, dict):
-            raise ValueError(
-                f"Bad API Response. Expected list, got {type(body)}"
-            )
-        # The initial page of items will be of type BaseResponseModel
-        page_of_items: Page[AnyResponse] = Page.parse_obj(body)
-        # So these items will be parsed into their correct types like here
-        page_of_items.items = [
-            response_model.parse_obj(generic_item)
-            for generic_item in body["items"]
-        ]
-        return page_of_items
+
+        def _parse_page(body: Json) -> Page[AnyResponse]:
+            if not isinstance(body, dict):
+                raise ValueError(
+                    f"Bad API Response. Expected list, got {type(body)}"
+                )
+            # The initial page of items will be of type BaseResponseModel
+            page_of_items: Page[AnyResponse] = Page.parse_obj(body)
+            # So these items will be parsed into their correct types like here
+            if filter_model.fields:
+                page_of_items.items = [
+                    self._parse_projected_response(
+                        response_model, generic_item
+                    )
+                    for generic_item in body["items"]
+                ]
+            else:
+                page_of_items.items = [
+                    response_model.parse_obj(generic_item)
+                    for generic_item in body["items"]
+                ]
+            return page_of_items
+
+        return self._get_with_response_cache(
+            f"{route}",
+            parse=_parse_page,
+            cache_key=(Page, response_model),
+            params=params,
+        )
+
+    @staticmethod
+    def _parse_projected_response(
+        response_model: Type[AnyResponse], item: Dict[str, Any]
+    ) -> AnyResponse:
+        """Parse a response that only includes a subset of its fields.
+
+        Args:
+            response_model: Model to use to parse the response.
+            item: The serialized response.
+
+        Returns:
+            The parsed response.
+        """
+        values = {
+            key: value
+            for key, value in item.items()
+            if key in response_model.get_projection_fields(include_body=False)
+        }
+        body = item.get("body") or {}
+        body_fields = response_model.__fields__["body"].type_.__fields__
+        values.update(
+            {key: value for key, value in body.items() if key in body_fields}
+        )
+        return response_model.construct_projection(values)
 
     def _list_resources(
         self,
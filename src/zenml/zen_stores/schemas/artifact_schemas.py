@@ -14,11 +14,12 @@
 """SQLModel implementation of artifact table."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 from uuid import UUID
 
 from pydantic import ValidationError
 from sqlalchemy import TEXT, Column
+from sqlalchemy.orm import selectinload
 from sqlmodel import Field, Relationship
 
 from zenml.config.source import Source
@@ -51,6 +52,8 @@ from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.base import ExecutableOption
+
     from zenml.zen_stores.schemas.artifact_visualization_schemas import (
         ArtifactVisualizationSchema,
     )
@@ -283,6 +286,51 @@ class ArtifactVersionSchema(BaseSchema, table=True):
             data_type=artifact_version_request.data_type.json(),
         )
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence["ExecutableOption"]:
+        """Get the query options to eagerly load the relationships of the schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            The query options.
+        """
+        from zenml.zen_stores.schemas.run_metadata_schemas import (
+            RunMetadataSchema,
+        )
+        from zenml.zen_stores.schemas.tag_schemas import TagResourceSchema
+
+        options = [
+            selectinload(cls.artifact).selectinload(ArtifactSchema.versions),
+            selectinload(cls.artifact)
+            .selectinload(ArtifactSchema.tags)
+            .selectinload(TagResourceSchema.tag),
+            selectinload(cls.user),
+            selectinload(cls.tags).selectinload(TagResourceSchema.tag),
+            selectinload(cls.output_of_step_runs).selectinload(
+                StepRunOutputArtifactSchema.step_run
+            ),
+        ]
+        if include_metadata:
+            options.extend(
+                [
+                    selectinload(cls.workspace),
+                    selectinload(cls.visualizations),
+                    selectinload(cls.run_metadata).options(
+                        *RunMetadataSchema.get_query_options()
+                    ),
+                ]
+            )
+        return options
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -14,12 +14,14 @@
 """Base classes for SQLModel schemas."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, List, Sequence, TypeVar
 from uuid import UUID, uuid4
 
 from sqlmodel import Field, SQLModel
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.base import ExecutableOption
+
     from zenml.models.v2.base.base import BaseResponse
 
     B = TypeVar("B", bound=BaseResponse)  # type: ignore[type-arg]
@@ -28,10 +30,38 @@ if TYPE_CHECKING:
 class BaseSchema(SQLModel):
     """Base SQL Model for ZenML entities."""
 
+    # Columns that can be requested in a field projection of the response
+    # model. These must have the same name and a compatible type as the
+    # corresponding field of the response model or its body.
+    PROJECTION_FIELDS: ClassVar[List[str]] = ["id", "created", "updated"]
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     created: datetime = Field(default_factory=datetime.utcnow)
     updated: datetime = Field(default_factory=datetime.utcnow)
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence["ExecutableOption"]:
+        """Get the query options to eagerly load the relationships of the schema.
+
+        Schemas that access relationships in their `to_model()` method can
+        override this method to load these relationships for all queried rows
+        at once instead of one query per row and relationship.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            The query options.
+        """
+        return []
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -57,4 +87,9 @@ class BaseSchema(SQLModel):
 class NamedSchema(BaseSchema):
     """Base Named SQL Model."""
 
+    PROJECTION_FIELDS: ClassVar[List[str]] = [
+        *BaseSchema.PROJECTION_FIELDS,
+        "name",
+    ]
+
     name: str
@@ -16,7 +16,7 @@
 import base64
 import json
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, List, Optional
 from uuid import UUID
 
 from sqlmodel import Relationship
@@ -47,6 +47,12 @@ if TYPE_CHECKING:
 class StackComponentSchema(NamedSchema, table=True):
     """SQL Model for stack components."""
 
+    PROJECTION_FIELDS: ClassVar[List[str]] = [
+        *NamedSchema.PROJECTION_FIELDS,
+        "type",
+        "flavor",
+    ]
+
     __tablename__ = "stack_component"
 
     type: StackComponentType
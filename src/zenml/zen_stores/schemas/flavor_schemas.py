@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """SQL Model Implementations for Flavors."""
 
+import hashlib
 import json
 from datetime import datetime
 from typing import Any, Optional
@@ -23,6 +24,7 @@ from sqlmodel import Field, Relationship
 
 from zenml.enums import StackComponentType
 from zenml.models import (
+    FlavorRequest,
     FlavorResponse,
     FlavorResponseBody,
     FlavorResponseMetadata,
@@ -84,6 +86,61 @@ class FlavorSchema(NamedSchema, table=True):
 
     is_custom: bool = Field(default=True)
 
+    @classmethod
+    def from_request(cls, flavor: "FlavorRequest") -> "FlavorSchema":
+        """Create a `FlavorSchema` from a `FlavorRequest`.
+
+        Args:
+            flavor: The `FlavorRequest` from which to create the schema.
+
+        Returns:
+            The created `FlavorSchema`.
+        """
+        return cls(
+            name=flavor.name,
+            type=flavor.type,
+            source=flavor.source,
+            config_schema=json.dumps(flavor.config_schema),
+            integration=flavor.integration,
+            connector_type=flavor.connector_type,
+            connector_resource_type=flavor.connector_resource_type,
+            connector_resource_id_attr=flavor.connector_resource_id_attr,
+            workspace_id=flavor.workspace,
+            user_id=flavor.user,
+            logo_url=flavor.logo_url,
+            docs_url=flavor.docs_url,
+            sdk_docs_url=flavor.sdk_docs_url,
+            is_custom=flavor.is_custom,
+        )
+
+    @property
+    def fingerprint(self) -> str:
+        """A fingerprint of the flavor content.
+
+        Two flavors with the same fingerprint only differ in their ID,
+        ownership and timestamps.
+
+        Returns:
+            The fingerprint of the flavor content.
+        """
+        content = {
+            "name": self.name,
+            "type": self.type,
+            "source": self.source,
+            "config_schema": json.loads(self.config_schema),
+            "integration": self.integration,
+            "connector_type": self.connector_type,
+            "connector_resource_type": self.connector_resource_type,
+            "connector_resource_id_attr": self.connector_resource_id_attr,
+            "logo_url": self.logo_url,
+            "docs_url": self.docs_url,
+            "sdk_docs_url": self.sdk_docs_url,
+            "is_custom": self.is_custom,
+        }
+        return hashlib.sha256(
+            json.dumps(content, sort_keys=True).encode()
+        ).hexdigest()
+
     def update(self, flavor_update: "FlavorUpdate") -> "FlavorSchema":
         """Update a `FlavorSchema` from a `FlavorUpdate`.
 
@@ -14,7 +14,7 @@
 """SQLModel implementation of model tables."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy import BOOLEAN, INTEGER, TEXT, Column
@@ -211,6 +211,12 @@ class ModelSchema(NamedSchema, table=True):
 class ModelVersionSchema(NamedSchema, table=True):
     """SQL Model for model version."""
 
+    PROJECTION_FIELDS: ClassVar[List[str]] = [
+        *NamedSchema.PROJECTION_FIELDS,
+        "number",
+        "stage",
+    ]
+
     __tablename__ = "model_version"
 
     workspace_id: UUID = build_foreign_key_field(
@@ -14,12 +14,13 @@
 """SQLModel implementation of pipeline deployment tables."""
 
 import json
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 from uuid import UUID
 
 from pydantic.json import pydantic_encoder
 from sqlalchemy import TEXT, Column, String
 from sqlalchemy.dialects.mysql import MEDIUMTEXT
+from sqlalchemy.orm import selectinload
 from sqlmodel import Field, Relationship
 
 from zenml.config.pipeline_configurations import PipelineConfiguration
@@ -44,6 +45,8 @@ from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.base import ExecutableOption
+
     from zenml.zen_stores.schemas.pipeline_run_schemas import PipelineRunSchema
     from zenml.zen_stores.schemas.step_run_schemas import StepRunSchema
 
@@ -189,6 +192,37 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
             server_version=request.server_version,
         )
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence["ExecutableOption"]:
+        """Get the query options to eagerly load the relationships of the schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            The query options.
+        """
+        options = [selectinload(cls.user)]
+        if include_metadata:
+            options.extend(
+                [
+                    selectinload(cls.workspace),
+                    selectinload(cls.pipeline),
+                    selectinload(cls.stack),
+                    selectinload(cls.build),
+                    selectinload(cls.schedule),
+                    selectinload(cls.code_reference),
+                ]
+            )
+        return options
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -15,10 +15,11 @@
 
 import json
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import UniqueConstraint
+from sqlalchemy.orm import selectinload
 from sqlmodel import TEXT, Column, Field, Relationship
 
 from zenml.config.pipeline_configurations import PipelineConfiguration
@@ -44,6 +45,8 @@ from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.base import ExecutableOption
+
     from zenml.zen_stores.schemas.logs_schemas import LogsSchema
     from zenml.zen_stores.schemas.model_schemas import (
         ModelVersionPipelineRunSchema,
@@ -55,6 +58,11 @@ if TYPE_CHECKING:
 class PipelineRunSchema(NamedSchema, table=True):
     """SQL Model for pipeline runs."""
 
+    PROJECTION_FIELDS: ClassVar[List[str]] = [
+        *NamedSchema.PROJECTION_FIELDS,
+        "status",
+    ]
+
     __tablename__ = "pipeline_run"
     __table_args__ = (
         UniqueConstraint(
@@ -209,6 +217,55 @@ class PipelineRunSchema(NamedSchema, table=True):
             trigger_execution_id=request.trigger_execution_id,
         )
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence["ExecutableOption"]:
+        """Get the query options to eagerly load the relationships of the schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            The query options.
+        """
+        from zenml.zen_stores.schemas.run_metadata_schemas import (
+            RunMetadataSchema,
+        )
+        from zenml.zen_stores.schemas.step_run_schemas import StepRunSchema
+
+        options = [
+            selectinload(cls.user),
+            selectinload(cls.trigger_execution),
+            selectinload(cls.deployment).options(
+                *PipelineDeploymentSchema.get_query_options(
+                    include_metadata=True
+                )
+            ),
+            selectinload(cls.stack),
+            selectinload(cls.pipeline),
+            selectinload(cls.build),
+            selectinload(cls.schedule),
+        ]
+        if include_metadata:
+            options.extend(
+                [
+                    selectinload(cls.workspace),
+                    selectinload(cls.run_metadata).options(
+                        *RunMetadataSchema.get_query_options()
+                    ),
+                    selectinload(cls.step_runs).options(
+                        *StepRunSchema.get_query_options()
+                    ),
+                ]
+            )
+        return options
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -235,13 +292,8 @@ class PipelineRunSchema(NamedSchema, table=True):
             else {}
         )
 
-        run_metadata = {
-            metadata_schema.key: metadata_schema.to_model()
-            for metadata_schema in self.run_metadata
-        }
-
         if self.deployment is not None:
-            deployment = self.deployment.to_model()
+            deployment = self.deployment.to_model(include_metadata=True)
 
             config = deployment.pipeline_configuration
             client_environment = deployment.client_environment
@@ -292,6 +344,10 @@ class PipelineRunSchema(NamedSchema, table=True):
         )
         metadata = None
         if include_metadata:
+            run_metadata = {
+                metadata_schema.key: metadata_schema.to_model()
+                for metadata_schema in self.run_metadata
+            }
             steps = {step.name: step.to_model() for step in self.step_runs}
 
             metadata = PipelineRunResponseMetadata(
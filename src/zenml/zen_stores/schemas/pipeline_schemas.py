@@ -14,7 +14,7 @@
 """SQL Model Implementations for Pipelines and Pipeline Runs."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, List, Optional
 from uuid import UUID
 
 from sqlalchemy import TEXT, Column, String
@@ -49,6 +49,11 @@ if TYPE_CHECKING:
 class PipelineSchema(NamedSchema, table=True):
     """SQL Model for pipelines."""
 
+    PROJECTION_FIELDS: ClassVar[List[str]] = [
+        *NamedSchema.PROJECTION_FIELDS,
+        "version",
+    ]
+
     __tablename__ = "pipeline"
 
     # Fields
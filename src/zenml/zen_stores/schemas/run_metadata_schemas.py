@@ -14,10 +14,11 @@
 """SQLModel implementation of pipeline run metadata tables."""
 
 import json
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import TEXT, VARCHAR, Column
+from sqlalchemy.orm import selectinload
 from sqlmodel import Field, Relationship
 
 from zenml.enums import MetadataResourceTypes
@@ -34,6 +35,8 @@ from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.base import ExecutableOption
+
     from zenml.zen_stores.schemas.artifact_schemas import ArtifactVersionSchema
     from zenml.zen_stores.schemas.model_schemas import ModelVersionSchema
     from zenml.zen_stores.schemas.pipeline_run_schemas import PipelineRunSchema
@@ -111,6 +114,28 @@ class RunMetadataSchema(BaseSchema, table=True):
     value: str = Field(sa_column=Column(TEXT, nullable=False))
     type: MetadataTypeEnum
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence["ExecutableOption"]:
+        """Get the query options to eagerly load the relationships of the schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            The query options.
+        """
+        options = [selectinload(cls.user)]
+        if include_metadata:
+            options.append(selectinload(cls.workspace))
+        return options
+
     def to_model(
         self,
         include_metadata: bool = False,
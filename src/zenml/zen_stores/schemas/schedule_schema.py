@@ -14,7 +14,7 @@
 """SQL Model Implementations for Pipeline Schedules."""
 
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, List, Optional
 from uuid import UUID
 
 from sqlmodel import Field, Relationship
@@ -42,6 +42,15 @@ if TYPE_CHECKING:
 class ScheduleSchema(NamedSchema, table=True):
     """SQL Model for schedules."""
 
+    PROJECTION_FIELDS: ClassVar[List[str]] = [
+        *NamedSchema.PROJECTION_FIELDS,
+        "active",
+        "cron_expression",
+        "start_time",
+        "end_time",
+        "catchup",
+    ]
+
     __tablename__ = "schedule"
 
     workspace_id: UUID = build_foreign_key_field(
@@ -16,7 +16,7 @@
 import base64
 import json
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, cast
 from uuid import UUID
 
 from sqlalchemy import TEXT, Column
@@ -41,6 +41,15 @@ if TYPE_CHECKING:
 class ServiceConnectorSchema(NamedSchema, table=True):
     """SQL Model for service connectors."""
 
+    PROJECTION_FIELDS: ClassVar[List[str]] = [
+        *NamedSchema.PROJECTION_FIELDS,
+        "connector_type",
+        "auth_method",
+        "resource_id",
+        "supports_instances",
+        "expires_at",
+    ]
+
     __tablename__ = "service_connector"
 
     connector_type: str = Field(sa_column=Column(TEXT))
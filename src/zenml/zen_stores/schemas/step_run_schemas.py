@@ -15,11 +15,12 @@
 
 import json
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import TEXT, Column, String
 from sqlalchemy.dialects.mysql import MEDIUMTEXT
+from sqlalchemy.orm import selectinload
 from sqlmodel import Field, Relationship, SQLModel
 
 from zenml.config.step_configurations import Step
@@ -47,6 +48,8 @@ from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.base import ExecutableOption
+
     from zenml.zen_stores.schemas.artifact_schemas import ArtifactVersionSchema
     from zenml.zen_stores.schemas.logs_schemas import LogsSchema
     from zenml.zen_stores.schemas.run_metadata_schemas import RunMetadataSchema
@@ -55,6 +58,11 @@ if TYPE_CHECKING:
 class StepRunSchema(NamedSchema, table=True):
     """SQL Model for steps of pipeline runs."""
 
+    PROJECTION_FIELDS: ClassVar[List[str]] = [
+        *NamedSchema.PROJECTION_FIELDS,
+        "status",
+    ]
+
     __tablename__ = "step_run"
 
     # Fields
@@ -175,6 +183,54 @@ class StepRunSchema(NamedSchema, table=True):
             source_code=request.source_code,
         )
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence["ExecutableOption"]:
+        """Get the query options to eagerly load the relationships of the schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            The query options.
+        """
+        from zenml.zen_stores.schemas.artifact_schemas import (
+            ArtifactVersionSchema,
+        )
+        from zenml.zen_stores.schemas.run_metadata_schemas import (
+            RunMetadataSchema,
+        )
+
+        artifact_version_options = ArtifactVersionSchema.get_query_options()
+        options = [
+            selectinload(cls.user),
+            selectinload(cls.deployment),
+            selectinload(cls.input_artifacts)
+            .selectinload(StepRunInputArtifactSchema.artifact_version)
+            .options(*artifact_version_options),
+            selectinload(cls.output_artifacts)
+            .selectinload(StepRunOutputArtifactSchema.artifact_version)
+            .options(*artifact_version_options),
+        ]
+        if include_metadata:
+            options.extend(
+                [
+                    selectinload(cls.workspace),
+                    selectinload(cls.logs),
+                    selectinload(cls.parents),
+                    selectinload(cls.run_metadata).options(
+                        *RunMetadataSchema.get_query_options()
+                    ),
+                ]
+            )
+        return options
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -196,11 +252,6 @@ class StepRunSchema(NamedSchema, table=True):
             RuntimeError: If the step run schema does not have a deployment_id
                 or a step_configuration.
         """
-        run_metadata = {
-            metadata_schema.key: metadata_schema.to_model()
-            for metadata_schema in self.run_metadata
-        }
-
         input_artifacts = {
             artifact.name: artifact.artifact_version.to_model()
             for artifact in self.input_artifacts
@@ -233,6 +284,11 @@ class StepRunSchema(NamedSchema, table=True):
         )
         metadata = None
         if include_metadata:
+            run_metadata = {
+                metadata_schema.key: metadata_schema.to_model()
+                for metadata_schema in self.run_metadata
+            }
+
             metadata = StepRunResponseMetadata(
                 workspace=self.workspace.to_model(),
                 config=full_step_config.config,
@@ -14,7 +14,7 @@
 """SQLModel implementation of tag tables."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List
+from typing import TYPE_CHECKING, Any, ClassVar, List
 from uuid import UUID
 
 from sqlalchemy import VARCHAR, Column
@@ -47,6 +47,11 @@ if TYPE_CHECKING:
 class TagSchema(NamedSchema, table=True):
     """SQL Model for tag."""
 
+    PROJECTION_FIELDS: ClassVar[List[str]] = [
+        *NamedSchema.PROJECTION_FIELDS,
+        "color",
+    ]
+
     __tablename__ = "tag"
 
     color: str = Field(sa_column=Column(VARCHAR(255), nullable=False))
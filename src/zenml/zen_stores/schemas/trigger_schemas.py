@@ -16,7 +16,7 @@
 import base64
 import json
 from datetime import datetime
-from typing import Any, List, Optional, cast
+from typing import Any, ClassVar, List, Optional, cast
 from uuid import UUID
 
 from pydantic.json import pydantic_encoder
@@ -48,6 +48,13 @@ from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 class TriggerSchema(NamedSchema, table=True):
     """SQL Model for triggers."""
 
+    PROJECTION_FIELDS: ClassVar[List[str]] = [
+        *NamedSchema.PROJECTION_FIELDS,
+        "is_active",
+        "action_flavor",
+        "action_subtype",
+    ]
+
     __tablename__ = "trigger"
 
     workspace_id: UUID = build_foreign_key_field(
@@ -14,7 +14,7 @@
 """SQLModel implementation of user tables."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, List, Optional
 from uuid import UUID
 
 from sqlalchemy import TEXT, Column, UniqueConstraint
@@ -64,6 +64,13 @@ if TYPE_CHECKING:
 class UserSchema(NamedSchema, table=True):
     """SQL Model for users."""
 
+    PROJECTION_FIELDS: ClassVar[List[str]] = [
+        *NamedSchema.PROJECTION_FIELDS,
+        "active",
+        "full_name",
+        "is_service_account",
+    ]
+
     __tablename__ = "user"
     __table_args__ = (UniqueConstraint("name", "is_service_account"),)
 
@@ -20,6 +20,14 @@ import math
 import os
 import re
 import sys
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
@@ -31,23 +39,33 @@ from typing import (
     ForwardRef,
     List,
     Optional,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
     Union,
     cast,
+    get_type_hints,
 )
 from uuid import UUID
 
-from pydantic import Field, SecretStr, root_validator, validator
-from sqlalchemy import asc, desc, func
+from pydantic import (
+    Field,
+    PrivateAttr,
+    SecretStr,
+    root_validator,
+    validator,
+)
+from sqlalchemy import asc, desc, event, func
 from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.exc import (
     ArgumentError,
+    DisconnectionError,
     IntegrityError,
     NoResultFound,
 )
-from sqlalchemy.orm import noload
+from sqlalchemy.orm import load_only, noload
+from sqlalchemy.sql.base import ExecutableOption
 from sqlmodel import (
     Session,
     SQLModel,
@@ -106,6 +124,7 @@ from zenml.exceptions import (
     StackExistsError,
     TriggerExistsError,
 )
+from zenml.integrations.registry import integration_registry
 from zenml.io import fileio
 from zenml.logger import get_console_handler, get_logger, get_logging_level
 from zenml.models import (
@@ -213,6 +232,7 @@ from zenml.models import (
     StackResponse,
     StackUpdate,
     StepRunFilter,
+    StepRunOutputs,
     StepRunRequest,
     StepRunResponse,
     StepRunUpdate,
@@ -363,6 +383,14 @@ class SqlZenStoreConfiguration(StoreConfiguration):
         pool_pre_ping: Enable emitting a test statement on the SQL connection
             at the start of each connection pool checkout, to test that the
             database connection is still viable.
+        connector_discovery_workers: The maximum number of service connectors
+            whose resources are discovered concurrently.
+        connector_discovery_timeout: The maximum time in seconds to wait for
+            a single service connector to list its resources before reporting
+            it as failed.
+        connector_discovery_cache_ttl: The time in seconds for which the
+            resources discovered by a service connector are cached. Set to 0
+            to disable caching.
     """
 
     type: StoreType = StoreType.SQL
@@ -382,6 +410,10 @@ class SqlZenStoreConfiguration(StoreConfiguration):
     max_overflow: int = 20
     pool_pre_ping: bool = True
 
+    connector_discovery_workers: int = Field(default=10, ge=1)
+    connector_discovery_timeout: int = Field(default=60, ge=1)
+    connector_discovery_cache_ttl: int = Field(default=0, ge=0)
+
     backup_strategy: DatabaseBackupStrategy = DatabaseBackupStrategy.IN_MEMORY
     # database backup directory
     backup_directory: str = Field(
@@ -733,6 +765,13 @@ class SqlZenStore(BaseZenStore):
     _alembic: Optional[Alembic] = None
     _secrets_store: Optional[BaseSecretsStore] = None
     _backup_secrets_store: Optional[BaseSecretsStore] = None
+    _connector_resources_cache: Dict[
+        Tuple[UUID, datetime, Optional[str], Optional[str]],
+        Tuple[float, ServiceConnectorResourcesModel],
+    ] = {}
+    _connector_resources_cache_lock: threading.Lock = PrivateAttr(
+        default_factory=threading.Lock
+    )
 
     @property
     def secrets_store(self) -> "BaseSecretsStore":
@@ -854,6 +893,33 @@ class SqlZenStore(BaseZenStore):
         """
         query = filter_model.apply_filter(query=query, table=table)
 
+        projection_fields: Optional[List[str]] = None
+        if filter_model.fields:
+            response_type = cls._get_response_type(
+                table=table,
+                custom_schema_to_model_conversion=custom_schema_to_model_conversion,
+            )
+            projection_fields = cls._get_projection_fields(
+                table=table,
+                response_type=response_type,
+                fields=filter_model.fields,
+            )
+            if not custom_fetch:
+                # Only load the projected columns and none of the
+                # relationships of the schema
+                query = query.options(
+                    load_only(
+                        *[getattr(table, field) for field in projection_fields]
+                    ),
+                    noload("*"),
+                )
+        else:
+            # Eagerly load all relationships that are accessed when converting
+            # the schemas to models instead of loading them row by row
+            query = query.options(
+                *table.get_query_options(include_metadata=hydrate)
+            )
+
         # Get the total amount of items in the database for a given query
         custom_fetch_result: Optional[List[Any]] = None
         if custom_fetch:
@@ -908,6 +974,17 @@ class SqlZenStore(BaseZenStore):
         # Convert this page of items from schemas to models.
         items: List[AnyResponse] = []
         for schema in item_schemas:
+            # If only some fields were requested, only include those.
+            if projection_fields is not None:
+                items.append(
+                    response_type.construct_projection(
+                        {
+                            field: getattr(schema, field)
+                            for field in projection_fields
+                        }
+                    )
+                )
+                continue
             # If a custom conversion function is provided, use it.
             if custom_schema_to_model_conversion:
                 items.append(custom_schema_to_model_conversion(schema))
@@ -931,6 +1008,76 @@ class SqlZenStore(BaseZenStore):
             max_size=filter_model.size,
         )
 
+    @staticmethod
+    def _get_response_type(
+        table: Type[AnySchema],
+        custom_schema_to_model_conversion: Optional[
+            Callable[..., AnyResponse]
+        ] = None,
+    ) -> Type[AnyResponse]:
+        """Get the response model type that a schema is converted to.
+
+        Args:
+            table: The schema table.
+            custom_schema_to_model_conversion: Custom callable used to convert
+                the schema into a model.
+
+        Returns:
+            The response model type.
+
+        Raises:
+            RuntimeError: If the response model type can not be inferred.
+        """
+        to_model = custom_schema_to_model_conversion or getattr(
+            table, "to_model", None
+        )
+        response_type = get_type_hints(to_model).get("return")
+        if not (
+            isinstance(response_type, type)
+            and issubclass(response_type, BaseResponse)
+        ):
+            raise RuntimeError(
+                f"Unable to infer the response model of schema "
+                f"`{table.__name__}`."
+            )
+        return cast(Type[AnyResponse], response_type)
+
+    @staticmethod
+    def _get_projection_fields(
+        table: Type[AnySchema],
+        response_type: Type[AnyResponse],
+        fields: List[str],
+    ) -> List[str]:
+        """Get the fields to include when projecting a schema to a response.
+
+        Args:
+            table: The schema table.
+            response_type: The response model type.
+            fields: The requested fields.
+
+        Returns:
+            The fields to include, which always contain the ID.
+
+        Raises:
+            ValueError: If one of the requested fields can not be projected.
+        """
+        response_fields = response_type.get_projection_fields()
+        projectable_fields = [
+            field
+            for field in table.PROJECTION_FIELDS
+            if field in response_fields
+        ]
+
+        invalid_fields = set(fields) - set(projectable_fields)
+        if invalid_fields:
+            raise ValueError(
+                f"Invalid fields {sorted(invalid_fields)} for "
+                f"`{response_type.__name__}`. Only the following fields can "
+                f"be requested: {sorted(projectable_fields)}."
+            )
+
+        return ["id"] + [field for field in fields if field != "id"]
+
     # ====================================
     # ZenML Store interface implementation
     # ====================================
@@ -939,6 +1086,40 @@ class SqlZenStore(BaseZenStore):
     # Initialization and configuration
     # --------------------------------
 
+    @staticmethod
+    def _guard_connection_pool(engine: Engine) -> None:
+        """Prevents sharing pooled connections between processes.
+
+        Server worker processes that are forked after the store was
+        initialized inherit the pooled connections of the parent process.
+        Using the same connection from multiple processes corrupts it, so
+        connections that were opened by another process are discarded
+        without closing them and replaced with new connections.
+
+        Args:
+            engine: The engine whose connection pool to guard.
+        """
+
+        def _connect(dbapi_connection: Any, connection_record: Any) -> None:
+            connection_record.info["pid"] = os.getpid()
+
+        def _checkout(
+            dbapi_connection: Any,
+            connection_record: Any,
+            connection_proxy: Any,
+        ) -> None:
+            if connection_record.info.get("pid") != os.getpid():
+                # The connection belongs to the parent process, so it must
+                # not be closed by this process.
+                connection_record.dbapi_connection = None
+                connection_proxy.dbapi_connection = None
+                raise DisconnectionError(
+                    "Connection was opened by another process."
+                )
+
+        event.listen(engine, "connect", _connect)
+        event.listen(engine, "checkout", _checkout)
+
     def _initialize(self) -> None:
         """Initialize the SQL store."""
         logger.debug("Initializing SqlZenStore at %s", self.config.url)
@@ -947,6 +1128,7 @@ class SqlZenStore(BaseZenStore):
         self._engine = create_engine(
             url=url, connect_args=connect_args, **engine_args
         )
+        self._guard_connection_pool(self._engine)
         self._migration_utils = MigrationUtils(
             url=url,
             connect_args=connect_args,
@@ -1396,8 +1578,111 @@ class SqlZenStore(BaseZenStore):
             self._sync_flavors()
 
     def _sync_flavors(self) -> None:
-        """Purge all in-built and integration flavors from the DB and sync."""
-        FlavorRegistry().register_flavors(store=self)
+        """Sync all in-built and integration flavors with the DB.
+
+        Flavors are compared with their DB counterparts by a fingerprint of
+        their content, so that only new or changed flavors are written. All
+        writes happen in a single transaction.
+
+        The fingerprints of the synced integration flavors are cached for
+        the current Python environment. The flavors of an integration are
+        only imported again if their cached fingerprints don't match the
+        flavors in the DB anymore.
+        """
+        flavor_registry = FlavorRegistry()
+
+        with Session(self.engine) as session:
+            existing_flavors: Dict[
+                Tuple[str, StackComponentType], FlavorSchema
+            ] = {}
+            for flavor_schema in session.exec(select(FlavorSchema)).all():
+                key = (
+                    flavor_schema.name,
+                    StackComponentType(flavor_schema.type),
+                )
+                # Custom flavors are only synced if there is no other flavor
+                # with the same name and type
+                if key not in existing_flavors or (
+                    existing_flavors[key].is_custom
+                    and not flavor_schema.is_custom
+                ):
+                    existing_flavors[key] = flavor_schema
+            existing_fingerprints = {
+                f"{flavor_type.value}:{name}": flavor.fingerprint
+                for (name, flavor_type), flavor in existing_flavors.items()
+            }
+
+            changed_integrations = []
+            for integration_name in integration_registry.integrations:
+                cached_fingerprints = (
+                    integration_registry.get_cached_flavor_fingerprints(
+                        integration_name
+                    )
+                )
+                if cached_fingerprints is None or any(
+                    existing_fingerprints.get(key) != fingerprint
+                    for key, fingerprint in cached_fingerprints.items()
+                ):
+                    changed_integrations.append(integration_name)
+
+            integration_flavors = (
+                flavor_registry.load_integration_flavor_models(
+                    changed_integrations
+                )
+            )
+            flavors = flavor_registry.get_builtin_flavor_models() + [
+                flavor
+                for flavor_models in integration_flavors.values()
+                for flavor in flavor_models
+            ]
+
+            created, updated = 0, 0
+            fingerprints: Dict[str, Dict[str, str]] = {
+                integration_name: {}
+                for integration_name in integration_flavors
+            }
+            for flavor in flavors:
+                new_flavor = FlavorSchema.from_request(flavor)
+                if len(new_flavor.config_schema) > TEXT_FIELD_MAX_LENGTH:
+                    logger.warning(
+                        f"Skipping sync of the '{flavor.name}' "
+                        f"{flavor.type.value} flavor: Json representation of "
+                        "its configuration schema exceeds max length."
+                    )
+                    continue
+
+                existing_flavor = existing_flavors.get(
+                    (flavor.name, flavor.type)
+                )
+                if existing_flavor is None:
+                    session.add(new_flavor)
+                    created += 1
+                elif existing_flavor.fingerprint != new_flavor.fingerprint:
+                    existing_flavor.update(FlavorUpdate.parse_obj(flavor))
+                    session.add(existing_flavor)
+                    updated += 1
+
+                if flavor.integration in fingerprints:
+                    fingerprints[flavor.integration][
+                        f"{flavor.type.value}:{flavor.name}"
+                    ] = new_flavor.fingerprint
+
+            session.commit()
+
+        for integration_name, flavor_fingerprints in fingerprints.items():
+            integration_registry.cache_flavor_fingerprints(
+                integration_name, flavor_fingerprints
+            )
+        integration_registry.save_installation_manifest()
+
+        skipped_integrations = len(integration_registry.integrations) - len(
+            changed_integrations
+        )
+        logger.debug(
+            f"Synced {len(flavors)} flavors: {created} created, {updated} "
+            f"updated, {len(flavors) - created - updated} unchanged. Skipped "
+            f"the unchanged flavors of {skipped_integrations} integrations."
+        )
 
     def get_store_info(self) -> ServerModel:
         """Get information about the store.
@@ -2006,8 +2291,12 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
             artifact_version = session.exec(
-                select(ArtifactVersionSchema).where(
-                    ArtifactVersionSchema.id == artifact_version_id
+                select(ArtifactVersionSchema)
+                .where(ArtifactVersionSchema.id == artifact_version_id)
+                .options(
+                    *ArtifactVersionSchema.get_query_options(
+                        include_metadata=hydrate
+                    )
                 )
             ).first()
             if artifact_version is None:
@@ -3015,22 +3304,7 @@ class SqlZenStore(BaseZenStore):
                 )
 
             else:
-                new_flavor = FlavorSchema(
-                    name=flavor.name,
-                    type=flavor.type,
-                    source=flavor.source,
-                    config_schema=config_schema,
-                    integration=flavor.integration,
-                    connector_type=flavor.connector_type,
-                    connector_resource_type=flavor.connector_resource_type,
-                    connector_resource_id_attr=flavor.connector_resource_id_attr,
-                    workspace_id=flavor.workspace,
-                    user_id=flavor.user,
-                    logo_url=flavor.logo_url,
-                    docs_url=flavor.docs_url,
-                    sdk_docs_url=flavor.sdk_docs_url,
-                    is_custom=flavor.is_custom,
-                )
+                new_flavor = FlavorSchema.from_request(flavor)
                 session.add(new_flavor)
                 session.commit()
 
@@ -3874,7 +4148,11 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
             return self._get_run_schema(
-                run_name_or_id, session=session
+                run_name_or_id,
+                session=session,
+                query_options=PipelineRunSchema.get_query_options(
+                    include_metadata=hydrate
+                ),
             ).to_model(include_metadata=hydrate)
 
     def _replace_placeholder_run(
@@ -4165,25 +4443,47 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The created run metadata.
         """
-        return_value: List[RunMetadataResponse] = []
+        return self.create_run_metadata_batch([run_metadata])
+
+    def create_run_metadata_batch(
+        self, run_metadata: List[RunMetadataRequest]
+    ) -> List[RunMetadataResponse]:
+        """Creates run metadata for multiple resources in one transaction.
+
+        All entries are flushed to the database together, which allows the
+        database driver to insert them with a single statement.
+
+        Args:
+            run_metadata: The run metadata to create.
+
+        Returns:
+            The created run metadata.
+        """
         with Session(self.engine) as session:
-            for key, value in run_metadata.values.items():
-                type_ = run_metadata.types[key]
-                run_metadata_schema = RunMetadataSchema(
-                    workspace_id=run_metadata.workspace,
-                    user_id=run_metadata.user,
-                    resource_id=run_metadata.resource_id,
-                    resource_type=run_metadata.resource_type.value,
-                    stack_component_id=run_metadata.stack_component_id,
+            run_metadata_schemas = [
+                RunMetadataSchema(
+                    workspace_id=request.workspace,
+                    user_id=request.user,
+                    resource_id=request.resource_id,
+                    resource_type=request.resource_type.value,
+                    stack_component_id=request.stack_component_id,
                     key=key,
                     value=json.dumps(value),
-                    type=type_,
-                )
-                session.add(run_metadata_schema)
-                session.commit()
-                return_value.append(
-                    run_metadata_schema.to_model(include_metadata=True)
+                    type=request.types[key],
                 )
+                for request in run_metadata
+                for key, value in request.values.items()
+            ]
+            if not run_metadata_schemas:
+                return []
+
+            session.add_all(run_metadata_schemas)
+            session.flush()
+            return_value = [
+                run_metadata_schema.to_model(include_metadata=True)
+                for run_metadata_schema in run_metadata_schemas
+            ]
+            session.commit()
         return return_value
 
     def get_run_metadata(
@@ -6018,66 +6318,276 @@ class SqlZenStore(BaseZenStore):
             filter_model=filter_model
         ).items
 
-        resource_list: List[ServiceConnectorResourcesModel] = []
+        # Make sure the built-in connector types are registered before
+        # spinning up the worker threads.
+        service_connector_registry.register_builtin_service_connectors()
 
+        results: Dict[UUID, Optional[ServiceConnectorResourcesModel]] = {}
+        to_discover: List[ServiceConnectorResponse] = []
+        now = time.monotonic()
         for connector in service_connectors:
-            if not service_connector_registry.is_registered(connector.type):
-                # For connectors that we can instantiate, i.e. those that have a
-                # connector type available locally, we return complete
-                # information about the resources that they have access to.
-                #
-                # For those that are not locally available, we only return
-                # rudimentary information extracted from the connector model
-                # without actively trying to discover the resources that they
-                # have access to.
-
-                if resource_id and connector.resource_id != resource_id:
-                    # If an explicit resource ID is required, the connector
-                    # has to be configured with it.
-                    continue
+            cache_key = (
+                connector.id,
+                connector.updated,
+                resource_type,
+                resource_id,
+            )
+            with self._connector_resources_cache_lock:
+                cached = self._connector_resources_cache.get(cache_key)
+            if cached and cached[0] > now:
+                results[connector.id] = cached[1].copy(deep=True)
+            else:
+                to_discover.append(connector)
 
-                resources = (
-                    ServiceConnectorResourcesModel.from_connector_model(
-                        connector,
-                        resource_type=resource_type,
+        if to_discover:
+            results.update(
+                self._discover_service_connector_resources(
+                    service_connectors=to_discover,
+                    resource_type=resource_type,
+                    resource_id=resource_id,
+                )
+            )
+
+        ttl = self.config.connector_discovery_cache_ttl
+        if ttl:
+            expires = time.monotonic() + ttl
+            with self._connector_resources_cache_lock:
+                # Drop expired entries to keep the cache bounded
+                self._connector_resources_cache = {
+                    key: value
+                    for key, value in self._connector_resources_cache.items()
+                    if value[0] > now
+                }
+                for connector in to_discover:
+                    resources = results.get(connector.id)
+                    if resources is None or resources.error:
+                        continue
+                    cache_key = (
+                        connector.id,
+                        connector.updated,
+                        resource_type,
+                        resource_id,
+                    )
+                    self._connector_resources_cache[cache_key] = (
+                        expires,
+                        resources.copy(deep=True),
                     )
+
+        resource_list: List[ServiceConnectorResourcesModel] = []
+        for connector in service_connectors:
+            resources = results.get(connector.id)
+            if resources is not None:
+                resource_list.append(resources)
+
+        return resource_list
+
+    def _discover_service_connector_resources(
+        self,
+        service_connectors: List[ServiceConnectorResponse],
+        resource_type: Optional[str] = None,
+        resource_id: Optional[str] = None,
+    ) -> Dict[UUID, Optional[ServiceConnectorResourcesModel]]:
+        """Discover the resources of multiple service connectors concurrently.
+
+        The discovery runs in a bounded thread pool. Service connectors that
+        don't finish within the configured timeout are reported with an error
+        instead of holding up the results of the other connectors. Connectors
+        that are still waiting for a free worker when all earlier connectors
+        would have timed out are cancelled and reported as timed out as well.
+
+        Args:
+            service_connectors: The service connectors to discover resources
+                for.
+            resource_type: The type of resource to scope to.
+            resource_id: The ID of the resource to scope to.
+
+        Returns:
+            The discovered resources, indexed by service connector ID. A
+            `None` value means the connector doesn't match the filters.
+        """
+        timeout = self.config.connector_discovery_timeout
+        max_workers = min(
+            self.config.connector_discovery_workers, len(service_connectors)
+        )
+        deadline = time.monotonic() + timeout * math.ceil(
+            len(service_connectors) / max_workers
+        )
+        start_times: Dict[UUID, float] = {}
+        start_times_lock = threading.Lock()
+
+        def _discover(
+            connector: ServiceConnectorResponse,
+        ) -> Optional[ServiceConnectorResourcesModel]:
+            with start_times_lock:
+                start_times[connector.id] = time.monotonic()
+            return self._list_resources_for_service_connector(
+                connector=connector,
+                resource_type=resource_type,
+                resource_id=resource_id,
+            )
+
+        def _get_expiration_time(connector: ServiceConnectorResponse) -> float:
+            with start_times_lock:
+                start_time = start_times.get(connector.id)
+            if start_time is None:
+                return deadline
+            return start_time + timeout
+
+        results: Dict[UUID, Optional[ServiceConnectorResourcesModel]] = {}
+        futures: Dict[
+            "Future[Optional[ServiceConnectorResourcesModel]]",
+            ServiceConnectorResponse,
+        ] = {}
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="zenml-connector-discovery",
+        )
+        try:
+            for connector in service_connectors:
+                futures[executor.submit(_discover, connector)] = connector
+            pending = set(futures)
+            while pending:
+                wait_time = (
+                    min(
+                        _get_expiration_time(futures[future])
+                        for future in pending
+                    )
+                    - time.monotonic()
+                )
+                done, pending = wait(
+                    pending,
+                    timeout=max(wait_time, 0),
+                    return_when=FIRST_COMPLETED,
                 )
-                for r in resources.resources:
-                    if not r.resource_ids:
-                        r.error = (
-                            f"The service '{connector.type}' connector type is "
-                            "not available."
+                for future in done:
+                    connector = futures[future]
+                    try:
+                        results[connector.id] = future.result()
+                    except (ValueError, AuthorizationException) as e:
+                        results[connector.id] = (
+                            self._get_service_connector_resources_error(
+                                connector=connector,
+                                resource_type=resource_type,
+                                error=e,
+                            )
                         )
 
-            else:
-                try:
-                    connector_instance = (
-                        service_connector_registry.instantiate_connector(
-                            model=connector
+                now = time.monotonic()
+                for future in list(pending):
+                    connector = futures[future]
+                    if _get_expiration_time(connector) > now:
+                        continue
+                    pending.remove(future)
+                    results[connector.id] = (
+                        self._get_service_connector_resources_error(
+                            connector=connector,
+                            resource_type=resource_type,
+                            error=TimeoutError(
+                                f"timed out after {timeout} seconds"
+                            ),
                         )
                     )
+        finally:
+            # Cancel the discoveries that didn't start yet. Running threads
+            # can't be interrupted, so don't block on connectors that timed
+            # out.
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
 
-                    resources = connector_instance.verify(
-                        resource_type=resource_type,
-                        resource_id=resource_id,
-                        list_resources=True,
-                    )
-                except (ValueError, AuthorizationException) as e:
-                    error = (
-                        f'Failed to fetch {resource_type or "available"} '
-                        f"resources from service connector {connector.name}/"
-                        f"{connector.id}: {e}"
+        return results
+
+    @staticmethod
+    def _get_service_connector_resources_error(
+        connector: ServiceConnectorResponse,
+        error: Exception,
+        resource_type: Optional[str] = None,
+    ) -> ServiceConnectorResourcesModel:
+        """Build a resources model that reports a discovery error.
+
+        Args:
+            connector: The service connector that failed.
+            error: The exception raised while discovering resources.
+            resource_type: The type of resource to scope to.
+
+        Returns:
+            A service connector resources model with the error set.
+        """
+        message = (
+            f'Failed to fetch {resource_type or "available"} '
+            f"resources from service connector {connector.name}/"
+            f"{connector.id}: {error}"
+        )
+        # Log the exception traceback if debug logging is enabled
+        logger.error(
+            message,
+            exc_info=error if logger.isEnabledFor(logging.DEBUG) else None,
+        )
+        resources = ServiceConnectorResourcesModel.from_connector_model(
+            connector,
+            resource_type=resource_type,
+        )
+        resources.set_error(message)
+        return resources
+
+    @staticmethod
+    def _list_resources_for_service_connector(
+        connector: ServiceConnectorResponse,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[str] = None,
+    ) -> Optional[ServiceConnectorResourcesModel]:
+        """List the resources that a single service connector has access to.
+
+        Args:
+            connector: The service connector.
+            resource_type: The type of resource to scope to.
+            resource_id: The ID of the resource to scope to.
+
+        Returns:
+            The resources that the service connector has access to, or `None`
+            if the connector doesn't match the given resource ID.
+
+        Raises:
+            ValueError: If the service connector configuration is invalid.
+            AuthorizationException: If the service connector fails to
+                authenticate.
+        """
+        if not service_connector_registry.is_registered(connector.type):
+            # For connectors that we can instantiate, i.e. those that have a
+            # connector type available locally, we return complete
+            # information about the resources that they have access to.
+            #
+            # For those that are not locally available, we only return
+            # rudimentary information extracted from the connector model
+            # without actively trying to discover the resources that they
+            # have access to.
+
+            if resource_id and connector.resource_id != resource_id:
+                # If an explicit resource ID is required, the connector
+                # has to be configured with it.
+                return None
+
+            resources = ServiceConnectorResourcesModel.from_connector_model(
+                connector,
+                resource_type=resource_type,
+            )
+            for r in resources.resources:
+                if not r.resource_ids:
+                    r.error = (
+                        f"The service '{connector.type}' connector type is "
+                        "not available."
                     )
-                    # Log an exception if debug logging is enabled
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception(error)
-                    else:
-                        logger.error(error)
-                    continue
+            return resources
 
-            resource_list.append(resources)
+        connector_instance = service_connector_registry.instantiate_connector(
+            model=connector
+        )
 
-        return resource_list
+        return connector_instance.verify(
+            resource_type=resource_type,
+            resource_id=resource_id,
+            list_resources=True,
+        )
 
     def list_service_connector_types(
         self,
@@ -6447,88 +6957,129 @@ class SqlZenStore(BaseZenStore):
 
         Returns:
             The created step run.
+        """
+        return self.create_run_steps([step_run])[0]
 
-        Raises:
-            EntityExistsError: if the step run already exists.
-            KeyError: if the pipeline run doesn't exist.
+    def create_run_steps(
+        self, step_runs: List[StepRunRequest]
+    ) -> List[StepRunResponse]:
+        """Creates multiple step runs in a single transaction.
+
+        Either all step runs are created or none of them is. The status of
+        each affected pipeline run is only updated once.
+
+        Args:
+            step_runs: The step runs to create.
+
+        Returns:
+            The created step runs, in the same order as the requests.
         """
         with Session(self.engine) as session:
-            # Check if the pipeline run exists
-            run = session.exec(
-                select(PipelineRunSchema).where(
-                    PipelineRunSchema.id == step_run.pipeline_run_id
-                )
-            ).first()
-            if run is None:
-                raise KeyError(
-                    f"Unable to create step '{step_run.name}': No pipeline run "
-                    f"with ID '{step_run.pipeline_run_id}' found."
-                )
+            step_schemas = [
+                self._create_run_step(step_run=step_run, session=session)
+                for step_run in step_runs
+            ]
 
-            # Check if the step name already exists in the pipeline run
-            existing_step_run = session.exec(
-                select(StepRunSchema)
-                .where(StepRunSchema.name == step_run.name)
-                .where(
-                    StepRunSchema.pipeline_run_id == step_run.pipeline_run_id
-                )
-            ).first()
-            if existing_step_run is not None:
-                raise EntityExistsError(
-                    f"Unable to create step '{step_run.name}': A step with "
-                    f"this name already exists in the pipeline run with ID "
-                    f"'{step_run.pipeline_run_id}'."
+            pipeline_run_ids = {
+                step_run.pipeline_run_id
+                for step_run in step_runs
+                if step_run.status != ExecutionStatus.RUNNING
+            }
+            for pipeline_run_id in pipeline_run_ids:
+                self._update_pipeline_run_status(
+                    pipeline_run_id=pipeline_run_id, session=session
                 )
 
-            # Create the step
-            step_schema = StepRunSchema.from_request(step_run)
-            session.add(step_schema)
+            session.commit()
 
-            # Add logs entry for the step if exists
-            if step_run.logs is not None:
-                log_entry = LogsSchema(
-                    uri=step_run.logs.uri,
-                    step_run_id=step_schema.id,
-                    artifact_store_id=step_run.logs.artifact_store_id,
-                )
-                session.add(log_entry)
+            return [
+                step_schema.to_model(include_metadata=True)
+                for step_schema in step_schemas
+            ]
 
-            # Save parent step IDs into the database.
-            for parent_step_id in step_run.parent_step_ids:
-                self._set_run_step_parent_step(
-                    child_id=step_schema.id,
-                    parent_id=parent_step_id,
-                    session=session,
-                )
+    def _create_run_step(
+        self, step_run: StepRunRequest, session: Session
+    ) -> StepRunSchema:
+        """Creates a step run without committing the session.
 
-            # Save input artifact IDs into the database.
-            for input_name, artifact_version_id in step_run.inputs.items():
-                self._set_run_step_input_artifact(
-                    run_step_id=step_schema.id,
-                    artifact_version_id=artifact_version_id,
-                    name=input_name,
-                    input_type=StepRunInputArtifactType.DEFAULT,
-                    session=session,
-                )
+        Args:
+            step_run: The step run to create.
+            session: The database session to use.
 
-            # Save output artifact IDs into the database.
-            for output_name, artifact_version_id in step_run.outputs.items():
-                self._set_run_step_output_artifact(
-                    step_run_id=step_schema.id,
-                    artifact_version_id=artifact_version_id,
-                    name=output_name,
-                    output_type=StepRunOutputArtifactType.DEFAULT,
-                    session=session,
-                )
+        Returns:
+            The created step run schema.
 
-            if step_run.status != ExecutionStatus.RUNNING:
-                self._update_pipeline_run_status(
-                    pipeline_run_id=step_run.pipeline_run_id, session=session
-                )
+        Raises:
+            EntityExistsError: if the step run already exists.
+            KeyError: if the pipeline run doesn't exist.
+        """
+        # Check if the pipeline run exists
+        run = session.exec(
+            select(PipelineRunSchema).where(
+                PipelineRunSchema.id == step_run.pipeline_run_id
+            )
+        ).first()
+        if run is None:
+            raise KeyError(
+                f"Unable to create step '{step_run.name}': No pipeline run "
+                f"with ID '{step_run.pipeline_run_id}' found."
+            )
 
-            session.commit()
+        # Check if the step name already exists in the pipeline run
+        existing_step_run = session.exec(
+            select(StepRunSchema)
+            .where(StepRunSchema.name == step_run.name)
+            .where(StepRunSchema.pipeline_run_id == step_run.pipeline_run_id)
+        ).first()
+        if existing_step_run is not None:
+            raise EntityExistsError(
+                f"Unable to create step '{step_run.name}': A step with "
+                f"this name already exists in the pipeline run with ID "
+                f"'{step_run.pipeline_run_id}'."
+            )
+
+        # Create the step
+        step_schema = StepRunSchema.from_request(step_run)
+        session.add(step_schema)
+
+        # Add logs entry for the step if exists
+        if step_run.logs is not None:
+            log_entry = LogsSchema(
+                uri=step_run.logs.uri,
+                step_run_id=step_schema.id,
+                artifact_store_id=step_run.logs.artifact_store_id,
+            )
+            session.add(log_entry)
+
+        # Save parent step IDs into the database.
+        for parent_step_id in step_run.parent_step_ids:
+            self._set_run_step_parent_step(
+                child_id=step_schema.id,
+                parent_id=parent_step_id,
+                session=session,
+            )
+
+        # Save input artifact IDs into the database.
+        for input_name, artifact_version_id in step_run.inputs.items():
+            self._set_run_step_input_artifact(
+                run_step_id=step_schema.id,
+                artifact_version_id=artifact_version_id,
+                name=input_name,
+                input_type=StepRunInputArtifactType.DEFAULT,
+                session=session,
+            )
+
+        # Save output artifact IDs into the database.
+        for output_name, artifact_version_id in step_run.outputs.items():
+            self._set_run_step_output_artifact(
+                step_run_id=step_schema.id,
+                artifact_version_id=artifact_version_id,
+                name=output_name,
+                output_type=StepRunOutputArtifactType.DEFAULT,
+                session=session,
+            )
 
-            return step_schema.to_model(include_metadata=True)
+        return step_schema
 
     def get_run_step(
         self, step_run_id: UUID, hydrate: bool = True
@@ -6548,7 +7099,11 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
             step_run = session.exec(
-                select(StepRunSchema).where(StepRunSchema.id == step_run_id)
+                select(StepRunSchema)
+                .where(StepRunSchema.id == step_run_id)
+                .options(
+                    *StepRunSchema.get_query_options(include_metadata=hydrate)
+                )
             ).first()
             if step_run is None:
                 raise KeyError(
@@ -6583,6 +7138,80 @@ class SqlZenStore(BaseZenStore):
                 hydrate=hydrate,
             )
 
+    def get_run_step_outputs(
+        self,
+        run_id: UUID,
+        step_names: List[str],
+        output_names: List[str],
+    ) -> Dict[str, StepRunOutputs]:
+        """Get the IDs and some of the outputs of steps of a pipeline run.
+
+        Args:
+            run_id: The ID of the pipeline run.
+            step_names: The names of the steps to fetch.
+            output_names: The names of the outputs to fetch for these steps.
+
+        Returns:
+            The IDs and outputs of the steps, indexed by step name. Steps or
+            outputs which don't exist are not included.
+
+        Raises:
+            KeyError: if the pipeline run doesn't exist.
+        """
+        with Session(self.engine) as session:
+            run_exists = session.exec(
+                select(PipelineRunSchema.id).where(
+                    PipelineRunSchema.id == run_id
+                )
+            ).first()
+            if run_exists is None:
+                raise KeyError(
+                    f"Unable to get step outputs for run with ID {run_id}: "
+                    f"No run with this ID found."
+                )
+
+            step_names_by_id: Dict[UUID, str] = {}
+            if step_names:
+                step_names_by_id = dict(
+                    session.exec(
+                        select(StepRunSchema.id, StepRunSchema.name)
+                        .where(StepRunSchema.pipeline_run_id == run_id)
+                        .where(col(StepRunSchema.name).in_(step_names))
+                    ).all()
+                )
+            step_outputs = {
+                name: StepRunOutputs(id=step_id)
+                for step_id, name in step_names_by_id.items()
+            }
+
+            if step_names_by_id and output_names:
+                outputs = session.exec(
+                    select(
+                        StepRunOutputArtifactSchema.step_id,
+                        StepRunOutputArtifactSchema.name,
+                        ArtifactVersionSchema,
+                    )
+                    .join(
+                        ArtifactVersionSchema,
+                        ArtifactVersionSchema.id
+                        == StepRunOutputArtifactSchema.artifact_id,
+                    )
+                    .where(
+                        col(StepRunOutputArtifactSchema.step_id).in_(
+                            step_names_by_id
+                        )
+                    )
+                    .where(
+                        col(StepRunOutputArtifactSchema.name).in_(output_names)
+                    )
+                ).all()
+                for step_id, output_name, artifact_version in outputs:
+                    step_outputs[step_names_by_id[step_id]].outputs[
+                        output_name
+                    ] = artifact_version.to_model()
+
+            return step_outputs
+
     def update_run_step(
         self,
         step_run_id: UUID,
@@ -6596,70 +7225,120 @@ class SqlZenStore(BaseZenStore):
 
         Returns:
             The updated step run.
-
-        Raises:
-            KeyError: if the step run doesn't exist.
         """
-        with Session(self.engine) as session:
-            # Check if the step exists
-            existing_step_run = session.exec(
-                select(StepRunSchema).where(StepRunSchema.id == step_run_id)
-            ).first()
-            if existing_step_run is None:
-                raise KeyError(
-                    f"Unable to update step with ID {step_run_id}: "
-                    f"No step with this ID found."
-                )
+        return self.update_run_steps({step_run_id: step_run_update})[0]
 
-            # Update the step
-            existing_step_run.update(step_run_update)
-            session.add(existing_step_run)
+    def update_run_steps(
+        self, step_run_updates: Dict[UUID, StepRunUpdate]
+    ) -> List[StepRunResponse]:
+        """Updates multiple step runs in a single transaction.
 
-            # Update the output artifacts.
-            for name, artifact_version_id in step_run_update.outputs.items():
-                self._set_run_step_output_artifact(
-                    step_run_id=step_run_id,
-                    artifact_version_id=artifact_version_id,
-                    name=name,
-                    output_type=StepRunOutputArtifactType.DEFAULT,
-                    session=session,
-                )
+        Either all step runs are updated or none of them is. The status of
+        each affected pipeline run is only updated once.
+
+        Args:
+            step_run_updates: The updates to apply, keyed by the ID of the
+                step run to update.
 
-            # Update saved artifacts
-            for (
-                artifact_name,
-                artifact_version_id,
-            ) in step_run_update.saved_artifact_versions.items():
-                self._set_run_step_output_artifact(
+        Returns:
+            The updated step runs, in the same order as the updates.
+        """
+        with Session(self.engine) as session:
+            step_schemas = [
+                self._update_run_step(
                     step_run_id=step_run_id,
-                    artifact_version_id=artifact_version_id,
-                    name=artifact_name,
-                    output_type=StepRunOutputArtifactType.MANUAL,
+                    step_run_update=step_run_update,
                     session=session,
                 )
+                for step_run_id, step_run_update in step_run_updates.items()
+            ]
 
-            # Update loaded artifacts.
-            for (
-                artifact_name,
-                artifact_version_id,
-            ) in step_run_update.loaded_artifact_versions.items():
-                self._set_run_step_input_artifact(
-                    run_step_id=step_run_id,
-                    artifact_version_id=artifact_version_id,
-                    name=artifact_name,
-                    input_type=StepRunInputArtifactType.MANUAL,
-                    session=session,
+            pipeline_run_ids = {
+                step_schema.pipeline_run_id for step_schema in step_schemas
+            }
+            for pipeline_run_id in pipeline_run_ids:
+                self._update_pipeline_run_status(
+                    pipeline_run_id=pipeline_run_id, session=session
                 )
 
-            self._update_pipeline_run_status(
-                pipeline_run_id=existing_step_run.pipeline_run_id,
+            session.commit()
+
+            responses = []
+            for step_schema in step_schemas:
+                session.refresh(step_schema)
+                responses.append(step_schema.to_model(include_metadata=True))
+            return responses
+
+    def _update_run_step(
+        self,
+        step_run_id: UUID,
+        step_run_update: StepRunUpdate,
+        session: Session,
+    ) -> StepRunSchema:
+        """Updates a step run without committing the session.
+
+        Args:
+            step_run_id: The ID of the step to update.
+            step_run_update: The update to be applied to the step.
+            session: The database session to use.
+
+        Returns:
+            The updated step run schema.
+
+        Raises:
+            KeyError: if the step run doesn't exist.
+        """
+        # Check if the step exists
+        existing_step_run = session.exec(
+            select(StepRunSchema).where(StepRunSchema.id == step_run_id)
+        ).first()
+        if existing_step_run is None:
+            raise KeyError(
+                f"Unable to update step with ID {step_run_id}: "
+                f"No step with this ID found."
+            )
+
+        # Update the step
+        existing_step_run.update(step_run_update)
+        session.add(existing_step_run)
+
+        # Update the output artifacts.
+        for name, artifact_version_id in step_run_update.outputs.items():
+            self._set_run_step_output_artifact(
+                step_run_id=step_run_id,
+                artifact_version_id=artifact_version_id,
+                name=name,
+                output_type=StepRunOutputArtifactType.DEFAULT,
                 session=session,
             )
 
-            session.commit()
-            session.refresh(existing_step_run)
+        # Update saved artifacts
+        for (
+            artifact_name,
+            artifact_version_id,
+        ) in step_run_update.saved_artifact_versions.items():
+            self._set_run_step_output_artifact(
+                step_run_id=step_run_id,
+                artifact_version_id=artifact_version_id,
+                name=artifact_name,
+                output_type=StepRunOutputArtifactType.MANUAL,
+                session=session,
+            )
+
+        # Update loaded artifacts.
+        for (
+            artifact_name,
+            artifact_version_id,
+        ) in step_run_update.loaded_artifact_versions.items():
+            self._set_run_step_input_artifact(
+                run_step_id=step_run_id,
+                artifact_version_id=artifact_version_id,
+                name=artifact_name,
+                input_type=StepRunInputArtifactType.MANUAL,
+                session=session,
+            )
 
-            return existing_step_run.to_model(include_metadata=True)
+        return existing_step_run
 
     @staticmethod
     def _set_run_step_parent_step(
@@ -7856,6 +8535,7 @@ class SqlZenStore(BaseZenStore):
         schema_class: Type[AnyNamedSchema],
         schema_name: str,
         session: Session,
+        query_options: Sequence[ExecutableOption] = (),
     ) -> AnyNamedSchema:
         """Query a schema by its 'name' or 'id' field.
 
@@ -7865,6 +8545,8 @@ class SqlZenStore(BaseZenStore):
             schema_name: The name of the schema used for error messages.
                 E.g., "workspace".
             session: The database session to use.
+            query_options: Options to apply to the query, e.g. to eagerly
+                load relationships of the schema.
 
         Returns:
             The schema object.
@@ -7893,7 +8575,7 @@ class SqlZenStore(BaseZenStore):
             )
 
         schema = session.exec(
-            select(schema_class).where(filter_params)
+            select(schema_class).where(filter_params).options(*query_options)
         ).first()
 
         if schema is None:
@@ -7989,6 +8671,7 @@ class SqlZenStore(BaseZenStore):
         self,
         run_name_or_id: Union[str, UUID],
         session: Session,
+        query_options: Sequence[ExecutableOption] = (),
     ) -> PipelineRunSchema:
         """Gets a run schema by name or ID.
 
@@ -7998,6 +8681,8 @@ class SqlZenStore(BaseZenStore):
         Args:
             run_name_or_id: The name or ID of the run to get.
             session: The database session to use.
+            query_options: Options to apply to the query, e.g. to eagerly
+                load relationships of the run.
 
         Returns:
             The run schema.
@@ -8007,6 +8692,7 @@ class SqlZenStore(BaseZenStore):
             schema_class=PipelineRunSchema,
             schema_name="run",
             session=session,
+            query_options=query_options,
         )
 
     def _get_model_schema(
@@ -8570,32 +9256,83 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The newly created model version to artifact link.
         """
+        return self.create_model_version_artifact_links(
+            [model_version_artifact_link]
+        )[0]
+
+    def create_model_version_artifact_links(
+        self, model_version_artifact_links: List[ModelVersionArtifactRequest]
+    ) -> List[ModelVersionArtifactResponse]:
+        """Creates multiple model version to artifact links in one transaction.
+
+        Existing links are fetched with a single query and only the missing
+        links are inserted.
+
+        Args:
+            model_version_artifact_links: the Model Version to Artifact Links
+                to be created.
+
+        Returns:
+            The created or existing links, in the same order as the requests.
+        """
+        if not model_version_artifact_links:
+            return []
+
         with Session(self.engine) as session:
-            # If the link already exists, return it
-            existing_model_version_artifact_link = session.exec(
+            existing_links = session.exec(
                 select(ModelVersionArtifactSchema)
                 .where(
-                    ModelVersionArtifactSchema.model_version_id
-                    == model_version_artifact_link.model_version
+                    col(ModelVersionArtifactSchema.model_version_id).in_(
+                        {
+                            link.model_version
+                            for link in model_version_artifact_links
+                        }
+                    )
                 )
                 .where(
-                    ModelVersionArtifactSchema.artifact_version_id
-                    == model_version_artifact_link.artifact_version,
+                    col(ModelVersionArtifactSchema.artifact_version_id).in_(
+                        {
+                            link.artifact_version
+                            for link in model_version_artifact_links
+                        }
+                    )
                 )
-            ).first()
-            if existing_model_version_artifact_link is not None:
-                return existing_model_version_artifact_link.to_model()
+            ).all()
+            links_by_key: Dict[
+                Tuple[UUID, UUID], ModelVersionArtifactResponse
+            ] = {
+                (
+                    existing_link.model_version_id,
+                    existing_link.artifact_version_id,
+                ): existing_link.to_model()
+                for existing_link in existing_links
+            }
 
-            model_version_artifact_link_schema = (
-                ModelVersionArtifactSchema.from_request(
-                    model_version_artifact_request=model_version_artifact_link,
-                )
-            )
-            session.add(model_version_artifact_link_schema)
-            session.commit()
-            return model_version_artifact_link_schema.to_model(
-                include_metadata=True
-            )
+            new_link_schemas: Dict[
+                Tuple[UUID, UUID], ModelVersionArtifactSchema
+            ] = {}
+            for link in model_version_artifact_links:
+                key = (link.model_version, link.artifact_version)
+                if key not in links_by_key and key not in new_link_schemas:
+                    new_link_schemas[key] = (
+                        ModelVersionArtifactSchema.from_request(
+                            model_version_artifact_request=link,
+                        )
+                    )
+
+            if new_link_schemas:
+                session.add_all(new_link_schemas.values())
+                session.flush()
+                for key, link_schema in new_link_schemas.items():
+                    links_by_key[key] = link_schema.to_model(
+                        include_metadata=True
+                    )
+                session.commit()
+
+            return [
+                links_by_key[(link.model_version, link.artifact_version)]
+                for link in model_version_artifact_links
+            ]
 
     def list_model_version_artifact_links(
         self,
@@ -8730,33 +9467,82 @@ class SqlZenStore(BaseZenStore):
             - Otherwise, returns the newly created model version to pipeline
                 run link.
         """
+        return self.create_model_version_pipeline_run_links(
+            [model_version_pipeline_run_link]
+        )[0]
+
+    def create_model_version_pipeline_run_links(
+        self,
+        model_version_pipeline_run_links: List[ModelVersionPipelineRunRequest],
+    ) -> List[ModelVersionPipelineRunResponse]:
+        """Creates multiple model version to pipeline run links in one transaction.
+
+        Existing links are fetched with a single query and only the missing
+        links are inserted.
+
+        Args:
+            model_version_pipeline_run_links: the Model Version to Pipeline
+                Run Links to be created.
+
+        Returns:
+            The created or existing links, in the same order as the requests.
+        """
+        if not model_version_pipeline_run_links:
+            return []
+
         with Session(self.engine) as session:
-            # If the link already exists, return it
-            existing_model_version_pipeline_run_link = session.exec(
+            existing_links = session.exec(
                 select(ModelVersionPipelineRunSchema)
                 .where(
-                    ModelVersionPipelineRunSchema.model_version_id
-                    == model_version_pipeline_run_link.model_version
+                    col(ModelVersionPipelineRunSchema.model_version_id).in_(
+                        {
+                            link.model_version
+                            for link in model_version_pipeline_run_links
+                        }
+                    )
                 )
                 .where(
-                    ModelVersionPipelineRunSchema.pipeline_run_id
-                    == model_version_pipeline_run_link.pipeline_run,
+                    col(ModelVersionPipelineRunSchema.pipeline_run_id).in_(
+                        {
+                            link.pipeline_run
+                            for link in model_version_pipeline_run_links
+                        }
+                    )
                 )
-            ).first()
-            if existing_model_version_pipeline_run_link is not None:
-                return existing_model_version_pipeline_run_link.to_model()
+            ).all()
+            links_by_key: Dict[
+                Tuple[UUID, UUID], ModelVersionPipelineRunResponse
+            ] = {
+                (
+                    existing_link.model_version_id,
+                    existing_link.pipeline_run_id,
+                ): existing_link.to_model()
+                for existing_link in existing_links
+            }
 
-            # Otherwise, create a new link
-            model_version_pipeline_run_link_schema = (
-                ModelVersionPipelineRunSchema.from_request(
-                    model_version_pipeline_run_link
-                )
-            )
-            session.add(model_version_pipeline_run_link_schema)
-            session.commit()
-            return model_version_pipeline_run_link_schema.to_model(
-                include_metadata=True
-            )
+            new_link_schemas: Dict[
+                Tuple[UUID, UUID], ModelVersionPipelineRunSchema
+            ] = {}
+            for link in model_version_pipeline_run_links:
+                key = (link.model_version, link.pipeline_run)
+                if key not in links_by_key and key not in new_link_schemas:
+                    new_link_schemas[key] = (
+                        ModelVersionPipelineRunSchema.from_request(link)
+                    )
+
+            if new_link_schemas:
+                session.add_all(new_link_schemas.values())
+                session.flush()
+                for key, link_schema in new_link_schemas.items():
+                    links_by_key[key] = link_schema.to_model(
+                        include_metadata=True
+                    )
+                session.commit()
+
+            return [
+                links_by_key[(link.model_version, link.pipeline_run)]
+                for link in model_version_pipeline_run_links
+            ]
 
     def list_model_version_pipeline_run_links(
         self,
@@ -14,7 +14,7 @@
 """ZenML Store interface."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from zenml.models import (
@@ -109,6 +109,7 @@ from zenml.models import (
     StackResponse,
     StackUpdate,
     StepRunFilter,
+    StepRunOutputs,
     StepRunRequest,
     StepRunResponse,
     StepRunUpdate,
@@ -1320,6 +1321,19 @@ class ZenStoreInterface(ABC):
             The created run metadata.
         """
 
+    @abstractmethod
+    def create_run_metadata_batch(
+        self, run_metadata: List[RunMetadataRequest]
+    ) -> List[RunMetadataResponse]:
+        """Creates run metadata for multiple resources in one transaction.
+
+        Args:
+            run_metadata: The run metadata to create.
+
+        Returns:
+            The created run metadata.
+        """
+
     @abstractmethod
     def get_run_metadata(
         self, run_metadata_id: UUID, hydrate: bool = True
@@ -2011,6 +2025,25 @@ class ZenStoreInterface(ABC):
             KeyError: if the pipeline run doesn't exist.
         """
 
+    @abstractmethod
+    def create_run_steps(
+        self, step_runs: List[StepRunRequest]
+    ) -> List[StepRunResponse]:
+        """Creates multiple step runs in a single transaction.
+
+        Either all step runs are created or none of them is.
+
+        Args:
+            step_runs: The step runs to create.
+
+        Returns:
+            The created step runs, in the same order as the requests.
+
+        Raises:
+            EntityExistsError: if one of the step runs already exists.
+            KeyError: if one of the pipeline runs doesn't exist.
+        """
+
     @abstractmethod
     def get_run_step(
         self, step_run_id: UUID, hydrate: bool = True
@@ -2047,6 +2080,28 @@ class ZenStoreInterface(ABC):
             A list of all step runs matching the filter criteria.
         """
 
+    @abstractmethod
+    def get_run_step_outputs(
+        self,
+        run_id: UUID,
+        step_names: List[str],
+        output_names: List[str],
+    ) -> Dict[str, StepRunOutputs]:
+        """Get the IDs and some of the outputs of steps of a pipeline run.
+
+        Args:
+            run_id: The ID of the pipeline run.
+            step_names: The names of the steps to fetch.
+            output_names: The names of the outputs to fetch for these steps.
+
+        Returns:
+            The IDs and outputs of the steps, indexed by step name. Steps or
+            outputs which don't exist are not included.
+
+        Raises:
+            KeyError: if the pipeline run doesn't exist.
+        """
+
     @abstractmethod
     def update_run_step(
         self,
@@ -2066,6 +2121,25 @@ class ZenStoreInterface(ABC):
             KeyError: if the step run doesn't exist.
         """
 
+    @abstractmethod
+    def update_run_steps(
+        self, step_run_updates: Dict[UUID, StepRunUpdate]
+    ) -> List[StepRunResponse]:
+        """Updates multiple step runs in a single transaction.
+
+        Either all step runs are updated or none of them is.
+
+        Args:
+            step_run_updates: The updates to apply, keyed by the ID of the
+                step run to update.
+
+        Returns:
+            The updated step runs, in the same order as the updates.
+
+        Raises:
+            KeyError: if one of the step runs doesn't exist.
+        """
+
     # -------------------- Triggers  --------------------
 
     @abstractmethod
@@ -2558,6 +2632,22 @@ class ZenStoreInterface(ABC):
             EntityExistsError: If a link with the given name already exists.
         """
 
+    @abstractmethod
+    def create_model_version_artifact_links(
+        self, model_version_artifact_links: List[ModelVersionArtifactRequest]
+    ) -> List[ModelVersionArtifactResponse]:
+        """Creates multiple model version to artifact links in one transaction.
+
+        Links that already exist are not created again.
+
+        Args:
+            model_version_artifact_links: the Model Version to Artifact Links
+                to be created.
+
+        Returns:
+            The created or existing links, in the same order as the requests.
+        """
+
     @abstractmethod
     def list_model_version_artifact_links(
         self,
@@ -2626,6 +2716,23 @@ class ZenStoreInterface(ABC):
                 run link.
         """
 
+    @abstractmethod
+    def create_model_version_pipeline_run_links(
+        self,
+        model_version_pipeline_run_links: List[ModelVersionPipelineRunRequest],
+    ) -> List[ModelVersionPipelineRunResponse]:
+        """Creates multiple model version to pipeline run links in one transaction.
+
+        Links that already exist are not created again.
+
+        Args:
+            model_version_pipeline_run_links: the Model Version to Pipeline
+                Run Links to be created.
+
+        Returns:
+            The created or existing links, in the same order as the requests.
+        """
+
     @abstractmethod
     def list_model_version_pipeline_run_links(
         self,
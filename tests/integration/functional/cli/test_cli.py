@@ -12,14 +12,16 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import importlib
 import os
 
 import click
 import pytest
 from click.testing import CliRunner
 
-from zenml.cli.cli import ZenMLCLI, cli
+from zenml.cli.cli import LAZY_COMMANDS, ZenMLCLI, cli
 from zenml.cli.formatter import ZenFormatter
+from zenml.enums import CliCategories
 
 
 @pytest.fixture(scope="function")
@@ -79,3 +81,31 @@ def test_cli_does_not_set_custom_source_root_if_inside_repository(
     runner.invoke(cli, ["version"])
 
     mock_set_custom_source_root.assert_not_called()
+
+
+def test_lazy_commands_match_registered_commands():
+    """Tests that the static lazy command registry matches the commands that
+    are registered when importing the CLI modules."""
+    for lazy_command in LAZY_COMMANDS.values():
+        for module in lazy_command.modules:
+            importlib.import_module(module)
+
+    assert set(cli.commands) == set(LAZY_COMMANDS)
+    for name, command in cli.commands.items():
+        lazy_command = LAZY_COMMANDS[name]
+        assert command.get_short_help_str(limit=300) == lazy_command.help
+        tag = getattr(command, "tag", CliCategories.OTHER_COMMANDS)
+        assert tag == lazy_command.tag
+        assert command.hidden == lazy_command.hidden
+
+
+def test_lazy_commands_are_loaded_on_access(runner):
+    """Tests that lazily loaded commands can be resolved and invoked."""
+    assert isinstance(cli.commands["stack"], click.Group)
+    assert "stack" in cli.list_commands(click.Context(cli))
+
+    result = runner.invoke(cli, ["stack", "--help"])
+    assert result.exit_code == 0
+
+    with pytest.raises(KeyError):
+        cli.commands["not_a_command"]
@@ -13,10 +13,18 @@
 #  permissions and limitations under the License.
 import os
 import platform
+import subprocess
+import sys
+import time
 
 import pytest
 import requests
 
+from zenml.constants import (
+    ENV_ZENML_CONFIG_PATH,
+    ENV_ZENML_DISABLE_DATABASE_MIGRATION,
+    ENV_ZENML_SERVER_JWT_SECRET_KEY,
+)
 from zenml.utils.networking_utils import scan_for_available_port
 from zenml.zen_server.deploy import ServerDeployer, ServerDeploymentConfig
 
@@ -73,3 +81,60 @@ def test_server_up_down(clean_client, mocker):
                 print(line)
             raise
     assert deployer.list_servers() == []
+
+
+@pytest.mark.skipif(
+    platform.system() == "Windows",
+    reason="ZenServer not supported as daemon on Windows.",
+)
+def test_server_starts_multiple_workers_on_empty_database(tmp_path):
+    """Test that multiple workers can start on a database that was never
+    migrated."""
+    port = scan_for_available_port(start=8003, stop=9000)
+    env = {
+        **os.environ,
+        ENV_ZENML_CONFIG_PATH: str(tmp_path / "config"),
+        "ZENML_STORE_URL": f"sqlite:///{tmp_path / 'zenml.db'}",
+        "ZENML_SERVER_WORKERS": "3",
+        "ZENML_ANALYTICS_OPT_IN": "false",
+        "ZENML_LOGGING_VERBOSITY": "INFO",
+    }
+    env.pop(ENV_ZENML_DISABLE_DATABASE_MIGRATION, None)
+    env.pop(ENV_ZENML_SERVER_JWT_SECRET_KEY, None)
+    script = (
+        "import uvicorn\n"
+        "from zenml.zen_server.utils import prepare_server_workers\n"
+        "uvicorn.run('zenml.zen_server.zen_server_api:app', "
+        f"port={port}, workers=prepare_server_workers())\n"
+    )
+    process = subprocess.Popen(
+        [sys.executable, "-c", script],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    endpoint = f"http://127.0.0.1:{port}"
+    try:
+        # Starting several workers on a single CPU can take a while
+        deadline = time.monotonic() + 3 * SERVER_START_STOP_TIMEOUT
+        healthy = False
+        while not healthy and time.monotonic() < deadline:
+            assert process.poll() is None, "ZenServer failed to start."
+            try:
+                healthy = requests.get(endpoint + "/health", timeout=1).ok
+            except requests.ConnectionError:
+                time.sleep(0.5)
+        assert healthy
+
+        # Give all workers time to finish their startup
+        time.sleep(5)
+        assert process.poll() is None, "A ZenServer worker failed to start."
+        for _ in range(10):
+            assert requests.get(endpoint + "/health", timeout=5).ok
+    finally:
+        process.terminate()
+        output, _ = process.communicate(timeout=SERVER_START_STOP_TIMEOUT)
+        print(output.decode(errors="replace"))
+
+    assert b"Child process failed to start" not in output
+    assert b"Traceback" not in output
@@ -11,12 +11,13 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import json
 import os
 import time
 import uuid
 from contextlib import ExitStack as does_not_raise
 from datetime import datetime
-from threading import Thread
+from threading import Event, Thread
 from typing import Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
@@ -38,6 +39,7 @@ from tests.integration.functional.zen_stores.utils import (
     ServiceConnectorTypeContext,
     StackContext,
     UserContext,
+    count_queries,
     list_of_entities,
 )
 from tests.unit.pipelines.test_build_utils import (
@@ -63,6 +65,7 @@ from zenml.enums import (
     ArtifactType,
     ColorVariants,
     ExecutionStatus,
+    GenericFilterOps,
     MetadataResourceTypes,
     ModelStages,
     StackComponentType,
@@ -88,6 +91,8 @@ from zenml.models import (
     ArtifactVersionResponse,
     ComponentFilter,
     ComponentUpdate,
+    FlavorFilter,
+    FlavorUpdate,
     ModelVersionArtifactFilter,
     ModelVersionArtifactRequest,
     ModelVersionFilter,
@@ -125,6 +130,7 @@ from zenml.models.v2.core.pipeline_run import PipelineRunRequest
 from zenml.models.v2.core.run_metadata import RunMetadataRequest
 from zenml.models.v2.core.step_run import StepRunRequest
 from zenml.models.v2.core.user import UserFilter
+from zenml.stack.flavor_registry import FlavorRegistry
 from zenml.utils import code_repository_utils, source_utils
 from zenml.utils.enum_utils import StrEnum
 from zenml.zen_stores.sql_zen_store import SqlZenStore
@@ -2262,6 +2268,102 @@ def test_count_stack_components():
 # | Stack component flavors |
 # '-------------------------'
 
+
+def test_list_components_with_field_projection():
+    """Tests listing stack components with only a subset of their fields."""
+    client = Client()
+    store = client.zen_store
+
+    components = store.list_stack_components(
+        ComponentFilter(fields=["name", "type"])
+    )
+    assert components.total > 0
+    for component in components:
+        assert component.is_projection
+        assert component.id
+        assert component.name
+        assert isinstance(component.type, StackComponentType)
+        assert "flavor" not in component.get_body().__fields_set__
+
+    with pytest.raises(ValueError):
+        store.list_stack_components(ComponentFilter(fields=["configuration"]))
+
+
+def test_flavor_sync_only_writes_changed_flavors():
+    """Tests that syncing the flavors only updates new or changed flavors."""
+    client = Client()
+    store = client.zen_store
+    if not isinstance(store, SqlZenStore):
+        pytest.skip("Test only applies to SQL store")
+
+    store._sync_flavors()
+    flavor = store.list_flavors(
+        FlavorFilter(name="local", type=StackComponentType.ORCHESTRATOR),
+        hydrate=True,
+    )[0]
+    other_flavor = store.list_flavors(
+        FlavorFilter(name="local", type=StackComponentType.ARTIFACT_STORE),
+        hydrate=True,
+    )[0]
+    store.update_flavor(flavor.id, FlavorUpdate(docs_url="https://zenml.io"))
+
+    store._sync_flavors()
+
+    synced_flavor = store.get_flavor(flavor.id)
+    assert synced_flavor.docs_url == flavor.docs_url
+    assert synced_flavor.updated > flavor.updated
+    assert store.get_flavor(other_flavor.id).updated == other_flavor.updated
+
+
+def test_flavor_sync_does_not_duplicate_custom_flavors():
+    """Tests that syncing the flavors reuses custom flavors with the same
+    name and type."""
+    client = Client()
+    store = client.zen_store
+    if not isinstance(store, SqlZenStore):
+        pytest.skip("Test only applies to SQL store")
+
+    store._sync_flavors()
+    flavor_filter = FlavorFilter(
+        name="local", type=StackComponentType.ORCHESTRATOR
+    )
+    flavor = store.list_flavors(flavor_filter, hydrate=True)[0]
+    store.update_flavor(
+        flavor.id, FlavorUpdate(is_custom=True, docs_url="https://zenml.io")
+    )
+
+    store._sync_flavors()
+
+    flavors = store.list_flavors(flavor_filter)
+    assert flavors.total == 1
+    assert flavors[0].id == flavor.id
+    assert flavors[0].docs_url == flavor.docs_url
+
+
+def test_flavor_sync_skips_unchanged_integration_flavors(mocker):
+    """Tests that syncing the flavors only loads the flavors of integrations
+    that changed since the last sync."""
+    client = Client()
+    store = client.zen_store
+    if not isinstance(store, SqlZenStore):
+        pytest.skip("Test only applies to SQL store")
+
+    store._sync_flavors()
+    flavor = store.list_flavors(
+        FlavorFilter(name="gcp", type=StackComponentType.ARTIFACT_STORE),
+        hydrate=True,
+    )[0]
+    load_spy = mocker.spy(FlavorRegistry, "load_integration_flavor_models")
+
+    store._sync_flavors()
+    assert list(load_spy.call_args.args[-1]) == []
+
+    store.update_flavor(flavor.id, FlavorUpdate(docs_url="https://zenml.io"))
+    store._sync_flavors()
+    assert list(load_spy.call_args.args[-1]) == [flavor.integration]
+    assert store.get_flavor(flavor.id).docs_url == flavor.docs_url
+
+
 # .--------.
 # | STACKS |
 # '--------'
@@ -2640,6 +2742,35 @@ def test_get_run_step_outputs_succeeds():
             assert len(run_step_outputs) == 1
 
 
+def test_get_run_step_outputs_by_name_succeeds():
+    """Tests getting selected outputs of selected steps of a run."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(1) as runs:
+        run = runs[0]
+        step_1 = run.steps["step_1"]
+
+        step_outputs = store.get_run_step_outputs(
+            run_id=run.id,
+            step_names=["step_1", "non_existent_step"],
+            output_names=["output", "non_existent_output"],
+        )
+        assert set(step_outputs) == {"step_1"}
+        assert step_outputs["step_1"].id == step_1.id
+        assert step_outputs["step_1"].outputs == step_1.outputs
+
+        step_outputs = store.get_run_step_outputs(
+            run_id=run.id, step_names=["step_1"], output_names=[]
+        )
+        assert step_outputs["step_1"].outputs == {}
+
+    with pytest.raises(KeyError):
+        store.get_run_step_outputs(
+            run_id=uuid.uuid4(), step_names=["step_1"], output_names=[]
+        )
+
+
 def test_get_run_step_inputs_succeeds():
     """Tests getting run step inputs."""
     client = Client()
@@ -3399,6 +3530,101 @@ def _update_connector_and_test(
             assert new_secret.values == secrets
 
 
+def test_connector_resources_discovery_reports_timeouts(mocker):
+    """Tests that a slow connector doesn't hold up resource discovery."""
+    client = Client()
+    store = client.zen_store
+    if not isinstance(store, SqlZenStore):
+        pytest.skip("Test only applies to SQL store")
+
+    original_list_resources = SqlZenStore._list_resources_for_service_connector
+    release_slow_connector = Event()
+
+    def _list_resources(connector, resource_type=None, resource_id=None):
+        if connector.resource_id == "garfield":
+            release_slow_connector.wait(timeout=30)
+        return original_list_resources(
+            connector=connector,
+            resource_type=resource_type,
+            resource_id=resource_id,
+        )
+
+    mocker.patch.object(
+        SqlZenStore,
+        "_list_resources_for_service_connector",
+        side_effect=_list_resources,
+    )
+    mocker.patch.object(store.config, "connector_discovery_timeout", 1)
+
+    connector_type = sample_name("cat'o'matic")
+    with ServiceConnectorContext(
+        connector_type=connector_type,
+        auth_method="paw-print",
+        resource_types=["cat"],
+        resource_id="aria",
+    ) as fast_connector:
+        with ServiceConnectorContext(
+            connector_type=connector_type,
+            auth_method="paw-print",
+            resource_types=["cat"],
+            resource_id="garfield",
+        ) as slow_connector:
+            try:
+                resources = store.list_service_connector_resources(
+                    workspace_name_or_id=client.active_workspace.id,
+                    connector_type=connector_type,
+                )
+            finally:
+                release_slow_connector.set()
+
+            resources_by_id = {r.id: r for r in resources}
+            assert len(resources_by_id) == 2
+            assert resources_by_id[fast_connector.id].error is None
+            assert resources_by_id[fast_connector.id].resources[
+                0
+            ].resource_ids == ["aria"]
+            assert "timed out" in resources_by_id[slow_connector.id].error
+
+
+def test_connector_resources_discovery_raises_unexpected_errors(mocker):
+    """Tests that resource discovery only reports connector errors."""
+    client = Client()
+    store = client.zen_store
+    if not isinstance(store, SqlZenStore):
+        pytest.skip("Test only applies to SQL store")
+
+    connector_type = sample_name("cat'o'matic")
+    with ServiceConnectorContext(
+        connector_type=connector_type,
+        auth_method="paw-print",
+        resource_types=["cat"],
+        resource_id="aria",
+    ) as connector:
+        mocker.patch.object(
+            SqlZenStore,
+            "_list_resources_for_service_connector",
+            side_effect=ValueError("invalid configuration"),
+        )
+        resources = store.list_service_connector_resources(
+            workspace_name_or_id=client.active_workspace.id,
+            connector_type=connector_type,
+        )
+        assert len(resources) == 1
+        assert resources[0].id == connector.id
+        assert "invalid configuration" in resources[0].error
+
+        mocker.patch.object(
+            SqlZenStore,
+            "_list_resources_for_service_connector",
+            side_effect=TypeError("bug"),
+        )
+        with pytest.raises(TypeError):
+            store.list_service_connector_resources(
+                workspace_name_or_id=client.active_workspace.id,
+                connector_type=connector_type,
+            )
+
+
 def test_connector_update_name():
     """Tests that a connector's name can be updated."""
     _update_connector_and_test(
@@ -4401,6 +4627,35 @@ class TestModelVersionArtifactLinks:
 
             assert link1.id == link2.id
 
+    def test_link_create_batch(self):
+        """Test creating multiple links at once, reusing existing ones."""
+        with ModelContext(True, create_artifacts=2) as (
+            model_version,
+            artifacts,
+        ):
+            zs = Client().zen_store
+            requests = [
+                ModelVersionArtifactRequest(
+                    user=model_version.user.id,
+                    workspace=model_version.workspace.id,
+                    model=model_version.model.id,
+                    model_version=model_version.id,
+                    artifact_version=artifact.id,
+                )
+                for artifact in artifacts
+            ]
+            existing_link = zs.create_model_version_artifact_link(requests[0])
+
+            links = zs.create_model_version_artifact_links(
+                requests + [requests[1]]
+            )
+
+            assert len(links) == 3
+            assert links[0].id == existing_link.id
+            assert links[1].artifact_version.id == artifacts[1].id
+            assert links[2].id == links[1].id
+            assert zs.create_model_version_artifact_links([]) == []
+
     def test_link_create_single_version_of_same_output_name_from_different_steps(
         self,
     ):
@@ -4643,6 +4898,36 @@ class TestModelVersionPipelineRunLinks:
             )
             assert link_1.id == link_2.id
 
+    def test_link_create_batch(self):
+        """Test creating multiple links at once, reusing existing ones."""
+        with ModelContext(True, create_prs=2) as (
+            model_version,
+            prs,
+        ):
+            zs = Client().zen_store
+            requests = [
+                ModelVersionPipelineRunRequest(
+                    user=model_version.user.id,
+                    workspace=model_version.workspace.id,
+                    model=model_version.model.id,
+                    model_version=model_version.id,
+                    pipeline_run=pr.id,
+                )
+                for pr in prs
+            ]
+            existing_link = zs.create_model_version_pipeline_run_link(
+                requests[0]
+            )
+
+            links = zs.create_model_version_pipeline_run_links(
+                requests + [requests[1]]
+            )
+
+            assert len(links) == 3
+            assert links[0].id == existing_link.id
+            assert links[1].pipeline_run.id == prs[1].id
+            assert links[2].id == links[1].id
+
     def test_link_delete_found(self):
         with ModelContext(True, create_prs=1) as (
             model_version,
@@ -5120,3 +5405,178 @@ def test_updating_the_pipeline_run_status(step_status, expected_run_status):
         )
         run_status = Client().get_pipeline_run(run_context.runs[-1].id).status
         assert run_status == expected_run_status
+
+
+def test_creating_multiple_step_runs_in_one_transaction():
+    """Tests that step runs can be created in a single transaction."""
+    client = Client()
+    run_context = PipelineRunContext(1)
+    with run_context:
+        existing_run = run_context.runs[-1]
+        run = client.zen_store.create_run(
+            PipelineRunRequest(
+                user=client.active_user.id,
+                workspace=client.active_workspace.id,
+                id=uuid4(),
+                name=sample_name("foo"),
+                deployment=existing_run.deployment_id,
+                status=ExecutionStatus.RUNNING,
+            )
+        )
+        step_runs = [
+            StepRunRequest(
+                user=client.active_user.id,
+                workspace=client.active_workspace.id,
+                name=step.name,
+                status=ExecutionStatus.CACHED,
+                pipeline_run_id=run.id,
+                deployment=existing_run.deployment_id,
+            )
+            for step in run_context.steps
+        ]
+
+        try:
+            # Nothing is created if one of the step runs already exists
+            with pytest.raises(EntityExistsError):
+                client.zen_store.create_run_steps(step_runs + [step_runs[0]])
+            assert not client.list_run_steps(pipeline_run_id=run.id).items
+
+            created_step_runs = client.zen_store.create_run_steps(step_runs)
+            assert [s.name for s in created_step_runs] == [
+                s.name for s in step_runs
+            ]
+            assert client.get_pipeline_run(run.id).status == (
+                ExecutionStatus.COMPLETED
+            )
+        finally:
+            client.delete_pipeline_run(run.id)
+
+
+def test_updating_multiple_step_runs_in_one_transaction():
+    """Tests that step runs can be updated in a single transaction."""
+    run_context = PipelineRunContext(1)
+    with run_context:
+        step_ids = [step.id for step in run_context.steps]
+
+        # Nothing is updated if one of the step runs doesn't exist
+        with pytest.raises(KeyError):
+            Client().zen_store.update_run_steps(
+                {
+                    step_ids[0]: StepRunUpdate(status=ExecutionStatus.FAILED),
+                    uuid4(): StepRunUpdate(status=ExecutionStatus.FAILED),
+                }
+            )
+        assert (
+            Client().get_run_step(step_ids[0]).status
+            == ExecutionStatus.COMPLETED
+        )
+
+        updated_steps = Client().zen_store.update_run_steps(
+            {
+                step_id: StepRunUpdate(status=ExecutionStatus.FAILED)
+                for step_id in step_ids
+            }
+        )
+        assert [step.id for step in updated_steps] == step_ids
+        assert all(
+            step.status == ExecutionStatus.FAILED for step in updated_steps
+        )
+        run_status = Client().get_pipeline_run(run_context.runs[-1].id).status
+        assert run_status == ExecutionStatus.FAILED
+
+
+def test_listing_step_runs_by_multiple_ids():
+    """Tests filtering step runs by a list of IDs."""
+    run_context = PipelineRunContext(1)
+    with run_context:
+        step_ids = [step.id for step in run_context.steps]
+        id_filter = (
+            f"{GenericFilterOps.ONEOF}:"
+            f"{json.dumps([str(step_ids[0]), str(uuid4())])}"
+        )
+
+        steps = Client().zen_store.list_run_steps(StepRunFilter(id=id_filter))
+        assert [step.id for step in steps.items] == [step_ids[0]]
+
+
+def test_creating_run_metadata_for_multiple_resources():
+    """Tests creating run metadata for multiple resources at once."""
+    client = Client()
+    run_context = PipelineRunContext(1)
+    with run_context:
+        requests = [
+            RunMetadataRequest(
+                user=client.active_user.id,
+                workspace=client.active_workspace.id,
+                resource_id=step.id,
+                resource_type=MetadataResourceTypes.STEP_RUN,
+                values={"accuracy": 0.9, "name": step.name},
+                types={
+                    "accuracy": MetadataTypeEnum.FLOAT,
+                    "name": MetadataTypeEnum.STRING,
+                },
+            )
+            for step in run_context.steps
+        ]
+
+        run_metadata = client.zen_store.create_run_metadata_batch(requests)
+        assert len(run_metadata) == 2 * len(run_context.steps)
+
+        for step in run_context.steps:
+            step_metadata = client.get_run_step(step.id).run_metadata
+            assert step_metadata["accuracy"].value == 0.9
+            assert step_metadata["name"].value == step.name
+
+    assert client.zen_store.create_run_metadata_batch([]) == []
+
+
+@pytest.mark.parametrize("hydrate", [False, True])
+def test_listing_runs_does_not_query_per_run(hydrate):
+    """Tests that the number of queries to list runs is independent of the page size."""
+    store = Client().zen_store
+    if not isinstance(store, SqlZenStore):
+        pytest.skip("Test only applies to SQL store")
+
+    with PipelineRunContext(3) as runs:
+        run_name_filter = f"startswith:{runs[0].name.rsplit('_', 1)[0]}"
+        query_counts = []
+        for size in (1, 3):
+            with count_queries(store) as statements:
+                page = store.list_runs(
+                    PipelineRunFilter(name=run_name_filter, size=size),
+                    hydrate=hydrate,
+                )
+                # Converting the response must not require any more queries
+                for run in page:
+                    assert run.stack
+                    if hydrate:
+                        assert len(run.steps) == 2
+            assert len(page) == size
+            query_counts.append(len(statements))
+
+        assert query_counts[0] == query_counts[1]
+
+
+@pytest.mark.parametrize("hydrate", [False, True])
+def test_listing_steps_and_artifact_versions_does_not_query_per_item(hydrate):
+    """Tests that the number of queries to list steps and artifact versions is independent of the page size."""
+    store = Client().zen_store
+    if not isinstance(store, SqlZenStore):
+        pytest.skip("Test only applies to SQL store")
+
+    with PipelineRunContext(3):
+        # Only list the second step, which has both inputs and outputs, so
+        # that all pages load the same relationships
+        for list_method, filter_model in (
+            (store.list_run_steps, StepRunFilter(name="step_2")),
+            (store.list_artifact_versions, ArtifactVersionFilter()),
+        ):
+            query_counts = []
+            for size in (1, 3):
+                filter_model.size = size
+                with count_queries(store) as statements:
+                    page = list_method(filter_model, hydrate=hydrate)
+                assert len(page) == size
+                query_counts.append(len(statements))
+
+            assert query_counts[0] == query_counts[1]
@@ -12,11 +12,23 @@
 #  permissions and limitations under the License.
 import logging
 import uuid
+from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from pydantic import BaseModel, Field, SecretStr
+from sqlalchemy import event
 
 from tests.integration.functional.utils import sample_name
 from zenml import (
@@ -127,6 +139,28 @@ pipeline_instance = connected_two_step_pipeline(
 )
 
 
+@contextmanager
+def count_queries(store: SqlZenStore) -> Generator[List[str], None, None]:
+    """Context manager that records the queries executed by a SQL store.
+
+    Args:
+        store: The SQL store.
+
+    Yields:
+        The list of executed query statements.
+    """
+    statements: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(store.engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(store.engine, "before_cursor_execute", _record)
+
+
 class PipelineRunContext:
     """Context manager that creates pipeline runs and cleans them up afterwards."""
 
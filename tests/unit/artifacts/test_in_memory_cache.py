@@ -0,0 +1,93 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from zenml.artifacts.in_memory_cache import (
+    InMemoryArtifactCache,
+    estimate_size,
+)
+
+
+def test_estimating_artifact_value_size():
+    """Tests that the size of array-like values is estimated from their
+    buffer size."""
+    array = np.zeros(1000, dtype=np.int64)
+    assert estimate_size(array) == 8000
+    assert estimate_size("aria") > 0
+
+
+def test_estimating_container_value_size():
+    """Tests that the elements of containers are included in the size and
+    that values of unknown size are not estimated."""
+    arrays = [np.zeros(1000, dtype=np.int64) for _ in range(3)]
+    assert estimate_size(arrays) > 24_000
+    assert estimate_size({"arrays": arrays, "shared": arrays[0]}) > 24_000
+
+    assert estimate_size(object()) is None
+    assert estimate_size([1, object()]) is None
+    assert estimate_size(np.array([object()])) is None
+
+    cache = InMemoryArtifactCache(max_size=10_000)
+    assert not cache.put(uuid4(), arrays)
+    assert not cache.put(uuid4(), [object()])
+    assert len(cache) == 0
+
+
+def test_in_memory_cache_returns_copies():
+    """Tests that modifying a value read from the cache does not affect the
+    cached value."""
+    cache = InMemoryArtifactCache(max_size=10_000)
+    artifact_version_id = uuid4()
+    assert cache.put(artifact_version_id, [1, 2, 3])
+
+    value = cache.get(artifact_version_id)
+    value.append(4)
+
+    assert cache.get(artifact_version_id) == [1, 2, 3]
+
+
+def test_in_memory_cache_evicts_least_recently_used_values():
+    """Tests that the cache evicts the least recently used values once it
+    exceeds its maximum size."""
+    cache = InMemoryArtifactCache(max_size=20_000)
+    first_id, second_id, third_id = uuid4(), uuid4(), uuid4()
+
+    cache.put(first_id, np.zeros(1000))
+    cache.put(second_id, np.zeros(1000))
+    # Reading the first value makes the second one the least recently used
+    cache.get(first_id)
+    cache.put(third_id, np.zeros(1000))
+
+    assert first_id in cache
+    assert second_id not in cache
+    assert third_id in cache
+    assert cache.size == 16_000
+
+    with pytest.raises(KeyError):
+        cache.get(second_id)
+
+
+def test_in_memory_cache_skips_values_exceeding_the_maximum_size():
+    """Tests that values larger than the cache are not cached and that a
+    cache with size 0 is disabled."""
+    cache = InMemoryArtifactCache(max_size=1_000)
+    assert not cache.put(uuid4(), np.zeros(1000))
+    assert len(cache) == 0
+
+    disabled_cache = InMemoryArtifactCache(max_size=0)
+    assert not disabled_cache.put(uuid4(), 1)
+    assert len(disabled_cache) == 0
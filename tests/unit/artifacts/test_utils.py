@@ -11,23 +11,32 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import io
 import os
 import shutil
 import tempfile
+import zipfile
 from uuid import uuid4
 
 import numpy as np
 import pytest
 
 from zenml.artifacts.utils import (
+    _create_image_thumbnail,
     _get_new_artifact_version,
     _load_artifact_from_uri,
+    _load_artifact_store,
+    _stream_zip,
+    _truncate_text_visualization,
+    list_artifact_files,
     load_artifact_from_response,
     load_model_from_metadata,
     save_model_metadata,
+    write_artifact_files_to_zip,
 )
 from zenml.client import Client
 from zenml.constants import MODEL_METADATA_YAML_FILE_NAME
+from zenml.enums import StackComponentType, VisualizationType
 from zenml.materializers.numpy_materializer import NUMPY_FILENAME
 from zenml.models import ArtifactVersionResponse, Page
 
@@ -206,3 +215,149 @@ def test__get_new_artifact_version(mocker, sample_artifact_version_model):
         _get_new_artifact_version(sample_artifact_version_model.name)
         == int(sample_artifact_version_model.version) + 1
     )
+
+
+@pytest.fixture
+def artifact_directory(clean_client: "Client"):
+    """Creates an artifact directory with nested files."""
+    temp_dir = tempfile.mkdtemp(
+        dir=clean_client.active_stack.artifact_store.path
+    )
+    files = {
+        "data.json": b"7",
+        "model/weights.bin": os.urandom(100_000),
+        "model/nested/config.yaml": b"layers: 3",
+    }
+    for file, content in files.items():
+        path = os.path.join(temp_dir, file)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+
+    yield temp_dir, files
+
+    shutil.rmtree(temp_dir)
+
+
+def test_list_artifact_files(clean_client, artifact_directory):
+    """Tests that artifact files are listed recursively."""
+    uri, files = artifact_directory
+    artifact_store = clean_client.active_stack.artifact_store
+
+    assert list_artifact_files(artifact_store, uri) == sorted(files)
+    assert list_artifact_files(artifact_store, uri + "_missing") == []
+
+
+def test_write_artifact_files_to_zip(mocker, clean_client, artifact_directory):
+    """Tests that every artifact file is written to a single zip entry."""
+    mocker.patch("zenml.artifacts.utils.ARTIFACT_ARCHIVE_CHUNK_SIZE", 1000)
+    uri, files = artifact_directory
+    artifact_store = clean_client.active_stack.artifact_store
+
+    buffer = io.BytesIO()
+    write_artifact_files_to_zip(artifact_store, uri, buffer, max_workers=2)
+
+    with zipfile.ZipFile(buffer) as zipf:
+        assert sorted(zipf.namelist()) == sorted(files)
+        for file, content in files.items():
+            assert zipf.read(file) == content
+
+
+def test_write_artifact_files_to_zip_fails_if_file_cannot_be_read(
+    mocker, clean_client, artifact_directory
+):
+    """Tests that errors reading artifact files are raised."""
+    uri, _ = artifact_directory
+    artifact_store = clean_client.active_stack.artifact_store
+    mocker.patch.object(
+        artifact_store, "open", side_effect=PermissionError("denied")
+    )
+
+    with pytest.raises(PermissionError):
+        write_artifact_files_to_zip(artifact_store, uri, io.BytesIO())
+
+
+def test_streaming_artifact_files_as_zip(
+    mocker, clean_client, artifact_directory
+):
+    """Tests streaming artifact files as a zip archive."""
+    mocker.patch("zenml.artifacts.utils.ARTIFACT_ARCHIVE_CHUNK_SIZE", 1000)
+    uri, files = artifact_directory
+    artifact_store = clean_client.active_stack.artifact_store
+
+    chunks = list(_stream_zip(artifact_store, uri))
+    assert len(chunks) > 1
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zipf:
+        assert sorted(zipf.namelist()) == sorted(files)
+        for file, content in files.items():
+            assert zipf.read(file) == content
+
+    # Stopping to read the stream early stops writing the archive
+    stream = _stream_zip(artifact_store, uri)
+    assert next(stream)
+    stream.close()
+
+
+def test_artifact_stores_are_cached_until_updated(clean_client, tmp_path):
+    """Tests that artifact stores are only instantiated again if updated."""
+    artifact_store_id = clean_client.create_stack_component(
+        name="cached_artifact_store",
+        flavor="local",
+        component_type=StackComponentType.ARTIFACT_STORE,
+        configuration={"path": str(tmp_path)},
+    ).id
+    zen_store = clean_client.zen_store
+
+    artifact_store = _load_artifact_store(artifact_store_id, zen_store)
+    assert _load_artifact_store(artifact_store_id, zen_store) is artifact_store
+
+    clean_client.update_stack_component(
+        name_id_or_prefix=artifact_store_id,
+        component_type=StackComponentType.ARTIFACT_STORE,
+        labels={"updated": "true"},
+    )
+    updated_artifact_store = _load_artifact_store(artifact_store_id, zen_store)
+    assert updated_artifact_store is not artifact_store
+    assert (
+        _load_artifact_store(artifact_store_id, zen_store)
+        is updated_artifact_store
+    )
+
+
+def test_truncating_text_visualizations(mocker):
+    """Tests that text visualization previews are truncated."""
+    mocker.patch("zenml.artifacts.utils.VISUALIZATION_PREVIEW_MAX_LENGTH", 10)
+
+    assert (
+        _truncate_text_visualization("short", VisualizationType.HTML)
+        == "short"
+    )
+    assert (
+        _truncate_text_visualization("a" * 20, VisualizationType.HTML)
+        == "a" * 10
+    )
+    # CSV previews only contain complete rows
+    assert (
+        _truncate_text_visualization("a,b\n1,2\n3,4\n", VisualizationType.CSV)
+        == "a,b\n1,2\n"
+    )
+
+
+def test_creating_image_thumbnails():
+    """Tests that large images are downsampled for previews."""
+    Image = pytest.importorskip("PIL.Image")
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (2048, 1024)).save(buffer, format="PNG")
+    thumbnail = _create_image_thumbnail(buffer.getvalue())
+
+    with Image.open(io.BytesIO(thumbnail)) as image:
+        assert image.size == (512, 256)
+        assert image.format == "PNG"
+
+    # Small images and invalid image data are returned unchanged
+    small = io.BytesIO()
+    Image.new("RGB", (10, 10)).save(small, format="PNG")
+    assert _create_image_thumbnail(small.getvalue()) == small.getvalue()
+    assert _create_image_thumbnail(b"not an image") == b"not an image"
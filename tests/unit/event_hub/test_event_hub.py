@@ -0,0 +1,138 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import threading
+from typing import Any, Dict
+from uuid import uuid4
+
+import pytest
+
+from zenml.event_hub.event_hub import InternalEventHub
+from zenml.event_sources.base_event import BaseEvent
+from zenml.event_sources.base_event_source import (
+    BaseEventSourceFlavor,
+    EventFilterConfig,
+)
+
+
+class AriaEvent(BaseEvent):
+    name: str
+
+
+class AriaEventFilterConfig(EventFilterConfig):
+    name: str
+
+    def event_matches_filter(self, event: BaseEvent) -> bool:
+        return isinstance(event, AriaEvent) and event.name == self.name
+
+
+class AriaEventSourceFlavor(BaseEventSourceFlavor):
+    EVENT_FILTER_CONFIG_CLASS = AriaEventFilterConfig
+
+
+@pytest.fixture
+def event_hub(mocker):
+    """Event hub with mocked triggers of a single event source."""
+    mocker.patch(
+        "zenml.event_hub.event_hub.plugin_flavor_registry"
+    ).return_value.get_flavor_class.return_value = AriaEventSourceFlavor
+    hub = InternalEventHub()
+    yield hub
+    hub.shutdown()
+
+
+def _mock_trigger(mocker, name: str) -> Any:
+    """Create a mock trigger that filters events by name."""
+    trigger = mocker.MagicMock()
+    trigger.id = uuid4()
+    trigger.event_filter = {"name": name}
+    return trigger
+
+
+def test_matching_triggers_are_indexed_per_event_source(mocker, event_hub):
+    """Tests that the active triggers of an event source are only loaded
+    once and reloaded after a trigger was changed."""
+    aria_trigger = _mock_trigger(mocker, "aria")
+    axl_trigger = _mock_trigger(mocker, "axl")
+    mock_depaginate = mocker.patch(
+        "zenml.event_hub.event_hub.depaginate",
+        return_value=[aria_trigger, axl_trigger],
+    )
+    event_source = mocker.MagicMock(id=uuid4())
+
+    for _ in range(3):
+        triggers = event_hub.get_matching_active_triggers_for_event(
+            event=AriaEvent(name="aria"), event_source=event_source
+        )
+        assert triggers == [aria_trigger]
+
+    assert mock_depaginate.call_count == 1
+
+    event_hub.deactivate_trigger(axl_trigger)
+    mock_depaginate.return_value = [aria_trigger]
+    assert (
+        event_hub.get_matching_active_triggers_for_event(
+            event=AriaEvent(name="axl"), event_source=event_source
+        )
+        == []
+    )
+    assert mock_depaginate.call_count == 2
+
+
+def test_actions_are_executed_outside_of_the_publishing_thread(
+    mocker, event_hub
+):
+    """Tests that actions are executed by the worker pool and executed
+    inline once the maximum number of pending actions is reached."""
+    mocker.patch(
+        "zenml.event_hub.base_event_hub.server_config"
+    ).return_value.configure_mock(
+        event_hub_max_workers=1, event_hub_max_pending_actions=1
+    )
+    release_action = threading.Event()
+    action_threads: Dict[str, threading.Thread] = {}
+
+    def _execute_action(event, trigger, action_callback) -> None:
+        action_threads[event.name] = threading.current_thread()
+        if event.name == "aria":
+            release_action.wait(timeout=10)
+
+    mocker.patch.object(event_hub, "_execute_action", _execute_action)
+
+    for name in ["aria", "axl"]:
+        event_hub.trigger_action(
+            event=AriaEvent(name=name),
+            event_source=mocker.MagicMock(),
+            trigger=_mock_trigger(mocker, name),
+            action_callback=mocker.MagicMock(),
+        )
+
+    # The second action is executed inline as the first one is still running
+    assert action_threads["axl"] is threading.current_thread()
+    release_action.set()
+    event_hub.shutdown(wait=True)
+
+    assert action_threads["aria"] is not threading.current_thread()
+    assert event_hub.action_stats["dispatched"] == 1
+    assert event_hub.action_stats["inline"] == 1
+
+
+def test_worker_pool_is_recreated_in_forked_processes(mocker, event_hub):
+    """Tests that forked server workers don't reuse the worker pool of the
+    parent process, whose threads don't exist in the forked process."""
+    executor, _ = event_hub._get_executor()
+    assert event_hub._get_executor()[0] is executor
+
+    mocker.patch("zenml.event_hub.base_event_hub.os.getpid", return_value=-1)
+    assert event_hub._get_executor()[0] is not executor
+    executor.shutdown()
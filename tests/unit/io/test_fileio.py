@@ -24,6 +24,7 @@ from hypothesis import HealthCheck, given, settings
 from hypothesis.strategies import text
 
 from zenml.io import fileio
+from zenml.io.local_filesystem import LocalFilesystem
 from zenml.logger import get_logger
 from zenml.utils import io_utils
 
@@ -239,6 +240,22 @@ def test_size_returns_zero_for_non_existent_file(tmp_path):
     assert fileio.size(os.path.join(tmp_path, "not_a_file.txt")) == 0
 
 
+def test_size_sums_nested_directories_without_listing_each_path(
+    tmp_path, mocker
+):
+    """Test that size sums up the sizes of all files in nested directories
+    using the `du` method of the file system."""
+    nested_dir = tmp_path / "nested" / "deeper"
+    nested_dir.mkdir(parents=True)
+    (tmp_path / "a.txt").write_text("aria")
+    (tmp_path / "nested" / "b.txt").write_text("blupus")
+    (nested_dir / "c.txt").write_text("axl")
+
+    mock_listdir = mocker.patch.object(LocalFilesystem, "listdir")
+    assert fileio.size(str(tmp_path)) == 13
+    mock_listdir.assert_not_called()
+
+
 def test_walk_returns_an_iterator(tmp_path) -> None:
     """Test that walk returns an iterator."""
     assert isinstance(fileio.walk(str(tmp_path)), Iterable)
@@ -14,6 +14,7 @@
 from contextlib import ExitStack as does_not_raise
 
 from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.materializers.materializer_registry import MaterializerRegistry
 from zenml.steps import step
 
 
@@ -108,3 +109,31 @@ def test_materializer_with_conflicting_parameter_and_explicit_materializer():
 
     with does_not_raise():
         some_step().configure(output_materializers=MyFirstMaterializer)()
+
+
+class MyLazyType:
+    pass
+
+
+class MyLazySubType(MyLazyType):
+    pass
+
+
+def test_lazy_materializer_registration(mocker):
+    """Tests that lazily registered materializers are imported on first
+    use."""
+    registry = MaterializerRegistry()
+    mock_import = mocker.patch("importlib.import_module")
+
+    registry.register_lazy_materializer_type(
+        f"{MyLazyType.__module__}.{MyLazyType.__qualname__}",
+        "my_lazy_materializer_module",
+    )
+    mock_import.assert_not_called()
+
+    registry[MyLazySubType]
+    mock_import.assert_called_once_with("my_lazy_materializer_module")
+
+    # The module is only imported once
+    registry[MyLazySubType]
+    mock_import.assert_called_once()
@@ -15,8 +15,10 @@
 import datetime
 
 import pandas
+import pytest
 
 from tests.unit.test_general import _test_materializer
+from zenml.materializers import pandas_materializer
 from zenml.materializers.pandas_materializer import PandasMaterializer
 
 
@@ -100,3 +102,77 @@ def test_pandas_materializer_with_index():
         assert_visualization_exists=True,
     )
     assert df_datetime_indexed.equals(result)
+
+
+def test_pandas_materializer_statistics_are_computed_once(mocker, tmp_path):
+    """Test that the statistics are shared between the visualizations and
+    the metadata and are computed on a sample of large dataframes."""
+    mocker.patch(
+        "zenml.materializers.pandas_materializer.PANDAS_STATISTICS_SAMPLE_SIZE",
+        10,
+    )
+    aggregate_spy = mocker.spy(pandas_materializer, "_aggregate_statistics")
+    describe_spy = mocker.spy(pandas.DataFrame, "describe")
+    dataframe = pandas.DataFrame(
+        {"A": range(100), "B": [True, False] * 50, "C": ["aria"] * 100}
+    )
+    materializer = PandasMaterializer(uri=str(tmp_path))
+
+    description = materializer._describe(dataframe)
+    metadata = materializer.extract_metadata(dataframe)
+
+    assert aggregate_spy.call_count == 1
+    assert describe_spy.call_count == 0
+    assert list(description.columns) == ["A"]
+    assert description.loc["count", "A"] == 10
+    assert metadata["shape"] == (100, 3)
+    assert metadata["statistics_sample_size"] == 10
+    assert set(metadata["mean"]) == {"A", "B"}
+    assert 0 <= metadata["min"]["A"] <= metadata["max"]["A"] < 100
+
+
+def test_pandas_materializer_statistics_match_pandas(tmp_path):
+    """Test that the single-pass statistics match the pandas statistics."""
+    dataframe = pandas.DataFrame(
+        {
+            "A": [0.5, None, 2.5, -1.0, 4.0] * 1000,
+            "B": range(5000),
+            "C": [True, False] * 2500,
+        }
+    )
+    materializer = PandasMaterializer(uri=str(tmp_path))
+
+    description = materializer._describe(dataframe)
+    metadata = materializer.extract_metadata(dataframe)
+
+    pandas.testing.assert_frame_equal(description, dataframe.describe())
+    assert "statistics_sample_size" not in metadata
+    for stat_name in ["mean", "std", "min", "max"]:
+        expected = getattr(dataframe, stat_name)()
+        for column in dataframe.columns:
+            assert metadata[stat_name][column] == pytest.approx(
+                float(expected[column])
+            )
+
+
+def test_pandas_materializer_marks_approximate_quantiles(mocker, tmp_path):
+    """Test that quantiles computed from the quantile sketch are marked as
+    approximate and that the metadata does not compute quantiles."""
+    mocker.patch(
+        "zenml.materializers.pandas_materializer.QUANTILE_SKETCH_SIZE", 10
+    )
+    aggregate_spy = mocker.spy(pandas_materializer, "_aggregate_statistics")
+    series = pandas.Series(range(100), name="values")
+    materializer = PandasMaterializer(uri=str(tmp_path))
+
+    metadata = materializer.extract_metadata(series)
+    assert aggregate_spy.call_args.kwargs["with_quantiles"] is False
+    assert metadata["mean"] == 49.5
+
+    description = materializer._describe(series)
+    assert aggregate_spy.call_count == 2
+    assert description.name == "values"
+    assert description["count"] == 100
+    assert description["max"] == 99
+    assert 0 <= description["50% (approx.)"] <= 99
+    assert "50%" not in description.index
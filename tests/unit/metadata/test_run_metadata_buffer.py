@@ -0,0 +1,81 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from uuid import uuid4
+
+from zenml.constants import TEXT_FIELD_MAX_LENGTH
+from zenml.enums import MetadataResourceTypes
+from zenml.metadata.metadata_types import MetadataTypeEnum
+from zenml.metadata.run_metadata_buffer import (
+    RunMetadataBuffer,
+    validate_run_metadata,
+)
+
+
+def test_validate_run_metadata_skips_unsupported_values():
+    """Tests that values which can't be stored are skipped."""
+    values, types = validate_run_metadata(
+        {
+            "accuracy": 0.9,
+            "description": "a" * (TEXT_FIELD_MAX_LENGTH + 1),
+            "name": "aria",
+        }
+    )
+
+    assert values == {"accuracy": 0.9, "name": "aria"}
+    assert types == {
+        "accuracy": MetadataTypeEnum.FLOAT,
+        "name": MetadataTypeEnum.STRING,
+    }
+
+
+def test_run_metadata_buffer_creates_metadata_in_one_request(mocker):
+    """Tests that flushing the buffer creates all metadata at once."""
+    mock_create_run_metadata_batch = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.create_run_metadata_batch",
+    )
+    step_run_id = uuid4()
+    artifact_version_id = uuid4()
+
+    buffer = RunMetadataBuffer()
+    buffer.add(
+        metadata={"accuracy": 0.8, "loss": 0.1},
+        resource_id=step_run_id,
+        resource_type=MetadataResourceTypes.STEP_RUN,
+    )
+    buffer.add(
+        metadata={"accuracy": 0.9},
+        resource_id=step_run_id,
+        resource_type=MetadataResourceTypes.STEP_RUN,
+    )
+    buffer.add(
+        metadata={"rows": 42},
+        resource_id=artifact_version_id,
+        resource_type=MetadataResourceTypes.ARTIFACT_VERSION,
+    )
+    assert len(buffer) == 3
+
+    buffer.flush()
+
+    mock_create_run_metadata_batch.assert_called_once()
+    requests = mock_create_run_metadata_batch.call_args.args[0]
+    assert [(r.resource_id, r.values) for r in requests] == [
+        (step_run_id, {"accuracy": 0.9, "loss": 0.1}),
+        (artifact_version_id, {"rows": 42}),
+    ]
+    assert len(buffer) == 0
+
+    # Flushing an empty buffer doesn't send a request
+    buffer.flush()
+    mock_create_run_metadata_batch.assert_called_once()
@@ -12,13 +12,14 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+from uuid import uuid4
 
 import pytest
 from pydantic import ValidationError
 
 from zenml.constants import STR_FIELD_MAX_LENGTH
 from zenml.enums import StackComponentType
-from zenml.models import ComponentBase
+from zenml.models import ComponentBase, ComponentResponse
 
 
 def test_component_base_model_fails_with_long_flavor():
@@ -31,3 +32,27 @@ def test_component_base_model_fails_with_long_flavor():
             flavor=long_flavor,
             configuration={},
         )
+
+
+def test_component_response_projection():
+    """Test that projected responses only include the requested fields."""
+    component_id = uuid4()
+    response = ComponentResponse.construct_projection(
+        {"id": str(component_id), "name": "abc", "type": "orchestrator"}
+    )
+
+    assert response.is_projection
+    assert response.id == component_id
+    assert response.name == "abc"
+    assert response.type == StackComponentType.ORCHESTRATOR
+    assert response.dict(exclude_unset=True) == {
+        "id": component_id,
+        "name": "abc",
+        "body": {"type": StackComponentType.ORCHESTRATOR},
+    }
+
+    with pytest.raises(ValidationError):
+        ComponentResponse.construct_projection({"type": "not_a_type"})
+
+    with pytest.raises(ValueError):
+        ComponentResponse.construct_projection({"not_a_field": 1})
@@ -11,6 +11,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import json
 import uuid
 from datetime import datetime
 from typing import Any, Optional, Type, Union
@@ -225,7 +226,7 @@ def test_uuid_filter_model_succeeds_for_invalid_uuid_on_non_equality():
     """Test filtering with other UUID operations is possible with non-UUIDs."""
     filter_value = "a92k34"
     for filter_op in UUIDFilter.ALLOWED_OPS:
-        if filter_op == GenericFilterOps.EQUALS:
+        if filter_op in (GenericFilterOps.EQUALS, GenericFilterOps.ONEOF):
             continue
         filter_model = SomeFilterModel(
             uuid_field=f"{filter_op}:{filter_value}"
@@ -238,6 +239,25 @@ def test_uuid_filter_model_succeeds_for_invalid_uuid_on_non_equality():
         assert model_filter.column == "uuid_field"
 
 
+def test_uuid_filter_model_one_of():
+    """Test filtering UUIDs by membership in a JSON list of UUIDs."""
+    uuids = [uuid.uuid4(), uuid.uuid4()]
+    filter_model = SomeFilterModel(
+        uuid_field=f"{GenericFilterOps.ONEOF}:{json.dumps([str(u) for u in uuids])}"
+    )
+    assert len(filter_model.list_of_filters) == 1
+    model_filter = filter_model.list_of_filters[0]
+    assert isinstance(model_filter, UUIDFilter)
+    assert model_filter.operation == GenericFilterOps.ONEOF
+    assert model_filter.value == [str(u) for u in uuids]
+
+    for invalid_value in ["a92k34", '["a92k34"]', "{}"]:
+        with pytest.raises(ValueError):
+            SomeFilterModel(
+                uuid_field=f"{GenericFilterOps.ONEOF}:{invalid_value}"
+            )
+
+
 def test_string_filter_model():
     """Test Filter model creation for string fields."""
     _test_filter_model(
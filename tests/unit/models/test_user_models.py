@@ -17,7 +17,8 @@ import pytest
 from pydantic import ValidationError
 
 from zenml.constants import STR_FIELD_MAX_LENGTH
-from zenml.models import UserRequest
+from zenml.exceptions import HydrationError
+from zenml.models import UserRequest, UserResponse
 
 UUID_BASE_STRING = "00000000-0000-0000-0000-000000000000"
 
@@ -38,3 +39,40 @@ def test_user_request_model_fails_with_long_activation_token():
         UserRequest(
             activation_token=long_token,
         )
+
+
+def test_user_response_projection_fails_for_missing_fields(
+    mocker, sample_user_model
+):
+    """Test that reading a field that was not included in a projection fails
+    instead of fetching the response, and that hydrating a projection loads
+    its actual values without warning about changed fields."""
+    sample_user_model.get_body().active = True
+    mock_get_hydrated_version = mocker.patch.object(
+        UserResponse,
+        "get_hydrated_version",
+        return_value=sample_user_model,
+    )
+    mock_warning = mocker.patch("zenml.models.v2.base.base.logger.warning")
+
+    response = UserResponse.construct_projection(
+        {"id": sample_user_model.id, "is_service_account": False}
+    )
+    assert response.get_body().__fields_set__ == {"is_service_account"}
+    assert "active" not in response.get_body().__dict__
+
+    assert response.is_service_account is False
+    with pytest.raises(HydrationError, match="`active`"):
+        response.active
+    with pytest.raises(HydrationError, match="`name`"):
+        response.name
+    mock_get_hydrated_version.assert_not_called()
+
+    # Hydrating a projection loads the missing fields without warning
+    response = UserResponse.construct_projection(
+        {"id": sample_user_model.id, "name": "axl"}
+    )
+    assert response.get_metadata() == sample_user_model.get_metadata()
+    assert response.active is True
+    mock_get_hydrated_version.assert_called_once()
+    mock_warning.assert_not_called()
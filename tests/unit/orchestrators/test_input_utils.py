@@ -18,7 +18,7 @@ import pytest
 
 from zenml.config.step_configurations import Step
 from zenml.exceptions import InputResolutionError
-from zenml.models import Page
+from zenml.models import StepRunOutputs
 from zenml.orchestrators import input_utils
 
 
@@ -33,10 +33,12 @@ def test_input_resolution(
     )
 
     mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(
-            index=1, max_size=50, total_pages=1, total=1, items=[step_run]
-        ),
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_run_step_outputs",
+        return_value={
+            "upstream_step": StepRunOutputs(
+                id=step_run.id, outputs=step_run.outputs
+            )
+        },
     )
     step = Step.parse_obj(
         {
@@ -64,10 +66,8 @@ def test_input_resolution(
 def test_input_resolution_with_missing_step_run(mocker):
     """Tests that input resolution fails if the upstream step run is missing."""
     mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(
-            index=1, max_size=50, total_pages=1, total=0, items=[]
-        ),
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_run_step_outputs",
+        return_value={},
     )
     step = Step.parse_obj(
         {
@@ -97,10 +97,8 @@ def test_input_resolution_with_missing_artifact(mocker, create_step_run):
     )
 
     mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(
-            index=1, max_size=50, total_pages=1, total=1, items=[step_run]
-        ),
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_run_step_outputs",
+        return_value={"upstream_step": StepRunOutputs(id=step_run.id)},
     )
     step = Step.parse_obj(
         {
@@ -122,49 +120,29 @@ def test_input_resolution_with_missing_artifact(mocker, create_step_run):
         input_utils.resolve_step_inputs(step=step, run_id=uuid4())
 
 
-def test_input_resolution_fetches_all_run_steps(
-    mocker, sample_artifact_version_model, create_step_run
-):
-    """Tests that input resolution fetches all step runs of the pipeline run."""
-    step_run = create_step_run(
-        step_run_name="upstream_step",
-        output_artifacts={"output_name": sample_artifact_version_model},
-    )
-    second_step_run = create_step_run(
-        step_run_name="other_step",
-    )
-    return_values = [
-        Page(index=1, max_size=1, total_pages=2, total=2, items=[step_run]),
-        Page(
-            index=2,
-            max_size=1,
-            total_pages=2,
-            total=2,
-            items=[second_step_run],
-        ),
-    ]
-    mock_list_run_steps = mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        side_effect=return_values,
+def test_input_resolution_only_fetches_required_step_outputs(mocker):
+    """Tests that input resolution only fetches the required steps and
+    outputs of the pipeline run in a single call."""
+    upstream_step_id = uuid4()
+    mock_get_run_step_outputs = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_run_step_outputs",
+        return_value={"upstream_step": StepRunOutputs(id=upstream_step_id)},
     )
     step = Step.parse_obj(
         {
             "spec": {
                 "source": "module.step_class",
                 "upstream_steps": ["upstream_step"],
-                "inputs": {
-                    "input_name": {
-                        "step_name": "upstream_step",
-                        "output_name": "output_name",
-                    }
-                },
+                "inputs": {},
             },
             "config": {"name": "step_name", "enable_cache": True},
         }
     )
+    run_id = uuid4()
 
-    input_utils.resolve_step_inputs(step=step, run_id=uuid4())
+    _, parent_ids = input_utils.resolve_step_inputs(step=step, run_id=run_id)
 
-    # `resolve_step_inputs(...)` depaginates the run steps so we fetch all
-    # step runs for the pipeline run
-    assert mock_list_run_steps.call_count == 2
+    assert parent_ids == [upstream_step_id]
+    mock_get_run_step_outputs.assert_called_once_with(
+        run_id=run_id, step_names=["upstream_step"], output_names=[]
+    )
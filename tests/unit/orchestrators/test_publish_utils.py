@@ -102,7 +102,7 @@ def test_pipeline_run_status_computation(
 def test_publish_pipeline_run_metadata(mocker):
     """Unit test for `publish_pipeline_run_metadata`."""
     mock_create_run = mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.create_run_metadata",
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.create_run_metadata_batch",
     )
     pipeline_run_id = uuid4()
     pipeline_run_metadata = {
@@ -113,13 +113,14 @@ def test_publish_pipeline_run_metadata(mocker):
         pipeline_run_id=pipeline_run_id,
         pipeline_run_metadata=pipeline_run_metadata,
     )
-    assert mock_create_run.call_count == 2  # once per run
+    mock_create_run.assert_called_once()
+    assert len(mock_create_run.call_args.args[0]) == 2  # once per component
 
 
 def test_publish_step_run_metadata(mocker):
     """Unit test for `publish_step_run_metadata`."""
     mock_create_run = mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.create_run_metadata",
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.create_run_metadata_batch",
     )
     step_run_id = uuid4()
     step_run_metadata = {
@@ -130,4 +131,5 @@ def test_publish_step_run_metadata(mocker):
         step_run_id=step_run_id,
         step_run_metadata=step_run_metadata,
     )
-    assert mock_create_run.call_count == 2  # once per run
+    mock_create_run.assert_called_once()
+    assert len(mock_create_run.call_args.args[0]) == 2  # once per component
@@ -0,0 +1,90 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from uuid import uuid4
+
+from zenml import pipeline, step
+from zenml.enums import ExecutionStatus
+from zenml.orchestrators.step_run_buffer import StepRunBuffer
+from zenml.zen_stores.sql_zen_store import SqlZenStore
+
+
+def test_step_run_buffer_creates_step_runs_in_one_request(
+    mocker, sample_step_request_model
+):
+    """Tests that flushing the buffer creates all step runs at once."""
+    mock_create_run_steps = mocker.patch.object(
+        SqlZenStore, "create_run_steps"
+    )
+    other_step_run = sample_step_request_model.copy(
+        update={"name": "other_step", "pipeline_run_id": uuid4()}
+    )
+
+    buffer = StepRunBuffer()
+    buffer.add(sample_step_request_model)
+    buffer.add(other_step_run)
+    assert len(buffer) == 2
+    assert "other_step" in buffer
+    assert "not_a_step" not in buffer
+
+    buffer.flush()
+
+    mock_create_run_steps.assert_called_once_with(
+        [sample_step_request_model, other_step_run]
+    )
+    assert len(buffer) == 0
+
+    # Flushing an empty buffer doesn't send a request
+    buffer.flush()
+    mock_create_run_steps.assert_called_once()
+
+
+@step
+def _buffered_producer() -> int:
+    return 1
+
+
+@step
+def _buffered_consumer(a: int, b: int) -> int:
+    return a + b
+
+
+@pipeline
+def _buffered_pipeline():
+    a = _buffered_producer(id="producer_a")
+    b = _buffered_producer(id="producer_b")
+    _buffered_consumer(a, b)
+
+
+def test_local_orchestrator_batches_cached_step_runs(clean_client, mocker):
+    """Tests that the local orchestrator creates cached step runs together."""
+    _buffered_pipeline()
+
+    create_run_steps_spy = mocker.spy(SqlZenStore, "create_run_steps")
+    _buffered_pipeline()
+
+    # The independent producers are created together once the consumer
+    # needs their outputs, the consumer itself after the last step finished
+    assert [
+        sorted(step_run.name for step_run in call.args[1])
+        for call in create_run_steps_spy.call_args_list
+    ] == [["producer_a", "producer_b"], ["_buffered_consumer"]]
+
+    run = clean_client.get_pipeline("_buffered_pipeline").last_run
+    assert run.status == ExecutionStatus.COMPLETED
+    assert len(run.steps) == 3
+    assert all(
+        step_run.status == ExecutionStatus.CACHED
+        for step_run in run.steps.values()
+    )
@@ -16,11 +16,15 @@ from uuid import uuid4
 
 import pytest
 
+from zenml.artifacts.in_memory_cache import InMemoryArtifactCache
 from zenml.artifacts.unmaterialized_artifact import UnmaterializedArtifact
 from zenml.config.pipeline_configurations import PipelineConfiguration
 from zenml.config.step_configurations import Step
 from zenml.config.step_run_info import StepRunInfo
+from zenml.metadata.run_metadata_buffer import RunMetadataBuffer
 from zenml.models import PipelineRunResponse, StepRunResponse
+from zenml.new.steps.step_context import StepContext
+from zenml.orchestrators import LocalOrchestrator
 from zenml.orchestrators.step_launcher import StepRunner
 from zenml.stack import Stack
 from zenml.steps import step
@@ -147,6 +151,55 @@ def test_running_a_failing_step(
     mock_publish_successful_step_run.assert_not_called()
 
 
+def test_failing_to_store_run_metadata_does_not_hide_step_error(
+    mocker,
+    local_stack,
+    sample_pipeline_run: PipelineRunResponse,
+    sample_step_run: StepRunResponse,
+):
+    """Tests that failing to store the run metadata neither replaces the
+    exception of the step nor leaks the step context."""
+    mocker.patch.object(Stack, "prepare_step_run")
+    mocker.patch.object(Stack, "cleanup_step_run")
+    mocker.patch("zenml.orchestrators.step_runner.publish_step_run_metadata")
+    mock_flush = mocker.patch.object(
+        RunMetadataBuffer, "flush", side_effect=ConnectionError()
+    )
+
+    step = Step.parse_obj(
+        {
+            "spec": {
+                "source": "tests.unit.orchestrators.test_step_runner.failing_step",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+            },
+        }
+    )
+    step_run_info = StepRunInfo(
+        step_run_id=uuid4(),
+        run_id=uuid4(),
+        run_name="run_name",
+        pipeline_step_name="step_name",
+        config=step.config,
+        pipeline=PipelineConfiguration(name="pipeline_name"),
+    )
+
+    runner = StepRunner(step=step, stack=local_stack)
+    with pytest.raises(RuntimeError):
+        runner.run(
+            pipeline_run=sample_pipeline_run,
+            step_run=sample_step_run,
+            step_run_info=step_run_info,
+            input_artifacts={},
+            output_artifact_uris={},
+        )
+
+    mock_flush.assert_called_once()
+    assert not StepContext._exists()
+
+
 def test_loading_unmaterialized_input_artifact(
     local_stack, sample_artifact_version_model
 ):
@@ -170,3 +223,80 @@ def test_loading_unmaterialized_input_artifact(
         artifact=artifact_response, data_type=UnmaterializedArtifact
     )
     assert artifact.dict() == artifact_response.dict()
+
+
+def test_loading_input_artifact_from_in_memory_cache(
+    mocker, local_stack, sample_artifact_version_model
+):
+    """Tests that input artifacts produced in the same process are read from
+    the in-memory cache if the cached value has the requested type."""
+    cache = InMemoryArtifactCache(max_size=10_000)
+    mocker.patch(
+        "zenml.orchestrators.step_runner.in_memory_artifact_cache", cache
+    )
+    mock_load_materializer = mocker.patch(
+        "zenml.utils.source_utils.load_and_validate_class"
+    )
+    step = Step.parse_obj(
+        {
+            "spec": {
+                "source": "module.step_class",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+            },
+        }
+    )
+    runner = StepRunner(step=step, stack=local_stack)
+    cache.put(sample_artifact_version_model.id, {"key": "value"})
+
+    value = runner._load_input_artifact(
+        artifact=sample_artifact_version_model, data_type=dict
+    )
+    assert value == {"key": "value"}
+    mock_load_materializer.assert_not_called()
+
+    # Values with a different type are loaded from the artifact store
+    runner._load_input_artifact(
+        artifact=sample_artifact_version_model, data_type=list
+    )
+    mock_load_materializer.assert_called_once()
+
+
+def test_in_memory_cache_is_only_used_for_in_process_orchestrators(
+    mocker, local_stack, sample_artifact_version_model
+):
+    """Tests that the in-memory cache is not used if the steps of a pipeline
+    don't run in the same process."""
+    cache = InMemoryArtifactCache(max_size=10_000)
+    mocker.patch(
+        "zenml.orchestrators.step_runner.in_memory_artifact_cache", cache
+    )
+    mocker.patch.object(
+        LocalOrchestrator,
+        "runs_steps_in_process",
+        new_callable=mocker.PropertyMock,
+        return_value=False,
+    )
+    mock_load_materializer = mocker.patch(
+        "zenml.utils.source_utils.load_and_validate_class"
+    )
+    step = Step.parse_obj(
+        {
+            "spec": {
+                "source": "module.step_class",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+            },
+        }
+    )
+    runner = StepRunner(step=step, stack=local_stack)
+    cache.put(sample_artifact_version_model.id, {"key": "value"})
+
+    runner._load_input_artifact(
+        artifact=sample_artifact_version_model, data_type=dict
+    )
+    mock_load_materializer.assert_called_once()
@@ -0,0 +1,102 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import json
+import os
+import shutil
+from uuid import uuid4
+
+from zenml.services.local.local_service import (
+    SERVICE_DAEMON_CONFIG_FILE_NAME,
+    LocalDaemonService,
+    LocalDaemonServiceConfig,
+)
+from zenml.services.local.local_service_index import (
+    LocalServiceIndex,
+    is_service_running,
+    update_service_statuses,
+)
+from zenml.services.service_status import ServiceState
+from zenml.services.service_type import ServiceType
+
+
+class AriaServiceConfig(LocalDaemonServiceConfig):
+    pipeline_name: str = ""
+    model_name: str = ""
+
+
+class AriaService(LocalDaemonService):
+    SERVICE_TYPE = ServiceType(
+        type="test", flavor="aria", name="aria", description="Aria service"
+    )
+    config: AriaServiceConfig
+
+    def run(self) -> None:
+        pass
+
+
+def _write_service(root_path: str, **config) -> AriaService:
+    """Write the configuration file of a service to its runtime directory."""
+    service = AriaService(uuid=uuid4(), config=AriaServiceConfig(**config))
+    service_path = os.path.join(root_path, str(service.uuid))
+    os.makedirs(service_path)
+    with open(
+        os.path.join(service_path, SERVICE_DAEMON_CONFIG_FILE_NAME), "w"
+    ) as f:
+        f.write(service.json(indent=4))
+    return service
+
+
+def test_local_service_index_filters_services(tmp_path, mocker):
+    """Tests that the index only loads the services matching the criteria
+    and picks up services that were created or deleted."""
+    root_path = str(tmp_path)
+    aria = _write_service(root_path, pipeline_name="p", model_name="aria")
+    axl = _write_service(root_path, pipeline_name="p", model_name="axl")
+    index = LocalServiceIndex(root_path)
+
+    services = index.load_services(pipeline_name="p", model_name="aria")
+    assert [service.uuid for service in services] == [aria.uuid]
+    assert [s.uuid for s in index.load_services(service_uuid=axl.uuid)] == [
+        axl.uuid
+    ]
+    assert len(index.load_services(pipeline_name="p", model_name="")) == 2
+
+    # Unchanged service configurations are not parsed again
+    json_load = mocker.spy(json, "load")
+    blupus = _write_service(root_path, pipeline_name="p", model_name="blupus")
+    shutil.rmtree(os.path.join(root_path, str(aria.uuid)))
+
+    services = index.load_services(pipeline_name="p")
+    assert {service.uuid for service in services} == {axl.uuid, blupus.uuid}
+    # Only the index file and the new service configuration are parsed
+    assert json_load.call_count == 2
+
+
+def test_updating_service_statuses_concurrently(mocker):
+    """Tests that the status of all services is updated."""
+    services = [mocker.MagicMock() for _ in range(3)]
+    update_service_statuses(services)
+    for service in services:
+        service.update_status.assert_called_once()
+
+
+def test_checking_running_services_does_not_poll_them(mocker):
+    """Tests that the last known status is used to check running services."""
+    service = AriaService(uuid=uuid4(), config=AriaServiceConfig())
+    check_status = mocker.patch.object(AriaService, "check_status")
+
+    assert not is_service_running(service)
+    service.status.update_state(ServiceState.ACTIVE)
+    assert is_service_running(service)
+    check_status.assert_not_called()
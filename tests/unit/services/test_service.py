@@ -0,0 +1,73 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import time
+from typing import Generator, Optional, Tuple
+
+from zenml.services import (
+    BaseService,
+    ServiceConfig,
+    ServiceState,
+    ServiceStatus,
+    ServiceType,
+)
+
+
+class SlowStartingService(BaseService):
+    SERVICE_TYPE = ServiceType(
+        type="test", flavor="slow", name="slow", description="Slow service"
+    )
+
+    status_checks: int = 0
+    checks_until_active: int = 3
+
+    def check_status(self) -> Tuple[ServiceState, str]:
+        self.status_checks += 1
+        if self.status_checks >= self.checks_until_active:
+            return ServiceState.ACTIVE, ""
+        return ServiceState.PENDING_STARTUP, ""
+
+    def get_logs(
+        self, follow: bool = False, tail: Optional[int] = None
+    ) -> Generator[str, bool, None]:
+        yield from ()
+
+
+def test_polling_service_status_checks_status_once_per_iteration():
+    """Tests that polling the service status updates the status once per
+    check and detects a started service without waiting a full second
+    between checks."""
+    service = SlowStartingService(
+        config=ServiceConfig(), status=ServiceStatus()
+    )
+    service.admin_state = ServiceState.ACTIVE
+
+    start = time.monotonic()
+    assert service.poll_service_status(timeout=10)
+
+    assert service.status_checks == 3
+    assert time.monotonic() - start < 1
+
+
+def test_polling_service_status_times_out():
+    """Tests that polling the service status stops at the timeout."""
+    service = SlowStartingService(
+        config=ServiceConfig(),
+        status=ServiceStatus(),
+        checks_until_active=1000,
+    )
+    service.admin_state = ServiceState.ACTIVE
+
+    start = time.monotonic()
+    assert not service.poll_service_status(timeout=1)
+    assert 1 <= time.monotonic() - start < 2
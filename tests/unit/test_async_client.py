@@ -0,0 +1,65 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import asyncio
+import threading
+from uuid import uuid4
+
+import pytest
+
+from zenml.analytics import source_context
+from zenml.async_client import AsyncClient
+from zenml.enums import SourceContextTypes
+
+
+def test_async_client_runs_calls_concurrently(mocker):
+    """Tests that independent calls are executed at the same time."""
+    barrier = threading.Barrier(3, timeout=10)
+    sources = []
+
+    def _get_run_step(step_run_id, hydrate):
+        sources.append(source_context.get())
+        # Only passes if all three calls are running at the same time
+        barrier.wait()
+        return step_run_id
+
+    client = mocker.MagicMock()
+    client.get_run_step.side_effect = _get_run_step
+    step_run_ids = [uuid4() for _ in range(3)]
+
+    async def _get_run_steps():
+        source_context.set(SourceContextTypes.DASHBOARD)
+        async with AsyncClient(client=client, max_workers=3) as async_client:
+            return await asyncio.gather(
+                *(
+                    async_client.get_run_step(step_run_id)
+                    for step_run_id in step_run_ids
+                )
+            )
+
+    assert asyncio.run(_get_run_steps()) == step_run_ids
+    assert sources == [SourceContextTypes.DASHBOARD] * 3
+
+
+def test_async_client_raises_errors_of_calls(mocker):
+    """Tests that errors of client calls are raised when awaiting them."""
+    client = mocker.MagicMock()
+    client.get_artifact_version.side_effect = KeyError("missing")
+
+    async def _get_artifact_version():
+        async with AsyncClient(client=client) as async_client:
+            await async_client.get_artifact_version("missing")
+
+    with pytest.raises(KeyError):
+        asyncio.run(_get_artifact_version())
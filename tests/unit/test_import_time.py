@@ -0,0 +1,68 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Import time regression tests."""
+
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+HEAVY_MODULES = [
+    "zenml.client",
+    "zenml.models",
+    "zenml.zen_stores",
+    "pandas",
+    "sqlmodel",
+]
+
+
+def _import_times(statement: str) -> Dict[str, int]:
+    """Runs a statement in a fresh interpreter and collects the import times.
+
+    Args:
+        statement: The statement to run.
+
+    Returns:
+        The cumulative import time in microseconds, indexed by module name.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            import_times[module.strip()] = int(cumulative)
+    return import_times
+
+
+@pytest.mark.parametrize(
+    "statement", ["import zenml", "from zenml.cli.cli import cli"]
+)
+def test_lightweight_imports_do_not_import_heavy_modules(statement):
+    """Tests that importing the package or the CLI entrypoint stays cheap."""
+    import_times = _import_times(statement)
+    slowest = sorted(import_times.items(), key=lambda x: x[1], reverse=True)
+
+    for module in HEAVY_MODULES:
+        assert module not in import_times, (
+            f"`{statement}` imports the heavy module `{module}`. Slowest "
+            f"imports (us): {slowest[:10]}"
+        )
@@ -0,0 +1,108 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+
+import pytest
+
+from zenml.integrations.integration import _check_requirement
+from zenml.integrations.registry import IntegrationRegistry
+
+
+@pytest.mark.parametrize(
+    "requirement,installed",
+    [
+        ("pydantic", True),
+        ("pydantic>=1.0", True),
+        ("pydantic<0.1", False),
+        ("pydantic[not-an-extra]", False),
+        ("zenml-package-that-does-not-exist", False),
+        ("zenml-package-that-does-not-exist; python_version<'3'", True),
+    ],
+)
+def test_check_requirement(requirement: str, installed: bool) -> None:
+    """Tests checking whether a requirement is installed."""
+    assert (
+        _check_requirement(requirement, integration_name="aria") is installed
+    )
+
+
+def test_installation_manifest_is_persisted(tmp_path, mocker) -> None:
+    """Tests that the installation status is persisted in the manifest."""
+    manifest_path = os.path.join(tmp_path, "manifest.json")
+    mocker.patch.object(
+        IntegrationRegistry, "_get_manifest_path", return_value=manifest_path
+    )
+    mocker.patch(
+        "zenml.integrations.registry.get_environment_fingerprint",
+        return_value="aria",
+    )
+
+    registry = IntegrationRegistry()
+    assert registry.get_cached_installation_status("cat", ["tuna"]) is None
+    registry.cache_installation_status("cat", ["tuna"], installed=True)
+    registry.save_installation_manifest()
+    assert os.path.exists(manifest_path)
+
+    registry = IntegrationRegistry()
+    assert registry.get_cached_installation_status("cat", ["tuna"]) is True
+    # Changed requirements invalidate the cached status
+    assert registry.get_cached_installation_status("cat", ["salmon"]) is None
+
+
+def test_installation_manifest_is_invalidated_by_environment_changes(
+    tmp_path, mocker
+) -> None:
+    """Tests that environment changes invalidate the manifest."""
+    manifest_path = os.path.join(tmp_path, "manifest.json")
+    mocker.patch.object(
+        IntegrationRegistry, "_get_manifest_path", return_value=manifest_path
+    )
+    mock_fingerprint = mocker.patch(
+        "zenml.integrations.registry.get_environment_fingerprint",
+        return_value="aria",
+    )
+
+    registry = IntegrationRegistry()
+    registry.cache_installation_status("cat", ["tuna"], installed=False)
+    registry.save_installation_manifest()
+
+    mock_fingerprint.return_value = "axl"
+    registry = IntegrationRegistry()
+    assert registry.get_cached_installation_status("cat", ["tuna"]) is None
+
+
+def test_flavor_fingerprints_are_persisted(tmp_path, mocker) -> None:
+    """Tests that the flavor fingerprints are persisted in the manifest."""
+    manifest_path = os.path.join(tmp_path, "manifest.json")
+    mocker.patch.object(
+        IntegrationRegistry, "_get_manifest_path", return_value=manifest_path
+    )
+    mock_fingerprint = mocker.patch(
+        "zenml.integrations.registry.get_environment_fingerprint",
+        return_value="aria",
+    )
+
+    registry = IntegrationRegistry()
+    assert registry.get_cached_flavor_fingerprints("cat") is None
+    registry.cache_flavor_fingerprints("cat", {"orchestrator:cat": "tuna"})
+    registry.save_installation_manifest()
+
+    registry = IntegrationRegistry()
+    assert registry.get_cached_flavor_fingerprints("cat") == {
+        "orchestrator:cat": "tuna"
+    }
+
+    mock_fingerprint.return_value = "axl"
+    registry = IntegrationRegistry()
+    assert registry.get_cached_flavor_fingerprints("cat") is None
@@ -0,0 +1,86 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import math
+import threading
+from typing import List, Tuple
+
+import pytest
+
+from zenml.models import Page
+from zenml.utils import pagination_utils
+
+
+class FakeListMethod:
+    """List method that returns pages of integers."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.calls: List[Tuple[int, int]] = []
+        self.threads = set()
+
+    def __call__(self, page: int, size: int) -> Page:
+        self.calls.append((page, size))
+        self.threads.add(threading.get_ident())
+        start = (page - 1) * size
+        return Page.construct(
+            index=page,
+            max_size=size,
+            total_pages=math.ceil(self.total / size),
+            total=self.total,
+            items=list(range(start, min(start + size, self.total))),
+        )
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iterating_items_of_all_pages(prefetch):
+    """Tests that the items of all pages are iterated in order."""
+    list_method = FakeListMethod(total=25)
+
+    items = pagination_utils.iterate_items(
+        list_method, page_size=10, prefetch=prefetch
+    )
+
+    assert list(items) == list(range(25))
+    assert list_method.calls == [(1, 10), (2, 10), (3, 10)]
+    if prefetch:
+        assert len(list_method.threads) == 2
+    else:
+        assert list_method.threads == {threading.get_ident()}
+
+
+def test_iterating_items_fetches_pages_lazily():
+    """Tests that pages are only fetched once the previous page is
+    processed."""
+    list_method = FakeListMethod(total=100)
+
+    items = pagination_utils.iterate_items(list_method, page_size=10)
+    assert next(items) == 0
+    # The first page and the prefetched second page
+    assert len(list_method.calls) <= 2
+    items.close()
+
+    assert len(list_method.calls) <= 2
+
+
+def test_depaginate_uses_the_maximum_page_size():
+    """Tests that depaginate fetches all items with the maximum page size."""
+    list_method = FakeListMethod(total=3)
+
+    assert pagination_utils.depaginate(list_method) == [0, 1, 2]
+    assert list_method.calls == [(1, pagination_utils.PAGE_SIZE_MAXIMUM)]
+
+    empty_list_method = FakeListMethod(total=0)
+    assert pagination_utils.depaginate(empty_list_method) == []
+    assert len(empty_list_method.calls) == 1
@@ -17,8 +17,10 @@ from pathlib import Path
 from zenml.client import Client
 from zenml.config import DockerSettings
 from zenml.integrations.sklearn import SKLEARN, SklearnIntegration
+from zenml.utils import pipeline_docker_image_builder
 from zenml.utils.pipeline_docker_image_builder import (
     PipelineDockerImageBuilder,
+    requirements_cache,
 )
 
 
@@ -144,3 +146,113 @@ def test_build_skipping():
         download_files=False,
     )
     assert image_digest
+
+
+def test_requirements_are_gathered_once_per_cache_context(mocker, local_stack):
+    """Tests that the local environment is only exported once while the
+    requirements cache is active."""
+    mock_check_output = mocker.patch(
+        "subprocess.check_output", return_value=b"local_requirements"
+    )
+    settings = DockerSettings(
+        install_stack_requirements=True,
+        replicate_local_python_environment="pip_freeze",
+    )
+
+    with requirements_cache():
+        for _ in range(3):
+            files = PipelineDockerImageBuilder.gather_requirements_files(
+                settings, stack=local_stack
+            )
+            assert files[0][1] == "local_requirements"
+
+        with requirements_cache():
+            PipelineDockerImageBuilder.gather_requirements_files(
+                settings, stack=local_stack
+            )
+
+    assert mock_check_output.call_count == 1
+
+    PipelineDockerImageBuilder.gather_requirements_files(
+        settings, stack=local_stack
+    )
+    PipelineDockerImageBuilder.gather_requirements_files(
+        settings, stack=local_stack
+    )
+    assert mock_check_output.call_count == 3
+
+
+def test_local_requirements_are_cached_on_disk(
+    mocker, local_stack, tmp_path: Path
+):
+    """Tests that the exported local environment is cached on disk until the
+    environment changes."""
+    mocker.patch.object(
+        pipeline_docker_image_builder, "CACHE_LOCAL_REQUIREMENTS", True
+    )
+    mocker.patch(
+        "zenml.utils.io_utils.get_global_config_directory",
+        return_value=str(tmp_path),
+    )
+    mock_check_output = mocker.patch(
+        "subprocess.check_output", return_value=b"local_requirements"
+    )
+    mock_fingerprint = mocker.patch.object(
+        pipeline_docker_image_builder,
+        "get_python_environment_fingerprint",
+        return_value="fingerprint",
+    )
+    settings = DockerSettings(replicate_local_python_environment="pip_freeze")
+
+    for _ in range(2):
+        files = PipelineDockerImageBuilder.gather_requirements_files(
+            settings, stack=local_stack
+        )
+        assert files[0][1] == "local_requirements"
+    assert mock_check_output.call_count == 1
+
+    # Custom commands are not cached on disk
+    settings = DockerSettings(replicate_local_python_environment=["cmd"])
+    PipelineDockerImageBuilder.gather_requirements_files(
+        settings, stack=local_stack
+    )
+    assert mock_check_output.call_count == 2
+
+    mock_fingerprint.return_value = "changed_fingerprint"
+    settings = DockerSettings(replicate_local_python_environment="pip_freeze")
+    PipelineDockerImageBuilder.gather_requirements_files(
+        settings, stack=local_stack
+    )
+    assert mock_check_output.call_count == 3
+
+
+def test_python_environment_fingerprint(mocker):
+    """Tests that the fingerprint of the local Python environment extends the
+    fingerprint of the installed packages with the export command."""
+    mock_fingerprint = mocker.patch.object(
+        pipeline_docker_image_builder,
+        "get_environment_fingerprint",
+        return_value="aria",
+    )
+    fingerprint = (
+        pipeline_docker_image_builder.get_python_environment_fingerprint(
+            "pip freeze"
+        )
+    )
+    assert fingerprint == (
+        pipeline_docker_image_builder.get_python_environment_fingerprint(
+            "pip freeze"
+        )
+    )
+    assert fingerprint != (
+        pipeline_docker_image_builder.get_python_environment_fingerprint(
+            "poetry export"
+        )
+    )
+
+    mock_fingerprint.return_value = "axl"
+    assert fingerprint != (
+        pipeline_docker_image_builder.get_python_environment_fingerprint(
+            "pip freeze"
+        )
+    )
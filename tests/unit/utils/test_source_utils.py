@@ -320,3 +320,50 @@ def test_package_utility_functions():
         source_utils._get_package_version(package_name="non_existent_package")
         is None
     )
+
+
+def test_loaded_sources_are_cached(mocker, tmp_path):
+    """Tests that loading a source again doesn't import its module again,
+    unless the module was replaced in the meantime."""
+    mocker.patch.object(
+        source_utils,
+        "get_source_root",
+        return_value=str(tmp_path),
+    )
+    module_path = tmp_path / "cached_test_module.py"
+    module_path.write_text("test = 1")
+    source = Source(
+        module="cached_test_module", attribute="test", type=SourceType.USER
+    )
+
+    try:
+        assert source_utils.load(source) == 1
+
+        load_module_spy = mocker.spy(source_utils, "_load_module")
+        assert source_utils.load(source) == 1
+        load_module_spy.assert_not_called()
+
+        # Replacing the module in `sys.modules` invalidates the cache entry
+        del sys.modules["cached_test_module"]
+        module_path.write_text("test = 2")
+        assert source_utils.load(source) == 2
+        load_module_spy.assert_called_once()
+    finally:
+        sys.modules.pop("cached_test_module", None)
+        source_utils.clear_caches()
+
+
+def test_package_lookups_are_cached_per_python_path(mocker):
+    """Tests that the installed distributions are only scanned once for the
+    same python path."""
+    source_utils.clear_caches()
+
+    assert source_utils._get_package_for_module("pytest") == "pytest"
+    assert source_utils._get_package_for_module("pytest") == "pytest"
+    cache_info = source_utils._get_packages_distributions.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+    mocker.patch.object(sys, "path", sys.path + ["not_a_real_directory"])
+    assert source_utils._get_package_for_module("pytest") == "pytest"
+    assert source_utils._get_packages_distributions.cache_info().misses == 2
@@ -0,0 +1,155 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from typing import Dict, List, Set, Tuple
+from uuid import uuid4
+
+from zenml.models import UserResponse
+from zenml.zen_server.rbac.caching_rbac import CachingRBAC
+from zenml.zen_server.rbac.models import Action, Resource, ResourceType
+from zenml.zen_server.rbac.rbac_interface import RBACInterface
+
+
+class FakeRBAC(RBACInterface):
+    """Local RBAC implementation that records the permission checks."""
+
+    def __init__(self, denied_resources: Set[Resource] = frozenset()):
+        self.denied_resources = set(denied_resources)
+        self.checked_resources: List[Set[Resource]] = []
+        self.listed_resources: List[Resource] = []
+
+    def check_permissions(
+        self, user: UserResponse, resources: Set[Resource], action: Action
+    ) -> Dict[Resource, bool]:
+        self.checked_resources.append(set(resources))
+        return {
+            resource: resource not in self.denied_resources
+            for resource in resources
+        }
+
+    def list_allowed_resource_ids(
+        self, user: UserResponse, resource: Resource, action: Action
+    ) -> Tuple[bool, List[str]]:
+        self.listed_resources.append(resource)
+        return False, [str(uuid4())]
+
+    def update_resource_membership(
+        self, user: UserResponse, resource: Resource, actions: List[Action]
+    ) -> None:
+        self.denied_resources.discard(resource)
+
+
+def _resource() -> Resource:
+    return Resource(type=ResourceType.STACK, id=uuid4())
+
+
+def test_caching_rbac_only_checks_uncached_resources(sample_user_model):
+    """Tests that cached decisions are reused and misses are batched."""
+    denied, allowed, new_1, new_2 = (_resource() for _ in range(4))
+    fake_rbac = FakeRBAC(denied_resources={denied})
+    rbac = CachingRBAC(rbac=fake_rbac, ttl=60)
+
+    assert rbac.check_permissions(
+        user=sample_user_model, resources={denied, allowed}, action=Action.READ
+    ) == {denied: False, allowed: True}
+
+    permissions = rbac.check_permissions(
+        user=sample_user_model,
+        resources={denied, allowed, new_1, new_2},
+        action=Action.READ,
+    )
+    assert permissions == {
+        denied: False,
+        allowed: True,
+        new_1: True,
+        new_2: True,
+    }
+    assert fake_rbac.checked_resources == [{denied, allowed}, {new_1, new_2}]
+
+    # Decisions are cached per action and user
+    rbac.check_permissions(
+        user=sample_user_model, resources={allowed}, action=Action.UPDATE
+    )
+    other_user = sample_user_model.copy(update={"id": uuid4()})
+    rbac.check_permissions(
+        user=other_user, resources={allowed}, action=Action.READ
+    )
+    assert len(fake_rbac.checked_resources) == 4
+
+
+def test_caching_rbac_decisions_expire(mocker, sample_user_model):
+    """Tests that decisions are checked again once they expired."""
+    resource = _resource()
+    fake_rbac = FakeRBAC()
+    rbac = CachingRBAC(rbac=fake_rbac, ttl=10)
+    mock_monotonic = mocker.patch(
+        "zenml.zen_server.rbac.caching_rbac.time.monotonic", return_value=100
+    )
+
+    for _ in range(2):
+        rbac.check_permissions(
+            user=sample_user_model, resources={resource}, action=Action.READ
+        )
+        rbac.list_allowed_resource_ids(
+            user=sample_user_model, resource=resource, action=Action.READ
+        )
+    assert len(fake_rbac.checked_resources) == 1
+    assert len(fake_rbac.listed_resources) == 1
+
+    mock_monotonic.return_value = 111
+    rbac.check_permissions(
+        user=sample_user_model, resources={resource}, action=Action.READ
+    )
+    rbac.list_allowed_resource_ids(
+        user=sample_user_model, resource=resource, action=Action.READ
+    )
+    assert len(fake_rbac.checked_resources) == 2
+    assert len(fake_rbac.listed_resources) == 2
+
+
+def test_caching_rbac_membership_updates_invalidate_decisions(
+    sample_user_model,
+):
+    """Tests that updating the membership of a user invalidates their
+    cached decisions."""
+    resource = _resource()
+    rbac = CachingRBAC(rbac=FakeRBAC(denied_resources={resource}), ttl=60)
+
+    assert not rbac.check_permissions(
+        user=sample_user_model, resources={resource}, action=Action.READ
+    )[resource]
+
+    rbac.update_resource_membership(
+        user=sample_user_model, resource=resource, actions=[Action.READ]
+    )
+    assert rbac.check_permissions(
+        user=sample_user_model, resources={resource}, action=Action.READ
+    )[resource]
+
+
+def test_caching_rbac_evicts_oldest_decisions(sample_user_model):
+    """Tests that the number of cached decisions is bounded."""
+    resources = [_resource() for _ in range(3)]
+    fake_rbac = FakeRBAC()
+    rbac = CachingRBAC(rbac=fake_rbac, ttl=60, max_entries=2)
+
+    for resource in resources:
+        rbac.check_permissions(
+            user=sample_user_model, resources={resource}, action=Action.READ
+        )
+
+    rbac.check_permissions(
+        user=sample_user_model, resources=set(resources), action=Action.READ
+    )
+    assert fake_rbac.checked_resources[-1] == {resources[0]}
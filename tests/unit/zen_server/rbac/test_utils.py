@@ -0,0 +1,83 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from tests.unit.zen_server.rbac.test_caching_rbac import FakeRBAC
+from zenml.models import Page
+from zenml.zen_server.rbac import utils as rbac_utils
+from zenml.zen_server.rbac.caching_rbac import CachingRBAC
+from zenml.zen_server.rbac.models import Resource, ResourceType
+
+
+@pytest.fixture
+def fake_rbac(mocker, sample_user_model):
+    """Enables RBAC with a fake implementation for another user."""
+    fake_rbac = FakeRBAC()
+    rbac = CachingRBAC(rbac=fake_rbac, ttl=60)
+    mocker.patch.object(
+        rbac_utils,
+        "server_config",
+        return_value=SimpleNamespace(rbac_enabled=True),
+    )
+    mocker.patch.object(
+        rbac_utils,
+        "get_auth_context",
+        return_value=SimpleNamespace(
+            user=sample_user_model.copy(update={"id": uuid4()})
+        ),
+    )
+    mocker.patch.object(rbac_utils, "rbac", return_value=rbac)
+    return fake_rbac
+
+
+def test_dehydrating_a_permitted_model_returns_it_unchanged(
+    fake_rbac, sample_pipeline_run
+):
+    """Tests that models are not copied if nothing needs to be dehydrated."""
+    page = Page(
+        index=1,
+        max_size=10,
+        total_pages=1,
+        total=1,
+        items=[sample_pipeline_run],
+    )
+
+    dehydrated_page = rbac_utils.dehydrate_page(page)
+
+    assert dehydrated_page.items[0] is page.items[0]
+    assert len(fake_rbac.checked_resources) == 1
+
+
+def test_dehydrating_a_model_replaces_forbidden_sub_models(
+    fake_rbac, sample_pipeline_run
+):
+    """Tests that forbidden sub-models are replaced without modifying the
+    original model."""
+    workspace = sample_pipeline_run.metadata.workspace
+    fake_rbac.denied_resources.add(
+        Resource(type=ResourceType.WORKSPACE, id=workspace.id)
+    )
+
+    dehydrated_run = rbac_utils.dehydrate_response_model(sample_pipeline_run)
+
+    assert dehydrated_run is not sample_pipeline_run
+    assert dehydrated_run.metadata.workspace.permission_denied
+    assert dehydrated_run.body.user is sample_pipeline_run.body.user
+    assert not sample_pipeline_run.metadata.workspace.permission_denied
+    # The denied permission is only checked once thanks to the cache
+    assert len(fake_rbac.checked_resources) == 1
@@ -0,0 +1,142 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import json
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from zenml.zen_server import metrics
+from zenml.zen_server.metrics import MetricsMiddleware, ServerMetrics
+
+
+@pytest.fixture
+def engine():
+    """An in-memory SQLite engine that counts its queries."""
+    engine = create_engine("sqlite://")
+    metrics.instrument_engine(engine, slow_query_threshold=0)
+    return engine
+
+
+def _create_app(engine, server_metrics, server_timing=False) -> FastAPI:
+    """Creates an app with an endpoint that runs two queries."""
+    app = FastAPI()
+    app.add_middleware(
+        MetricsMiddleware, metrics=server_metrics, server_timing=server_timing
+    )
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int) -> int:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+        return item_id
+
+    return app
+
+
+def test_metrics_are_recorded_per_route(engine):
+    """Tests that request and query metrics are recorded per route."""
+    server_metrics = ServerMetrics(buckets=[0.001, 60])
+    client = TestClient(_create_app(engine, server_metrics))
+
+    assert client.get("/items/1").status_code == 200
+    assert client.get("/items/2").status_code == 200
+    assert client.get("/unknown").status_code == 404
+
+    rendered = server_metrics.render()
+    labels = 'method="GET",route="/items/{item_id}"'
+    assert "zenml_http_requests_in_progress 0" in rendered
+    assert f'zenml_http_requests_total{{{labels},status="200"}} 2' in rendered
+    assert (
+        'zenml_http_requests_total{method="GET",route="unmatched",'
+        'status="404"} 1'
+    ) in rendered
+    assert (
+        f'zenml_http_request_duration_seconds_bucket{{{labels},le="60"}} 2'
+    ) in rendered
+    assert f"zenml_http_request_duration_seconds_count{{{labels}}} 2" in (
+        rendered
+    )
+    assert f"zenml_http_response_size_bytes_sum{{{labels}}} 2" in rendered
+    assert f"zenml_db_queries_total{{{labels}}} 4" in rendered
+
+
+def test_server_timing_header(engine):
+    """Tests that the Server-Timing header is only added if enabled."""
+    client = TestClient(_create_app(engine, ServerMetrics()))
+    assert "Server-Timing" not in client.get("/items/1").headers
+
+    client = TestClient(
+        _create_app(engine, ServerMetrics(), server_timing=True)
+    )
+    server_timing = client.get("/items/1").headers["Server-Timing"]
+    assert server_timing.startswith("app;dur=")
+    assert 'desc="2 queries"' in server_timing
+
+
+def test_slow_queries_are_logged(mocker):
+    """Tests that queries slower than the threshold are logged."""
+    mock_warning = mocker.patch.object(metrics.logger, "warning")
+    engine = create_engine("sqlite://")
+    metrics.instrument_engine(engine, slow_query_threshold=1e-12)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    mock_warning.assert_called_once()
+    assert mock_warning.call_args.args[-1] == "SELECT 1"
+
+
+def test_failed_queries_do_not_leak_start_times(engine):
+    """Tests that the start times of failed queries are removed."""
+    with engine.connect() as connection:
+        with pytest.raises(OperationalError):
+            connection.execute(text("SELECT * FROM missing_table"))
+        connection.execute(text("SELECT 1"))
+
+        assert connection.info["query_start_time"] == []
+
+
+def test_metrics_of_all_workers_are_rendered(engine, tmp_path):
+    """Tests that the metrics of all worker processes are aggregated."""
+    server_metrics = ServerMetrics(
+        buckets=[0.001, 60], multiprocess_dir=str(tmp_path)
+    )
+    client = TestClient(_create_app(engine, server_metrics))
+    assert client.get("/items/1").status_code == 200
+
+    # Snapshot of another worker process that already exited
+    labels = 'method="GET",route="/items/{item_id}"'
+    snapshot = json.loads((tmp_path / f"{os.getpid()}.json").read_text())
+    snapshot["pid"] = 2**22 + 1
+    snapshot["requests_in_progress"] = 5
+    (tmp_path / "other.json").write_text(json.dumps(snapshot))
+
+    rendered = server_metrics.render()
+    assert "zenml_http_requests_in_progress 0" in rendered
+    assert f'zenml_http_requests_total{{{labels},status="200"}} 2' in rendered
+    assert f"zenml_db_queries_total{{{labels}}} 4" in rendered
+
+    # Invalid snapshots are skipped
+    (tmp_path / "invalid.json").write_text("{")
+    assert server_metrics.render() == rendered
+
+    # The snapshot of this worker is removed when it shuts down
+    server_metrics.remove_snapshot()
+    assert not (tmp_path / f"{os.getpid()}.json").exists()
@@ -0,0 +1,104 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+
+import pytest
+
+from zenml.config.global_config import GlobalConfiguration
+from zenml.config.server_config import ServerConfiguration
+from zenml.constants import (
+    ENV_ZENML_DISABLE_DATABASE_MIGRATION,
+    ENV_ZENML_SERVER_JWT_SECRET_KEY,
+    ENV_ZENML_SERVER_METRICS_MULTIPROCESS_DIR,
+)
+from zenml.zen_server import utils
+
+
+@pytest.fixture
+def server_env(monkeypatch):
+    """Server environment without a JWT secret key or metrics directory."""
+    # Changes made to the copy of the environment are discarded afterwards
+    monkeypatch.setattr(os, "environ", os.environ.copy())
+    monkeypatch.delenv(ENV_ZENML_SERVER_JWT_SECRET_KEY, raising=False)
+    monkeypatch.delenv(
+        ENV_ZENML_SERVER_METRICS_MULTIPROCESS_DIR, raising=False
+    )
+    yield monkeypatch
+
+
+def test_single_worker_environment_is_not_changed(server_env):
+    """Tests that a single worker doesn't need a shared environment."""
+    server_env.setattr(
+        utils, "_server_config", ServerConfiguration(metrics_enabled=True)
+    )
+
+    assert utils.prepare_server_workers() == 1
+    assert ENV_ZENML_SERVER_JWT_SECRET_KEY not in os.environ
+    assert ENV_ZENML_SERVER_METRICS_MULTIPROCESS_DIR not in os.environ
+
+
+def test_multiple_workers_share_their_configuration(server_env, mocker):
+    """Tests that multiple workers share the JWT secret key and a metrics
+    directory."""
+    mock_atexit_register = mocker.patch("atexit.register")
+    config = ServerConfiguration(workers=4, metrics_enabled=True)
+    server_env.setattr(utils, "_server_config", config)
+
+    assert utils.prepare_server_workers() == 4
+
+    worker_config = ServerConfiguration.get_server_config()
+    assert worker_config.jwt_secret_key == config.jwt_secret_key
+    assert worker_config.metrics_multiprocess_dir
+    assert os.path.isdir(worker_config.metrics_multiprocess_dir)
+
+    # The generated metrics directory is removed when the server exits
+    cleanup, metrics_dir = mock_atexit_register.call_args.args
+    assert metrics_dir == worker_config.metrics_multiprocess_dir
+    cleanup(metrics_dir, ignore_errors=True)
+    assert not os.path.exists(metrics_dir)
+
+
+def test_multiple_workers_dont_migrate_the_database(server_env, mocker):
+    """Tests that the database is migrated once before starting the
+    workers."""
+    server_env.delenv(ENV_ZENML_DISABLE_DATABASE_MIGRATION, raising=False)
+    mock_zen_store = mocker.patch.object(
+        GlobalConfiguration, "zen_store", new_callable=mocker.PropertyMock
+    )
+    server_env.setattr(utils, "_server_config", ServerConfiguration(workers=2))
+
+    utils.prepare_server_workers()
+
+    mock_zen_store.assert_called_once()
+    assert ENV_ZENML_DISABLE_DATABASE_MIGRATION in os.environ
+
+
+def test_configured_metrics_directory_is_emptied(server_env, tmp_path):
+    """Tests that snapshots of previous server runs are removed."""
+    (tmp_path / "123.json").write_text("{}")
+    (tmp_path / "456.tmp").write_text("")
+    server_env.setattr(
+        utils,
+        "_server_config",
+        ServerConfiguration(
+            workers=2,
+            metrics_enabled=True,
+            metrics_multiprocess_dir=str(tmp_path),
+        ),
+    )
+
+    utils.prepare_server_workers()
+
+    assert list(tmp_path.iterdir()) == []
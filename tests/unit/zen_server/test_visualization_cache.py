@@ -0,0 +1,55 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from uuid import uuid4
+
+from zenml.enums import VisualizationType
+from zenml.models import LoadedVisualization
+from zenml.zen_server.visualization_cache import VisualizationCache
+
+
+def _visualization(size: int) -> LoadedVisualization:
+    """Creates a visualization with a value of the given size."""
+    return LoadedVisualization(type=VisualizationType.HTML, value="a" * size)
+
+
+def test_visualization_cache_evicts_least_recently_used_entries():
+    """Tests that the cache stays within its maximum size."""
+    cache = VisualizationCache(max_size=100)
+    first, second, third = [(uuid4(), 0, False) for _ in range(3)]
+
+    cache.put(first, _visualization(40))
+    cache.put(second, _visualization(40))
+    assert cache.get(first) is not None
+
+    cache.put(third, _visualization(40))
+    assert cache.size == 80
+    assert cache.get(first) is not None
+    assert cache.get(second) is None
+    assert cache.get(third) is not None
+
+
+def test_visualization_cache_skips_large_visualizations():
+    """Tests that visualizations larger than the cache are not cached."""
+    cache = VisualizationCache(max_size=100)
+    key = (uuid4(), 0, False)
+
+    cache.put(key, _visualization(101))
+    assert cache.get(key) is None
+    assert cache.size == 0
+
+    cache.put(key, _visualization(50))
+    cache.put(key, _visualization(20))
+    assert cache.size == 20
+    assert cache.get(key).value == "a" * 20
@@ -0,0 +1,37 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from fastapi.testclient import TestClient
+
+from zenml.constants import HEALTH
+from zenml.zen_server.zen_server_api import app
+
+
+def test_json_responses_support_conditional_requests():
+    """Tests that JSON responses have an ETag and are only sent again if they
+    changed."""
+    client = TestClient(app)
+
+    response = client.get(HEALTH)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = client.get(HEALTH, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+    response = client.get(HEALTH, headers={"If-None-Match": 'W/"outdated"'})
+    assert response.status_code == 200
+    assert response.json() == "OK"
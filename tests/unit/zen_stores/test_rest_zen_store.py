@@ -0,0 +1,204 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+import pytest
+import requests
+
+from zenml.analytics import source_context
+from zenml.constants import REST_CONNECTION_POOL_SIZE, WORKSPACES
+from zenml.enums import SourceContextTypes
+from zenml.models import WorkspaceFilter, WorkspaceResponse
+from zenml.zen_stores.rest_zen_store import (
+    RestZenStore,
+    RestZenStoreConfiguration,
+)
+
+
+def _response(
+    status_code: int, body: Any = None, etag: Optional[str] = None
+) -> requests.Response:
+    """Creates a response."""
+    response = requests.Response()
+    response.status_code = status_code
+    if body is not None:
+        response._content = json.dumps(body).encode()
+    if etag:
+        response.headers["ETag"] = etag
+    return response
+
+
+@pytest.fixture
+def rest_store(mocker) -> RestZenStore:
+    """A REST store that doesn't connect to a server."""
+    mocker.patch.object(RestZenStore, "_initialize")
+    return RestZenStore(
+        config=RestZenStoreConfiguration(
+            url="http://localhost:8080", api_token="token"
+        )
+    )
+
+
+def test_unchanged_resources_are_not_parsed_again(
+    mocker, rest_store, sample_workspace_model
+):
+    """Tests that unchanged resources are returned from the response cache."""
+    body = json.loads(sample_workspace_model.json())
+    request_headers: Dict[str, Optional[str]] = {}
+
+    def _request(method, url, headers=None, **kwargs):
+        request_headers[url] = (headers or {}).get("If-None-Match")
+        if request_headers[url] == "etag":
+            return _response(304, etag="etag")
+        return _response(200, body=body, etag="etag")
+
+    mocker.patch.object(rest_store.session, "request", side_effect=_request)
+    parse_spy = mocker.spy(WorkspaceResponse, "parse_obj")
+
+    workspace = rest_store.get_workspace(sample_workspace_model.id)
+    assert list(request_headers.values()) == [None]
+
+    # Responses are hydrated in place, so every caller gets its own copy
+    workspace.name = "modified"
+    cached_workspace = rest_store.get_workspace(sample_workspace_model.id)
+    assert cached_workspace == sample_workspace_model
+    assert cached_workspace is not workspace
+    assert list(request_headers.values()) == ["etag"]
+    assert parse_spy.call_count == 1
+
+    # Other query parameters are cached separately
+    rest_store.get_workspace(sample_workspace_model.id, hydrate=False)
+    assert parse_spy.call_count == 2
+
+    # Clearing the session also clears the cached responses
+    rest_store.clear_session()
+    mocker.patch.object(rest_store.session, "request", side_effect=_request)
+    rest_store.get_workspace(sample_workspace_model.id)
+    assert parse_spy.call_count == 3
+
+
+def test_responses_without_etag_are_not_cached(
+    mocker, rest_store, sample_workspace_model
+):
+    """Tests that responses are not cached if the server doesn't send an
+    ETag."""
+    body = json.loads(sample_workspace_model.json())
+    mock_request = mocker.patch.object(
+        rest_store.session, "request", return_value=_response(200, body=body)
+    )
+
+    rest_store.get_workspace(sample_workspace_model.id)
+    workspace = rest_store.get_workspace(sample_workspace_model.id)
+
+    assert workspace == sample_workspace_model
+    for call in mock_request.call_args_list:
+        assert "If-None-Match" not in call.kwargs["headers"]
+    assert not rest_store._response_cache
+
+
+def test_successful_responses_are_decoded_once(
+    mocker, rest_store, sample_workspace_model
+):
+    """Tests that successful responses are only decoded to build the
+    model."""
+    response = _response(200, body=json.loads(sample_workspace_model.json()))
+    mocker.patch.object(rest_store.session, "request", return_value=response)
+    json_spy = mocker.spy(response, "json")
+
+    rest_store.get_workspace(sample_workspace_model.id)
+
+    assert json_spy.call_count == 1
+
+
+def test_expired_tokens_are_refreshed(mocker, rest_store):
+    """Tests that requests are retried once after an authorization error."""
+    mock_request = mocker.patch.object(
+        rest_store.session,
+        "request",
+        return_value=_response(
+            401, body={"detail": ["AuthorizationException", "expired"]}
+        ),
+    )
+    mock_clear_session = mocker.patch.object(RestZenStore, "clear_session")
+
+    response = rest_store._send_request("GET", "http://localhost:8080/api")
+
+    assert response.status_code == 401
+    assert mock_request.call_count == 2
+    mock_clear_session.assert_called_once()
+
+
+def test_listing_resources_uses_the_response_cache(
+    mocker, rest_store, sample_workspace_model
+):
+    """Tests that unchanged pages are returned from the response cache."""
+    body = {
+        "index": 1,
+        "max_size": 50,
+        "total_pages": 1,
+        "total": 1,
+        "items": [json.loads(sample_workspace_model.json())],
+    }
+    mock_request = mocker.patch.object(
+        rest_store.session,
+        "request",
+        side_effect=[
+            _response(200, body=body, etag="etag"),
+            _response(304, etag="etag"),
+        ],
+    )
+
+    page = rest_store.list_workspaces(WorkspaceFilter())
+    assert page.items == [sample_workspace_model]
+    assert mock_request.call_args.args[1].endswith(WORKSPACES)
+
+    cached_page = rest_store.list_workspaces(WorkspaceFilter())
+    assert cached_page == page
+    assert cached_page is not page
+    assert cached_page.items[0] is not page.items[0]
+    assert mock_request.call_args.kwargs["headers"]["If-None-Match"] == "etag"
+
+
+def test_requests_send_the_source_of_their_context(
+    mocker, rest_store, sample_workspace_model
+):
+    """Tests that concurrent requests send the source of their own context."""
+    body = json.loads(sample_workspace_model.json())
+    mock_request = mocker.patch.object(
+        rest_store.session, "request", return_value=_response(200, body=body)
+    )
+
+    def _get_workspace(source: SourceContextTypes) -> None:
+        source_context.set(source)
+        rest_store.get_workspace(sample_workspace_model.id)
+
+    sources = [SourceContextTypes.CLI, SourceContextTypes.PYTHON] * 4
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_get_workspace, sources))
+
+    sent_sources = [
+        call.kwargs["headers"][source_context.name]
+        for call in mock_request.call_args_list
+    ]
+    assert sorted(sent_sources) == sorted(source.value for source in sources)
+    assert source_context.name not in rest_store.session.headers
+
+
+def test_session_keeps_a_connection_pool(rest_store):
+    """Tests that the session keeps the configured number of connections."""
+    adapter = rest_store.session.get_adapter(rest_store.url)
+    assert adapter._pool_maxsize == REST_CONNECTION_POOL_SIZE
@@ -0,0 +1,39 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from zenml.zen_stores.sql_zen_store import SqlZenStore
+
+
+def test_pooled_connections_are_not_shared_between_processes(mocker, tmp_path):
+    """Tests that a forked process doesn't use the pooled connections of its
+    parent process."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'zenml.db'}", poolclass=QueuePool
+    )
+    SqlZenStore._guard_connection_pool(engine)
+
+    with engine.connect() as connection:
+        parent_connection = connection.connection.dbapi_connection
+        connection.execute(text("SELECT 1"))
+
+    mocker.patch("zenml.zen_stores.sql_zen_store.os.getpid", return_value=-1)
+    with engine.connect() as connection:
+        assert connection.connection.dbapi_connection is not parent_connection
+        connection.execute(text("SELECT 1"))
+
+    # The connection of the parent process was not closed
+    parent_connection.execute("SELECT 1")